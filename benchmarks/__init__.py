@@ -0,0 +1 @@
+"""Benchmarks for clappia_api_tools; run the modules with ``python -m benchmarks.<name>``"""
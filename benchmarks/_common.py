@@ -0,0 +1,93 @@
+"""Helpers shared by the benchmark scripts: statistics, metadata and JSON reports"""
+
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Sequence
+
+import clappia_api_tools
+
+
+def quiet_logging() -> None:
+    """Silence per-request INFO logs so they do not skew timings"""
+    logging.getLogger("clappia_api_tools").setLevel(logging.WARNING)
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Linearly interpolated percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(samples: List[float], scale: float = 1000.0) -> Dict[str, float]:
+    """p50/p95/p99/mean/max of samples given in seconds, reported in ``scale`` units"""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0, "max": 0.0}
+    return {
+        "p50": round(percentile(ordered, 50) * scale, 4),
+        "p95": round(percentile(ordered, 95) * scale, 4),
+        "p99": round(percentile(ordered, 99) * scale, 4),
+        "mean": round(sum(ordered) / len(ordered) * scale, 4),
+        "max": round(ordered[-1] * scale, 4),
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MiB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 2)
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def metadata(suite: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "suite": suite,
+        "libraryVersion": clappia_api_tools.__version__,
+        "gitRevision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpuCount": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "settings": settings,
+    }
+
+
+def write_report(path: str, meta: Dict[str, Any], results: List[Dict[str, Any]]) -> None:
+    report = {"meta": meta, "results": results}
+    if path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Wrote {len(results)} results to {path}", file=sys.stderr)
+
+
+def print_table(rows: List[List[Any]], headers: List[str]) -> None:
+    widths = [max(len(str(x)) for x in column) for column in zip(headers, *rows)]
+    line = "  ".join(f"{{:>{w}}}" for w in widths)
+    print(line.format(*headers), file=sys.stderr)
+    for row in rows:
+        print(line.format(*row), file=sys.stderr)
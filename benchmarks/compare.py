@@ -0,0 +1,95 @@
+"""Compare two benchmark reports produced by the same suite.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json [--fail-above 10]
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks._common import print_table
+
+# Metric path -> True when higher is better
+MACRO_METRICS = {
+    ("requestsPerSecond",): True,
+    ("latencyMs", "p50"): False,
+    ("latencyMs", "p99"): False,
+    ("cpuMsPerRequest",): False,
+}
+MICRO_METRICS = {
+    ("usPerOp", "p50"): False,
+    ("usPerOp", "mean"): False,
+}
+KEY_FIELDS = ("operation", "concurrency", "payloadFields", "benchmark", "size")
+
+
+def _key(result: Dict[str, Any]) -> Tuple:
+    return tuple(result.get(field) for field in KEY_FIELDS)
+
+
+def _get(result: Dict[str, Any], path: Tuple[str, ...]) -> Optional[float]:
+    value: Any = result
+    for part in path:
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+def compare(baseline: Dict[str, Any], candidate: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Percentage change per scenario and metric; positive ``regression`` means worse"""
+    metrics = MICRO_METRICS if baseline["meta"]["suite"] == "micro" else MACRO_METRICS
+    old = {_key(r): r for r in baseline["results"]}
+    rows = []
+    for result in candidate["results"]:
+        before = old.get(_key(result))
+        if before is None:
+            continue
+        for path, higher_is_better in metrics.items():
+            a, b = _get(before, path), _get(result, path)
+            if not a or b is None:
+                continue
+            change = (b - a) / a * 100
+            rows.append({
+                "scenario": " ".join(str(v) for v in _key(result) if v is not None),
+                "metric": ".".join(path),
+                "baseline": a,
+                "candidate": b,
+                "changePct": round(change, 2),
+                "regressionPct": round(-change if higher_is_better else change, 2),
+            })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare", description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--fail-above", type=float, default=None,
+                        help="Exit with status 1 when any metric regresses by more than this percentage")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    with open(args.candidate, encoding="utf-8") as handle:
+        candidate = json.load(handle)
+    if baseline["meta"]["suite"] != candidate["meta"]["suite"]:
+        print("Reports come from different suites", file=sys.stderr)
+        return 2
+
+    rows = compare(baseline, candidate)
+    print(f"{baseline['meta']['libraryVersion']} ({baseline['meta']['gitRevision']}) -> "
+          f"{candidate['meta']['libraryVersion']} ({candidate['meta']['gitRevision']})", file=sys.stderr)
+    print_table(
+        [[r["scenario"], r["metric"], r["baseline"], r["candidate"], f"{r['changePct']:+.1f}%"] for r in rows],
+        ["scenario", "metric", "baseline", "candidate", "change"],
+    )
+    if args.fail_above is not None and any(r["regressionPct"] > args.fail_above for r in rows):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""End-to-end throughput and tail latency of ClappiaClient against a local simulator.
+
+The simulator runs in a separate process (``python -m clappia_api_tools.simulator``)
+so CPU time and peak RSS measured here belong to the client alone.
+
+Usage:
+    python -m benchmarks.macro --concurrency 1,8,32 --payload-fields 5,50,200 \\
+        --requests 500 --output macro.json
+    python -m benchmarks.compare baseline.json macro.json
+"""
+
+import argparse
+import itertools
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from benchmarks._common import metadata, peak_rss_mb, print_table, quiet_logging, summarize, write_report
+from clappia_api_tools import ClappiaClient, PoolConfig, RequestsTransport, RetryConfig
+
+APP_ID = "BENCHAPP1"
+EMAIL = "bench@example.com"
+OPERATIONS = ("create_submission", "edit_submission", "get_definition", "create_app")
+
+
+def submission_data(fields: int) -> Dict[str, Any]:
+    return {f"field{i}": f"value {i} " * 4 for i in range(fields)}
+
+
+def app_sections(fields: int) -> List[Dict[str, Any]]:
+    per_section = 25
+    sections = []
+    for start in range(0, max(fields, 1), per_section):
+        count = min(per_section, fields - start) or 1
+        sections.append({
+            "sectionName": f"Section {len(sections) + 1}",
+            "fields": [
+                {"fieldType": "singleLineText", "label": f"Field {start + i}"} for i in range(count)
+            ],
+        })
+    return sections
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_simulator(latency: str, port: Optional[int] = None) -> Tuple[subprocess.Popen, str]:
+    port = port or _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "clappia_api_tools.simulator", "--port", str(port), "--latency", latency],
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("simulator did not start")
+
+
+def build_call(client: ClappiaClient, operation: str, fields: int) -> Callable[[int], Any]:
+    """Return a function performing one call of ``operation``; setup requests are made here"""
+    data = submission_data(fields)
+    if operation == "create_submission":
+        return lambda i: client.create_submission(APP_ID, data, EMAIL)
+    if operation == "create_app":
+        sections = app_sections(fields)
+        return lambda i: client.create_app(f"Benchmark App {i}", EMAIL, sections)
+    # Setup calls go through their own session, closed before the measured calls start
+    with requests.Session() as session:
+        setup = ClappiaClient(
+            client.api_utils.api_key, client.api_utils.base_url, client.api_utils.workplace_id,
+            transport=RequestsTransport(client.api_utils.base_url, session=session),
+            structured_results=True,
+        )
+        if operation == "edit_submission":
+            submission_id = setup.create_submission(APP_ID, data, EMAIL).data["submissionId"]
+            return lambda i: client.edit_submission(APP_ID, submission_id, data, EMAIL)
+        if operation == "get_definition":
+            app_id = setup.create_app("Benchmark App", EMAIL, app_sections(fields)).data["appId"]
+            return lambda i: client.get_app_definition(app_id)
+    raise ValueError(f"unknown operation {operation}")
+
+
+def run_scenario(base_url: str, operation: str, concurrency: int, fields: int, requests: int) -> Dict[str, Any]:
+    client = ClappiaClient(
+        "bench-key", base_url, "BENCHWP",
+        pool_config=PoolConfig(pool_maxsize=max(concurrency, 10)),
+        retry_config=RetryConfig.disabled(),
+    )
+    call = build_call(client, operation, fields)
+    for i in range(min(concurrency, 10)):
+        call(i)
+
+    latencies: List[float] = []
+    errors = 0
+
+    def timed(i: int) -> bool:
+        started = time.perf_counter()
+        result = call(i)
+        latencies.append(time.perf_counter() - started)
+        return not str(result).startswith("Error")
+
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for ok in executor.map(timed, range(requests)):
+            errors += 0 if ok else 1
+    wall = time.perf_counter() - wall_started
+    cpu = time.process_time() - cpu_started
+
+    return {
+        "operation": operation,
+        "concurrency": concurrency,
+        "payloadFields": fields,
+        "requests": requests,
+        "errors": errors,
+        "requestsPerSecond": round(requests / wall, 2),
+        "latencyMs": summarize(latencies),
+        "cpuMsPerRequest": round(cpu / requests * 1000, 4),
+    }
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.macro", description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", default=",".join(OPERATIONS))
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 8, 32])
+    parser.add_argument("--payload-fields", type=_int_list, default=[5, 50, 200])
+    parser.add_argument("--requests", type=int, default=300, help="Measured requests per scenario")
+    parser.add_argument("--latency", default="0", help="Simulator latency, e.g. 0.005 or lognormal:0.005,0.5")
+    parser.add_argument("--base-url", default=None, help="Use an already running simulator instead of starting one")
+    parser.add_argument("--output", default="macro-results.json", help='JSON report path, "-" for stdout')
+    args = parser.parse_args(argv)
+
+    quiet_logging()
+    operations = [op for op in args.operations.split(",") if op]
+    process = None
+    base_url = args.base_url
+    if base_url is None:
+        process, base_url = start_simulator(args.latency)
+
+    results = []
+    try:
+        for operation, concurrency, fields in itertools.product(operations, args.concurrency, args.payload_fields):
+            result = run_scenario(base_url, operation, concurrency, fields, args.requests)
+            results.append(result)
+            print(
+                f"{operation:<18} c={concurrency:<3} fields={fields:<4} "
+                f"{result['requestsPerSecond']:>9.1f} req/s  p99={result['latencyMs']['p99']:.2f}ms",
+                file=sys.stderr,
+            )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print_table(
+        [
+            [r["operation"], r["concurrency"], r["payloadFields"], r["requestsPerSecond"],
+             r["latencyMs"]["p50"], r["latencyMs"]["p95"], r["latencyMs"]["p99"], r["cpuMsPerRequest"], r["errors"]]
+            for r in results
+        ],
+        ["operation", "conc", "fields", "req/s", "p50ms", "p95ms", "p99ms", "cpu_ms", "errors"],
+    )
+    # ru_maxrss is a process-wide high-water mark, so it is reported once for the whole run
+    peak_rss = peak_rss_mb()
+    print(f"peak RSS {peak_rss:.1f} MiB", file=sys.stderr)
+    settings = {k: v for k, v in vars(args).items() if k != "output"}
+    meta = metadata("macro", settings)
+    meta["peakRssMb"] = peak_rss
+    write_report(args.output, meta, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""Micro-benchmarks for the client-side hot paths of a Clappia call.
+
+Each benchmark isolates one stage (validation, payload building, model
+serialization, response parsing, result formatting) on realistic data sizes,
+plus a full in-process call that adds them all up without any network.
+
+Usage:
+    python -m benchmarks.micro --output micro.json
+    python -m benchmarks.micro --filter validate --samples 15
+    python -m benchmarks.compare baseline.json micro.json
+"""
+
+import argparse
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks._common import metadata, print_table, quiet_logging, summarize, write_report
+from clappia_api_tools._models.model import Field, Section
+from clappia_api_tools._utils.api_utils import ClappiaAPIUtils
+from clappia_api_tools._utils.transport import InProcessTransport, TransportResponse
+from clappia_api_tools._utils.validators import ClappiaInputValidator
+from clappia_api_tools.client.app_definition_client import AppDefinitionClient
+from clappia_api_tools.client.submission_client import SubmissionClient
+
+APP_ID = "BENCHAPP1"
+EMAIL = "bench.user@example.com"
+
+Benchmark = Tuple[str, int, Callable[[], Any]]
+
+
+# -----------------------------------------------------------------------------
+# Realistic data
+# -----------------------------------------------------------------------------
+
+def emails(count: int) -> List[str]:
+    return [f"user.{i}@team{i % 37}.example.com" for i in range(count)]
+
+
+def submission_data(fields: int) -> Dict[str, Any]:
+    return {f"field{i}": f"Observed value number {i}" for i in range(fields)}
+
+
+def sections(fields: int, per_section: int = 25) -> List[Dict[str, Any]]:
+    result = []
+    for start in range(0, fields, per_section):
+        result.append({
+            "sectionName": f"Section {len(result) + 1}",
+            "fields": [
+                {"fieldType": "singleSelector", "label": f"Question {start + i}", "options": ["Yes", "No", "N/A"]}
+                for i in range(min(per_section, fields - start))
+            ],
+        })
+    return result
+
+
+def definition(fields: int) -> Dict[str, Any]:
+    """An app definition response shaped like getAppDefinition's"""
+    return {
+        "appId": APP_ID,
+        "version": 12,
+        "state": "ACTIVE",
+        "pageIds": ["page1", "page2"],
+        "sectionIds": [f"section{i}" for i in range(fields // 25 + 1)],
+        "fieldDefinitions": {
+            f"field{i}": {
+                "fieldName": f"field{i}",
+                "label": f"<b>Question {i}</b>",
+                "fieldType": "singleSelector",
+                "required": i % 3 == 0,
+                "options": [{"label": "Yes"}, {"label": "No"}, {"label": "N/A"}],
+                "displayCondition": "",
+                "tags": ["inspection", f"group{i % 10}"],
+            }
+            for i in range(fields)
+        },
+        "metadata": {"sectionName": "Benchmark App", "description": "Generated for micro-benchmarks"},
+    }
+
+
+# -----------------------------------------------------------------------------
+# Benchmarks
+# -----------------------------------------------------------------------------
+
+def build_benchmarks() -> List[Benchmark]:
+    submissions = SubmissionClient("bench-key", "https://bench.local", "BENCHWP")
+    definitions = AppDefinitionClient("bench-key", "https://bench.local", "BENCHWP")
+    utils = ClappiaAPIUtils("bench-key", "https://bench.local", "BENCHWP")
+
+    owner_list = emails(10_000)
+    data_200 = submission_data(200)
+    sections_500 = sections(500)
+    section_models = [
+        Section(s["sectionName"], [Field(f["fieldType"], f["label"], f["options"]) for f in s["fields"]])
+        for s in sections_500
+    ]
+    definition_500 = definition(500)
+    definition_body = TransportResponse.from_json(200, definition_500)
+    definition_request = definitions._prepare_get_definition(APP_ID, "en", True, True)
+    create_request = submissions._prepare_create_submission(APP_ID, submission_data(5), EMAIL)
+    in_process = AppDefinitionClient(
+        "bench-key", "https://bench.local", "BENCHWP",
+        transport=InProcessTransport(lambda request: definition_body),
+    )
+
+    return [
+        ("validate_email", 1, lambda: ClappiaInputValidator.validate_email(EMAIL)),
+        ("validate_app_id", 1, lambda: ClappiaInputValidator.validate_app_id(APP_ID)),
+        ("validate_email_list", 10_000, lambda: ClappiaInputValidator.validate_email_list(owner_list)),
+        ("validate_app_structure", 500, lambda: ClappiaInputValidator.validate_app_structure(section_models)),
+        ("prepare_create_submission", 200, lambda: submissions._prepare_create_submission(APP_ID, data_200, EMAIL)),
+        ("prepare_update_owners", 10_000,
+         lambda: submissions._prepare_update_owners(APP_ID, "SUB1", EMAIL, owner_list)),
+        ("prepare_create_app", 500, lambda: definitions._prepare_create_app("Benchmark App", EMAIL, sections_500)),
+        ("section_to_dict", 500, lambda: [section.to_dict() for section in section_models]),
+        ("encode_request_body", 200, lambda: utils.build_request("POST", "submissions/create", {"data": data_200})),
+        ("handle_response", 500, lambda: utils.handle_response(definition_body)),
+        ("format_get_definition", 500, lambda: definitions._format_get_definition(definition_request, definition_500)),
+        ("format_create_submission", 1,
+         lambda: submissions._format_create_submission(create_request, {"submissionId": "SUB1"})),
+        ("get_definition_in_process", 500, lambda: in_process.get_definition(APP_ID)),
+    ]
+
+
+def measure(fn: Callable[[], Any], samples: int, min_sample_time: float) -> Tuple[int, List[float]]:
+    """Time ``fn``: calibrate loops per sample, then return per-op seconds for each sample"""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_sample_time or loops >= 1_000_000:
+            break
+        loops *= 10 if elapsed < min_sample_time / 10 else 2
+
+    per_op = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        per_op.append((time.perf_counter() - started) / loops)
+    return loops, per_op
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.micro", description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--samples", type=int, default=7)
+    parser.add_argument("--min-sample-time", type=float, default=0.05, help="Seconds each sample should take")
+    parser.add_argument("--output", default="micro-results.json", help='JSON report path, "-" for stdout')
+    args = parser.parse_args(argv)
+
+    quiet_logging()
+    results = []
+    for name, size, fn in build_benchmarks():
+        if args.filter not in name:
+            continue
+        loops, per_op = measure(fn, args.samples, args.min_sample_time)
+        stats = summarize(per_op, scale=1_000_000)
+        results.append({
+            "benchmark": name,
+            "size": size,
+            "loops": loops,
+            "samples": args.samples,
+            "usPerOp": stats,
+            "opsPerSecond": round(1_000_000 / stats["p50"], 2) if stats["p50"] else None,
+        })
+
+    print_table(
+        [[r["benchmark"], r["size"], r["usPerOp"]["p50"], r["usPerOp"]["p99"], r["opsPerSecond"]] for r in results],
+        ["benchmark", "size", "p50_us", "p99_us", "ops/s"],
+    )
+    settings = {k: v for k, v in vars(args).items() if k != "output"}
+    write_report(args.output, metadata("micro", settings), results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
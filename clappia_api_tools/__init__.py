@@ -7,9 +7,83 @@ This package provides a unified client for interacting with Clappia APIs.
 from .client.clappia_client import ClappiaClient
 from .client.app_definition_client import AppDefinitionClient
 from .client.submission_client import SubmissionClient
+from .client.async_clappia_client import AsyncClappiaClient
+from .client.async_app_definition_client import AsyncAppDefinitionClient
+from .client.async_submission_client import AsyncSubmissionClient
+from ._utils.http_pool import PoolConfig
+from ._utils.retry import RetryConfig, RetryPolicy, RetryBudget
+from ._utils.definition_cache import DefinitionCache
+from ._utils.definition_store import DefinitionStore
+from ._utils.outbox import SubmissionOutbox, OutboxEntry
+from ._utils.idempotency import IdempotencyLedger
+from ._utils.coalescing import EditCoalescer
+from ._utils.schema_validator import SubmissionValidator, SubmissionSchema
+from ._utils.field_index import FieldIndex, FieldInfo, FieldResolver
+from ._utils.rate_limit import RateLimit, RateLimiter, FileTokenStore
+from ._utils.metrics import MetricsSink, ClientMetrics, PrometheusExporter
+from ._utils.json_codec import JsonCodec, StdlibJsonCodec, OrjsonCodec, set_default_codec
+from ._utils.raw_body import RawBodyTemplate
+from ._utils.transport import (
+    Transport,
+    AsyncTransport,
+    RequestsTransport,
+    HttpxTransport,
+    InProcessTransport,
+    AsyncInProcessTransport,
+    TransportRequest,
+    TransportResponse,
+    TransportTimeout,
+    TransportConnectionError,
+)
+from ._models.model import ClappiaResult, RawResult
 
 __version__ = "1.0.1"
-__all__ = ["ClappiaClient", "AppDefinitionClient", "SubmissionClient"]
+__all__ = [
+    "ClappiaClient",
+    "AppDefinitionClient",
+    "SubmissionClient",
+    "AsyncClappiaClient",
+    "AsyncAppDefinitionClient",
+    "AsyncSubmissionClient",
+    "PoolConfig",
+    "RetryConfig",
+    "RetryPolicy",
+    "RetryBudget",
+    "DefinitionCache",
+    "DefinitionStore",
+    "SubmissionOutbox",
+    "OutboxEntry",
+    "IdempotencyLedger",
+    "EditCoalescer",
+    "SubmissionValidator",
+    "SubmissionSchema",
+    "FieldIndex",
+    "FieldInfo",
+    "FieldResolver",
+    "RateLimit",
+    "RateLimiter",
+    "FileTokenStore",
+    "MetricsSink",
+    "ClientMetrics",
+    "PrometheusExporter",
+    "JsonCodec",
+    "StdlibJsonCodec",
+    "OrjsonCodec",
+    "set_default_codec",
+    "RawBodyTemplate",
+    "Transport",
+    "AsyncTransport",
+    "RequestsTransport",
+    "HttpxTransport",
+    "InProcessTransport",
+    "AsyncInProcessTransport",
+    "TransportRequest",
+    "TransportResponse",
+    "TransportTimeout",
+    "TransportConnectionError",
+    "ClappiaResult",
+    "RawResult",
+]
 
 
 def __dir__():
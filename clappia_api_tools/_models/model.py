@@ -1,19 +1,73 @@
+import json
 import os
-from dataclasses import dataclass
-from typing import List, Optional
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Pattern
+
+# addField/updateField properties a Field can set, in the API's naming
+FIELD_PROPERTIES = (
+    "label",
+    "description",
+    "required",
+    "blockWidthPercentageDesktop",
+    "blockWidthPercentageMobile",
+    "displayCondition",
+    "retainValues",
+    "isEditable",
+    "editabilityCondition",
+    "validation",
+    "defaultValue",
+    "options",
+    "style",
+    "numberOfCols",
+    "allowedFileTypes",
+    "maxFileAllowed",
+    "imageQuality",
+    "imageText",
+    "fileNamePrefix",
+    "formula",
+    "hidden",
+)
+
 
 @dataclass
 class Field:
-    """Field model for creating an app"""
-    """
-    fieldType: str
-    label: str
-    options: Optional[List[str]] = None
+    """Field model for creating an app.
+
+    Attributes:
+        fieldType: Type of the field, e.g. ``singleLineText``.
+        label: Label shown for the field.
+        options: Choices of selector fields.
+        fieldName: Existing field a migration spec refers to; None for new fields.
+        description, required, ..., hidden: Optional addField/updateField properties
+            (see FIELD_PROPERTIES); None leaves them unset.
     """
 
     fieldType: str
     label: str
     options: Optional[List[str]] = None
+    fieldName: Optional[str] = None
+    description: Optional[str] = None
+    required: Optional[bool] = None
+    blockWidthPercentageDesktop: Optional[int] = None
+    blockWidthPercentageMobile: Optional[int] = None
+    displayCondition: Optional[str] = None
+    retainValues: Optional[bool] = None
+    isEditable: Optional[bool] = None
+    editabilityCondition: Optional[str] = None
+    validation: Optional[str] = None
+    defaultValue: Optional[str] = None
+    style: Optional[str] = None
+    numberOfCols: Optional[int] = None
+    allowedFileTypes: Optional[List[str]] = None
+    maxFileAllowed: Optional[int] = None
+    imageQuality: Optional[str] = None
+    imageText: Optional[str] = None
+    fileNamePrefix: Optional[str] = None
+    formula: Optional[str] = None
+    hidden: Optional[bool] = None
+
     def to_dict(self) -> dict:
         result = {
             "fieldType": self.fieldType,
@@ -23,6 +77,15 @@ class Field:
             result["options"] = self.options
         return result
 
+    def properties(self) -> Dict[str, Any]:
+        """addField/updateField properties that are set, keyed as in the API"""
+        return {name: getattr(self, name) for name in FIELD_PROPERTIES if getattr(self, name) is not None}
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> "Field":
+        known = {name: spec[name] for name in cls.__dataclass_fields__ if name in spec}
+        return cls(**known)
+
 @dataclass
 class Section:
     """Section model for creating an app"""
@@ -37,4 +100,130 @@ class Section:
         return {
             "sectionName": self.sectionName,
             "fields": [field.to_dict() for field in self.fields]
-        }
\ No newline at end of file
+        }
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> "Section":
+        return cls(sectionName=spec["sectionName"], fields=[Field.from_dict(f) for f in spec.get("fields", [])])
+
+_STATUS_CODE_PATTERN = re.compile(r"^(?:API Error|Unexpected API response) \((\d{3})\)")
+
+
+@dataclass
+class ClappiaResult:
+    """Structured outcome of a client call.
+
+    Returned by clients created with ``structured_results=True``. The human-readable
+    text returned by the string API is only rendered when ``text`` (or ``str()``)
+    is first used, so programmatic callers never pay for pretty-printing.
+
+    Attributes:
+        success: Whether the call succeeded.
+        data: Parsed API response (or the per-record results of a bulk call).
+        error: Error message without the "Error: " prefix.
+        error_code: One of ERROR_CODES when the call failed.
+        status_code: HTTP status of a failed API response, when known.
+        elapsed: Seconds spent on the call, including retries.
+    """
+
+    success: bool
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    error_code: Optional[str] = None
+    status_code: Optional[int] = None
+    elapsed: float = 0.0
+    renderer: Optional[Callable[[], str]] = field(default=None, repr=False, compare=False)
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    ERROR_CODES = (
+        "validation_error",
+        "configuration_error",
+        "timeout",
+        "connection_error",
+        "rate_limited",
+        "api_error",
+        "partial_failure",
+        "unexpected_error",
+    )
+
+    @classmethod
+    def from_error(cls, message: str, elapsed: float = 0.0, error_code: Optional[str] = None) -> "ClappiaResult":
+        """Build a failed result from an error message, classifying it"""
+        if message.startswith("Error: "):
+            message = message[len("Error: "):]
+        status_code = None
+        match = _STATUS_CODE_PATTERN.match(message)
+        if error_code is None:
+            if match or message.startswith(("API Error", "Unexpected API response")):
+                error_code = "api_error"
+            elif message.startswith("Request timeout"):
+                error_code = "timeout"
+            elif message.startswith("Connection error"):
+                error_code = "connection_error"
+            elif message.startswith("Rate limit exceeded"):
+                error_code = "rate_limited"
+            elif message.startswith("Configuration error") or message.endswith("is not configured"):
+                error_code = "configuration_error"
+            elif message.startswith("Unexpected error"):
+                error_code = "unexpected_error"
+            else:
+                error_code = "validation_error"
+        if match:
+            status_code = int(match.group(1))
+        return cls(success=False, error=message, error_code=error_code, status_code=status_code, elapsed=elapsed)
+
+    @property
+    def text(self) -> str:
+        """Formatted text identical to what the string API returns"""
+        if self._text is None:
+            if self.renderer is not None:
+                self._text = self.renderer()
+            elif self.success:
+                self._text = "Success"
+            else:
+                self._text = f"Error: {self.error}"
+        return self._text
+
+    def __str__(self) -> str:
+        return self.text
+
+
+# A JSON scalar: string (with escapes), number, true, false or null
+_SCALAR = rb'("(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null)'
+
+
+@lru_cache(maxsize=64)
+def _field_pattern(key: str) -> Pattern[bytes]:
+    return re.compile(rb'"' + re.escape(key.encode("utf-8")) + rb'"\s*:\s*' + _SCALAR)
+
+
+@dataclass
+class RawResult(ClappiaResult):
+    """Outcome of a raw call: the response body as received, not parsed.
+
+    ``extract`` pulls single scalar values such as ``submissionId`` out of the body
+    without decoding the rest of it; ``json`` decodes the whole body when needed.
+
+    Attributes:
+        content: Response body of a successful call.
+    """
+
+    content: bytes = b""
+    decoder: Optional[Callable[[bytes], Any]] = field(default=None, repr=False, compare=False)
+
+    def extract(self, key: str, default: Any = None) -> Any:
+        """Value of the first ``"key": <scalar>`` pair in the body.
+
+        Only strings, numbers, booleans and null are found. The first occurrence wins,
+        wherever it is nested, so use it for keys that are unique in the response.
+        """
+        match = _field_pattern(key).search(self.content)
+        if match is None:
+            return default
+        return json.loads(match.group(1))
+
+    def json(self) -> Any:
+        """Decode the whole body"""
+        if not self.content:
+            return None
+        return self.decoder(self.content) if self.decoder is not None else json.loads(self.content)
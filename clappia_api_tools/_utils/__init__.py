@@ -2,4 +2,30 @@ __all__ = []
 
 from .logging_utils import get_logger
 from .validators import ClappiaInputValidator
+from .http_pool import PoolConfig, SessionPool, get_shared_pool
+from .retry import RetryConfig, RetryPolicy, RetryBudget
+from .definition_cache import DefinitionCache
+from .definition_store import DefinitionStore
+from .outbox import SubmissionOutbox, OutboxEntry
+from .idempotency import IdempotencyLedger
+from .coalescing import EditCoalescer
+from .schema_validator import SubmissionValidator, SubmissionSchema
+from .field_index import FieldIndex, FieldInfo, FieldResolver
+from .rate_limit import RateLimit, RateLimiter, MemoryTokenStore, FileTokenStore
+from .metrics import MetricsSink, ClientMetrics, PrometheusExporter
+from .json_codec import JsonCodec, StdlibJsonCodec, OrjsonCodec, get_default_codec, set_default_codec
+from .raw_body import RawBodyTemplate, check_raw_object
+from .transport import (
+    Transport,
+    AsyncTransport,
+    RequestsTransport,
+    HttpxTransport,
+    InProcessTransport,
+    AsyncInProcessTransport,
+    TransportRequest,
+    TransportResponse,
+    TransportError,
+    TransportTimeout,
+    TransportConnectionError,
+)
 from .api_utils import ClappiaAPIUtils
\ No newline at end of file
@@ -1,14 +1,41 @@
 import os
-import json
+import time
 import requests
-from typing import Optional, Dict, Any, Tuple
-from clappia_api_tools._utils.logging_utils import get_logger
+from functools import partial
+from typing import Hashable, Optional, Dict, Any, Tuple, Union
+from clappia_api_tools._utils.logging_utils import BodyPreview, get_logger
+from clappia_api_tools._utils.http_pool import PoolConfig
+from clappia_api_tools._utils.json_codec import JsonCodec, get_default_codec
+from clappia_api_tools._utils.retry import EndpointClass, RetryConfig, classify_endpoint, next_retry_delay
+from clappia_api_tools._utils.rate_limit import RateLimiter
+from clappia_api_tools._utils.singleflight import SingleFlight
+from clappia_api_tools._utils.metrics import (
+    CONNECTION_ERROR,
+    RATE_LIMITED,
+    TIMEOUT,
+    UNEXPECTED_ERROR,
+    MetricsSink,
+)
+from clappia_api_tools._utils.transport import (
+    RequestsTransport,
+    Transport,
+    TransportConnectionError,
+    TransportRequest,
+    TransportResponse,
+    TransportTimeout,
+)
 
 logger = get_logger(__name__)
 
+# (success, error_message, body, etag); body is None when the server answered 304 Not Modified
+ConditionalResult = Tuple[bool, Optional[str], Optional[bytes], Optional[str]]
 
-class ClappiaAPIUtils:
-    """Utilities for Clappia API interactions"""
+# Shared by every client in the process, so identical reads from separate clients also collapse
+_read_flight = SingleFlight()
+
+
+class BaseClappiaAPIUtils:
+    """Configuration, headers and response handling shared by the sync and async API utilities"""
 
     def __init__(
         self,
@@ -16,6 +43,12 @@ class ClappiaAPIUtils:
         base_url: str,
         workplace_id: str,
         timeout: int = 30,
+        pool_config: Optional[PoolConfig] = None,
+        retry_config: Optional[RetryConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        metrics: Optional[MetricsSink] = None,
+        json_codec: Optional[JsonCodec] = None,
+        dedupe_reads: bool = True,
     ):
         """
         Initialize API utilities with configurable parameters
@@ -25,11 +58,28 @@ class ClappiaAPIUtils:
             base_url: API base URL
             workplace_id: Workplace ID
             timeout: Request timeout in seconds
+            pool_config: Connection pool settings. Clients created with the same
+                base_url and pool_config share one pooled keep-alive session.
+            retry_config: Retry policies per endpoint class. Defaults to retrying reads
+                on transient failures and mutations only when the server rejected them.
+            rate_limiter: Client-side token bucket limiter consulted before every
+                attempt, including retries. None (default) disables pacing.
+            metrics: Sink told about every attempt and retry. None (default) records nothing.
+            json_codec: Encodes request bodies and decodes responses. Defaults to orjson
+                when installed, else the standard library.
+            dedupe_reads: Let concurrent identical reads (same request and credentials)
+                share one call, including its retries, instead of each going to the network.
         """
         self.api_key = api_key
         self.base_url = base_url
         self.workplace_id = workplace_id
         self.timeout = timeout
+        self.pool_config = pool_config or PoolConfig()
+        self.retry_config = retry_config or RetryConfig()
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+        self.json_codec = json_codec or get_default_codec()
+        self.dedupe_reads = dedupe_reads
 
     def validate_environment(self) -> Tuple[bool, str]:
         """Validate that required configuration is available"""
@@ -58,8 +108,110 @@ class ClappiaAPIUtils:
             "workplaceId": self.workplace_id,
         }
 
+    def build_url(self, endpoint: str) -> str:
+        """Join the configured base URL and an endpoint path"""
+        return f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
+    def _retry_delay(
+        self,
+        method: str,
+        endpoint: str,
+        attempt: int,
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None,
+        request_sent: bool = True,
+    ) -> Optional[float]:
+        """Seconds to wait before retrying a failed attempt, or None to give up"""
+        delay = next_retry_delay(
+            self.retry_config,
+            classify_endpoint(method, endpoint),
+            attempt,
+            status_code=status_code,
+            retry_after=retry_after,
+            request_sent=request_sent,
+        )
+        if delay is not None:
+            reason = f"status {status_code}" if status_code is not None else "connection failure"
+            if self.metrics is not None:
+                self.metrics.observe_retry(endpoint, str(status_code) if status_code is not None else "network")
+            logger.warning(
+                "Retrying %s %s in %.2fs (attempt %d) after %s", method, endpoint, delay, attempt + 1, reason
+            )
+        return delay
+
+    def build_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> TransportRequest:
+        """Encode an API call into the request handed to the transport"""
+        if data:
+            logger.debug("Request data: %s", BodyPreview(data))
+        body = self.json_codec.encode(data) if data is not None else None
+        return self.build_raw_request(method, endpoint, body, params)
+
+    def build_raw_request(
+        self,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> TransportRequest:
+        """Wrap an already encoded JSON body into the request handed to the transport"""
+        url = self.build_url(endpoint)
+        logger.info("Making %s request to %s", method, url)
+        return TransportRequest(
+            method=method,
+            url=url,
+            headers={**self.get_headers(), **headers} if headers else self.get_headers(),
+            params=params,
+            body=body,
+            timeout=self.timeout,
+        )
+
+    def _flight_key(self, method: str, endpoint: str, request: TransportRequest) -> Optional[Hashable]:
+        """Key identical concurrent reads share a call under, or None when the request must go out itself"""
+        if not self.dedupe_reads or classify_endpoint(method, endpoint) is not EndpointClass.READ:
+            return None
+        params = tuple(sorted((name, str(value)) for name, value in (request.params or {}).items()))
+        # Headers carry the credentials and any If-None-Match validator
+        headers = tuple(sorted(request.headers.items()))
+        return (request.method.upper(), request.url, params, request.body, headers)
+
+    def _rate_limit_error(self, endpoint: str) -> str:
+        if self.metrics is not None:
+            self.metrics.observe_request(endpoint, None, RATE_LIMITED, None, 0, 0)
+        return f"Rate limit exceeded - no request slot available for {endpoint}"
+
+    def _observe(
+        self,
+        endpoint: str,
+        request: TransportRequest,
+        started: float,
+        response: Any = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Report one attempt to the metrics sink"""
+        if self.metrics is None:
+            return
+        self.metrics.observe_request(
+            endpoint,
+            response.status_code if response is not None else None,
+            error,
+            time.perf_counter() - started,
+            len(request.body) if request.body else 0,
+            len(response.content) if response is not None else 0,
+        )
+
+    def _record_request(self) -> None:
+        if self.retry_config.budget is not None:
+            self.retry_config.budget.record_request()
+
     def handle_response(
-        self, response: requests.Response
+        self, response: Any
     ) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
         """
         Handle API response and return structured result
@@ -69,25 +221,79 @@ class ClappiaAPIUtils:
         """
         if response.status_code == 200:
             try:
-                return True, None, response.json()
-            except json.JSONDecodeError:
-                logger.warning(f"Valid response but invalid JSON: {response.text}")
+                return True, None, self.json_codec.decode(response.content)
+            except ValueError:
+                logger.warning("Valid response but invalid JSON: %s", BodyPreview(response))
                 return True, None, {"raw_response": response.text}
 
         error_message = self._format_error_message(response)
         return False, error_message, None
 
-    def _format_error_message(self, response: requests.Response) -> str:
+    def handle_raw_response(self, response: Any) -> Tuple[bool, Optional[str], Optional[bytes]]:
+        """Like handle_response, but returns the undecoded body of a successful response"""
+        if response.status_code == 200:
+            return True, None, response.content
+        return False, self._format_error_message(response), None
+
+    def handle_conditional_response(self, response: Any) -> ConditionalResult:
+        """Like handle_raw_response, but also accepts 304 Not Modified and returns the ETag"""
+        if response.status_code == 304:
+            return True, None, None, response.headers.get("ETag")
+        if response.status_code == 200:
+            return True, None, response.content, response.headers.get("ETag")
+        return False, self._format_error_message(response), None, None
+
+    def _format_error_message(self, response: Any) -> str:
         """Format error message from API response"""
         if response.status_code in [400, 401, 403, 404]:
             try:
-                error_data = response.json()
-                return f"API Error ({response.status_code}): {json.dumps(error_data, indent=2)}"
-            except json.JSONDecodeError:
+                error_data = self.json_codec.decode(response.content)
+                return f"API Error ({response.status_code}): {self.json_codec.pretty(error_data)}"
+            except ValueError:
                 return f"API Error ({response.status_code}): {response.text}"
         else:
             return f"Unexpected API response ({response.status_code}): {response.text}"
 
+
+class ClappiaAPIUtils(BaseClappiaAPIUtils):
+    """Utilities for Clappia API interactions"""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        workplace_id: str,
+        timeout: int = 30,
+        pool_config: Optional[PoolConfig] = None,
+        retry_config: Optional[RetryConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[Transport] = None,
+        metrics: Optional[MetricsSink] = None,
+        json_codec: Optional[JsonCodec] = None,
+        dedupe_reads: bool = True,
+    ):
+        """
+        Args:
+            transport: Sends the HTTP requests. Defaults to a RequestsTransport using
+                the session shared by every client with the same base_url and pool config.
+        """
+        super().__init__(
+            api_key, base_url, workplace_id, timeout, pool_config, retry_config, rate_limiter, metrics, json_codec,
+            dedupe_reads,
+        )
+        self.transport = transport or RequestsTransport(self.base_url or "", self.pool_config)
+        if metrics is not None:
+            metrics.watch_pool(self.transport)
+
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """Pooled session of the default transport, None for other transports"""
+        return getattr(self.transport, "session", None)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Return connection pool statistics for this client's transport"""
+        return self.transport.stats()
+
     def make_request(
         self,
         method: str,
@@ -111,31 +317,129 @@ class ClappiaAPIUtils:
         if not env_valid:
             return False, f"Configuration error: {env_error}", None
 
-        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-        headers = self.get_headers()
-
         try:
-            logger.info(f"Making {method} request to {url}")
-            if data:
-                logger.debug(f"Request data: {json.dumps(data, indent=2)}")
-
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=data,
-                params=params,
-                timeout=self.timeout,
-            )
+            request = self.build_request(method, endpoint, data, params)
+        except Exception as e:
+            return False, f"Unexpected error: {str(e)}", None
 
-            logger.info(f"Response status: {response.status_code}")
-            logger.debug(f"Response body: {response.text}")
+        response = self._send_with_retries(method, endpoint, request)
+        if isinstance(response, str):
+            return False, response, None
+        return self.handle_response(response)
 
-            return self.handle_response(response)
+    def make_raw_request(
+        self,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[bool, Optional[str], Optional[bytes]]:
+        """
+        Make HTTP request with a pre-encoded JSON body, without decoding the response
 
-        except requests.exceptions.Timeout:
-            return False, f"Request timeout after {self.timeout} seconds", None
-        except requests.exceptions.ConnectionError:
-            return False, "Connection error - unable to reach Clappia API", None
-        except Exception as e:
-            return False, f"Unexpected error: {str(e)}", None
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (will be appended to base_url)
+            body: Encoded JSON request body, sent as is
+            params: Query parameters (for GET requests)
+
+        Returns:
+            Tuple of (success: bool, error_message: str, response_body: bytes)
+        """
+        env_valid, env_error = self.validate_environment()
+        if not env_valid:
+            return False, f"Configuration error: {env_error}", None
+
+        request = self.build_raw_request(method, endpoint, body, params)
+        response = self._send_with_retries(method, endpoint, request)
+        if isinstance(response, str):
+            return False, response, None
+        return self.handle_raw_response(response)
+
+    def make_conditional_request(
+        self,
+        method: str,
+        endpoint: str,
+        etag: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> ConditionalResult:
+        """
+        Make a read that the server may answer with 304 Not Modified
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (will be appended to base_url)
+            etag: ETag of the copy the caller holds, sent as If-None-Match
+            params: Query parameters (for GET requests)
+
+        Returns:
+            Tuple of (success: bool, error_message: str, response_body: bytes, etag: str);
+            response_body is None when the held copy is still current
+        """
+        env_valid, env_error = self.validate_environment()
+        if not env_valid:
+            return False, f"Configuration error: {env_error}", None, None
+
+        request = self.build_raw_request(method, endpoint, params=params,
+                                         headers={"If-None-Match": etag} if etag else None)
+        response = self._send_with_retries(method, endpoint, request)
+        if isinstance(response, str):
+            return False, response, None, None
+        return self.handle_conditional_response(response)
+
+    def _send_with_retries(
+        self, method: str, endpoint: str, request: TransportRequest
+    ) -> Union[TransportResponse, str]:
+        """Send a request, pacing and retrying it; returns the final response or an error message"""
+        key = self._flight_key(method, endpoint, request)
+        if key is None:
+            return self._send_attempts(method, endpoint, request)
+        return _read_flight.do(key, partial(self._send_attempts, method, endpoint, request))
+
+    def _send_attempts(
+        self, method: str, endpoint: str, request: TransportRequest
+    ) -> Union[TransportResponse, str]:
+        self._record_request()
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None and not self.rate_limiter.acquire(self.workplace_id, endpoint):
+                return self._rate_limit_error(endpoint)
+            started = time.perf_counter()
+            try:
+                response = self.transport.send(request)
+            except TransportTimeout as e:
+                self._observe(endpoint, request, started, error=TIMEOUT)
+                failure = f"Request timeout after {self.timeout} seconds"
+                request_sent = e.request_sent
+            except TransportConnectionError as e:
+                self._observe(endpoint, request, started, error=CONNECTION_ERROR)
+                failure = "Connection error - unable to reach Clappia API"
+                request_sent = e.request_sent
+            except Exception as e:
+                self._observe(endpoint, request, started, error=UNEXPECTED_ERROR)
+                return f"Unexpected error: {str(e)}"
+            else:
+                self._observe(endpoint, request, started, response)
+                logger.info("Response status: %s", response.status_code)
+                logger.debug("Response body: %s", BodyPreview(response))
+
+                if response.status_code == 200:
+                    return response
+                delay = self._retry_delay(
+                    method,
+                    endpoint,
+                    attempt,
+                    status_code=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            delay = self._retry_delay(method, endpoint, attempt, request_sent=request_sent)
+            if delay is None:
+                return failure
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,193 @@
+import asyncio
+import time
+from functools import partial
+from typing import Optional, Dict, Any, Tuple, Union
+from clappia_api_tools._utils.logging_utils import BodyPreview, get_logger
+from clappia_api_tools._utils.http_pool import PoolConfig
+from clappia_api_tools._utils.json_codec import JsonCodec
+from clappia_api_tools._utils.api_utils import BaseClappiaAPIUtils, ConditionalResult
+from clappia_api_tools._utils.retry import RetryConfig
+from clappia_api_tools._utils.rate_limit import RateLimiter
+from clappia_api_tools._utils.singleflight import AsyncSingleFlight
+from clappia_api_tools._utils.metrics import CONNECTION_ERROR, TIMEOUT, UNEXPECTED_ERROR, MetricsSink
+from clappia_api_tools._utils.transport import (
+    AsyncTransport,
+    HttpxTransport,
+    TransportConnectionError,
+    TransportRequest,
+    TransportResponse,
+    TransportTimeout,
+)
+
+logger = get_logger(__name__)
+
+# Keys include the running loop, so only coroutines on the same loop share a call
+_read_flight = AsyncSingleFlight()
+
+
+class AsyncClappiaAPIUtils(BaseClappiaAPIUtils):
+    """Non-blocking utilities for Clappia API interactions.
+
+    By default requests go through one pooled ``httpx.AsyncClient`` per instance,
+    so a single event loop can keep many calls in flight over reused keep-alive
+    connections. The default transport requires the ``async`` extra
+    (``pip install clappia-api-tools[async]``).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        workplace_id: str,
+        timeout: int = 30,
+        pool_config: Optional[PoolConfig] = None,
+        retry_config: Optional[RetryConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[AsyncTransport] = None,
+        metrics: Optional[MetricsSink] = None,
+        json_codec: Optional[JsonCodec] = None,
+        dedupe_reads: bool = True,
+    ):
+        super().__init__(
+            api_key, base_url, workplace_id, timeout, pool_config, retry_config, rate_limiter, metrics, json_codec,
+            dedupe_reads,
+        )
+        self.transport = transport or HttpxTransport(self.pool_config)
+        if metrics is not None:
+            metrics.watch_pool(self.transport)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Return connection statistics for this client's transport"""
+        return self.transport.stats()
+
+    async def aclose(self) -> None:
+        """Close the transport and its connections"""
+        await self.transport.aclose()
+
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Make non-blocking HTTP request to Clappia API
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (will be appended to base_url)
+            data: Request body data (for POST/PUT requests)
+            params: Query parameters (for GET requests)
+
+        Returns:
+            Tuple of (success: bool, error_message: str, response_data: dict)
+        """
+        env_valid, env_error = self.validate_environment()
+        if not env_valid:
+            return False, f"Configuration error: {env_error}", None
+
+        try:
+            request = self.build_request(method, endpoint, data, params)
+        except Exception as e:
+            return False, f"Unexpected error: {str(e)}", None
+
+        response = await self._send_with_retries(method, endpoint, request)
+        if isinstance(response, str):
+            return False, response, None
+        return self.handle_response(response)
+
+    async def make_raw_request(
+        self,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[bool, Optional[str], Optional[bytes]]:
+        """Non-blocking counterpart of ClappiaAPIUtils.make_raw_request"""
+        env_valid, env_error = self.validate_environment()
+        if not env_valid:
+            return False, f"Configuration error: {env_error}", None
+
+        request = self.build_raw_request(method, endpoint, body, params)
+        response = await self._send_with_retries(method, endpoint, request)
+        if isinstance(response, str):
+            return False, response, None
+        return self.handle_raw_response(response)
+
+    async def make_conditional_request(
+        self,
+        method: str,
+        endpoint: str,
+        etag: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> ConditionalResult:
+        """Non-blocking counterpart of ClappiaAPIUtils.make_conditional_request"""
+        env_valid, env_error = self.validate_environment()
+        if not env_valid:
+            return False, f"Configuration error: {env_error}", None, None
+
+        request = self.build_raw_request(method, endpoint, params=params,
+                                         headers={"If-None-Match": etag} if etag else None)
+        response = await self._send_with_retries(method, endpoint, request)
+        if isinstance(response, str):
+            return False, response, None, None
+        return self.handle_conditional_response(response)
+
+    async def _send_with_retries(
+        self, method: str, endpoint: str, request: TransportRequest
+    ) -> Union[TransportResponse, str]:
+        """Send a request, pacing and retrying it; returns the final response or an error message"""
+        key = self._flight_key(method, endpoint, request)
+        if key is None:
+            return await self._send_attempts(method, endpoint, request)
+        key = (asyncio.get_running_loop(), key)
+        return await _read_flight.do(key, partial(self._send_attempts, method, endpoint, request))
+
+    async def _send_attempts(
+        self, method: str, endpoint: str, request: TransportRequest
+    ) -> Union[TransportResponse, str]:
+        self._record_request()
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None and not await self.rate_limiter.aacquire(self.workplace_id, endpoint):
+                return self._rate_limit_error(endpoint)
+            started = time.perf_counter()
+            try:
+                response = await self.transport.send(request)
+            except TransportTimeout as e:
+                self._observe(endpoint, request, started, error=TIMEOUT)
+                failure = f"Request timeout after {self.timeout} seconds"
+                request_sent = e.request_sent
+            except TransportConnectionError as e:
+                self._observe(endpoint, request, started, error=CONNECTION_ERROR)
+                failure = "Connection error - unable to reach Clappia API"
+                request_sent = e.request_sent
+            except Exception as e:
+                self._observe(endpoint, request, started, error=UNEXPECTED_ERROR)
+                return f"Unexpected error: {str(e)}"
+            else:
+                self._observe(endpoint, request, started, response)
+                logger.info("Response status: %s", response.status_code)
+                logger.debug("Response body: %s", BodyPreview(response))
+
+                if response.status_code == 200:
+                    return response
+                delay = self._retry_delay(
+                    method,
+                    endpoint,
+                    attempt,
+                    status_code=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            delay = self._retry_delay(method, endpoint, attempt, request_sent=request_sent)
+            if delay is None:
+                return failure
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -0,0 +1,186 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from clappia_api_tools._utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+EditKey = Tuple[str, str, str]
+EditSender = Callable[[Dict[str, Any]], Any]
+
+
+class _Batch:
+    __slots__ = ("payload", "futures", "deadline")
+
+    def __init__(self, payload: Dict[str, Any], deadline: float):
+        self.payload = {**payload, "data": dict(payload["data"])}
+        self.futures: List[Future] = []
+        self.deadline = deadline
+
+
+class EditCoalescer:
+    """Merges edits of the same submission into one ``submissions/edit`` request.
+
+    Edits are buffered per (app, submission, requesting user). A buffer is sent when
+    ``window`` seconds passed since its first edit or when it holds ``max_edits``
+    edits, with the data of all its edits merged in call order (the last write of a
+    field wins). Every caller gets a Future that resolves with the shared outcome.
+
+    Only one request per submission is in flight at a time, so a later batch never
+    overtakes an earlier one.
+
+    Usage:
+        coalescer = EditCoalescer(window=0.05)
+        client = ClappiaClient(edit_coalescer=coalescer)
+        futures = [client.edit_submission_coalesced("MFX093412", "HGO51464561", {f: v}, email) for f, v in changes]
+        results = [f.result() for f in futures]
+    """
+
+    def __init__(self, window: float = 0.05, max_edits: int = 100, max_workers: int = 4):
+        """
+        Args:
+            window: Seconds to wait for more edits after the first edit of a submission.
+            max_edits: Number of buffered edits of one submission that triggers an
+                immediate send.
+            max_workers: Maximum number of merged requests in flight at once.
+        """
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if max_edits < 1:
+            raise ValueError("max_edits must be at least 1")
+        self.window = window
+        self.max_edits = max_edits
+        self.max_workers = max_workers
+        self._pending: Dict[EditKey, _Batch] = {}
+        self._inflight: Set[EditKey] = set()
+        self._condition = threading.Condition()
+        self._sender: Optional[EditSender] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = False
+        self._edits = 0
+        self._requests = 0
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> EditKey:
+        return (payload["appId"], payload["submissionId"], payload["requestingUserEmailAddress"])
+
+    def start(self, sender: EditSender) -> None:
+        """Start the flusher, sending merged edit payloads through ``sender``.
+
+        Args:
+            sender: Function taking the merged ``submissions/edit`` payload; its return
+                value (or exception) becomes the outcome of every merged edit. Calling
+                start again while running keeps the first sender.
+        """
+        with self._condition:
+            if self._flusher is not None:
+                return
+            self._sender = sender
+            self._closed = False
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="clappia-edit")
+            self._flusher = threading.Thread(target=self._run, name="clappia-edit-flusher", daemon=True)
+            self._flusher.start()
+
+    def submit(self, payload: Dict[str, Any]) -> Future:
+        """Buffer one edit payload and return a Future for its outcome"""
+        future: Future = Future()
+        key = self.make_key(payload)
+        with self._condition:
+            if self._closed or self._flusher is None:
+                raise RuntimeError("EditCoalescer is not running")
+            batch = self._pending.get(key)
+            if batch is None:
+                batch = _Batch(payload, time.monotonic() + self.window)
+                self._pending[key] = batch
+            else:
+                batch.payload["data"].update(payload["data"])
+            batch.futures.append(future)
+            self._edits += 1
+            if len(batch.futures) >= self.max_edits:
+                batch.deadline = 0.0
+            self._condition.notify_all()
+        return future
+
+    def _run(self) -> None:
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                due = [
+                    key for key, batch in self._pending.items()
+                    if key not in self._inflight and (batch.deadline <= now or self._closed)
+                ]
+                for key in due:
+                    self._dispatch(key, self._pending.pop(key))
+                if self._closed and not self._pending and not self._inflight:
+                    return
+                waiting = [b.deadline for k, b in self._pending.items() if k not in self._inflight]
+                timeout = max(0.0, min(waiting) - now) if waiting else None
+                self._condition.wait(timeout)
+
+    def _dispatch(self, key: EditKey, batch: _Batch) -> None:
+        # Called with the condition held
+        self._inflight.add(key)
+        self._requests += 1
+        logger.debug("Sending %d coalesced edits of submission %s", len(batch.futures), key[1])
+        self._executor.submit(self._send, key, batch)
+
+    def _send(self, key: EditKey, batch: _Batch) -> None:
+        try:
+            outcome = self._sender(batch.payload)
+        except BaseException as e:
+            for future in batch.futures:
+                future.set_exception(e)
+        else:
+            for future in batch.futures:
+                future.set_result(outcome)
+        finally:
+            with self._condition:
+                self._inflight.discard(key)
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send every buffered edit now and wait for the outcomes.
+
+        Returns False if ``timeout`` seconds passed first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            for batch in self._pending.values():
+                batch.deadline = 0.0
+            self._condition.notify_all()
+            while self._pending or self._inflight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        """Send buffered edits, wait for them and stop the flusher"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            flusher.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "edits": self._edits,
+                "requests": self._requests,
+                "pending": sum(len(b.futures) for b in self._pending.values()),
+                "inflight": len(self._inflight),
+            }
+
+    def __enter__(self) -> "EditCoalescer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,320 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from clappia_api_tools._utils.api_utils import ConditionalResult
+from clappia_api_tools._utils.definition_store import DefinitionKey, DefinitionStore, StoredDefinition
+from clappia_api_tools._utils.definition_variants import derive_variant
+from clappia_api_tools._utils.singleflight import AsyncSingleFlight, SingleFlight
+
+RequestResult = Tuple[bool, Optional[str], Optional[Dict[str, Any]]]
+# Sends the definition request with If-None-Match set to the given ETag, if any
+Fetcher = Callable[[Optional[str]], ConditionalResult]
+AsyncFetcher = Callable[[Optional[str]], Awaitable[ConditionalResult]]
+Compiled = TypeVar("Compiled")
+
+
+class DefinitionCache:
+    """Bounded TTL + LRU cache for ``getAppDefinition`` responses.
+
+    Entries are keyed by (app_id, language, strip_html, include_tags). Only successful
+    responses are cached. Concurrent misses for the same key share one load, and
+    invalidating an app discards entries as well as loads that were already in flight,
+    so a schema written by this process is never served stale afterwards.
+
+    With a DefinitionStore the cache sits on top of an on-disk layer shared with other
+    processes. Misses are served from disk while the stored copy is younger than
+    ``ttl``; older copies are revalidated with a conditional request, and only a
+    changed definition is downloaded again.
+
+    Clients read definitions through ``get_variant``. With ``derive_variants`` only the
+    canonical variant (with HTML and tags) of each app and language is fetched and
+    cached; stripped and tag-less variants are derived from it on first use and kept
+    alongside it, sharing every unchanged part. Local stripping only touches display
+    text (see DISPLAY_TEXT_KEYS), so it is opt-in.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0, store: Optional[DefinitionStore] = None,
+                 derive_variants: bool = False):
+        """
+        Args:
+            max_entries: Maximum number of definitions kept; least recently used are evicted.
+            ttl: Seconds an entry stays fresh, in memory and on disk. 0 or less disables expiry.
+            store: On-disk layer shared between processes. None (default) keeps
+                definitions in this process only.
+            derive_variants: Derive strip_html and include_tags variants locally from one
+                canonical fetch. False (default) fetches and caches every variant separately.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.store = store
+        self.derive_variants = derive_variants
+        self._entries: "OrderedDict[DefinitionKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Derived variants per canonical key, valid while that entry holds the same object
+        self._variants: Dict[DefinitionKey, Tuple[Dict[str, Any], Dict[DefinitionKey, Any]]] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self._async_flight = AsyncSingleFlight()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._loads = 0
+        self._disk_hits = 0
+        self._revalidations = 0
+        self._derivations = 0
+
+    @staticmethod
+    def make_key(app_id: str, language: str, strip_html: bool, include_tags: bool) -> DefinitionKey:
+        return (app_id.strip(), language, bool(strip_html), bool(include_tags))
+
+    def canonical_key(self, key: DefinitionKey) -> DefinitionKey:
+        """Key of the variant fetched to serve ``key``"""
+        return (key[0], key[1], False, True) if self.derive_variants else key
+
+    def get(self, key: DefinitionKey) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached definition, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            stored_at, value = entry
+            if self.ttl > 0 and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self._variants.pop(key, None)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: DefinitionKey, value: Dict[str, Any], generation: Optional[int] = None) -> None:
+        """Store a definition, unless its app was invalidated after ``generation`` was read"""
+        with self._lock:
+            if generation is not None and self._generations.get(key[0], 0) != generation:
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._variants.pop(evicted, None)
+                self._evictions += 1
+
+    def generation(self, app_id: str) -> int:
+        with self._lock:
+            return self._generations.get(app_id.strip(), 0)
+
+    def invalidate_app(self, app_id: str) -> int:
+        """Drop every cached variant of an app; returns the number of entries removed"""
+        app_id = app_id.strip()
+        with self._lock:
+            self._generations[app_id] = self._generations.get(app_id, 0) + 1
+            stale = [key for key in self._entries if key[0] == app_id]
+            for key in stale:
+                del self._entries[key]
+                self._variants.pop(key, None)
+            self._invalidations += 1
+        if self.store is not None:
+            self.store.invalidate_app(app_id)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            for app_id in {key[0] for key in self._entries}:
+                self._generations[app_id] = self._generations.get(app_id, 0) + 1
+            self._entries.clear()
+            self._variants.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def get_or_load(self, key: DefinitionKey, loader: Callable[[], RequestResult],
+                    fetch: Optional[Fetcher] = None) -> RequestResult:
+        """Return a cached definition or run ``loader`` once for all concurrent callers.
+
+        With a store, ``fetch`` is used instead of ``loader`` so that stored copies can
+        be revalidated; without one, loaded definitions are stored without an ETag.
+        """
+        value = self.get(key)
+        if value is not None:
+            return True, None, value
+        return self._flight.do(key, lambda: self._load(key, loader, fetch))
+
+    async def aget_or_load(self, key: DefinitionKey, loader: Callable[[], Awaitable[RequestResult]],
+                           fetch: Optional[AsyncFetcher] = None) -> RequestResult:
+        """asyncio counterpart of get_or_load"""
+        value = self.get(key)
+        if value is not None:
+            return True, None, value
+
+        async def load() -> RequestResult:
+            generation = self.generation(key[0])
+            if self.store is None:
+                result = await loader()
+            else:
+                # SQLite reads and the fsync of writes block, so they run in a worker thread
+                store_generation, stored, result = await asyncio.to_thread(self._read_store, key)
+                if result is None:
+                    if fetch is None:
+                        result = await asyncio.to_thread(self._write_store, key, await loader(), store_generation)
+                    else:
+                        etag = stored[1] if stored is not None else None
+                        fetched = await fetch(etag)
+                        result = await asyncio.to_thread(self._apply_fetch, key, stored, fetched, store_generation)
+            self._store(key, result, generation)
+            return result
+
+        return await self._async_flight.do(key, load)
+
+    def get_variant(self, key: DefinitionKey, loader: Callable[[], RequestResult],
+                    fetch: Optional[Fetcher] = None) -> RequestResult:
+        """Return the definition variant ``key``, loading ``canonical_key(key)`` when missing.
+
+        ``loader`` and ``fetch`` request the canonical variant; see get_or_load.
+        """
+        source = self.canonical_key(key)
+        return self._derive(key, source, self.get_or_load(source, loader, fetch))
+
+    async def aget_variant(self, key: DefinitionKey, loader: Callable[[], Awaitable[RequestResult]],
+                           fetch: Optional[AsyncFetcher] = None) -> RequestResult:
+        """asyncio counterpart of get_variant"""
+        source = self.canonical_key(key)
+        return self._derive(key, source, await self.aget_or_load(source, loader, fetch))
+
+    def _derive(self, key: DefinitionKey, source: DefinitionKey, result: RequestResult) -> RequestResult:
+        success, _, canonical = result
+        if key == source or not success or canonical is None or "raw_response" in canonical:
+            return result
+        with self._lock:
+            memo = self._variants.get(source)
+            if memo is not None and memo[0] is canonical and key in memo[1]:
+                return True, None, memo[1][key]
+
+        derived = derive_variant(canonical, strip_html=key[2], include_tags=key[3])
+        with self._lock:
+            self._derivations += 1
+            entry = self._entries.get(source)
+            # Only remembered next to the cached canonical, so it is dropped along with it
+            if entry is not None and entry[1] is canonical:
+                memo = self._variants.get(source)
+                if memo is None or memo[0] is not canonical:
+                    memo = self._variants[source] = (canonical, {})
+                memo[1][key] = derived
+        return True, None, derived
+
+    def _load(self, key: DefinitionKey, loader: Callable[[], RequestResult],
+              fetch: Optional[Fetcher] = None) -> RequestResult:
+        generation = self.generation(key[0])
+        if self.store is None:
+            result = loader()
+        else:
+            store_generation, stored, result = self._read_store(key)
+            if result is None:
+                if fetch is None:
+                    result = self._write_store(key, loader(), store_generation)
+                else:
+                    etag = stored[1] if stored is not None else None
+                    result = self._apply_fetch(key, stored, fetch(etag), store_generation)
+        self._store(key, result, generation)
+        return result
+
+    def _read_store(self, key: DefinitionKey) -> Tuple[int, Optional[StoredDefinition], Optional[RequestResult]]:
+        """Store generation, stored copy, and the result when that copy is still fresh"""
+        store_generation = self.store.generation(key[0])
+        stored = self.store.get(key)
+        if stored is not None and (self.ttl <= 0 or time.time() - stored[0] <= self.ttl):
+            with self._lock:
+                self._disk_hits += 1
+            return store_generation, stored, (True, None, stored[3])
+        return store_generation, stored, None
+
+    def _write_store(self, key: DefinitionKey, result: RequestResult, store_generation: int) -> RequestResult:
+        success, _, data = result
+        if success and data is not None:
+            self.store.put_definition(key, data, store_generation)
+        return result
+
+    def _apply_fetch(self, key: DefinitionKey, stored: Optional[StoredDefinition],
+                     fetched: ConditionalResult, store_generation: int) -> RequestResult:
+        success, error, content, etag = fetched
+        if not success:
+            return False, error, None
+        if content is None:
+            if stored is None:
+                return False, "Unexpected API response (304): no stored definition to revalidate", None
+            self.store.touch(key)
+            with self._lock:
+                self._revalidations += 1
+            return True, None, stored[3]
+        try:
+            definition = self.store.codec.decode(content)
+        except ValueError:
+            return True, None, {"raw_response": content.decode("utf-8", errors="replace")}
+        self.store.put(key, content, etag, store_generation)
+        return True, None, definition
+
+    def _store(self, key: DefinitionKey, result: RequestResult, generation: int) -> None:
+        success, _, data = result
+        with self._lock:
+            self._loads += 1
+        if success and data is not None:
+            self.put(key, data, generation)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxEntries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "loads": self._loads,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "diskHits": self._disk_hits,
+                "revalidations": self._revalidations,
+                "derivations": self._derivations,
+            }
+
+
+class CompiledDefinitions(Generic[Compiled]):
+    """Per-app memo of a structure compiled from an app definition.
+
+    The compiled value is reused while the definition is the same object (as handed
+    out by a DefinitionCache) or has the same ``version``, and rebuilt once it changes.
+    """
+
+    def __init__(self, compile: Callable[[Dict[str, Any]], Compiled]):
+        self._compile = compile
+        self._entries: Dict[str, Tuple[Dict[str, Any], Compiled]] = {}
+        self._lock = threading.Lock()
+        self.compiles = 0
+
+    def get(self, app_id: str, definition: Dict[str, Any]) -> Compiled:
+        app_id = app_id.strip()
+        with self._lock:
+            stored = self._entries.get(app_id)
+        if stored is not None:
+            stored_definition, value = stored
+            version = stored_definition.get("version")
+            if stored_definition is definition or (version is not None and version == definition.get("version")):
+                return value
+        value = self._compile(definition)
+        with self._lock:
+            self._entries[app_id] = (definition, value)
+            self.compiles += 1
+        return value
+
+    def forget(self, app_id: str) -> None:
+        with self._lock:
+            self._entries.pop(app_id.strip(), None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
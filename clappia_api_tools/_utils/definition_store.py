@@ -0,0 +1,216 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+from clappia_api_tools._utils.json_codec import JsonCodec, get_default_codec
+from clappia_api_tools._utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+DefinitionKey = Tuple[str, str, bool, bool]
+# (stored_at, etag, fingerprint, definition)
+StoredDefinition = Tuple[float, Optional[str], str, Dict[str, Any]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS definitions (
+    app_id TEXT NOT NULL,
+    language TEXT NOT NULL,
+    strip_html INTEGER NOT NULL,
+    include_tags INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    fingerprint TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (app_id, language, strip_html, include_tags)
+);
+CREATE TABLE IF NOT EXISTS generations (
+    app_id TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL
+);
+"""
+
+
+def fingerprint(content: bytes) -> str:
+    """Content hash identifying one version of a definition body"""
+    return hashlib.sha256(content).hexdigest()
+
+
+class DefinitionStore:
+    """On-disk store of ``getAppDefinition`` responses shared by the processes on a host.
+
+    Definitions are kept in a SQLite file as zlib-compressed JSON, together with the
+    server's ETag and a content fingerprint. Give it to a DefinitionCache as ``store``:
+    a restarted worker then reads definitions from disk instead of downloading them,
+    and an expired entry is revalidated with If-None-Match rather than refetched.
+
+    Several processes may read and write the same file. Writes run in their own
+    transaction, and invalidating an app bumps a per-app generation on disk, so a
+    load that was in flight in another process while the app changed is not stored.
+
+    Usage:
+        store = DefinitionStore("/var/cache/clappia/definitions.db")
+        client = ClappiaClient(definition_cache=DefinitionCache(store=store))
+    """
+
+    def __init__(self, path: str, codec: Optional[JsonCodec] = None, compression_level: int = 6):
+        """
+        Args:
+            path: SQLite database file. Created when missing.
+            codec: Decodes stored definitions and encodes ones handed over already decoded.
+                Defaults to the process-wide codec.
+            compression_level: zlib level (1-9) of the stored bodies.
+        """
+        self.path = path
+        self.codec = codec or get_default_codec()
+        self.compression_level = compression_level
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._reads = 0
+        self._writes = 0
+        self._unchanged = 0
+        self._stale_writes = 0
+
+    def get(self, key: DefinitionKey) -> Optional[StoredDefinition]:
+        """Return the stored definition for ``key``, however old, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, etag, fingerprint, body FROM definitions"
+                " WHERE app_id = ? AND language = ? AND strip_html = ? AND include_tags = ?",
+                self._key_params(key),
+            ).fetchone()
+            if row is None:
+                return None
+            self._reads += 1
+        stored_at, etag, digest, body = row
+        try:
+            definition = self.codec.decode(zlib.decompress(body))
+        except (zlib.error, ValueError) as e:
+            logger.warning("Ignoring unreadable stored definition of %s: %s", key[0], e)
+            return None
+        return stored_at, etag, digest, definition
+
+    def put(self, key: DefinitionKey, content: bytes, etag: Optional[str] = None,
+            generation: Optional[int] = None) -> bool:
+        """Store a definition body, unless its app was invalidated after ``generation`` was read.
+
+        Returns:
+            Whether the body was written. An unchanged body only has its age reset.
+        """
+        digest = fingerprint(content)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if generation is not None and self._generation(key[0]) != generation:
+                    self._conn.execute("ROLLBACK")
+                    self._stale_writes += 1
+                    return False
+                updated = self._conn.execute(
+                    "UPDATE definitions SET stored_at = ?, etag = ?"
+                    " WHERE app_id = ? AND language = ? AND strip_html = ? AND include_tags = ? AND fingerprint = ?",
+                    (time.time(), etag) + self._key_params(key) + (digest,),
+                ).rowcount
+                if not updated:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO definitions"
+                        " (app_id, language, strip_html, include_tags, body, etag, fingerprint, stored_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        self._key_params(key)
+                        + (zlib.compress(content, self.compression_level), etag, digest, time.time()),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            if updated:
+                self._unchanged += 1
+            else:
+                self._writes += 1
+            return not updated
+
+    def put_definition(self, key: DefinitionKey, definition: Dict[str, Any], generation: Optional[int] = None) -> bool:
+        """Store an already decoded definition; see put"""
+        return self.put(key, self.codec.encode(definition), None, generation)
+
+    def touch(self, key: DefinitionKey) -> None:
+        """Mark a stored definition as just revalidated"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE definitions SET stored_at = ?"
+                " WHERE app_id = ? AND language = ? AND strip_html = ? AND include_tags = ?",
+                (time.time(),) + self._key_params(key),
+            )
+
+    def generation(self, app_id: str) -> int:
+        with self._lock:
+            return self._generation(app_id.strip())
+
+    def invalidate_app(self, app_id: str) -> int:
+        """Drop every stored variant of an app; returns the number of entries removed"""
+        app_id = app_id.strip()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT INTO generations (app_id, generation) VALUES (?, 1)"
+                    " ON CONFLICT (app_id) DO UPDATE SET generation = generation + 1",
+                    (app_id,),
+                )
+                removed = self._conn.execute("DELETE FROM definitions WHERE app_id = ?", (app_id,)).rowcount
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return removed
+
+    def clear(self) -> None:
+        """Drop every stored definition, in every process sharing the file"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT INTO generations (app_id, generation) SELECT DISTINCT app_id, 1 FROM definitions WHERE true"
+                    " ON CONFLICT (app_id) DO UPDATE SET generation = generation + 1"
+                )
+                self._conn.execute("DELETE FROM definitions")
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _generation(self, app_id: str) -> int:
+        row = self._conn.execute("SELECT generation FROM generations WHERE app_id = ?", (app_id,)).fetchone()
+        return row[0] if row is not None else 0
+
+    @staticmethod
+    def _key_params(key: DefinitionKey) -> Tuple[Any, ...]:
+        app_id, language, strip_html, include_tags = key
+        return app_id, language, int(strip_html), int(include_tags)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM definitions").fetchone()[0]
+            return {
+                "path": self.path,
+                "size": size,
+                "reads": self._reads,
+                "writes": self._writes,
+                "unchanged": self._unchanged,
+                "staleWrites": self._stale_writes,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "DefinitionStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,55 @@
+import html
+import re
+from typing import Any
+
+# Keys holding metadata tags, dropped from variants fetched with includeTags=false
+TAG_KEYS = frozenset({"tags"})
+
+# Keys holding display text, the only strings stripped of HTML. Everything else, such
+# as options, default values and expressions, is data and is kept exactly as fetched
+DISPLAY_TEXT_KEYS = frozenset({"label", "description", "sectionName", "title"})
+
+# Opening, closing and self-closing tags plus comments; a "<" not followed by a
+# letter, "/" or "!" (as in "a < b") is left alone
+_TAG = re.compile(r"<(?:[A-Za-z/][^<>]*|!--.*?--)>", re.DOTALL)
+
+
+def strip_html(text: str) -> str:
+    """Text without HTML tags, with entities such as ``&amp;`` decoded"""
+    if "<" not in text and "&" not in text:
+        return text
+    return html.unescape(_TAG.sub("", text))
+
+
+def derive_variant(definition: Any, strip_html: bool, include_tags: bool) -> Any:
+    """Derive a getAppDefinition variant from the response fetched with HTML and tags.
+
+    Only containers on the way to a changed value are copied; unchanged subtrees are
+    shared with ``definition``, so a variant costs little memory next to it.
+    """
+    if not strip_html and include_tags:
+        return definition
+    return _derive(definition, strip_html, include_tags, None)
+
+
+def _derive(value: Any, strip: bool, include_tags: bool, key: Any) -> Any:
+    if isinstance(value, str):
+        if not strip or key not in DISPLAY_TEXT_KEYS:
+            return value
+        stripped = strip_html(value)
+        return value if stripped == value else stripped
+    if isinstance(value, dict):
+        derived = {}
+        changed = False
+        for name, item in value.items():
+            if not include_tags and name in TAG_KEYS:
+                changed = True
+                continue
+            new = _derive(item, strip, include_tags, name)
+            changed = changed or new is not item
+            derived[name] = new
+        return derived if changed else value
+    if isinstance(value, list):
+        derived = [_derive(item, strip, include_tags, key) for item in value]
+        return derived if any(new is not old for new, old in zip(derived, value)) else value
+    return value
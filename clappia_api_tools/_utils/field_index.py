@@ -0,0 +1,197 @@
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from clappia_api_tools._utils.definition_cache import CompiledDefinitions, DefinitionCache, RequestResult
+from clappia_api_tools._utils.definition_variants import strip_html
+from clappia_api_tools._utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+_NOT_ALPHANUMERIC = re.compile(r"[\W_]+")
+
+
+@dataclass(frozen=True)
+class FieldInfo:
+    """What the definition says about one field.
+
+    Attributes:
+        field_name: Internal name submission data must be keyed by.
+        label: Label shown in the app, if any.
+        field_type: Clappia field type, e.g. "singleLineText".
+        section_index: Position of the section holding the field, None when not placed.
+        section_name: Name of that section.
+        definition: The full field definition.
+    """
+
+    field_name: str
+    label: Optional[str]
+    field_type: Optional[str]
+    section_index: Optional[int] = None
+    section_name: Optional[str] = None
+    definition: Dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+
+class FieldIndex:
+    """Lookup of an app's fields by fieldName, label and normalized label.
+
+    Built once from a ``getAppDefinition`` response. ``resolve`` is a dictionary lookup,
+    tried in order: exact fieldName, exact label, then the label lowercased with
+    spaces and punctuation removed (so "Employee Name", "employee_name" and
+    "EMPLOYEE-NAME" all match). Labels shared by several fields are ambiguous and
+    never resolve.
+    """
+
+    def __init__(self, app_id: str, version: Any, fields: List[FieldInfo]):
+        self.app_id = app_id
+        self.version = version
+        self.fields: Dict[str, FieldInfo] = {info.field_name: info for info in fields}
+        self._by_label: Dict[str, FieldInfo] = {}
+        self._by_normalized: Dict[str, FieldInfo] = {}
+        # Keys shared by several fields, with the names of those fields
+        self._ambiguous_labels: Dict[str, Set[str]] = {}
+        self._ambiguous_normalized: Dict[str, Set[str]] = {}
+        for info in fields:
+            if info.label:
+                self._add(self._by_label, self._ambiguous_labels, info.label.strip(), info)
+                self._add(self._by_normalized, self._ambiguous_normalized, self.normalize(info.label), info)
+            self._add(self._by_normalized, self._ambiguous_normalized, self.normalize(info.field_name), info)
+
+    @staticmethod
+    def _add(lookup: Dict[str, FieldInfo], ambiguous: Dict[str, Set[str]], key: str, info: FieldInfo) -> None:
+        if not key:
+            return
+        existing = lookup.get(key)
+        if existing is not None and existing.field_name != info.field_name:
+            ambiguous.setdefault(key, {existing.field_name}).add(info.field_name)
+        lookup[key] = info
+
+    @staticmethod
+    def normalize(label: str) -> str:
+        return _NOT_ALPHANUMERIC.sub("", label.casefold())
+
+    @classmethod
+    def build(cls, definition: Dict[str, Any]) -> "FieldIndex":
+        """Index a ``getAppDefinition`` response"""
+        definitions = definition.get("fieldDefinitions")
+        definitions = dict(definitions) if isinstance(definitions, dict) else {}
+        placement: Dict[str, Tuple[int, Optional[str]]] = {}
+        for section_index, section in enumerate(definition.get("sections") or []):
+            if not isinstance(section, dict):
+                continue
+            for entry in section.get("fields") or []:
+                # Sections list field names, or full field objects
+                if isinstance(entry, dict) and entry.get("fieldName"):
+                    definitions.setdefault(entry["fieldName"], entry)
+                    entry = entry["fieldName"]
+                if isinstance(entry, str):
+                    placement.setdefault(entry, (section_index, section.get("sectionName")))
+
+        fields = []
+        for name, spec in definitions.items():
+            spec = spec if isinstance(spec, dict) else {}
+            section_index, section_name = placement.get(name, (None, None))
+            label = spec.get("label")
+            fields.append(FieldInfo(
+                field_name=name,
+                # Indexed from the canonical definition, whose labels may carry markup
+                label=strip_html(label) if isinstance(label, str) else None,
+                field_type=spec.get("fieldType"),
+                section_index=section_index,
+                section_name=section_name,
+                definition=spec,
+            ))
+        return cls(definition.get("appId", ""), definition.get("version"), fields)
+
+    def resolve(self, key: str) -> Optional[FieldInfo]:
+        """Field a fieldName or label refers to, None when it matches none or several"""
+        info = self.fields.get(key)
+        if info is not None:
+            return info
+        stripped = key.strip()
+        if stripped in self._by_label:
+            return None if stripped in self._ambiguous_labels else self._by_label[stripped]
+        normalized = self.normalize(key)
+        if normalized in self._ambiguous_normalized:
+            return None
+        return self._by_normalized.get(normalized)
+
+    def candidates(self, key: str) -> List[str]:
+        """Names of the fields an ambiguous key could refer to"""
+        stripped = key.strip()
+        if stripped in self._by_label:
+            return sorted(self._ambiguous_labels.get(stripped, ()))
+        return sorted(self._ambiguous_normalized.get(self.normalize(key), ()))
+
+    def translate(self, data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """Re-key label-keyed data by fieldName.
+
+        Returns:
+            The re-keyed data and a list of problems (keys that match no field or
+            several, or two keys naming the same field); the data is only usable when
+            the list is empty.
+        """
+        translated: Dict[str, Any] = {}
+        sources: Dict[str, str] = {}
+        problems = []
+        for key, value in data.items():
+            info = self.resolve(key) if isinstance(key, str) else None
+            if info is None:
+                candidates = self.candidates(key) if isinstance(key, str) else []
+                if candidates:
+                    problems.append(f"'{key}' matches several fields ({', '.join(candidates)})")
+                else:
+                    problems.append(f"'{key}' matches no field label or name")
+                continue
+            if info.field_name in sources:
+                problems.append(f"'{key}' and '{sources[info.field_name]}' both refer to field '{info.field_name}'")
+                continue
+            sources[info.field_name] = key
+            translated[info.field_name] = value
+        return translated, problems
+
+
+class FieldResolver:
+    """Per-app FieldIndex, built from definitions read through a DefinitionCache.
+
+    An index is built once per definition version and rebuilt when the cached
+    definition changes, e.g. after add_field invalidates it.
+    """
+
+    def __init__(self, definition_cache: Optional[DefinitionCache] = None):
+        """
+        Args:
+            definition_cache: Cache the definitions are loaded through. Defaults to a
+                private DefinitionCache with its default size and TTL.
+        """
+        self.definition_cache = definition_cache if definition_cache is not None else DefinitionCache()
+        self._indexes: CompiledDefinitions[FieldIndex] = CompiledDefinitions(FieldIndex.build)
+        self._lock = threading.Lock()
+        self._resolved = 0
+        self._failed = 0
+
+    def index(self, app_id: str, definition: Dict[str, Any]) -> FieldIndex:
+        """FieldIndex of a definition, building it on first use of its version"""
+        return self._indexes.get(app_id, definition)
+
+    def index_from(self, app_id: str, loaded: RequestResult) -> Union[str, FieldIndex]:
+        """FieldIndex from the outcome of loading the definition, or an error message"""
+        success, error_message, definition = loaded
+        if not success or not isinstance(definition, dict):
+            with self._lock:
+                self._failed += 1
+            logger.error("Error: could not load definition of app_id %s to resolve labels: %s", app_id, error_message)
+            return f"Error: {error_message or 'app definition unavailable'}"
+        with self._lock:
+            self._resolved += 1
+        return self.index(app_id, definition)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "indexes": len(self._indexes),
+                "builds": self._indexes.compiles,
+                "resolved": self._resolved,
+                "failed": self._failed,
+            }
@@ -0,0 +1,134 @@
+import threading
+from dataclasses import dataclass
+from typing import Dict, Any, Tuple, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool settings for the HTTP session shared by Clappia clients.
+
+    Attributes:
+        pool_connections: Number of per-host connection pools kept by the session.
+        pool_maxsize: Maximum number of idle connections kept open per host.
+        pool_block: When True, ``pool_maxsize`` is a hard per-host limit and callers
+            wait for a free connection instead of opening an extra one.
+        keep_alive: Whether connections are reused between requests. False sends
+            ``Connection: close`` so every request opens a fresh connection.
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+
+
+DEFAULT_POOL_CONFIG = PoolConfig()
+
+
+def _normalize_base_url(base_url: str) -> str:
+    parts = urlsplit(base_url.strip())
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+class SessionPool:
+    """Registry of pooled ``requests`` sessions.
+
+    One session (and therefore one set of keep-alive connection pools) is kept per
+    base URL and pool configuration, so every client built from the same
+    configuration reuses the same TCP/TLS connections.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[Tuple[str, PoolConfig], requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get_session(
+        self, base_url: str, config: Optional[PoolConfig] = None
+    ) -> requests.Session:
+        """Return the shared session for ``base_url``, creating it on first use"""
+        config = config or DEFAULT_POOL_CONFIG
+        key = (_normalize_base_url(base_url), config)
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._create_session(config)
+                self._sessions[key] = session
+            return session
+
+    @staticmethod
+    def _create_session(config: PoolConfig) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not config.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def stats(self) -> Dict[str, Any]:
+        """Return connection statistics for every session in the registry"""
+        with self._lock:
+            items = list(self._sessions.items())
+        return {
+            base_url: session_stats(session, config)
+            for (base_url, config), session in items
+        }
+
+    def close(self) -> None:
+        """Close every pooled session and forget it"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+def session_stats(session: requests.Session, config: PoolConfig) -> Dict[str, Any]:
+    """Summarize the urllib3 connection pools held by ``session``"""
+    hosts = {}
+    seen = set()
+    for adapter in session.adapters.values():
+        if id(adapter) in seen or not isinstance(adapter, HTTPAdapter):
+            continue
+        seen.add(id(adapter))
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+            hosts[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "connectionsOpened": pool.num_connections,
+                "requestsSent": pool.num_requests,
+                "inUse": pool.pool.maxsize - pool.pool.qsize(),
+                "idle": idle,
+            }
+    return {
+        "config": {
+            "poolConnections": config.pool_connections,
+            "poolMaxsize": config.pool_maxsize,
+            "poolBlock": config.pool_block,
+            "keepAlive": config.keep_alive,
+        },
+        "hosts": hosts,
+    }
+
+
+_shared_pool = SessionPool()
+
+
+def get_shared_pool() -> SessionPool:
+    """Return the process-wide session registry used by default"""
+    return _shared_pool
@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from clappia_api_tools._utils.logging_utils import get_logger
+from clappia_api_tools._utils.singleflight import AsyncSingleFlight, SingleFlight
+
+logger = get_logger(__name__)
+
+RequestResult = Tuple[bool, Optional[str], Optional[Dict[str, Any]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS idempotency (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idempotency_created ON idempotency (created_at);
+"""
+
+
+class IdempotencyLedger:
+    """Records the outcome of submission creates by idempotency key.
+
+    A create whose key is already recorded returns the recorded response without
+    another request, so retrying a create that already succeeded (after a crash, an
+    outbox replay or a caller-side retry) cannot create a duplicate. Concurrent creates
+    with the same key share one request. Only successful responses are recorded.
+
+    Entries live in a bounded in-memory LRU and, when ``path`` is given, in a SQLite
+    file that survives restarts and can be shared by several processes.
+
+    Usage:
+        ledger = IdempotencyLedger(path="clappia-idempotency.db")
+        client = ClappiaClient(idempotency_ledger=ledger)
+        client.create_submission("MFX093412", {"name": "Ada"}, "ada@example.com", idempotency_key="order-42")
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 7 * 24 * 3600.0, path: Optional[str] = None):
+        """
+        Args:
+            max_entries: Maximum number of keys kept in memory; least recently used are evicted.
+            ttl: Seconds a recorded outcome is honored. 0 or less keeps outcomes forever.
+            path: SQLite database file for the on-disk store. Created when missing.
+                None (default) keeps the ledger in memory only.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self._async_flight = AsyncSingleFlight()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._hits = 0
+        self._misses = 0
+        self._recorded = 0
+        self._evictions = 0
+
+        if path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """Content hash of a create payload, used when the caller supplies no key.
+
+        Identical records for the same app, user and workplace map to the same key;
+        pass distinct keys to create identical records on purpose.
+        """
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        return "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _expired(self, recorded_at: float) -> bool:
+        return self.ttl > 0 and time.time() - recorded_at > self.ttl
+
+    def _remember(self, key: str, recorded_at: float, response: Dict[str, Any]) -> None:
+        self._entries[key] = (recorded_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the recorded response for ``key``, or None when it has not succeeded yet"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT created_at, response FROM idempotency WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = (row[0], json.loads(row[1]))
+                    self._remember(key, *entry)
+            if entry is None or self._expired(entry[0]):
+                if entry is not None:
+                    self._entries.pop(key, None)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def record(self, key: str, response: Optional[Dict[str, Any]]) -> None:
+        """Record the successful response of the create identified by ``key``"""
+        response = response if response is not None else {}
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, response)
+            self._recorded += 1
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO idempotency (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(response), now),
+                )
+
+    def forget(self, key: str) -> None:
+        """Drop a recorded outcome so the next create with ``key`` is sent again"""
+        with self._lock:
+            self._entries.pop(key, None)
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM idempotency WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        """Delete expired outcomes from the on-disk store; returns how many were removed"""
+        if self._conn is None or self.ttl <= 0:
+            return 0
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM idempotency WHERE created_at < ?", (time.time() - self.ttl,)
+            ).rowcount
+
+    def get_or_send(self, key: str, sender: Callable[[], RequestResult]) -> RequestResult:
+        """Return the recorded response for ``key`` or run ``sender`` once for all concurrent callers"""
+        response = self.get(key)
+        if response is not None:
+            logger.info("Returning recorded result for idempotency key %s", key)
+            return True, None, response
+        return self._flight.do(key, lambda: self._send(key, sender))
+
+    async def aget_or_send(self, key: str, sender: Callable[[], Awaitable[RequestResult]]) -> RequestResult:
+        """asyncio counterpart of get_or_send"""
+        response = self.get(key)
+        if response is not None:
+            logger.info("Returning recorded result for idempotency key %s", key)
+            return True, None, response
+
+        async def send() -> RequestResult:
+            # A caller that finished while this one waited to lead may have recorded it
+            recorded = self.get(key)
+            if recorded is not None:
+                return True, None, recorded
+            result = await sender()
+            if result[0]:
+                self.record(key, result[2])
+            return result
+
+        return await self._async_flight.do(key, send)
+
+    def _send(self, key: str, sender: Callable[[], RequestResult]) -> RequestResult:
+        recorded = self.get(key)
+        if recorded is not None:
+            return True, None, recorded
+        result = sender()
+        if result[0]:
+            self.record(key, result[2])
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxEntries": self.max_entries,
+                "ttl": self.ttl,
+                "persistent": self._conn is not None,
+                "hits": self._hits,
+                "misses": self._misses,
+                "recorded": self._recorded,
+                "evictions": self._evictions,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> "IdempotencyLedger":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
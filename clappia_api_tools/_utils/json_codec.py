@@ -0,0 +1,109 @@
+import json
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+class JsonCodec(ABC):
+    """Encodes request bodies and decodes response bodies.
+
+    ``encode`` returns compact UTF-8 bytes ready for the transport, ``decode`` accepts
+    the raw response bytes, and ``pretty`` renders the indented text used in formatted
+    results. Decoding errors must be ValueErrors (``json.JSONDecodeError`` is one).
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        ...
+
+    @abstractmethod
+    def decode(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        ...
+
+    @abstractmethod
+    def pretty(self, value: Any) -> str:
+        ...
+
+
+class StdlibJsonCodec(JsonCodec):
+    """Codec backed by the standard library ``json`` module. Rejects NaN and Infinity."""
+
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+    def decode(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def pretty(self, value: Any) -> str:
+        return json.dumps(value, indent=2)
+
+
+def _has_non_finite(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by ``orjson``, which serializes straight to bytes.
+
+    Requires ``pip install orjson``. Behaves like StdlibJsonCodec: NaN and Infinity
+    are rejected rather than written as null, non-string dict keys are converted like
+    the standard library does, and ``pretty`` uses the standard library so formatted
+    results read the same with either backend.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson. Install with: pip install orjson")
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def encode(self, value: Any) -> bytes:
+        encoded = orjson.dumps(value, option=self._options)
+        # orjson writes NaN and Infinity as null; only look for them when a null was written
+        if b"null" in encoded and _has_non_finite(value):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return encoded
+
+    def decode(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return orjson.loads(data)
+
+    def pretty(self, value: Any) -> str:
+        return json.dumps(value, indent=2)
+
+
+_default_codec: Optional[JsonCodec] = None
+
+
+def get_default_codec() -> JsonCodec:
+    """Codec used when a client is not given one: orjson when installed, else stdlib"""
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = OrjsonCodec() if orjson is not None else StdlibJsonCodec()
+    return _default_codec
+
+
+def set_default_codec(codec: Optional[JsonCodec]) -> None:
+    """Replace the process-wide default codec; None restores automatic selection.
+
+    Only affects clients created afterwards.
+    """
+    global _default_codec
+    _default_codec = codec
@@ -1,6 +1,14 @@
+import json
+import logging
 import sys
 from datetime import datetime
 from enum import Enum
+from typing import Any, Optional
+
+PACKAGE_LOGGER_NAME = "clappia_api_tools"
+
+# Request/response bodies larger than this are truncated in debug logs
+MAX_BODY_LOG_CHARS = 2000
 
 
 class bcolors:
@@ -23,100 +31,174 @@ class LogLevel(Enum):
     CRITICAL = 4
 
 
+_STDLIB_LEVELS = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL,
+}
+
+
+class ConsoleHandler(logging.Handler):
+    """Colored console output used until the application configures logging itself.
+
+    Records are dropped here as soon as the root logger has handlers, so they are
+    only written once, by the application's own handlers.
+    """
+
+    def __init__(self, timestamp_format: str = "%Y-%m-%d %H:%M:%S"):
+        super().__init__()
+        self.timestamp_format = timestamp_format
+        self.colors = {
+            logging.DEBUG: bcolors.OKBLUE,
+            logging.INFO: bcolors.OKGREEN,
+            logging.WARNING: bcolors.WARNING,
+            logging.ERROR: bcolors.FAIL,
+            logging.CRITICAL: bcolors.HEADER,
+        }
+        self.reset_color = bcolors.ENDC
+
+    def emit(self, record: logging.LogRecord):
+        if logging.getLogger().handlers:
+            return
+        try:
+            timestamp = datetime.fromtimestamp(record.created).strftime(self.timestamp_format)
+            message = f"[{timestamp}] [{record.name}] [{record.levelname}] {record.getMessage()}"
+            output_stream = sys.stderr if record.levelno >= logging.WARNING else sys.stdout
+            if hasattr(output_stream, "isatty") and output_stream.isatty():
+                message = f"{self.colors.get(record.levelno, '')}{message}{self.reset_color}"
+            print(message, file=output_stream)
+        except Exception:
+            self.handleError(record)
+
+
+def _package_logger() -> logging.Logger:
+    package_logger = logging.getLogger(PACKAGE_LOGGER_NAME)
+    if not any(isinstance(h, ConsoleHandler) for h in package_logger.handlers):
+        package_logger.addHandler(ConsoleHandler())
+        if package_logger.level == logging.NOTSET:
+            package_logger.setLevel(logging.INFO)
+    return package_logger
+
+
 class Logger:
+    """Thin wrapper over a stdlib ``logging.Logger``.
+
+    Messages take %-style arguments that are only formatted when a record is
+    actually emitted, so disabled levels cost a single level check. Loggers are
+    children of the ``clappia_api_tools`` logger and honor its level and handlers.
+    """
+
     def __init__(
         self,
         name: str = "Logger",
-        level: LogLevel = LogLevel.INFO,
+        level: Optional[LogLevel] = None,
         timestamp_format: str = "%Y-%m-%d %H:%M:%S",
     ):
+        _package_logger()
+        if name != PACKAGE_LOGGER_NAME and not name.startswith(PACKAGE_LOGGER_NAME + "."):
+            name = f"{PACKAGE_LOGGER_NAME}.{name}"
         self.name = name
-        self.level = level
         self.timestamp_format = timestamp_format
-
-        self.colors = {
-            LogLevel.DEBUG: bcolors.OKBLUE,
-            LogLevel.INFO: bcolors.OKGREEN,
-            LogLevel.WARNING: bcolors.WARNING,
-            LogLevel.ERROR: bcolors.FAIL,
-            LogLevel.CRITICAL: bcolors.HEADER,
-        }
-        self.reset_color = bcolors.ENDC
+        self._logger = logging.getLogger(name)
+        if level is not None:
+            self.set_level(level)
+
+    @property
+    def level(self) -> LogLevel:
+        effective = self._logger.getEffectiveLevel()
+        for log_level, stdlib_level in _STDLIB_LEVELS.items():
+            if effective <= stdlib_level:
+                return log_level
+        return LogLevel.CRITICAL
 
     def _should_log(self, level: LogLevel) -> bool:
-        return level.value >= self.level.value
+        return self._logger.isEnabledFor(_STDLIB_LEVELS[level])
 
-    def _format_message(self, level: LogLevel, message: str) -> str:
-        timestamp = datetime.now().strftime(self.timestamp_format)
-        return f"[{timestamp}] [{self.name}] [{level.name}] {message}"
+    def _log(self, level: LogLevel, message: Any, *args: Any):
+        stdlib_level = _STDLIB_LEVELS[level]
+        if self._logger.isEnabledFor(stdlib_level):
+            self._logger.log(stdlib_level, message, *args, stacklevel=3)
 
-    def _log(self, level: LogLevel, message: str):
-        if not self._should_log(level):
-            return
+    def debug(self, message: Any, *args: Any):
+        self._log(LogLevel.DEBUG, message, *args)
+
+    def info(self, message: Any, *args: Any):
+        self._log(LogLevel.INFO, message, *args)
 
-        message_str = str(message)
-        formatted_message = self._format_message(level, message_str)
+    def warning(self, message: Any, *args: Any):
+        self._log(LogLevel.WARNING, message, *args)
 
-        supports_color = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
+    def error(self, message: Any, *args: Any):
+        self._log(LogLevel.ERROR, message, *args)
 
-        if supports_color:
-            color = self.colors.get(level, "")
-            colored_message = f"{color}{formatted_message}{self.reset_color}"
-        else:
-            colored_message = formatted_message
+    def critical(self, message: Any, *args: Any):
+        self._log(LogLevel.CRITICAL, message, *args)
 
-        output_stream = (
-            sys.stderr if level.value >= LogLevel.WARNING.value else sys.stdout
-        )
-        print(colored_message, file=output_stream)
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        return self._should_log(level)
 
-    def debug(self, message: str):
-        self._log(LogLevel.DEBUG, message)
+    def set_level(self, level: LogLevel):
+        self._logger.setLevel(_STDLIB_LEVELS[level])
 
-    def info(self, message: str):
-        self._log(LogLevel.INFO, message)
 
-    def warning(self, message: str):
-        self._log(LogLevel.WARNING, message)
+class BodyPreview:
+    """Log argument that serializes a request or response body only when emitted.
 
-    def error(self, message: str):
-        self._log(LogLevel.ERROR, message)
+    Bodies longer than ``limit`` characters are truncated.
+    """
 
-    def critical(self, message: str):
-        self._log(LogLevel.CRITICAL, message)
+    __slots__ = ("body", "limit")
 
-    def set_level(self, level: LogLevel):
-        self.level = level
+    def __init__(self, body: Any, limit: int = MAX_BODY_LOG_CHARS):
+        self.body = body
+        self.limit = limit
+
+    def __str__(self) -> str:
+        body = self.body
+        if hasattr(body, "text") and not isinstance(body, (dict, list, str)):
+            body = body.text
+        if not isinstance(body, str):
+            try:
+                body = json.dumps(body, default=str)
+            except (TypeError, ValueError):
+                body = repr(body)
+        if len(body) > self.limit:
+            return f"{body[:self.limit]}... [truncated {len(body) - self.limit} chars]"
+        return body
 
 
-_default_logger = Logger()
+_default_logger = Logger(PACKAGE_LOGGER_NAME)
 
 
-def get_logger(name: str = "Logger", level: LogLevel = LogLevel.INFO) -> Logger:
+def get_logger(name: str = "Logger", level: Optional[LogLevel] = None) -> Logger:
+    """Return a logger under ``clappia_api_tools``; level None inherits the package level"""
     return Logger(name, level)
 
 
-def debug(message: str):
-    _default_logger.debug(message)
+def debug(message: Any, *args: Any):
+    _default_logger.debug(message, *args)
 
 
-def info(message: str):
-    _default_logger.info(message)
+def info(message: Any, *args: Any):
+    _default_logger.info(message, *args)
 
 
-def warning(message: str):
-    _default_logger.warning(message)
+def warning(message: Any, *args: Any):
+    _default_logger.warning(message, *args)
 
 
-def error(message: str):
-    _default_logger.error(message)
+def error(message: Any, *args: Any):
+    _default_logger.error(message, *args)
 
 
-def critical(message: str):
-    _default_logger.critical(message)
+def critical(message: Any, *args: Any):
+    _default_logger.critical(message, *args)
 
 
 def set_level(level: LogLevel):
+    """Set the level of every clappia_api_tools logger that has no level of its own"""
     _default_logger.set_level(level)
 
 
@@ -129,4 +211,6 @@ __all__ = [
     "error",
     "critical",
     "LogLevel",
+    "BodyPreview",
+    "MAX_BODY_LOG_CHARS",
 ]
@@ -0,0 +1,349 @@
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Upper bounds, in seconds, of the request latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Error classes of attempts that got no HTTP response
+TIMEOUT = "timeout"
+CONNECTION_ERROR = "connection_error"
+RATE_LIMITED = "rate_limited"
+UNEXPECTED_ERROR = "unexpected_error"
+
+# DefinitionCache.stats() counters exported as cache metrics
+_CACHE_COUNTERS = (
+    "hits", "misses", "loads", "evictions", "expirations", "invalidations", "diskHits", "revalidations", "derivations",
+)
+
+
+class MetricsSink:
+    """Receives measurements from the request path.
+
+    Every method is a no-op; subclass and override the ones a backend needs (StatsD,
+    OpenTelemetry, ...). ClientMetrics is the built-in implementation. Methods are
+    called inline on every attempt, so they must be cheap and must not raise.
+    """
+
+    def observe_request(self, endpoint: str, status_code: Optional[int], error: Optional[str],
+                        seconds: Optional[float], bytes_sent: int, bytes_received: int) -> None:
+        """One attempt at an endpoint.
+
+        Args:
+            endpoint: API endpoint, e.g. ``submissions/create``.
+            status_code: HTTP status, None when no response was received.
+            error: Error class when no response was received (TIMEOUT, CONNECTION_ERROR,
+                RATE_LIMITED or UNEXPECTED_ERROR), else None.
+            seconds: Time spent in the transport, None when nothing was sent.
+            bytes_sent: Size of the request body.
+            bytes_received: Size of the response body.
+        """
+
+    def observe_retry(self, endpoint: str, reason: str) -> None:
+        """A failed attempt is about to be retried; reason is the status code or "network" """
+
+    def watch_pool(self, transport: Any) -> None:
+        """Report the connections of ``transport`` (from its ``stats()``) when collected"""
+
+    def watch_cache(self, cache: Any) -> None:
+        """Report the counters of a DefinitionCache (from its ``stats()``) when collected"""
+
+
+class _Shard:
+    """Metrics written by one thread"""
+
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self):
+        # (metric, endpoint, label) -> value
+        self.counters: Dict[Tuple[str, str, str], float] = {}
+        # endpoint -> per-bucket counts (last one is +Inf), then sum, then count
+        self.histograms: Dict[str, List[float]] = {}
+
+    def absorb(self, other: "_Shard") -> None:
+        """Add the metrics of ``other``, whose thread has finished, to this shard"""
+        for key, value in other.counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        for endpoint, histogram in other.histograms.items():
+            merged = self.histograms.get(endpoint)
+            if merged is None:
+                self.histograms[endpoint] = list(histogram)
+            else:
+                for position, value in enumerate(histogram):
+                    merged[position] += value
+
+
+class ClientMetrics(MetricsSink):
+    """In-process metrics: per-endpoint counters and latency histograms.
+
+    Each thread updates its own shard of plain dicts, so recording takes no lock and
+    threads never contend; ``snapshot`` merges the shards when metrics are read. The
+    shards of finished threads are folded into one retired shard, so short-lived
+    worker threads do not accumulate. Connection pool and definition cache figures
+    are read from the watched objects at the same time. Share one instance between
+    clients to aggregate them.
+
+    Usage:
+        metrics = ClientMetrics()
+        client = ClappiaClient(..., metrics=metrics)
+        print(PrometheusExporter(metrics).render())
+    """
+
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Args:
+            latency_buckets: Increasing upper bounds of the latency histogram buckets, in seconds.
+        """
+        buckets = tuple(float(bound) for bound in latency_buckets)
+        if not buckets or any(a >= b for a, b in zip(buckets, buckets[1:])):
+            raise ValueError("latency_buckets must be a non-empty increasing sequence")
+        self.latency_buckets = buckets
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, _Shard]] = []
+        # Metrics of threads that have finished
+        self._retired = _Shard()
+        self._pools: Dict[int, Any] = {}
+        self._caches: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._retire_finished()
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _retire_finished(self) -> None:
+        # Called with the lock held; a finished thread no longer writes to its shard
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                self._retired.absorb(shard)
+        self._shards = live
+
+    def observe_request(self, endpoint: str, status_code: Optional[int], error: Optional[str],
+                        seconds: Optional[float], bytes_sent: int, bytes_received: int) -> None:
+        shard = self._shard()
+        counters = shard.counters
+        status = str(status_code) if status_code is not None else error or UNEXPECTED_ERROR
+        key = ("requests", endpoint, status)
+        counters[key] = counters.get(key, 0) + 1
+        if status_code is None or status_code >= 400:
+            error_class = error if status_code is None else f"http_{status_code // 100}xx"
+            key = ("errors", endpoint, error_class or UNEXPECTED_ERROR)
+            counters[key] = counters.get(key, 0) + 1
+        if bytes_sent:
+            key = ("bytes_sent", endpoint, "")
+            counters[key] = counters.get(key, 0) + bytes_sent
+        if bytes_received:
+            key = ("bytes_received", endpoint, "")
+            counters[key] = counters.get(key, 0) + bytes_received
+        if seconds is not None:
+            histograms = shard.histograms
+            histogram = histograms.get(endpoint)
+            if histogram is None:
+                histogram = histograms[endpoint] = [0.0] * (len(self.latency_buckets) + 3)
+            histogram[bisect_left(self.latency_buckets, seconds)] += 1
+            histogram[-2] += seconds
+            histogram[-1] += 1
+
+    def observe_retry(self, endpoint: str, reason: str) -> None:
+        counters = self._shard().counters
+        key = ("retries", endpoint, reason)
+        counters[key] = counters.get(key, 0) + 1
+
+    def watch_pool(self, transport: Any) -> None:
+        with self._lock:
+            self._pools[id(transport)] = transport
+
+    def watch_cache(self, cache: Any) -> None:
+        with self._lock:
+            self._caches[id(cache)] = cache
+
+    def reset(self) -> None:
+        """Forget recorded requests; watched pools and caches are kept"""
+        with self._lock:
+            self._retire_finished()
+            self._retired = _Shard()
+            shards = [shard for _, shard in self._shards]
+        for shard in shards:
+            shard.counters.clear()
+            shard.histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Merged view of every metric.
+
+        Returns:
+            ``endpoints`` maps each endpoint to its ``requests`` (by status code or
+            error class), ``errors``, ``retries``, ``bytesSent``, ``bytesReceived`` and
+            ``latency`` (``buckets`` of cumulative counts keyed by upper bound, ``sum``,
+            ``count``). ``pool`` sums the in-use and idle connections of the watched
+            transports, ``cache`` the counters of the watched definition caches.
+        """
+        with self._lock:
+            self._retire_finished()
+            # Other threads absorb into the retired shard under the lock, so read a copy
+            retired = _Shard()
+            retired.absorb(self._retired)
+            shards = [shard for _, shard in self._shards] + [retired]
+            pools = list(self._pools.values())
+            caches = list(self._caches.values())
+
+        endpoints: Dict[str, Dict[str, Any]] = {}
+        size = len(self.latency_buckets) + 3
+        for shard in shards:
+            # dict() copies are atomic, so owners can keep writing meanwhile
+            for (metric, endpoint, label), value in dict(shard.counters).items():
+                entry = self._endpoint(endpoints, endpoint)
+                if metric in ("requests", "errors", "retries"):
+                    entry[metric][label] = entry[metric].get(label, 0) + int(value)
+                else:
+                    name = "bytesSent" if metric == "bytes_sent" else "bytesReceived"
+                    entry[name] += int(value)
+            for endpoint, histogram in dict(shard.histograms).items():
+                merged = self._endpoint(endpoints, endpoint).setdefault("_histogram", [0.0] * size)
+                for position, value in enumerate(list(histogram)):
+                    merged[position] += value
+
+        for entry in endpoints.values():
+            histogram = entry.pop("_histogram", [0.0] * size)
+            cumulative, buckets = 0, {}
+            for bound, count in zip(self.latency_buckets + (float("inf"),), histogram):
+                cumulative += int(count)
+                buckets[bound] = cumulative
+            entry["latency"] = {"buckets": buckets, "sum": histogram[-2], "count": int(histogram[-1])}
+
+        pool = {"inUse": 0, "idle": 0}
+        for transport in pools:
+            for host in (transport.stats().get("hosts") or {}).values():
+                pool["inUse"] += host.get("inUse", 0)
+                pool["idle"] += host.get("idle", 0)
+        cache = {name: 0 for name in _CACHE_COUNTERS} if caches else {}
+        for definition_cache in caches:
+            stats = definition_cache.stats()
+            for name in _CACHE_COUNTERS:
+                cache[name] += stats.get(name, 0)
+
+        return {"endpoints": endpoints, "pool": pool, "cache": cache}
+
+    @staticmethod
+    def _endpoint(endpoints: Dict[str, Dict[str, Any]], endpoint: str) -> Dict[str, Any]:
+        entry = endpoints.get(endpoint)
+        if entry is None:
+            entry = endpoints[endpoint] = {
+                "requests": {}, "errors": {}, "retries": {}, "bytesSent": 0, "bytesReceived": 0,
+            }
+        return entry
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _bound(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(value)
+
+
+class PrometheusExporter:
+    """Renders ClientMetrics in the Prometheus text exposition format.
+
+    ``render`` returns the text to serve from an existing ``/metrics`` route; ``serve``
+    starts a small built-in HTTP server instead, so no exporter process is needed.
+    """
+
+    def __init__(self, metrics: ClientMetrics, namespace: str = "clappia"):
+        self.metrics = metrics
+        self.namespace = namespace
+
+    def render(self) -> str:
+        snapshot = self.metrics.snapshot()
+        endpoints = sorted(snapshot["endpoints"].items())
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            full_name = f"{self.namespace}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            return full_name
+
+        name = family("requests_total", "counter", "HTTP attempts by endpoint and status code or error class.")
+        for endpoint, entry in endpoints:
+            for status, count in sorted(entry["requests"].items()):
+                lines.append(f"{name}{_labels(endpoint=endpoint, status=status)} {count}")
+
+        name = family("request_errors_total", "counter", "Failed attempts by endpoint and error class.")
+        for endpoint, entry in endpoints:
+            for error, count in sorted(entry["errors"].items()):
+                lines.append(f"{name}{_labels(endpoint=endpoint, error=error)} {count}")
+
+        name = family("retries_total", "counter", "Retries by endpoint and the status code or failure that caused them.")
+        for endpoint, entry in endpoints:
+            for reason, count in sorted(entry["retries"].items()):
+                lines.append(f"{name}{_labels(endpoint=endpoint, reason=reason)} {count}")
+
+        name = family("request_duration_seconds", "histogram", "Time spent sending one attempt and reading its response.")
+        for endpoint, entry in endpoints:
+            latency = entry["latency"]
+            if not latency["count"]:
+                continue
+            for bound, count in latency["buckets"].items():
+                lines.append(f"{name}_bucket{_labels(endpoint=endpoint, le=_bound(bound))} {count}")
+            lines.append(f"{name}_sum{_labels(endpoint=endpoint)} {latency['sum']!r}")
+            lines.append(f"{name}_count{_labels(endpoint=endpoint)} {latency['count']}")
+
+        name = family("request_bytes_total", "counter", "Request body bytes sent.")
+        for endpoint, entry in endpoints:
+            lines.append(f"{name}{_labels(endpoint=endpoint)} {entry['bytesSent']}")
+
+        name = family("response_bytes_total", "counter", "Response body bytes received.")
+        for endpoint, entry in endpoints:
+            lines.append(f"{name}{_labels(endpoint=endpoint)} {entry['bytesReceived']}")
+
+        name = family("pool_connections", "gauge", "Pooled HTTP connections by state.")
+        lines.append(f"{name}{_labels(state='in_use')} {snapshot['pool']['inUse']}")
+        lines.append(f"{name}{_labels(state='idle')} {snapshot['pool']['idle']}")
+
+        if snapshot["cache"]:
+            name = family("definition_cache_events_total", "counter", "Definition cache events by kind.")
+            for event, count in snapshot["cache"].items():
+                lines.append(f"{name}{_labels(event=event)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve ``render()`` at ``/metrics`` from a daemon thread.
+
+        Returns:
+            The running server; call ``shutdown()`` on it to stop. Port 0 picks a free
+            port, available as ``server.server_address[1]``.
+        """
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="clappia-metrics", daemon=True).start()
+        return server
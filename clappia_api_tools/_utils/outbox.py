@@ -0,0 +1,448 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from clappia_api_tools._models.model import ClappiaResult
+from clappia_api_tools._utils.logging_utils import get_logger
+from clappia_api_tools._utils.retry import RetryPolicy
+
+logger = get_logger(__name__)
+
+RequestResult = Tuple[bool, Optional[str], Optional[Dict[str, Any]]]
+Sender = Callable[[str, str, Optional[Dict[str, Any]], Optional[str]], RequestResult]
+
+PENDING = "pending"
+INFLIGHT = "inflight"
+DONE = "done"
+FAILED = "failed"
+
+# Failures worth replaying later; anything else (a 4xx rejection, a malformed
+# response) would fail the same way again and is parked as FAILED.
+TRANSIENT_ERROR_CODES = frozenset({"timeout", "connection_error", "rate_limited"})
+TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    method TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    ordering_key TEXT,
+    idempotency_key TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease_until REAL,
+    last_error TEXT,
+    response TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_ready ON outbox (status, available_at);
+CREATE INDEX IF NOT EXISTS outbox_ordering ON outbox (ordering_key, id);
+"""
+
+# An entry is claimable when it is due, or when the worker holding it died and its
+# lease ran out, and no earlier entry with the same ordering key is still unfinished.
+_CLAIM = """
+SELECT id FROM outbox AS o
+WHERE ((o.status = 'pending' AND o.available_at <= :now)
+       OR (o.status = 'inflight' AND o.lease_until < :now))
+  AND (o.ordering_key IS NULL OR NOT EXISTS (
+      SELECT 1 FROM outbox AS e
+      WHERE e.ordering_key = o.ordering_key AND e.id < o.id AND e.status IN ('pending', 'inflight')))
+ORDER BY o.id
+LIMIT 1
+"""
+
+
+def is_transient_error(error_message: str) -> bool:
+    """Whether a failed make_request outcome may succeed if replayed later"""
+    result = ClappiaResult.from_error(error_message)
+    if result.error_code in TRANSIENT_ERROR_CODES:
+        return True
+    return result.status_code in TRANSIENT_STATUSES
+
+
+@dataclass
+class OutboxEntry:
+    """One queued mutation.
+
+    Attributes:
+        id: Outbox entry ID, increasing in enqueue order.
+        method: HTTP method.
+        endpoint: API endpoint relative to the base URL.
+        data: JSON body to send.
+        ordering_key: Entries sharing a key are delivered one at a time, in order.
+        idempotency_key: Key of a create in the idempotency ledger, so a replay of a
+            create that already succeeded is not sent again.
+        status: "pending", "inflight", "done" or "failed".
+        attempts: Delivery attempts made so far.
+        last_error: Error of the latest failed attempt.
+        response: API response of the successful attempt.
+        created_at: Enqueue time, seconds since the epoch.
+        updated_at: Time of the latest status change, seconds since the epoch.
+    """
+
+    id: int
+    method: str
+    endpoint: str
+    data: Dict[str, Any]
+    ordering_key: Optional[str]
+    idempotency_key: Optional[str]
+    status: str
+    attempts: int
+    last_error: Optional[str]
+    response: Optional[Dict[str, Any]]
+    created_at: float
+    updated_at: float
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "OutboxEntry":
+        return cls(
+            id=row["id"],
+            method=row["method"],
+            endpoint=row["endpoint"],
+            data=json.loads(row["payload"]),
+            ordering_key=row["ordering_key"],
+            idempotency_key=row["idempotency_key"],
+            status=row["status"],
+            attempts=row["attempts"],
+            last_error=row["last_error"],
+            response=json.loads(row["response"]) if row["response"] else None,
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+
+class SubmissionOutbox:
+    """Durable SQLite (WAL) queue of submission mutations, drained by background workers.
+
+    Enqueued requests are committed to disk before the caller gets control back, then
+    delivered by up to ``max_workers`` threads. An entry is only marked done after the
+    API answered 200; transient failures (timeouts, connection errors, 429 and 5xx) are
+    rescheduled with exponential backoff, other failures are parked as failed. Entries
+    left in flight by a crashed process are replayed after a restart.
+
+    Delivery is at-least-once: a crash between the API accepting a request and the
+    entry being marked done replays that request.
+
+    Usage:
+        outbox = SubmissionOutbox("clappia-outbox.db")
+        client = ClappiaClient(outbox=outbox)
+        client.create_submission("MFX093412", {"name": "Ada"}, "ada@example.com")
+        outbox.drain(timeout=30)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_workers: int = 4,
+        max_attempts: int = 10,
+        backoff: Optional[RetryPolicy] = None,
+        lease_timeout: float = 300.0,
+        poll_interval: float = 1.0,
+        recover_inflight: bool = True,
+    ):
+        """
+        Args:
+            path: SQLite database file. Created when missing.
+            max_workers: Maximum number of requests in flight at once.
+            max_attempts: Attempts before a transiently failing entry is parked as failed.
+                0 retries forever.
+            backoff: Delay schedule between attempts of one entry. Defaults to 1s doubling
+                up to 5 minutes, with jitter.
+            lease_timeout: Seconds a worker may hold an entry before another worker or
+                process takes it over.
+            poll_interval: Seconds idle workers sleep before looking for due entries.
+            recover_inflight: Requeue entries left in flight at open time. Disable when
+                several processes share one database; leases expiring covers them then.
+        """
+        self.path = path
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.backoff = backoff or RetryPolicy(backoff_base=1.0, backoff_max=300.0)
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(outbox)")}
+        if "idempotency_key" not in columns:
+            self._conn.execute("ALTER TABLE outbox ADD COLUMN idempotency_key TEXT")
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition()
+        self._sender: Optional[Sender] = None
+        self._workers: List[threading.Thread] = []
+        self._active = 0
+        self._stopping = False
+        # Delivery counters, updated by every worker thread
+        self._stats_lock = threading.Lock()
+        self._delivered = 0
+        self._failed = 0
+        self._retried = 0
+
+        if recover_inflight:
+            recovered = self._write(
+                "UPDATE outbox SET status = ?, lease_until = NULL, available_at = ? WHERE status = ?",
+                (PENDING, time.time(), INFLIGHT),
+            )
+            if recovered:
+                logger.warning("Requeued %s outbox entries left in flight by a previous run", recovered)
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def _write(self, sql: str, params: Tuple = ()) -> int:
+        with self._lock:
+            return self._conn.execute(sql, params).rowcount
+
+    def enqueue(
+        self,
+        method: str,
+        endpoint: str,
+        data: Dict[str, Any],
+        ordering_key: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> int:
+        """Durably queue a request and wake a worker; returns the entry ID.
+
+        Raises:
+            ValueError: If ``data`` is not JSON serializable.
+            sqlite3.Error: If the entry could not be written.
+        """
+        payload = json.dumps(data, allow_nan=False)
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO outbox (method, endpoint, payload, ordering_key, idempotency_key, status, available_at, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (method, endpoint, payload, ordering_key, idempotency_key, PENDING, now, now, now),
+            )
+            entry_id = cursor.lastrowid
+        logger.info("Queued %s %s as outbox entry %s", method, endpoint, entry_id)
+        with self._wakeup:
+            self._wakeup.notify()
+        return entry_id
+
+    def get(self, entry_id: int) -> Optional[OutboxEntry]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM outbox WHERE id = ?", (entry_id,)).fetchone()
+        return OutboxEntry.from_row(row) if row else None
+
+    def entries(self, status: Optional[str] = None, limit: int = 100) -> List[OutboxEntry]:
+        """Entries in enqueue order, optionally only those with ``status``"""
+        with self._lock:
+            if status is None:
+                rows = self._conn.execute("SELECT * FROM outbox ORDER BY id LIMIT ?", (limit,)).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT * FROM outbox WHERE status = ? ORDER BY id LIMIT ?", (status, limit)
+                ).fetchall()
+        return [OutboxEntry.from_row(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        counts = {PENDING: 0, INFLIGHT: 0, DONE: 0, FAILED: 0}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def retry_failed(self) -> int:
+        """Requeue every failed entry; returns how many were requeued"""
+        requeued = self._write(
+            "UPDATE outbox SET status = ?, attempts = 0, available_at = ?, updated_at = ? WHERE status = ?",
+            (PENDING, time.time(), time.time(), FAILED),
+        )
+        if requeued:
+            with self._wakeup:
+                self._wakeup.notify_all()
+        return requeued
+
+    def purge_done(self, older_than: float = 0.0) -> int:
+        """Delete delivered entries finished more than ``older_than`` seconds ago"""
+        return self._write(
+            "DELETE FROM outbox WHERE status = ? AND updated_at <= ?", (DONE, time.time() - older_than)
+        )
+
+    def _claim(self) -> Optional[OutboxEntry]:
+        now = time.time()
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock up front, so two processes sharing the
+            # database cannot claim the same entry
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(_CLAIM, {"now": now}).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    "UPDATE outbox SET status = ?, attempts = attempts + 1, lease_until = ?, updated_at = ? WHERE id = ?",
+                    (INFLIGHT, now + self.lease_timeout, now, row["id"]),
+                )
+                entry = self._conn.execute("SELECT * FROM outbox WHERE id = ?", (row["id"],)).fetchone()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return OutboxEntry.from_row(entry)
+
+    def _complete(self, entry: OutboxEntry, response: Optional[Dict[str, Any]]) -> None:
+        self._write(
+            "UPDATE outbox SET status = ?, lease_until = NULL, last_error = NULL, response = ?, updated_at = ? WHERE id = ?",
+            (DONE, json.dumps(response), time.time(), entry.id),
+        )
+
+    def _fail(self, entry: OutboxEntry, error_message: str) -> None:
+        now = time.time()
+        exhausted = self.max_attempts > 0 and entry.attempts >= self.max_attempts
+        if is_transient_error(error_message) and not exhausted:
+            delay = self.backoff.backoff(entry.attempts)
+            self._write(
+                "UPDATE outbox SET status = ?, lease_until = NULL, last_error = ?, available_at = ?, updated_at = ? WHERE id = ?",
+                (PENDING, error_message, now + delay, now, entry.id),
+            )
+            with self._stats_lock:
+                self._retried += 1
+            logger.warning("Outbox entry %s failed (attempt %s), retrying in %.1fs: %s",
+                           entry.id, entry.attempts, delay, error_message)
+            return
+        self._write(
+            "UPDATE outbox SET status = ?, lease_until = NULL, last_error = ?, updated_at = ? WHERE id = ?",
+            (FAILED, error_message, now, entry.id),
+        )
+        with self._stats_lock:
+            self._failed += 1
+        logger.error("Outbox entry %s failed permanently after %s attempts: %s", entry.id, entry.attempts, error_message)
+
+    # -------------------------------------------------------------------------
+    # Workers
+    # -------------------------------------------------------------------------
+
+    def start(self, sender: Sender) -> None:
+        """Start the workers, delivering entries through ``sender``.
+
+        Args:
+            sender: Function taking (method, endpoint, data, idempotency_key) and returning
+                make_request's (success, error_message, response_data) tuple. Calling start again while
+                running keeps the first sender.
+        """
+        with self._wakeup:
+            if self._workers:
+                return
+            self._sender = sender
+            self._stopping = False
+            for index in range(self.max_workers):
+                worker = threading.Thread(target=self._run, name=f"clappia-outbox-{index}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                if self._stopping:
+                    return
+            try:
+                entry = self._claim()
+            except sqlite3.Error as e:
+                logger.error("Outbox claim failed: %s", e)
+                entry = None
+            if entry is None:
+                with self._wakeup:
+                    if not self._stopping:
+                        self._wakeup.wait(self.poll_interval)
+                continue
+            with self._wakeup:
+                self._active += 1
+            try:
+                self._deliver(entry)
+            finally:
+                with self._wakeup:
+                    self._active -= 1
+                    self._wakeup.notify_all()
+
+    def _deliver(self, entry: OutboxEntry) -> None:
+        try:
+            success, error_message, response_data = self._sender(
+                entry.method, entry.endpoint, entry.data, entry.idempotency_key
+            )
+        except Exception as e:
+            success, error_message, response_data = False, f"Unexpected error: {str(e)}", None
+        try:
+            if success:
+                self._complete(entry, response_data)
+                with self._stats_lock:
+                    self._delivered += 1
+                logger.info("Delivered outbox entry %s", entry.id)
+            else:
+                self._fail(entry, error_message or "")
+        except sqlite3.Error as e:
+            # The lease runs out and the entry is replayed, as after a crash
+            logger.error("Could not record outcome of outbox entry %s: %s", entry.id, e)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until no entry is pending or in flight.
+
+        Entries waiting for a backoff delay count as pending, so this may wait for
+        retries. Returns False if ``timeout`` seconds passed first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            counts = self.counts()
+            if counts[PENDING] == 0 and counts[INFLIGHT] == 0:
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            with self._wakeup:
+                self._wakeup.notify_all()
+                self._wakeup.wait(min(self.poll_interval, remaining) if remaining is not None else self.poll_interval)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the workers after their current delivery; queued entries stay on disk"""
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify_all()
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.join(timeout)
+
+    def close(self) -> None:
+        self.stop()
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry counts by status and delivery counters of this process"""
+        with self._wakeup:
+            active = self._active
+        with self._stats_lock:
+            delivered, retried, failed = self._delivered, self._retried, self._failed
+        return {
+            **self.counts(),
+            "workers": len(self._workers),
+            "active": active,
+            "delivered": delivered,
+            "retried": retried,
+            "permanentlyFailed": failed,
+        }
+
+    def __enter__(self) -> "SubmissionOutbox":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,261 @@
+import asyncio
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+BucketKey = Tuple[str, str]
+
+# Scope used for the bucket shared by every endpoint of a workplace
+WORKPLACE_SCOPE = "*"
+
+BLOCK = "block"
+WAIT = "wait"
+FAIL = "fail"
+_MODES = (BLOCK, WAIT, FAIL)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket settings.
+
+    Attributes:
+        rate: Tokens added per second (sustained requests per second).
+        burst: Bucket capacity, the number of requests that may be sent back to back.
+            Defaults to ``max(1, rate)``.
+    """
+
+    rate: float
+    burst: Optional[float] = None
+
+    def __post_init__(self):
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+    @property
+    def capacity(self) -> float:
+        return self.burst if self.burst is not None else max(1.0, self.rate)
+
+
+def _refill(tokens: float, updated: float, now: float, limit: RateLimit) -> float:
+    return min(limit.capacity, tokens + max(0.0, now - updated) * limit.rate)
+
+
+class MemoryTokenStore:
+    """Token buckets shared by every thread in the process"""
+
+    def __init__(self):
+        self._buckets: Dict[BucketKey, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: BucketKey, limit: RateLimit) -> float:
+        """Take one token, returning 0 on success or the seconds until one is available"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (limit.capacity, now))
+            tokens = _refill(tokens, updated, now, limit)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                return 0.0
+            self._buckets[key] = (tokens, now)
+            return (1 - tokens) / limit.rate
+
+    def refund(self, key: BucketKey, limit: RateLimit) -> None:
+        """Return a token taken for a request that was not sent"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (limit.capacity, now))
+            self._buckets[key] = (min(limit.capacity, _refill(tokens, updated, now, limit) + 1), now)
+
+
+class FileTokenStore:
+    """Token buckets shared across processes on one host through locked files.
+
+    Each bucket is a small JSON file in ``directory`` updated under an exclusive
+    ``flock``, so gunicorn or multiprocessing workers draw from the same buckets.
+    POSIX only.
+    """
+
+    def __init__(self, directory: str):
+        if fcntl is None:
+            raise RuntimeError("FileTokenStore requires fcntl (POSIX systems only)")
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: BucketKey) -> str:
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", "__".join(key))
+        return os.path.join(self.directory, f"{name}.bucket")
+
+    def take(self, key: BucketKey, limit: RateLimit) -> float:
+        """Take one token, returning 0 on success or the seconds until one is available"""
+        return self._update(key, limit, -1)
+
+    def refund(self, key: BucketKey, limit: RateLimit) -> None:
+        """Return a token taken for a request that was not sent"""
+        self._update(key, limit, 1)
+
+    def _update(self, key: BucketKey, limit: RateLimit, change: int) -> float:
+        fd = os.open(self._path(key), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            raw = os.read(fd, 256)
+            now = time.time()
+            try:
+                state = json.loads(raw) if raw else None
+                tokens, updated = float(state["tokens"]), float(state["updated"])
+            except (ValueError, TypeError, KeyError):
+                tokens, updated = limit.capacity, now
+            tokens = _refill(tokens, updated, now, limit)
+            wait = 0.0
+            if change > 0:
+                tokens = min(limit.capacity, tokens + change)
+            elif tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / limit.rate
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, json.dumps({"tokens": tokens, "updated": now}).encode())
+            return wait
+        finally:
+            os.close(fd)
+
+
+class RateLimiter:
+    """Client-side token bucket limiter keyed by workplace and endpoint.
+
+    A request must obtain a token from the workplace-wide bucket (when
+    ``workplace_limit`` is set) and from its endpoint's bucket (when the endpoint
+    appears in ``endpoint_limits``). Share one limiter between clients to pace
+    them together; use a FileTokenStore to pace several processes.
+
+    Modes:
+        "block": wait as long as needed for a token.
+        "wait": wait up to ``timeout`` seconds, then fail.
+        "fail": fail immediately when no token is available.
+    """
+
+    def __init__(
+        self,
+        workplace_limit: Optional[RateLimit] = None,
+        endpoint_limits: Optional[Dict[str, RateLimit]] = None,
+        mode: str = BLOCK,
+        timeout: float = 30.0,
+        store=None,
+    ):
+        """
+        Args:
+            workplace_limit: Limit shared by all endpoints of a workplace.
+            endpoint_limits: Limits for individual endpoints, e.g. ``{"submissions/create": RateLimit(5)}``.
+            mode: What to do when the bucket is empty: "block", "wait" or "fail".
+            timeout: Maximum seconds to wait in "wait" mode.
+            store: Bucket storage. Defaults to an in-process MemoryTokenStore.
+        """
+        if mode not in _MODES:
+            raise ValueError(f"mode must be one of {', '.join(_MODES)}")
+        self.workplace_limit = workplace_limit
+        self.endpoint_limits = {k.strip("/"): v for k, v in (endpoint_limits or {}).items()}
+        self.mode = mode
+        self.timeout = timeout
+        self.store = store if store is not None else MemoryTokenStore()
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._rejected = 0
+        self._waited = 0.0
+
+    def _buckets(self, workplace_id: str, endpoint: str) -> List[Tuple[BucketKey, RateLimit]]:
+        endpoint = endpoint.strip("/")
+        buckets = []
+        limit = self.endpoint_limits.get(endpoint)
+        if limit is not None:
+            buckets.append(((workplace_id, endpoint), limit))
+        if self.workplace_limit is not None:
+            buckets.append(((workplace_id, WORKPLACE_SCOPE), self.workplace_limit))
+        return buckets
+
+    def _deadline(self, mode: str, timeout: Optional[float]) -> Optional[float]:
+        if mode == BLOCK:
+            return None
+        if mode == FAIL:
+            return time.monotonic()
+        return time.monotonic() + (self.timeout if timeout is None else timeout)
+
+    def _record(self, acquired: bool, waited: float) -> None:
+        with self._lock:
+            if acquired:
+                self._acquired += 1
+            else:
+                self._rejected += 1
+            self._waited += waited
+
+    def _reject(self, taken: List[Tuple[BucketKey, RateLimit]], started: float) -> None:
+        # The request is not sent, so the tokens already drawn from other buckets go back
+        for key, limit in taken:
+            self.store.refund(key, limit)
+        self._record(False, time.monotonic() - started)
+
+    def acquire(self, workplace_id: str, endpoint: str, mode: Optional[str] = None,
+                timeout: Optional[float] = None) -> bool:
+        """Obtain a token for one request, sleeping as the mode allows.
+
+        Returns:
+            True when a token was obtained, False when the mode gave up.
+        """
+        deadline = self._deadline(mode or self.mode, timeout)
+        started = time.monotonic()
+        taken = []
+        for key, limit in self._buckets(workplace_id, endpoint):
+            while True:
+                wait = self.store.take(key, limit)
+                if wait <= 0:
+                    taken.append((key, limit))
+                    break
+                if deadline is not None and time.monotonic() + wait > deadline:
+                    self._reject(taken, started)
+                    return False
+                time.sleep(wait)
+        self._record(True, time.monotonic() - started)
+        return True
+
+    async def aacquire(self, workplace_id: str, endpoint: str, mode: Optional[str] = None,
+                       timeout: Optional[float] = None) -> bool:
+        """asyncio counterpart of acquire that yields to the event loop while waiting"""
+        deadline = self._deadline(mode or self.mode, timeout)
+        started = time.monotonic()
+        taken = []
+        for key, limit in self._buckets(workplace_id, endpoint):
+            while True:
+                wait = await self._off_loop(self.store.take, key, limit)
+                if wait <= 0:
+                    taken.append((key, limit))
+                    break
+                if deadline is not None and time.monotonic() + wait > deadline:
+                    await self._off_loop(self._reject, taken, started)
+                    return False
+                await asyncio.sleep(wait)
+        self._record(True, time.monotonic() - started)
+        return True
+
+    async def _off_loop(self, fn, *args):
+        # Only the in-process store is non-blocking; others (flock, I/O) run in a worker thread
+        if isinstance(self.store, MemoryTokenStore):
+            return fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "acquired": self._acquired,
+                "rejected": self._rejected,
+                "waitedSeconds": round(self._waited, 3),
+            }
@@ -0,0 +1,70 @@
+from typing import Any, Dict, Optional
+
+from clappia_api_tools._utils.json_codec import JsonCodec, get_default_codec
+
+_WHITESPACE = b" \t\r\n"
+
+
+def check_raw_object(data: Any, name: str = "data") -> Optional[str]:
+    """Cheap shape check of a pre-encoded JSON object, without decoding it.
+
+    Returns:
+        An "Error: ..." message, or None when ``data`` looks like a non-empty object.
+    """
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        return f"Error: {name} must be encoded JSON bytes"
+    # Index scans instead of strip(), which would copy a large payload
+    view = memoryview(data).cast("B") if isinstance(data, memoryview) else data
+    start, end = 0, len(view)
+    while start < end and view[start] in _WHITESPACE:
+        start += 1
+    while end > start and view[end - 1] in _WHITESPACE:
+        end -= 1
+    if end - start < 2 or view[start] != ord("{") or view[end - 1] != ord("}"):
+        return f"Error: {name} must be an encoded JSON object"
+    inner = start + 1
+    while inner < end - 1 and view[inner] in _WHITESPACE:
+        inner += 1
+    if inner == end - 1:
+        return f"Error: {name} cannot be empty - at least one field is required"
+    return None
+
+
+class RawBodyTemplate:
+    """Request body envelope with a slot for pre-encoded bytes.
+
+    The fixed members (workplaceId, appId, requestingUserEmailAddress, ...) are encoded
+    once; ``render`` splices the caller's bytes in under ``slot`` with a single join,
+    so the payload is never decoded or re-encoded.
+
+    Usage:
+        template = RawBodyTemplate({"workplaceId": "WP1", "appId": "APP1"})
+        template.render(b'{"name":"Ada"}', submissionId="S1")
+        # b'{"workplaceId":"WP1","appId":"APP1","submissionId":"S1","data":{"name":"Ada"}}'
+    """
+
+    def __init__(self, members: Dict[str, Any], slot: str = "data", codec: Optional[JsonCodec] = None):
+        """
+        Args:
+            members: Members every body carries.
+            slot: Name of the member the pre-encoded bytes go to.
+            codec: Encodes the members. Defaults to the process-wide codec.
+        """
+        self.codec = codec or get_default_codec()
+        encoded = self.codec.encode(members)
+        # Drop the closing brace so more members can follow
+        self._head = encoded[:-1] + (b"," if members else b"")
+        self._slot = self.codec.encode(slot) + b":"
+
+    def render(self, payload: bytes, **members: Any) -> bytes:
+        """Body with ``payload`` under the slot, plus per-call ``members``"""
+        parts = [self._head]
+        for name, value in members.items():
+            parts.append(self.codec.encode(name))
+            parts.append(b":")
+            parts.append(self.codec.encode(value))
+            parts.append(b",")
+        parts.append(self._slot)
+        parts.append(payload)
+        parts.append(b"}")
+        return b"".join(parts)
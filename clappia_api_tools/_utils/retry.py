@@ -0,0 +1,218 @@
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Dict, FrozenSet, Optional
+
+
+class EndpointClass(Enum):
+    """How safe an endpoint is to retry"""
+
+    READ = "read"
+    MUTATION = "mutation"
+
+
+ENDPOINT_CLASSES: Dict[str, EndpointClass] = {
+    "appdefinitionv2/getAppDefinition": EndpointClass.READ,
+    "submissions/create": EndpointClass.MUTATION,
+    "submissions/edit": EndpointClass.MUTATION,
+    "submissions/updateSubmissionOwners": EndpointClass.MUTATION,
+    "submissions/updateStatus": EndpointClass.MUTATION,
+    "appdefinitionv2/createApp": EndpointClass.MUTATION,
+    "appdefinitionv2/addField": EndpointClass.MUTATION,
+    "appdefinitionv2/updateField": EndpointClass.MUTATION,
+}
+
+# Statuses where the server refused the request before acting on it, so even a
+# non-idempotent mutation can be resent without risking a duplicate.
+REJECTED_STATUSES = frozenset({429, 503})
+
+
+def classify_endpoint(method: str, endpoint: str) -> EndpointClass:
+    """Return the retry class of an endpoint, treating unknown GETs as reads"""
+    known = ENDPOINT_CLASSES.get(endpoint.strip("/"))
+    if known is not None:
+        return known
+    return EndpointClass.READ if method.upper() == "GET" else EndpointClass.MUTATION
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry settings for one endpoint class.
+
+    Attributes:
+        max_attempts: Total attempts including the first one. 1 disables retries.
+        backoff_base: Delay before the first retry, in seconds.
+        backoff_max: Upper bound for any single backoff delay, in seconds.
+        jitter: Use full jitter (uniform between 0 and the exponential delay).
+        retry_statuses: HTTP statuses that may be retried.
+        respect_retry_after: Honor the server's Retry-After header when present.
+        max_retry_after: Give up instead of waiting when Retry-After asks for longer.
+        retry_ambiguous: Retry failures where the request may already have been
+            processed (read timeouts, dropped connections, 500/502/504). Safe for
+            reads; for mutations only enable it when duplicates are acceptable.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+    retry_ambiguous: bool = True
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (1-based)"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def is_retryable(self, status_code: Optional[int] = None, request_sent: bool = True) -> bool:
+        """Whether a failed attempt may be retried under this policy.
+
+        Args:
+            status_code: HTTP status of the response, or None when no response arrived.
+            request_sent: False when the connection failed before the request went out.
+        """
+        if status_code is None:
+            return self.retry_ambiguous or not request_sent
+        if status_code not in self.retry_statuses:
+            return False
+        return self.retry_ambiguous or status_code in REJECTED_STATUSES
+
+
+class RetryBudget:
+    """Process-wide cap on retries, as a fraction of recent requests.
+
+    A retry is allowed while retries in the last ``window`` seconds stay below
+    ``min_retries_per_second * window + ratio * requests``. During an outage every
+    request fails, so retries stop growing with traffic instead of multiplying it.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries_per_second: float = 1.0, window: float = 10.0):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._requests: deque = deque()
+        self._retries: deque = deque()
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._requests and self._requests[0] < cutoff:
+            self._requests.popleft()
+        while self._retries and self._retries[0] < cutoff:
+            self._retries.popleft()
+
+    def record_request(self) -> None:
+        """Count a first attempt towards the budget"""
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """Reserve one retry, returning False when the budget is exhausted"""
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            allowed = self.min_retries_per_second * self.window + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        """Requests and retries counted in the current window"""
+        with self._lock:
+            self._trim(time.monotonic())
+            return {"requests": len(self._requests), "retries": len(self._retries)}
+
+
+_default_budget = RetryBudget()
+
+
+def get_default_retry_budget() -> RetryBudget:
+    """Return the retry budget shared by every client in the process"""
+    return _default_budget
+
+
+def _default_mutation_policy() -> RetryPolicy:
+    return RetryPolicy(retry_ambiguous=False)
+
+
+@dataclass
+class RetryConfig:
+    """Retry policies per endpoint class plus the budget they draw from.
+
+    Reads are retried on any transient failure. Mutations are only retried when the
+    request was rejected before being processed (connection refused, 429, 503).
+    """
+
+    read: RetryPolicy = field(default_factory=RetryPolicy)
+    mutation: RetryPolicy = field(default_factory=_default_mutation_policy)
+    budget: Optional[RetryBudget] = field(default_factory=get_default_retry_budget)
+
+    @classmethod
+    def disabled(cls) -> "RetryConfig":
+        """Configuration that never retries"""
+        return cls(read=RetryPolicy(max_attempts=1), mutation=RetryPolicy(max_attempts=1), budget=None)
+
+    def policy_for(self, endpoint_class: EndpointClass) -> RetryPolicy:
+        return self.read if endpoint_class is EndpointClass.READ else self.mutation
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or an HTTP date"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def next_retry_delay(
+    config: RetryConfig,
+    endpoint_class: EndpointClass,
+    attempt: int,
+    status_code: Optional[int] = None,
+    retry_after: Optional[str] = None,
+    request_sent: bool = True,
+) -> Optional[float]:
+    """Decide whether attempt ``attempt`` (1-based) should be retried.
+
+    Returns:
+        Seconds to wait before the next attempt, or None to give up.
+    """
+    policy = config.policy_for(endpoint_class)
+    if attempt >= policy.max_attempts:
+        return None
+    if not policy.is_retryable(status_code, request_sent):
+        return None
+
+    delay = policy.backoff(attempt)
+    if policy.respect_retry_after:
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            if server_delay > policy.max_retry_after:
+                return None
+            delay = max(delay, server_delay)
+
+    if config.budget is not None and not config.budget.try_acquire():
+        return None
+    return delay
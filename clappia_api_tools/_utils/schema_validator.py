@@ -0,0 +1,286 @@
+import difflib
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from clappia_api_tools._utils.definition_cache import CompiledDefinitions, DefinitionCache, DefinitionKey, RequestResult
+from clappia_api_tools._utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# A compiled check returns a description of what is wrong with a value, or None
+Check = Callable[[Any], Optional[str]]
+
+_DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y", "%Y/%m/%d", "%d/%m/%Y")
+_TIME_FORMATS = ("%H:%M", "%H:%M:%S", "%I:%M %p")
+_SELECTOR_TYPES = ("singleSelector", "dropDown")
+_TEXT_TYPES = ("singleLineText", "multiLineText", "phoneNumber", "codeScanner", "nfcReader", "address")
+_NUMBER_TYPES = ("counter", "slider")
+_FILE_TYPES = ("file", "signature")
+
+
+def _show(value: Any) -> str:
+    text = repr(value)
+    return text if len(text) <= 40 else text[:37] + "..."
+
+
+def _check_text(value: Any) -> Optional[str]:
+    if isinstance(value, (dict, list)):
+        return f"expected text, got {type(value).__name__}"
+    return None
+
+
+def _check_number(value: Any) -> Optional[str]:
+    if isinstance(value, bool):
+        return f"expected a number, got {_show(value)}"
+    if isinstance(value, (int, float)):
+        return None
+    if isinstance(value, str):
+        try:
+            float(value.strip())
+            return None
+        except ValueError:
+            pass
+    return f"expected a number, got {_show(value)}"
+
+
+def _parses(value: Any, formats: Tuple[str, ...]) -> bool:
+    if not isinstance(value, str):
+        return False
+    value = value.strip()
+    for fmt in formats:
+        try:
+            datetime.strptime(value, fmt)
+            return True
+        except ValueError:
+            continue
+    return False
+
+
+def _check_date(value: Any) -> Optional[str]:
+    if _parses(value, _DATE_FORMATS):
+        return None
+    return f"expected a date such as 2024-01-15 or 15-01-2024, got {_show(value)}"
+
+
+def _check_time(value: Any) -> Optional[str]:
+    if _parses(value, _TIME_FORMATS):
+        return None
+    return f"expected a time such as 14:30 or 02:30 PM, got {_show(value)}"
+
+
+def _single_option_check(options: FrozenSet[str]) -> Check:
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return f"expected one of the options, got {_show(value)}"
+        if value.strip() not in options:
+            return f"{_show(value)} is not an option (options: {', '.join(sorted(options))})"
+        return None
+    return check
+
+
+def _multi_option_check(options: FrozenSet[str]) -> Check:
+    def check(value: Any) -> Optional[str]:
+        if isinstance(value, str):
+            chosen = [item.strip() for item in value.split(",") if item.strip()]
+        elif isinstance(value, list) and all(isinstance(item, str) for item in value):
+            chosen = [item.strip() for item in value]
+        else:
+            return f"expected a list or comma-separated string of options, got {_show(value)}"
+        unknown = [item for item in chosen if item not in options]
+        if unknown:
+            return f"{', '.join(map(repr, unknown))} not among the options ({', '.join(sorted(options))})"
+        return None
+    return check
+
+
+def _file_check(max_files: Optional[int]) -> Check:
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, list):
+            return 'expected a list of {"s3Path": {"bucket": ..., "key": ...}} objects'
+        if max_files is not None and len(value) > max_files:
+            return f"at most {max_files} files allowed, got {len(value)}"
+        for position, item in enumerate(value):
+            s3_path = item.get("s3Path") if isinstance(item, dict) else None
+            if not isinstance(s3_path, dict):
+                return f'file {position} must be an object with an "s3Path" object'
+            for part in ("bucket", "key"):
+                if not isinstance(s3_path.get(part), str) or not s3_path[part].strip():
+                    return f'file {position} s3Path needs a non-empty "{part}"'
+            if "makePublic" in s3_path and not isinstance(s3_path["makePublic"], bool):
+                return f'file {position} s3Path "makePublic" must be a boolean'
+        return None
+    return check
+
+
+def _compile_field(definition: Dict[str, Any]) -> Optional[Check]:
+    """Check for one field definition; None accepts any value"""
+    field_type = definition.get("fieldType")
+    options = definition.get("options")
+    if isinstance(options, list) and options and all(isinstance(option, str) for option in options):
+        option_set: Optional[FrozenSet[str]] = frozenset(option.strip() for option in options)
+    else:
+        option_set = None
+
+    if field_type in _SELECTOR_TYPES:
+        return _single_option_check(option_set) if option_set else _check_text
+    if field_type == "multiSelector":
+        return _multi_option_check(option_set) if option_set else None
+    if field_type in _TEXT_TYPES:
+        return _check_text
+    if field_type in _NUMBER_TYPES:
+        return _check_number
+    if field_type == "dateSelector":
+        return _check_date
+    if field_type == "timeSelector":
+        return _check_time
+    if field_type in _FILE_TYPES:
+        max_files = definition.get("maxFileAllowed")
+        return _file_check(max_files if isinstance(max_files, int) and not isinstance(max_files, bool) else None)
+    return None
+
+
+class SubmissionSchema:
+    """Field checks compiled from one version of an app definition.
+
+    Compiling does all per-field work (option sets, file limits, choosing the type
+    check) once, so validating a record is a dictionary lookup and one check per
+    submitted key.
+    """
+
+    def __init__(self, app_id: str, version: Any, checks: Dict[str, Optional[Check]], known: bool = True):
+        """
+        Args:
+            app_id: App the definition belongs to.
+            version: Definition version the checks were compiled from.
+            checks: Check per fieldName; None accepts any value of that field.
+            known: False when the definition had no recognizable field list; such a
+                schema accepts every record rather than rejecting valid data.
+        """
+        self.app_id = app_id
+        self.version = version
+        self.checks = checks
+        self.known = known
+
+    @classmethod
+    def compile(cls, definition: Dict[str, Any]) -> "SubmissionSchema":
+        """Compile a ``getAppDefinition`` response"""
+        fields = definition.get("fieldDefinitions")
+        known = isinstance(fields, dict)
+        if not known:
+            # Fall back to field objects nested in the sections
+            fields = {
+                field["fieldName"]: field
+                for section in definition.get("sections") or []
+                if isinstance(section, dict)
+                for field in section.get("fields") or []
+                if isinstance(field, dict) and field.get("fieldName")
+            }
+            known = bool(fields)
+        checks = {
+            name: _compile_field(field) if isinstance(field, dict) else None
+            for name, field in fields.items()
+        }
+        return cls(definition.get("appId", ""), definition.get("version"), checks, known)
+
+    def validate(self, data: Dict[str, Any]) -> List[str]:
+        """Problems with a submission's data; empty when it matches the definition"""
+        if not self.known:
+            return []
+        problems = []
+        checks = self.checks
+        for name, value in data.items():
+            if name not in checks:
+                close = difflib.get_close_matches(name, checks, n=1)
+                hint = f" (did you mean '{close[0]}'?)" if close else ""
+                problems.append(f"unknown field '{name}'{hint}")
+                continue
+            check = checks[name]
+            if check is None or value is None:
+                continue
+            problem = check(value)
+            if problem is not None:
+                problems.append(f"'{name}': {problem}")
+        return problems
+
+
+class SubmissionValidator:
+    """Pre-flight check of submission data against the app's definition.
+
+    Catches unknown field names and values that do not fit the field type (options
+    of selectors, dates, times, numbers, file s3Path objects) before a create or edit
+    is sent, instead of after a round trip that ends in a 400.
+
+    Definitions are read through ``definition_cache``; pass the cache used by the
+    app definition client so schema changes made through it take effect at once.
+    Changes made elsewhere are picked up when the cached definition expires. Each
+    definition version is compiled once into a SubmissionSchema.
+
+    When the definition cannot be loaded the data is sent unchecked and the API
+    remains the judge.
+    """
+
+    def __init__(self, definition_cache: Optional[DefinitionCache] = None):
+        """
+        Args:
+            definition_cache: Cache the definitions are loaded through. Defaults to a
+                private DefinitionCache with its default size and TTL.
+        """
+        self.definition_cache = definition_cache if definition_cache is not None else DefinitionCache()
+        self._schemas: CompiledDefinitions[SubmissionSchema] = CompiledDefinitions(SubmissionSchema.compile)
+        self._lock = threading.Lock()
+        self._checked = 0
+        self._rejected = 0
+        self._unavailable = 0
+
+    @staticmethod
+    def definition_key(app_id: str) -> DefinitionKey:
+        """Cache key of the definition variant the checks are compiled from.
+
+        The canonical variant, with HTML and tags, so options and defaults are checked
+        against the values the server stores rather than a stripped rendering.
+        """
+        return DefinitionCache.make_key(app_id, "en", False, True)
+
+    def schema(self, app_id: str, definition: Dict[str, Any]) -> SubmissionSchema:
+        """Compiled schema of a definition, compiling it on first use of its version"""
+        return self._schemas.get(app_id, definition)
+
+    def validate(self, app_id: str, data: Dict[str, Any], definition: Dict[str, Any]) -> List[str]:
+        """Problems with ``data`` according to ``definition``; empty when it is valid"""
+        problems = self.schema(app_id, definition).validate(data)
+        with self._lock:
+            self._checked += 1
+            if problems:
+                self._rejected += 1
+        return problems
+
+    def check(self, app_id: str, data: Dict[str, Any], loaded: RequestResult) -> Optional[str]:
+        """Error message for invalid data, given the outcome of loading the definition.
+
+        Returns None when the data is valid or the definition could not be loaded.
+        """
+        success, error_message, definition = loaded
+        if not success or not isinstance(definition, dict):
+            with self._lock:
+                self._unavailable += 1
+            logger.warning("Sending unvalidated data: definition of app_id %s unavailable: %s", app_id, error_message)
+            return None
+        problems = self.validate(app_id, data, definition)
+        if not problems:
+            return None
+        return f"Error: data does not match the app definition - {'; '.join(problems)}"
+
+    def forget(self, app_id: str) -> None:
+        """Drop the compiled schema of an app"""
+        self._schemas.forget(app_id)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "schemas": len(self._schemas),
+                "compiles": self._schemas.compiles,
+                "checked": self._checked,
+                "rejected": self._rejected,
+                "unavailable": self._unavailable,
+            }
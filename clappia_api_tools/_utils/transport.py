@@ -0,0 +1,267 @@
+import inspect
+import json
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from clappia_api_tools._utils.http_pool import PoolConfig, get_shared_pool, session_stats
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the async extra
+    httpx = None
+
+
+class TransportError(Exception):
+    """Base class for failures where no HTTP response was received.
+
+    Attributes:
+        request_sent: False when the connection failed before any part of the
+            request went out, so it is safe to resend even a mutation.
+    """
+
+    def __init__(self, message: str = "", request_sent: bool = True):
+        super().__init__(message)
+        self.request_sent = request_sent
+
+
+class TransportTimeout(TransportError):
+    """The request timed out"""
+
+
+class TransportConnectionError(TransportError):
+    """The server could not be reached or the connection dropped"""
+
+
+@dataclass
+class TransportRequest:
+    """An HTTP request as seen by a transport.
+
+    Attributes:
+        method: HTTP method.
+        url: Absolute URL.
+        headers: Request headers.
+        params: Query parameters.
+        body: Encoded JSON body, or None.
+        timeout: Timeout in seconds.
+    """
+
+    method: str
+    url: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    params: Optional[Dict[str, Any]] = None
+    body: Optional[bytes] = None
+    timeout: Optional[float] = None
+
+    @property
+    def path(self) -> str:
+        """URL path without the leading slash, e.g. ``submissions/create``"""
+        return urlsplit(self.url).path.lstrip("/")
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+
+@dataclass
+class TransportResponse:
+    """Status, headers and raw body returned by a transport"""
+
+    status_code: int
+    headers: Mapping[str, str] = field(default_factory=CaseInsensitiveDict)
+    content: bytes = b""
+
+    def __post_init__(self):
+        if not isinstance(self.headers, CaseInsensitiveDict):
+            self.headers = CaseInsensitiveDict(self.headers)
+
+    @classmethod
+    def from_json(cls, status_code: int, data: Any, headers: Optional[Mapping[str, str]] = None) -> "TransportResponse":
+        """Build a response with a JSON body"""
+        merged = {"Content-Type": "application/json", **(headers or {})}
+        return cls(status_code, merged, json.dumps(data).encode("utf-8"))
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class Transport:
+    """Sends one HTTP request and returns the raw response.
+
+    Implementations raise TransportTimeout or TransportConnectionError when no
+    response was received. Retries, rate limiting and error formatting stay in
+    ClappiaAPIUtils, so every transport gets them for free.
+    """
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        """Connection statistics, if the transport keeps any"""
+        return {}
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncTransport:
+    """asyncio counterpart of Transport"""
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _is_connect_failure(error: requests.exceptions.ConnectionError) -> bool:
+    """Whether the connection failed before any part of the request was sent"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    reason = getattr(reason, "reason", reason)
+    return type(reason).__name__ in ("NewConnectionError", "NameResolutionError", "ConnectTimeoutError")
+
+
+class RequestsTransport(Transport):
+    """Default transport using a pooled ``requests`` session.
+
+    Without an explicit session, the session comes from the process-wide pool, so
+    every client with the same base_url and pool config shares keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "",
+        pool_config: Optional[PoolConfig] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        self.base_url = base_url
+        self.pool_config = pool_config or PoolConfig()
+        self._session = session
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            self._session = get_shared_pool().get_session(self.base_url, self.pool_config)
+        return self._session
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        try:
+            response = self.session.request(
+                method=request.method,
+                url=request.url,
+                headers=request.headers,
+                data=request.body,
+                params=request.params,
+                timeout=request.timeout,
+            )
+        except requests.exceptions.Timeout as e:
+            raise TransportTimeout(str(e), request_sent=not isinstance(e, requests.exceptions.ConnectTimeout)) from e
+        except requests.exceptions.ConnectionError as e:
+            raise TransportConnectionError(str(e), request_sent=not _is_connect_failure(e)) from e
+        return TransportResponse(response.status_code, response.headers, response.content)
+
+    def stats(self) -> Dict[str, Any]:
+        return session_stats(self.session, self.pool_config)
+
+
+class HttpxTransport(AsyncTransport):
+    """Default async transport using one pooled ``httpx.AsyncClient``.
+
+    Requires the ``async`` extra (``pip install clappia-api-tools[async]``).
+    """
+
+    def __init__(self, pool_config: Optional[PoolConfig] = None, client: Optional["httpx.AsyncClient"] = None):
+        if httpx is None:
+            raise ImportError(
+                "Async clients require httpx. Install with: pip install clappia-api-tools[async]"
+            )
+        self.pool_config = pool_config or PoolConfig()
+        self._client = client
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """Pooled async HTTP client, created on first use"""
+        if self._client is None or self._client.is_closed:
+            config = self.pool_config
+            limits = httpx.Limits(
+                max_connections=config.pool_maxsize if config.pool_block else None,
+                max_keepalive_connections=config.pool_maxsize if config.keep_alive else 0,
+            )
+            self._client = httpx.AsyncClient(limits=limits)
+        return self._client
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        try:
+            response = await self.client.request(
+                method=request.method,
+                url=request.url,
+                headers=request.headers,
+                content=request.body,
+                params=request.params,
+                timeout=request.timeout,
+            )
+        except httpx.TimeoutException as e:
+            raise TransportTimeout(
+                str(e), request_sent=not isinstance(e, (httpx.ConnectTimeout, httpx.PoolTimeout))
+            ) from e
+        except httpx.TransportError as e:
+            raise TransportConnectionError(str(e), request_sent=not isinstance(e, httpx.ConnectError)) from e
+        return TransportResponse(response.status_code, response.headers, response.content)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and its connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+Handler = Callable[[TransportRequest], TransportResponse]
+AsyncHandler = Callable[[TransportRequest], Union[TransportResponse, Awaitable[TransportResponse]]]
+
+
+class InProcessTransport(Transport):
+    """Transport that hands requests straight to a Python function.
+
+    No sockets, no serialization beyond the JSON body. Useful for tests and for
+    profiling the library's own overhead separately from network time.
+    """
+
+    def __init__(self, handler: Handler):
+        self.handler = handler
+        self.requests_sent = 0
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        self.requests_sent += 1
+        return self.handler(request)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"requestsSent": self.requests_sent}
+
+
+class AsyncInProcessTransport(AsyncTransport):
+    """asyncio counterpart of InProcessTransport; the handler may be sync or async"""
+
+    def __init__(self, handler: AsyncHandler):
+        self.handler = handler
+        self.requests_sent = 0
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        self.requests_sent += 1
+        response = self.handler(request)
+        if inspect.isawaitable(response):
+            response = await response
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        return {"requestsSent": self.requests_sent}
@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+import signal
+import sys
+from typing import Dict, List, Optional
+
+from clappia_api_tools._utils.idempotency import IdempotencyLedger
+from clappia_api_tools._utils.rate_limit import RateLimit, RateLimiter
+from clappia_api_tools.client.submission_client import SubmissionClient
+from clappia_api_tools.importer import ImportStats, SubmissionImporter
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # pragma: no cover - python-dotenv is optional at runtime
+    load_dotenv = None
+
+
+def _parse_mapping(items: List[str]) -> Dict[str, str]:
+    mapping = {}
+    for item in items:
+        column, sep, field_name = item.partition("=")
+        if not sep or not column.strip() or not field_name.strip():
+            raise argparse.ArgumentTypeError(f'invalid mapping "{item}", expected COLUMN=fieldName')
+        mapping[column.strip()] = field_name.strip()
+    return mapping
+
+
+def _add_connection_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--api-key", default=os.environ.get("CLAPPIA_API_KEY"), help="Defaults to $CLAPPIA_API_KEY")
+    parser.add_argument("--base-url", default=os.environ.get("CLAPPIA_BASE_URL"), help="Defaults to $CLAPPIA_BASE_URL")
+    parser.add_argument(
+        "--workplace-id", default=os.environ.get("CLAPPIA_WORKPLACE_ID"), help="Defaults to $CLAPPIA_WORKPLACE_ID"
+    )
+    parser.add_argument("--timeout", type=int, default=30, help="Request timeout in seconds")
+
+
+def _add_import_parser(subparsers) -> None:
+    parser = subparsers.add_parser(
+        "import",
+        help="Create submissions from a CSV or JSONL file",
+        description="Stream a CSV or JSONL file into an app, one submission per record. "
+                    "Progress is checkpointed, so running the same command again resumes a killed import.",
+    )
+    parser.add_argument("file", help="CSV or JSONL file to import")
+    parser.add_argument("--app-id", required=True, help="App to create the submissions in")
+    parser.add_argument("--email", required=True, help="Email address of the requesting user (submission owner)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default=None, help="Defaults to the file extension")
+    parser.add_argument("--delimiter", default=None, help="CSV delimiter (default: comma, tab for .tsv)")
+    parser.add_argument("--map", dest="mappings", action="append", default=[], metavar="COLUMN=FIELD",
+                        help="Send COLUMN as fieldName FIELD; repeatable")
+    parser.add_argument("--mapping-file", default=None, help='JSON file of {"column": "fieldName"} renames')
+    parser.add_argument("--only-mapped", action="store_true", help="Drop columns without a mapping")
+    parser.add_argument("--keep-empty", action="store_true", help="Send empty values instead of omitting them")
+    parser.add_argument("--resolve-labels", action="store_true",
+                        help="Columns are field labels (e.g. \"Employee Name\"); translate them to field names")
+    parser.add_argument("--concurrency", type=int, default=8, help="Create requests in flight at once")
+    parser.add_argument("--rate", type=float, default=None, help="Maximum create requests per second")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint file (default: FILE.checkpoint.json)")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start from the beginning")
+    parser.add_argument("--failures", default=None, help="JSONL file receiving failed records (default: FILE.failures.jsonl)")
+    parser.add_argument("--ledger", default=None,
+                        help="Idempotency ledger database; records resent after a crash are not created twice")
+    parser.add_argument("--quiet", action="store_true", help="Do not print progress")
+    _add_connection_arguments(parser)
+    parser.set_defaults(handler=run_import)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="clappia-tools", description="Command line tools for the Clappia API.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    _add_import_parser(subparsers)
+    return parser
+
+
+def _print_progress(stats: ImportStats) -> None:
+    line = (
+        f"{stats.fraction:6.1%}  {stats.succeeded} created  {stats.failed} failed  "
+        f"{stats.rate:.1f} records/s  {stats.elapsed:.0f}s"
+    )
+    if sys.stderr.isatty():
+        print(f"\r{line}", end="", file=sys.stderr, flush=True)
+    else:
+        print(line, file=sys.stderr, flush=True)
+
+
+def run_import(args: argparse.Namespace) -> int:
+    mapping: Dict[str, str] = {}
+    if args.mapping_file:
+        with open(args.mapping_file, "r", encoding="utf-8") as f:
+            mapping.update(json.load(f))
+    try:
+        mapping.update(_parse_mapping(args.mappings))
+    except argparse.ArgumentTypeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    limiter = None
+    if args.rate is not None:
+        limiter = RateLimiter(endpoint_limits={"submissions/create": RateLimit(args.rate)})
+    ledger = IdempotencyLedger(path=args.ledger) if args.ledger else None
+    client = SubmissionClient(
+        api_key=args.api_key,
+        base_url=args.base_url,
+        workplace_id=args.workplace_id,
+        timeout=args.timeout,
+        rate_limiter=limiter,
+        idempotency_ledger=ledger,
+        structured_results=True,
+    )
+    env_valid, env_error = client.api_utils.validate_environment()
+    if not env_valid:
+        print(f"Error: {env_error}", file=sys.stderr)
+        return 2
+
+    importer = SubmissionImporter(
+        client,
+        args.app_id,
+        args.email,
+        mapping=mapping,
+        only_mapped=args.only_mapped,
+        keep_empty=args.keep_empty,
+        resolve_labels=args.resolve_labels,
+        concurrency=args.concurrency,
+        checkpoint_path=args.checkpoint or f"{args.file}.checkpoint.json",
+        failures_path=args.failures or f"{args.file}.failures.jsonl",
+        progress=None if args.quiet else _print_progress,
+    )
+    # SIGTERM stops reading and checkpoints what finished, like Ctrl-C
+    signal.signal(signal.SIGTERM, lambda signum, frame: importer.stop())
+    try:
+        stats = importer.run(args.file, args.format, restart=args.restart, delimiter=args.delimiter)
+    except KeyboardInterrupt:
+        print("\nInterrupted; run the same command again to resume.", file=sys.stderr)
+        return 130
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if ledger is not None:
+            ledger.close()
+
+    if not args.quiet and sys.stderr.isatty():
+        print(file=sys.stderr)
+    print(json.dumps({
+        "file": args.file,
+        "appId": args.app_id,
+        "created": stats.succeeded,
+        "failed": stats.failed,
+        "resumedFromByte": stats.resumed_from,
+        "seconds": round(stats.elapsed, 3),
+        "recordsPerSecond": round(stats.rate, 1),
+    }, indent=2))
+    return 1 if stats.failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    if load_dotenv is not None:
+        load_dotenv()
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
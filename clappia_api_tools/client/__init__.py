@@ -2,5 +2,18 @@ from .clappia_client import ClappiaClient
 from .base_client import BaseClappiaClient
 from .submission_client import SubmissionClient
 from .app_definition_client import AppDefinitionClient
+from .async_clappia_client import AsyncClappiaClient
+from .async_base_client import AsyncBaseClappiaClient
+from .async_submission_client import AsyncSubmissionClient
+from .async_app_definition_client import AsyncAppDefinitionClient
 
-__all__ = ["ClappiaClient", "BaseClappiaClient", "SubmissionClient", "AppDefinitionClient"]
+__all__ = [
+    "ClappiaClient",
+    "BaseClappiaClient",
+    "SubmissionClient",
+    "AppDefinitionClient",
+    "AsyncClappiaClient",
+    "AsyncBaseClappiaClient",
+    "AsyncSubmissionClient",
+    "AsyncAppDefinitionClient",
+]
@@ -1,64 +1,55 @@
-import json
-from .base_client import BaseClappiaClient
+from functools import partial
+from .base_client import BaseClappiaClient, PreparedRequest, definition_request
 from clappia_api_tools._utils.validators import ClappiaInputValidator
-from clappia_api_tools._utils.logging_utils import get_logger
+from clappia_api_tools._utils.logging_utils import BodyPreview, get_logger
 from clappia_api_tools._models.model import Section
 from clappia_api_tools._models.model import Field
-from typing import List, Dict, Any, Optional
+from clappia_api_tools._utils.definition_cache import DefinitionCache
+from typing import List, Dict, Any, Optional, Union, Tuple
+from clappia_api_tools._models.model import ClappiaResult, RawResult
 
 logger = get_logger(__name__)
 
 
-class AppDefinitionClient(BaseClappiaClient):
-    """Client for managing Clappia app definitions.
-    
-    This client handles retrieving and managing application definitions,
-    including forms, fields, sections, and metadata.
+class AppDefinitionOperations:
+    """Validation, payload building and response formatting for app definition calls.
+
+    Shared by AppDefinitionClient and AsyncAppDefinitionClient so both validate inputs
+    and render results identically; only the transport differs.
     """
 
-    def get_definition(self, app_id: str, language: str = "en", 
-                      strip_html: bool = True, include_tags: bool = True) -> str:
-        """Fetches complete definition of a Clappia application including forms, fields, sections, and metadata.
+    definition_cache: Optional[DefinitionCache] = None
 
-        Retrieves structure and configuration of a Clappia app to understand available fields,
-        validation rules, and workflow logic before creating charts, filtering submissions, or planning integrations.
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Returns hit/miss/eviction statistics of the definition cache, or None when caching is off."""
+        return self.definition_cache.stats() if self.definition_cache is not None else None
 
-        Args:
-            app_id: Unique application identifier in uppercase letters and numbers format (e.g., QGU236634). Use this to specify which Clappia app definition to retrieve.
-            language: Language code for field labels and translations. Available options: "en" (English, default), "es" (Spanish), "fr" (French), "de" (German). Use "es" for Spanish reports or "fr" for French localization.
-            strip_html: Whether to remove HTML formatting from text fields. True (default) removes HTML tags for clean text, False preserves HTML formatting for display purposes.
-            include_tags: Whether to include metadata tags in response. True (default) includes full metadata tags, False returns basic structure only for lightweight responses.
+    def _invalidate_definitions(self, prepared: PreparedRequest, response_data: Optional[Dict[str, Any]]) -> None:
+        """Drops cached definitions of an app after a schema mutation was sent.
 
-        Returns:
-            str: Formatted response with app definition details and complete structure
+        Runs whatever the outcome: a failed or timed-out write may still have been applied.
         """
+        if self.definition_cache is None:
+            return
+        app_id = prepared.context.get("invalidates_app")
+        if app_id is None and prepared.endpoint == "appdefinitionv2/createApp" and response_data:
+            app_id = response_data.get("appId")
+        if app_id:
+            self.definition_cache.invalidate_app(app_id)
+
+    def _prepare_get_definition(self, app_id: str, language: str = "en", 
+                      strip_html: bool = True, include_tags: bool = True) -> Union[str, PreparedRequest]:
         is_valid, error_msg = ClappiaInputValidator.validate_app_id(app_id)
         if not is_valid:
             return f"Error: Invalid app_id - {error_msg}"
 
-        params = {
-            "appId": app_id.strip(),
-            "workplaceId": self.api_utils.workplace_id,
-            "language": language,
-            "stripHtml": str(strip_html).lower(),
-            "includeTags": str(include_tags).lower(),
-        }
-
-        logger.info(
-            f"Getting app definition for app_id: {app_id} with params: {params}"
+        prepared = definition_request(
+            self.api_utils.workplace_id, DefinitionCache.make_key(app_id, language, strip_html, include_tags)
         )
+        logger.info("Getting app definition for app_id: %s with params: %s", app_id, prepared.params)
+        return prepared
 
-        success, error_message, response_data = self.api_utils.make_request(
-            method="GET",
-            endpoint="appdefinitionv2/getAppDefinition",
-            params=params,
-        )
-
-        if not success:
-            logger.error(f"Error: {error_message}")
-            return f"Error: {error_message}"
-
-
+    def _format_get_definition(self, prepared: PreparedRequest, response_data: Optional[Dict[str, Any]]) -> str:
         app_info = {
             "appId": response_data.get("appId") if response_data else None,
             "version": response_data.get("version") if response_data else None,
@@ -82,30 +73,10 @@ class AppDefinitionClient(BaseClappiaClient):
             ),
         }
 
-        return f"Successfully retrieved app definition:\n\nSUMMARY:\n{json.dumps(app_info, indent=2)}\n\nFULL DEFINITION:\n{json.dumps(response_data, indent=2)}"
-
-    def create_app(self, app_name: str, requesting_user_email_address: str, 
-                   sections: List[Dict[str, Any]]) -> str:
-        """Create a new Clappia application with specified sections and fields.
-
-        Args:
-            app_name: Name of the new application (e.g., "Employee Survey", "Inventory Management"). Minimum 10 characters.
-            requesting_user_email_address: Email address of the user creating the app (becomes the app owner).
-            sections: List of Section objects defining the app structure. Each section contains fields with specific types and properties.
-
-            Example:
-            {
-                "sections": [
-                    {
-                        "sectionName": "Section 1",
-                        "fields": [{"fieldType": "singleLineText", "label": "Field 1", "options": ["Option 1", "Option 2"]}, {"fieldType": "multiLineText", "label": "Field 2", "options": ["Option 3", "Option 4"]}]
-                    }
-                ]
-            }
+        return f"Successfully retrieved app definition:\n\nSUMMARY:\n{self.api_utils.json_codec.pretty(app_info)}\n\nFULL DEFINITION:\n{self.api_utils.json_codec.pretty(response_data)}"
 
-        Returns:
-            str: Success message with app ID and URL, or error message if the request fails.
-        """
+    def _prepare_create_app(self, app_name: str, requesting_user_email_address: str, 
+                   sections: List[Dict[str, Any]]) -> Union[str, PreparedRequest]:
         is_valid, error_msg = ClappiaInputValidator.validate_app_name(app_name)
         if not is_valid:
             return f"Error: Invalid app_name - {error_msg}"
@@ -124,7 +95,7 @@ class AppDefinitionClient(BaseClappiaClient):
                     options=field_dict.get("options")
                 )
                 fields.append(field)
-            
+
             section = Section(
                 sectionName=section_dict["sectionName"],
                 fields=fields
@@ -146,19 +117,18 @@ class AppDefinitionClient(BaseClappiaClient):
             "sections": [section.to_dict() for section in section_objects],
         }
 
-        logger.info(f"Creating app with payload: {json.dumps(payload, indent=2)}")
+        logger.info("Creating app: %s", app_name)
+        logger.debug("App payload: %s", BodyPreview(payload))
 
-        success, error_message, response_data = self.api_utils.make_request(
+        return PreparedRequest(
             method="POST",
             endpoint="appdefinitionv2/createApp",
             data=payload,
+            context={"app_name": app_name},
         )
 
-        if not success:
-            logger.error(f"Error: {error_message}")
-            return f"Error: {error_message}"
-        
-
+    def _format_create_app(self, prepared: PreparedRequest, response_data: Optional[Dict[str, Any]]) -> str:
+        app_name = prepared.context["app_name"]
         app_id = response_data.get("appId") if response_data else None
         app_url = response_data.get("appUrl") if response_data else None
         result = {
@@ -167,9 +137,9 @@ class AppDefinitionClient(BaseClappiaClient):
             "appUrl": app_url,
             "status": "created"
         }
-        return f"App created successfully:\nSUMMARY:\n{json.dumps(result, indent=2)}\n\nFULL RESPONSE:\n{json.dumps(response_data, indent=2)}"
+        return f"App created successfully:\nSUMMARY:\n{self.api_utils.json_codec.pretty(result)}\n\nFULL RESPONSE:\n{self.api_utils.json_codec.pretty(response_data)}"
 
-    def add_field(self, app_id: str, requesting_user_email_address: str,
+    def _prepare_add_field(self, app_id: str, requesting_user_email_address: str,
                   section_index: int, field_index: int, field_type: str, 
                   label: Optional[str] = None, required: Optional[bool] = None,  description: Optional[str] = None,
                   block_width_percentage_desktop: Optional[int] = None,
@@ -189,40 +159,7 @@ class AppDefinitionClient(BaseClappiaClient):
                   image_text: Optional[str] = None,
                   file_name_prefix: Optional[str] = None,
                   formula: Optional[str] = None,
-                  hidden: Optional[bool] = None) -> str:
-        """Add a new field to an existing Clappia application at a specific position.
-
-        Args:
-            app_id: Application ID (e.g., "MFX093412").
-            requesting_user_email_address: Email address of the user adding the field.
-            section_index: Index of the section to add the field to (starts from 0).
-            field_index: Position within the section for the new field (starts from 0).
-            field_type: Type of field (e.g., "singleLineText", "singleSelector").
-            label: Display label for the field.
-            required: Whether the field is required.
-            description: Field description or help text.
-            block_width_percentage_desktop: Width percentage on desktop.
-            block_width_percentage_mobile: Width percentage on mobile.
-            display_condition: Condition for when to show the field.
-            retain_values: Whether to retain values when field is hidden.
-            is_editable: Whether the field can be edited.
-            editability_condition: Condition for when field is editable.
-            validation: Validation type.
-            default_value: Default value for the field.
-            options: List of options for selector fields.
-            style: Style for selector fields.
-            number_of_cols: Number of columns for selector fields.
-            allowed_file_types: List of allowed file types for file fields.
-            max_file_allowed: Maximum files allowed.
-            image_quality: Image quality for file fields.
-            image_text: Text overlay for image fields.
-            file_name_prefix: Prefix for uploaded file names.
-            formula: Formula for calculation fields.
-            hidden: Whether the field is hidden.
-
-        Returns:
-            str: Success message with generated field name or error message if the request fails.
-        """
+                  hidden: Optional[bool] = None) -> Union[str, PreparedRequest]:
         add_field_to_app_field_types = [
             "singleLineText",
             "multiLineText",
@@ -320,192 +257,22 @@ class AppDefinitionClient(BaseClappiaClient):
         if hidden is not None and field_type == "formula":
             payload["hidden"] = hidden
         
-        logger.info(f"Adding field to app_id: {app_id} with payload: {payload}")
-        
-        success, error_message, response_data = self.api_utils.make_request(
-            method="POST",
-            endpoint="appdefinitionv2/addField",
-            data=payload,
-        )
-        
-        if not success:
-            logger.error(f"Error: {error_message}")
-            return f"Error: {error_message}"
-        
-        
-        field_name = response_data.get("fieldName") if response_data else None
-        result = f"Successfully added field.\nField Name: {field_name}\n\nFULL RESPONSE:\n{json.dumps(response_data, indent=2)}"
-        return result
- 
-    def add_field(self, app_id: str, requesting_user_email_address: str,
-                  section_index: int, field_index: int, field_type: str, 
-                  label: Optional[str] = None, required: Optional[bool] = None,  description: Optional[str] = None,
-                  block_width_percentage_desktop: Optional[int] = None,
-                  block_width_percentage_mobile: Optional[int] = None,
-                  display_condition: Optional[str] = None,
-                  retain_values: Optional[bool] = None,
-                  is_editable: Optional[bool] = None,
-                  editability_condition: Optional[str] = None,
-                  validation: Optional[str] = None,
-                  default_value: Optional[str] = None,
-                  options: Optional[List[str]] = None,
-                  style: Optional[str] = None,
-                  number_of_cols: Optional[int] = None,
-                  allowed_file_types: Optional[List[str]] = None,
-                  max_file_allowed: Optional[int] = None,
-                  image_quality: Optional[str] = None,
-                  image_text: Optional[str] = None,
-                  file_name_prefix: Optional[str] = None,
-                  formula: Optional[str] = None,
-                  hidden: Optional[bool] = None) -> str:
-        """Add a new field to an existing Clappia application at a specific position.
+        logger.info("Adding field to app_id: %s", app_id)
+        logger.debug("Field payload: %s", BodyPreview(payload))
 
-        Args:
-            app_id: Application ID (e.g., "MFX093412").
-            requesting_user_email_address: Email address of the user adding the field.
-            section_index: Index of the section to add the field to (starts from 0).
-            field_index: Position within the section for the new field (starts from 0).
-            field_type: Type of field (e.g., "singleLineText", "singleSelector").
-            label: Display label for the field.
-            required: Whether the field is required.
-            description: Field description or help text.
-            block_width_percentage_desktop: Width percentage on desktop.
-            block_width_percentage_mobile: Width percentage on mobile.
-            display_condition: Condition for when to show the field.
-            retain_values: Whether to retain values when field is hidden.
-            is_editable: Whether the field can be edited.
-            editability_condition: Condition for when field is editable.
-            validation: Validation type.
-            default_value: Default value for the field.
-            options: List of options for selector fields.
-            style: Style for selector fields.
-            number_of_cols: Number of columns for selector fields.
-            allowed_file_types: List of allowed file types for file fields.
-            max_file_allowed: Maximum files allowed.
-            image_quality: Image quality for file fields.
-            image_text: Text overlay for image fields.
-            file_name_prefix: Prefix for uploaded file names.
-            formula: Formula for calculation fields.
-            hidden: Whether the field is hidden.
-
-        Returns:
-            str: Success message with generated field name or error message if the request fails.
-        """
-        add_field_to_app_field_types = [
-            "singleLineText",
-            "multiLineText",
-            "singleSelector",
-            "multiSelector",
-            "dropDown",
-            "dateSelector",
-            "timeSelector",
-            "phoneNumber",
-            "uniqueNumbering",
-            "file",
-            "gpsLocation",
-            "html",
-            "calculationsAndLogic",
-            "codeScanner",
-            "counter",
-            "slider",
-            "signature",
-            "validation",
-            "liveTracking",
-            "nfcReader",
-            "address"          
-        ]
-            
-        is_valid, error_msg = ClappiaInputValidator.validate_app_id(app_id)
-        if not is_valid:
-            return f"Error: Invalid app_id - {error_msg}"
-        
-        if not requesting_user_email_address or not requesting_user_email_address.strip():
-            return "Error: requesting_user_email_address is required and cannot be empty"
-        
-        if not ClappiaInputValidator.validate_email(requesting_user_email_address):
-            return "Error: requesting_user_email_address must be a valid email address"
-        
-        env_valid, env_error = self.api_utils.validate_environment()
-        if not env_valid:
-            return f"Error: {env_error}"
-        
-        if field_type not in add_field_to_app_field_types:
-            return f"Error: field_type '{field_type}' is not allowed to be added to app, allowed field types are {add_field_to_app_field_types}"
-
-        payload = {
-            "workplaceId": self.api_utils.workplace_id,
-            "appId": app_id.strip(),
-            "requestingUserEmailAddress": requesting_user_email_address.strip(),
-            "sectionIndex": section_index,
-            "fieldIndex": field_index,
-            "fieldType": field_type,
-        }
-        
-        # Add optional parameters if provided
-        if description is not None:
-            payload["description"] = description.strip()
-
-        if required is not None:
-            payload["required"] = required
-
-        if label is not None:
-            payload["label"] = label.strip()
-
-        if block_width_percentage_desktop is not None:
-            payload["blockWidthPercentageDesktop"] = block_width_percentage_desktop
-        if block_width_percentage_mobile is not None:
-            payload["blockWidthPercentageMobile"] = block_width_percentage_mobile
-        if display_condition is not None:
-            payload["displayCondition"] = display_condition.strip()
-        if retain_values is not None:
-            payload["retainValues"] = retain_values
-        if is_editable is not None:
-            payload["isEditable"] = is_editable
-        if editability_condition is not None:
-            payload["editabilityCondition"] = editability_condition.strip()
-        if validation is not None:
-            payload["validation"] = validation
-        if default_value is not None and field_type == "singleLineText":
-            payload["defaultValue"] = default_value.strip()
-        if options is not None and field_type in ["singleSelector", "multiSelector", "dropDown"]:
-            payload["options"] = options
-        if style is not None and field_type in ["singleSelector", "multiSelector"]:
-            payload["style"] = style
-        if number_of_cols is not None and field_type in ["singleSelector", "multiSelector"]:
-            payload["numberOfCols"] = number_of_cols
-        if allowed_file_types is not None and field_type == "file":
-            payload["allowedFileTypes"] = allowed_file_types
-        if max_file_allowed is not None and field_type == "file":
-            payload["maxFileAllowed"] = max_file_allowed
-        if image_quality is not None and field_type == "file":
-            payload["imageQuality"] = image_quality
-        if image_text is not None and field_type == "file":
-            payload["imageText"] = image_text.strip()
-        if file_name_prefix is not None and field_type == "file":
-            payload["fileNamePrefix"] = file_name_prefix.strip()
-        if formula is not None and field_type == "calculationsAndLogic":
-            payload["formula"] = formula.strip()
-        if hidden is not None and field_type == "formula":
-            payload["hidden"] = hidden
-        
-        logger.info(f"Adding field to app_id: {app_id} with payload: {payload}")
-        
-        success, error_message, response_data = self.api_utils.make_request(
+        return PreparedRequest(
             method="POST",
             endpoint="appdefinitionv2/addField",
             data=payload,
+            context={"invalidates_app": app_id.strip()},
         )
-        
-        if not success:
-            logger.error(f"Error: {error_message}")
-            return f"Error: {error_message}"
-        
-        
+
+    def _format_add_field(self, prepared: PreparedRequest, response_data: Optional[Dict[str, Any]]) -> str:
         field_name = response_data.get("fieldName") if response_data else None
-        result = f"Successfully added field.\nField Name: {field_name}\n\nFULL RESPONSE:\n{json.dumps(response_data, indent=2)}"
+        result = f"Successfully added field.\nField Name: {field_name}\n\nFULL RESPONSE:\n{self.api_utils.json_codec.pretty(response_data)}"
         return result
-    
-    def update_field(self, app_id: str, requesting_user_email_address: str, field_name: str,
+
+    def _prepare_update_field(self, app_id: str, requesting_user_email_address: str, field_name: str,
                     label: Optional[str] = None, description: Optional[str] = None,
                     required: Optional[bool] = None, block_width_percentage_desktop: Optional[int] = None,
                     block_width_percentage_mobile: Optional[int] = None, display_condition: Optional[str] = None,
@@ -516,57 +283,7 @@ class AppDefinitionClient(BaseClappiaClient):
                     allowed_file_types: Optional[List[str]] = None, max_file_allowed: Optional[int] = None,
                     image_quality: Optional[str] = None, image_text: Optional[str] = None,
                     file_name_prefix: Optional[str] = None, formula: Optional[str] = None,
-                    hidden: Optional[bool] = None) -> str:
-        """Updates an existing field in a Clappia application with new configuration.
-
-        Modifies the properties of an existing field in a Clappia app, enabling dynamic form updates,
-        A/B testing, and iterative improvements without recreating the entire app.
-
-        Args:
-            app_id: Application ID in uppercase letters and numbers format (e.g., "MFX093412").
-            requesting_user_email_address: Email address of the user updating the field.
-                This user must have permission to modify the app. Must be a valid email format.
-            field_name: Variable name of the existing field to update (e.g., "employeeName", "department").
-            label: New display label for the field.
-            description: New field description/help text.
-            required: Whether the field is mandatory.
-            block_width_percentage_desktop: Width percentage on desktop (1-100).
-            block_width_percentage_mobile: Width percentage on mobile (1-100).
-            display_condition: Condition for when to show the field.
-            retain_values: Whether to retain values when field is hidden.
-            is_editable: Whether the field can be edited.
-            editability_condition: Condition for when field is editable.
-            validation: Validation type - "none", "number", "email", "url", "custom".
-            default_value: Default value for the field (applicable only for singleLineText).
-            options: List of options for selector fields (applicable for singleSelector/multiSelector/dropDown).
-            style: Style for selector fields - "Standard" or "Chips" (applicable for singleSelector/multiSelector).
-            number_of_cols: Number of columns for selector fields (applicable for singleSelector/multiSelector).
-            allowed_file_types: List of allowed file types (applicable for file fields).
-                Valid values: "images_camera_upload", "images_gallery_upload", "videos", "documents".
-            max_file_allowed: Maximum files allowed, between 1-10 (applicable for file fields).
-            image_quality: Image quality - "low", "medium", "high" (applicable for file fields).
-            image_text: Text overlay for image fields (applicable for file fields).
-            file_name_prefix: Prefix for uploaded file names (applicable for file fields).
-            formula: Formula for calculation fields (applicable for calculationsAndLogic fields).
-            hidden: Whether the field is hidden (applicable for formula fields).
-
-        Returns:
-            str: Formatted response with field update details and status.
-
-        Examples:
-            Update field label and make required:
-                >>> client.update_field("APP123", "user@company.com", "employeeName", 
-                ...                    label="Full Employee Name", required=True)
-
-            Update dropdown options:
-                >>> client.update_field("APP123", "user@company.com", "department",
-                ...                    options=["HR", "IT", "Finance", "Marketing"])
-
-            Change validation and add description:
-                >>> client.update_field("APP123", "user@company.com", "emailField",
-                ...                    validation="email", 
-                ...                    description="Enter your corporate email")
-        """
+                    hidden: Optional[bool] = None) -> Union[str, PreparedRequest]:
         # Validation
         is_valid, error_msg = ClappiaInputValidator.validate_app_id(app_id)
         if not is_valid:
@@ -676,18 +393,9 @@ class AppDefinitionClient(BaseClappiaClient):
         if hidden is not None:
             payload["hidden"] = hidden
 
-        logger.info(f"Updating field '{field_name}' in app_id: {app_id} with payload: {payload}")
+        logger.info("Updating field '%s' in app_id: %s", field_name, app_id)
+        logger.debug("Field payload: %s", BodyPreview(payload))
 
-        success, error_message, response_data = self.api_utils.make_request(
-            method="POST",
-            endpoint="appdefinitionv2/updateField",
-            data=payload,
-        )
-
-        if not success:
-            logger.error(f"Error: {error_message}")
-            return f"Error: {error_message}"
-        
         updated_properties = []
         if label is not None:
             updated_properties.append("label")
@@ -733,12 +441,300 @@ class AppDefinitionClient(BaseClappiaClient):
         if hidden is not None:
             updated_properties.append("hidden")
 
+        return PreparedRequest(
+            method="POST",
+            endpoint="appdefinitionv2/updateField",
+            data=payload,
+            context={
+                "invalidates_app": app_id.strip(),
+                "field_name": field_name,
+                "app_id": app_id,
+                "requesting_user_email_address": requesting_user_email_address,
+                "updated_properties": updated_properties,
+            },
+        )
+
+    def _format_update_field(self, prepared: PreparedRequest, response_data: Optional[Dict[str, Any]]) -> str:
         update_info = {
-            "fieldName": field_name,
-            "appId": app_id,
-            "requestingUser": requesting_user_email_address,
-            "updatedProperties": updated_properties,
+            "fieldName": prepared.context["field_name"],
+            "appId": prepared.context["app_id"],
+            "requestingUser": prepared.context["requesting_user_email_address"],
+            "updatedProperties": prepared.context["updated_properties"],
             "status": "updated",
         }
 
-        return f"Successfully updated field:\n\nSUMMARY:\n{json.dumps(update_info, indent=2)}\n\nFULL RESPONSE:\n{json.dumps(response_data, indent=2)}"
\ No newline at end of file
+        return f"Successfully updated field:\n\nSUMMARY:\n{self.api_utils.json_codec.pretty(update_info)}\n\nFULL RESPONSE:\n{self.api_utils.json_codec.pretty(response_data)}"
+
+
+class AppDefinitionClient(AppDefinitionOperations, BaseClappiaClient):
+    """Client for managing Clappia app definitions.
+    
+    This client handles retrieving and managing application definitions,
+    including forms, fields, sections, and metadata.
+
+    Methods return formatted strings, or ClappiaResult objects when the client is
+    created with structured_results=True.
+    """
+
+    def __init__(self, *args, definition_cache: Optional[DefinitionCache] = None, **kwargs):
+        """Initialize the app definition client.
+
+        Accepts the same arguments as BaseClappiaClient, plus:
+
+        Args:
+            definition_cache: Cache for get_definition responses. add_field, update_field and
+                create_app invalidate the affected app. None (default) disables caching.
+        """
+        super().__init__(*args, **kwargs)
+        self.definition_cache = definition_cache
+        if definition_cache is not None and self.api_utils.metrics is not None:
+            self.api_utils.metrics.watch_cache(definition_cache)
+
+    def _send(self, prepared: PreparedRequest) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        cache_key = prepared.context.get("cache_key")
+        if self.definition_cache is not None and cache_key is not None:
+            source = definition_request(self.api_utils.workplace_id, self.definition_cache.canonical_key(cache_key))
+            return self.definition_cache.get_variant(
+                cache_key,
+                lambda: super(AppDefinitionClient, self)._send(source),
+                partial(self._send_conditional, source),
+            )
+
+        result = super()._send(prepared)
+        self._invalidate_definitions(prepared, result[2])
+        return result
+
+    def get_definition(self, app_id: str, language: str = "en", 
+                      strip_html: bool = True, include_tags: bool = True) -> Union[str, ClappiaResult]:
+        """Fetches complete definition of a Clappia application including forms, fields, sections, and metadata.
+
+        Retrieves structure and configuration of a Clappia app to understand available fields,
+        validation rules, and workflow logic before creating charts, filtering submissions, or planning integrations.
+
+        Args:
+            app_id: Unique application identifier in uppercase letters and numbers format (e.g., QGU236634). Use this to specify which Clappia app definition to retrieve.
+            language: Language code for field labels and translations. Available options: "en" (English, default), "es" (Spanish), "fr" (French), "de" (German). Use "es" for Spanish reports or "fr" for French localization.
+            strip_html: Whether to remove HTML formatting from text fields. True (default) removes HTML tags for clean text, False preserves HTML formatting for display purposes.
+            include_tags: Whether to include metadata tags in response. True (default) includes full metadata tags, False returns basic structure only for lightweight responses.
+
+        Returns:
+            str: Formatted response with app definition details and complete structure
+        """
+        prepared = self._prepare_get_definition(app_id, language, strip_html, include_tags)
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        return self._execute(prepared, self._format_get_definition)
+
+    def get_definition_raw(self, app_id: str, language: str = "en",
+                           strip_html: bool = True, include_tags: bool = True) -> RawResult:
+        """Fetches the definition of a Clappia application as the undecoded response body.
+
+        Skips the definition cache and the formatting of get_definition; use it to pass
+        the definition on unchanged, or decode it with result.json() when needed.
+
+        Returns:
+            RawResult: Always structured, with the response body in result.content.
+        """
+        prepared = self._prepare_get_definition(app_id, language, strip_html, include_tags)
+        if isinstance(prepared, str):
+            return RawResult.from_error(prepared)
+        return self._execute_raw(prepared)
+
+    def create_app(self, app_name: str, requesting_user_email_address: str, 
+                   sections: List[Dict[str, Any]]) -> Union[str, ClappiaResult]:
+        """Create a new Clappia application with specified sections and fields.
+
+        Args:
+            app_name: Name of the new application (e.g., "Employee Survey", "Inventory Management"). Minimum 10 characters.
+            requesting_user_email_address: Email address of the user creating the app (becomes the app owner).
+            sections: List of Section objects defining the app structure. Each section contains fields with specific types and properties.
+
+            Example:
+            {
+                "sections": [
+                    {
+                        "sectionName": "Section 1",
+                        "fields": [{"fieldType": "singleLineText", "label": "Field 1", "options": ["Option 1", "Option 2"]}, {"fieldType": "multiLineText", "label": "Field 2", "options": ["Option 3", "Option 4"]}]
+                    }
+                ]
+            }
+
+        Returns:
+            str: Success message with app ID and URL, or error message if the request fails.
+        """
+        prepared = self._prepare_create_app(app_name, requesting_user_email_address, sections)
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        return self._execute(prepared, self._format_create_app)
+
+    def add_field(self, app_id: str, requesting_user_email_address: str,
+                  section_index: int, field_index: int, field_type: str, 
+                  label: Optional[str] = None, required: Optional[bool] = None,  description: Optional[str] = None,
+                  block_width_percentage_desktop: Optional[int] = None,
+                  block_width_percentage_mobile: Optional[int] = None,
+                  display_condition: Optional[str] = None,
+                  retain_values: Optional[bool] = None,
+                  is_editable: Optional[bool] = None,
+                  editability_condition: Optional[str] = None,
+                  validation: Optional[str] = None,
+                  default_value: Optional[str] = None,
+                  options: Optional[List[str]] = None,
+                  style: Optional[str] = None,
+                  number_of_cols: Optional[int] = None,
+                  allowed_file_types: Optional[List[str]] = None,
+                  max_file_allowed: Optional[int] = None,
+                  image_quality: Optional[str] = None,
+                  image_text: Optional[str] = None,
+                  file_name_prefix: Optional[str] = None,
+                  formula: Optional[str] = None,
+                  hidden: Optional[bool] = None) -> Union[str, ClappiaResult]:
+        """Add a new field to an existing Clappia application at a specific position.
+
+        Args:
+            app_id: Application ID (e.g., "MFX093412").
+            requesting_user_email_address: Email address of the user adding the field.
+            section_index: Index of the section to add the field to (starts from 0).
+            field_index: Position within the section for the new field (starts from 0).
+            field_type: Type of field (e.g., "singleLineText", "singleSelector").
+            label: Display label for the field.
+            required: Whether the field is required.
+            description: Field description or help text.
+            block_width_percentage_desktop: Width percentage on desktop.
+            block_width_percentage_mobile: Width percentage on mobile.
+            display_condition: Condition for when to show the field.
+            retain_values: Whether to retain values when field is hidden.
+            is_editable: Whether the field can be edited.
+            editability_condition: Condition for when field is editable.
+            validation: Validation type.
+            default_value: Default value for the field.
+            options: List of options for selector fields.
+            style: Style for selector fields.
+            number_of_cols: Number of columns for selector fields.
+            allowed_file_types: List of allowed file types for file fields.
+            max_file_allowed: Maximum files allowed.
+            image_quality: Image quality for file fields.
+            image_text: Text overlay for image fields.
+            file_name_prefix: Prefix for uploaded file names.
+            formula: Formula for calculation fields.
+            hidden: Whether the field is hidden.
+
+        Returns:
+            str: Success message with generated field name or error message if the request fails.
+        """
+        prepared = self._prepare_add_field(
+            app_id, requesting_user_email_address, section_index, field_index, field_type,
+            label=label,
+            required=required,
+            description=description,
+            block_width_percentage_desktop=block_width_percentage_desktop,
+            block_width_percentage_mobile=block_width_percentage_mobile,
+            display_condition=display_condition,
+            retain_values=retain_values,
+            is_editable=is_editable,
+            editability_condition=editability_condition,
+            validation=validation,
+            default_value=default_value,
+            options=options,
+            style=style,
+            number_of_cols=number_of_cols,
+            allowed_file_types=allowed_file_types,
+            max_file_allowed=max_file_allowed,
+            image_quality=image_quality,
+            image_text=image_text,
+            file_name_prefix=file_name_prefix,
+            formula=formula,
+            hidden=hidden,
+        )
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        return self._execute(prepared, self._format_add_field)
+
+    def update_field(self, app_id: str, requesting_user_email_address: str, field_name: str,
+                    label: Optional[str] = None, description: Optional[str] = None,
+                    required: Optional[bool] = None, block_width_percentage_desktop: Optional[int] = None,
+                    block_width_percentage_mobile: Optional[int] = None, display_condition: Optional[str] = None,
+                    retain_values: Optional[bool] = None, is_editable: Optional[bool] = None,
+                    editability_condition: Optional[str] = None, validation: Optional[str] = None,
+                    default_value: Optional[str] = None, options: Optional[List[str]] = None,
+                    style: Optional[str] = None, number_of_cols: Optional[int] = None,
+                    allowed_file_types: Optional[List[str]] = None, max_file_allowed: Optional[int] = None,
+                    image_quality: Optional[str] = None, image_text: Optional[str] = None,
+                    file_name_prefix: Optional[str] = None, formula: Optional[str] = None,
+                    hidden: Optional[bool] = None) -> Union[str, ClappiaResult]:
+        """Updates an existing field in a Clappia application with new configuration.
+
+        Modifies the properties of an existing field in a Clappia app, enabling dynamic form updates,
+        A/B testing, and iterative improvements without recreating the entire app.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., "MFX093412").
+            requesting_user_email_address: Email address of the user updating the field.
+                This user must have permission to modify the app. Must be a valid email format.
+            field_name: Variable name of the existing field to update (e.g., "employeeName", "department").
+            label: New display label for the field.
+            description: New field description/help text.
+            required: Whether the field is mandatory.
+            block_width_percentage_desktop: Width percentage on desktop (1-100).
+            block_width_percentage_mobile: Width percentage on mobile (1-100).
+            display_condition: Condition for when to show the field.
+            retain_values: Whether to retain values when field is hidden.
+            is_editable: Whether the field can be edited.
+            editability_condition: Condition for when field is editable.
+            validation: Validation type - "none", "number", "email", "url", "custom".
+            default_value: Default value for the field (applicable only for singleLineText).
+            options: List of options for selector fields (applicable for singleSelector/multiSelector/dropDown).
+            style: Style for selector fields - "Standard" or "Chips" (applicable for singleSelector/multiSelector).
+            number_of_cols: Number of columns for selector fields (applicable for singleSelector/multiSelector).
+            allowed_file_types: List of allowed file types (applicable for file fields).
+                Valid values: "images_camera_upload", "images_gallery_upload", "videos", "documents".
+            max_file_allowed: Maximum files allowed, between 1-10 (applicable for file fields).
+            image_quality: Image quality - "low", "medium", "high" (applicable for file fields).
+            image_text: Text overlay for image fields (applicable for file fields).
+            file_name_prefix: Prefix for uploaded file names (applicable for file fields).
+            formula: Formula for calculation fields (applicable for calculationsAndLogic fields).
+            hidden: Whether the field is hidden (applicable for formula fields).
+
+        Returns:
+            str: Formatted response with field update details and status.
+
+        Examples:
+            Update field label and make required:
+                >>> client.update_field("APP123", "user@company.com", "employeeName", 
+                ...                    label="Full Employee Name", required=True)
+
+            Update dropdown options:
+                >>> client.update_field("APP123", "user@company.com", "department",
+                ...                    options=["HR", "IT", "Finance", "Marketing"])
+
+            Change validation and add description:
+                >>> client.update_field("APP123", "user@company.com", "emailField",
+                ...                    validation="email", 
+                ...                    description="Enter your corporate email")
+        """
+        prepared = self._prepare_update_field(
+            app_id, requesting_user_email_address, field_name,
+            label=label,
+            description=description,
+            required=required,
+            block_width_percentage_desktop=block_width_percentage_desktop,
+            block_width_percentage_mobile=block_width_percentage_mobile,
+            display_condition=display_condition,
+            retain_values=retain_values,
+            is_editable=is_editable,
+            editability_condition=editability_condition,
+            validation=validation,
+            default_value=default_value,
+            options=options,
+            style=style,
+            number_of_cols=number_of_cols,
+            allowed_file_types=allowed_file_types,
+            max_file_allowed=max_file_allowed,
+            image_quality=image_quality,
+            image_text=image_text,
+            file_name_prefix=file_name_prefix,
+            formula=formula,
+            hidden=hidden,
+        )
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        return self._execute(prepared, self._format_update_field)
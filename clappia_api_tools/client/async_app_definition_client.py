@@ -0,0 +1,192 @@
+import asyncio
+from functools import partial
+from typing import List, Dict, Any, Optional, Tuple, Union
+from .async_base_client import AsyncBaseClappiaClient
+from .app_definition_client import AppDefinitionOperations
+from .base_client import PreparedRequest, definition_request
+from clappia_api_tools._utils.definition_cache import DefinitionCache
+from clappia_api_tools._models.model import ClappiaResult, RawResult
+
+
+class AsyncAppDefinitionClient(AppDefinitionOperations, AsyncBaseClappiaClient):
+    """Asyncio client for managing Clappia app definitions.
+
+    Async counterpart of AppDefinitionClient. Inputs are validated and results are
+    formatted exactly as in AppDefinitionClient; see its methods for argument details.
+    """
+
+    def __init__(self, *args, definition_cache: Optional[DefinitionCache] = None, **kwargs):
+        """Initialize the async app definition client.
+
+        Accepts the same arguments as AsyncBaseClappiaClient, plus:
+
+        Args:
+            definition_cache: Cache for get_definition responses, which may be shared with
+                sync clients. None (default) disables caching.
+        """
+        super().__init__(*args, **kwargs)
+        self.definition_cache = definition_cache
+        if definition_cache is not None and self.api_utils.metrics is not None:
+            self.api_utils.metrics.watch_cache(definition_cache)
+
+    async def _send(self, prepared: PreparedRequest) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        cache_key = prepared.context.get("cache_key")
+        if self.definition_cache is not None and cache_key is not None:
+            source = definition_request(self.api_utils.workplace_id, self.definition_cache.canonical_key(cache_key))
+            return await self.definition_cache.aget_variant(
+                cache_key,
+                lambda: super(AsyncAppDefinitionClient, self)._send(source),
+                partial(self._send_conditional, source),
+            )
+
+        result = await super()._send(prepared)
+        # Invalidating a DefinitionStore commits to SQLite, which blocks
+        await asyncio.to_thread(self._invalidate_definitions, prepared, result[2])
+        return result
+
+    async def get_definition(self, app_id: str, language: str = "en", 
+                            strip_html: bool = True, include_tags: bool = True) -> Union[str, ClappiaResult]:
+        """Fetches complete definition of a Clappia application including forms, fields, sections, and metadata.
+
+        Args:
+            app_id: Unique application identifier in uppercase letters and numbers format (e.g., QGU236634).
+            language: Language code for field labels and translations. Default is "en".
+            strip_html: Whether to remove HTML formatting from text fields.
+            include_tags: Whether to include metadata tags in response.
+
+        Returns:
+            str: Formatted response with app definition details and complete structure
+        """
+        prepared = self._prepare_get_definition(app_id, language, strip_html, include_tags)
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        return await self._execute(prepared, self._format_get_definition)
+
+    async def get_definition_raw(self, app_id: str, language: str = "en",
+                                 strip_html: bool = True, include_tags: bool = True) -> RawResult:
+        """Fetches an app definition as undecoded bytes; see AppDefinitionClient.get_definition_raw."""
+        prepared = self._prepare_get_definition(app_id, language, strip_html, include_tags)
+        if isinstance(prepared, str):
+            return RawResult.from_error(prepared)
+        return await self._execute_raw(prepared)
+
+    async def create_app(self, app_name: str, requesting_user_email_address: str, 
+                         sections: List[Dict[str, Any]]) -> Union[str, ClappiaResult]:
+        """Create a new Clappia application with specified sections and fields.
+
+        Args:
+            app_name: Name of the new application.
+            requesting_user_email_address: Email address of the user creating the app (becomes the app owner).
+            sections: List of section dicts with "sectionName" and "fields" keys, as in AppDefinitionClient.create_app.
+
+        Returns:
+            str: Success message with app ID and URL, or error message if the request fails.
+        """
+        prepared = self._prepare_create_app(app_name, requesting_user_email_address, sections)
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        return await self._execute(prepared, self._format_create_app)
+
+    async def add_field(self, app_id: str, requesting_user_email_address: str,
+                        section_index: int, field_index: int, field_type: str, 
+                        label: Optional[str] = None, required: Optional[bool] = None,  description: Optional[str] = None,
+                        block_width_percentage_desktop: Optional[int] = None,
+                        block_width_percentage_mobile: Optional[int] = None,
+                        display_condition: Optional[str] = None,
+                        retain_values: Optional[bool] = None,
+                        is_editable: Optional[bool] = None,
+                        editability_condition: Optional[str] = None,
+                        validation: Optional[str] = None,
+                        default_value: Optional[str] = None,
+                        options: Optional[List[str]] = None,
+                        style: Optional[str] = None,
+                        number_of_cols: Optional[int] = None,
+                        allowed_file_types: Optional[List[str]] = None,
+                        max_file_allowed: Optional[int] = None,
+                        image_quality: Optional[str] = None,
+                        image_text: Optional[str] = None,
+                        file_name_prefix: Optional[str] = None,
+                        formula: Optional[str] = None,
+                        hidden: Optional[bool] = None) -> Union[str, ClappiaResult]:
+        """Add a new field to an existing Clappia application at a specific position.
+
+        Accepts the same arguments as AppDefinitionClient.add_field.
+
+        Returns:
+            str: Success message with generated field name or error message if the request fails.
+        """
+        prepared = self._prepare_add_field(
+            app_id, requesting_user_email_address, section_index, field_index, field_type,
+            label=label,
+            required=required,
+            description=description,
+            block_width_percentage_desktop=block_width_percentage_desktop,
+            block_width_percentage_mobile=block_width_percentage_mobile,
+            display_condition=display_condition,
+            retain_values=retain_values,
+            is_editable=is_editable,
+            editability_condition=editability_condition,
+            validation=validation,
+            default_value=default_value,
+            options=options,
+            style=style,
+            number_of_cols=number_of_cols,
+            allowed_file_types=allowed_file_types,
+            max_file_allowed=max_file_allowed,
+            image_quality=image_quality,
+            image_text=image_text,
+            file_name_prefix=file_name_prefix,
+            formula=formula,
+            hidden=hidden,
+        )
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        return await self._execute(prepared, self._format_add_field)
+
+    async def update_field(self, app_id: str, requesting_user_email_address: str, field_name: str,
+                          label: Optional[str] = None, description: Optional[str] = None,
+                          required: Optional[bool] = None, block_width_percentage_desktop: Optional[int] = None,
+                          block_width_percentage_mobile: Optional[int] = None, display_condition: Optional[str] = None,
+                          retain_values: Optional[bool] = None, is_editable: Optional[bool] = None,
+                          editability_condition: Optional[str] = None, validation: Optional[str] = None,
+                          default_value: Optional[str] = None, options: Optional[List[str]] = None,
+                          style: Optional[str] = None, number_of_cols: Optional[int] = None,
+                          allowed_file_types: Optional[List[str]] = None, max_file_allowed: Optional[int] = None,
+                          image_quality: Optional[str] = None, image_text: Optional[str] = None,
+                          file_name_prefix: Optional[str] = None, formula: Optional[str] = None,
+                          hidden: Optional[bool] = None) -> Union[str, ClappiaResult]:
+        """Updates an existing field in a Clappia application with new configuration.
+
+        Accepts the same arguments as AppDefinitionClient.update_field; only properties
+        that are not None are sent.
+
+        Returns:
+            str: Formatted response with field update details and status.
+        """
+        prepared = self._prepare_update_field(
+            app_id, requesting_user_email_address, field_name,
+            label=label,
+            description=description,
+            required=required,
+            block_width_percentage_desktop=block_width_percentage_desktop,
+            block_width_percentage_mobile=block_width_percentage_mobile,
+            display_condition=display_condition,
+            retain_values=retain_values,
+            is_editable=is_editable,
+            editability_condition=editability_condition,
+            validation=validation,
+            default_value=default_value,
+            options=options,
+            style=style,
+            number_of_cols=number_of_cols,
+            allowed_file_types=allowed_file_types,
+            max_file_allowed=max_file_allowed,
+            image_quality=image_quality,
+            image_text=image_text,
+            file_name_prefix=file_name_prefix,
+            formula=formula,
+            hidden=hidden,
+        )
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        return await self._execute(prepared, self._format_update_field)
@@ -0,0 +1,144 @@
+import time
+from functools import partial
+from typing import Optional, Dict, Any, Tuple, Union
+from clappia_api_tools._utils.async_api_utils import AsyncClappiaAPIUtils
+from clappia_api_tools._utils.api_utils import ConditionalResult
+from clappia_api_tools._utils.http_pool import PoolConfig
+from clappia_api_tools._utils.retry import RetryConfig
+from clappia_api_tools._utils.rate_limit import RateLimiter
+from clappia_api_tools._utils.metrics import MetricsSink
+from clappia_api_tools._utils.json_codec import JsonCodec
+from clappia_api_tools._utils.transport import AsyncTransport
+from clappia_api_tools._models.model import ClappiaResult, RawResult
+from clappia_api_tools._utils.logging_utils import get_logger
+from .base_client import PreparedRequest, ResponseFormatter
+
+logger = get_logger(__name__)
+
+
+class AsyncBaseClappiaClient:
+    """Base client with shared functionality for all asyncio Clappia clients.
+
+    Mirrors BaseClappiaClient, but requests are awaited on a pooled non-blocking
+    HTTP client instead of blocking the calling thread.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        workplace_id: Optional[str] = None,
+        timeout: int = 30,
+        pool_config: Optional[PoolConfig] = None,
+        retry_config: Optional[RetryConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[AsyncTransport] = None,
+        structured_results: bool = False,
+        metrics: Optional[MetricsSink] = None,
+        json_codec: Optional[JsonCodec] = None,
+        dedupe_reads: bool = True,
+        api_utils: Optional[AsyncClappiaAPIUtils] = None,
+    ):
+        """Initialize base async Clappia client.
+
+        Args:
+            api_key: Clappia API key.
+            base_url: API base URL.
+            workplace_id: Workspace ID.
+            timeout: Request timeout in seconds.
+            pool_config: Connection pool settings (pool size, per-host limit, keep-alive).
+            retry_config: Retry policies per endpoint class and the retry budget they share.
+            rate_limiter: Client-side token bucket limiter. Share one instance between
+                clients to pace them together.
+            transport: Sends the HTTP requests. Defaults to the pooled HTTP transport;
+                pass an in-process transport to run without a network.
+            structured_results: Return ClappiaResult objects instead of formatted strings.
+                The string form stays available, rendered lazily, via ClappiaResult.text.
+            metrics: Sink for per-endpoint request metrics, e.g. a ClientMetrics shared
+                between clients. None (default) records nothing.
+            json_codec: Encodes request bodies and decodes responses. Defaults to orjson
+                when installed, else the standard library json module.
+            dedupe_reads: Let concurrent identical reads, such as many callers fetching the
+                same definition at once, share one request. Defaults to True.
+            api_utils: Existing AsyncClappiaAPIUtils to share with other async clients.
+                When given, the connection parameters above are ignored.
+        """
+        if api_utils is None:
+            api_utils = AsyncClappiaAPIUtils(
+                api_key, base_url, workplace_id, timeout,
+                pool_config=pool_config, retry_config=retry_config,
+                rate_limiter=rate_limiter, transport=transport, metrics=metrics,
+                json_codec=json_codec, dedupe_reads=dedupe_reads,
+            )
+        self.api_utils = api_utils
+        self.structured_results = structured_results
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP connections."""
+        await self.api_utils.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _send(self, prepared: PreparedRequest) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        """Sends a prepared request and returns the raw (success, error, data) tuple."""
+        return await self.api_utils.make_request(
+            method=prepared.method,
+            endpoint=prepared.endpoint,
+            data=prepared.data,
+            params=prepared.params,
+        )
+
+    async def _send_conditional(self, prepared: PreparedRequest, etag: Optional[str]) -> ConditionalResult:
+        """Sends a prepared read with If-None-Match, for revalidating a stored response."""
+        return await self.api_utils.make_conditional_request(
+            method=prepared.method,
+            endpoint=prepared.endpoint,
+            etag=etag,
+            params=prepared.params,
+        )
+
+    async def _execute(self, prepared: PreparedRequest, formatter: ResponseFormatter) -> Union[str, ClappiaResult]:
+        """Sends a prepared request and returns the outcome as a string or ClappiaResult."""
+        started = time.perf_counter()
+        success, error_message, response_data = await self._send(prepared)
+        elapsed = time.perf_counter() - started
+
+        if not success:
+            logger.error("Error: %s", error_message)
+            return self._finish(ClappiaResult.from_error(error_message or "", elapsed))
+
+        return self._finish(ClappiaResult(
+            success=True,
+            data=response_data,
+            elapsed=elapsed,
+            renderer=partial(formatter, prepared, response_data),
+        ))
+
+    async def _execute_raw(self, prepared: PreparedRequest) -> RawResult:
+        """Sends a raw request; the response body is returned undecoded."""
+        started = time.perf_counter()
+        success, error_message, content = await self.api_utils.make_raw_request(
+            method=prepared.method,
+            endpoint=prepared.endpoint,
+            body=prepared.body,
+            params=prepared.params,
+        )
+        elapsed = time.perf_counter() - started
+
+        if not success:
+            logger.error("Error: %s", error_message)
+            return RawResult.from_error(error_message or "", elapsed)
+        return RawResult(success=True, content=content or b"", elapsed=elapsed, decoder=self.api_utils.json_codec.decode)
+
+    def _reject(self, message: str) -> Union[str, ClappiaResult]:
+        """Returns a validation failure produced before any request was sent."""
+        if not self.structured_results:
+            return message
+        return ClappiaResult.from_error(message)
+
+    def _finish(self, result: ClappiaResult) -> Union[str, ClappiaResult]:
+        return result if self.structured_results else result.text
@@ -0,0 +1,174 @@
+from typing import Optional, Dict, Any, List, Union
+from .async_submission_client import AsyncSubmissionClient
+from .async_app_definition_client import AsyncAppDefinitionClient
+from clappia_api_tools._utils.async_api_utils import AsyncClappiaAPIUtils
+from clappia_api_tools._utils.http_pool import PoolConfig
+from clappia_api_tools._utils.retry import RetryConfig
+from clappia_api_tools._utils.rate_limit import RateLimiter
+from clappia_api_tools._utils.transport import AsyncTransport
+from clappia_api_tools._utils.definition_cache import DefinitionCache
+from clappia_api_tools._utils.idempotency import IdempotencyLedger
+from clappia_api_tools._utils.schema_validator import SubmissionValidator
+from clappia_api_tools._utils.field_index import FieldResolver
+from clappia_api_tools._utils.metrics import MetricsSink
+from clappia_api_tools._utils.json_codec import JsonCodec
+from clappia_api_tools._models.model import ClappiaResult, RawResult
+
+
+class AsyncClappiaClient:
+    """Asyncio Clappia client that provides unified access to all Clappia functionality.
+
+    Async counterpart of ClappiaClient. All specialized clients share one pooled
+    non-blocking HTTP client, so a single event loop can keep many calls in flight.
+
+    Usage:
+        async with AsyncClappiaClient(api_key, base_url, workplace_id) as client:
+            result = await client.submissions.create_submission(app_id, data, email)
+
+    Attributes:
+        submissions: AsyncSubmissionClient for managing submissions
+        app_definition: AsyncAppDefinitionClient for retrieving app definitions
+    """
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, 
+                 workplace_id: Optional[str] = None, timeout: int = 30,
+                 pool_config: Optional[PoolConfig] = None,
+                 retry_config: Optional[RetryConfig] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 transport: Optional[AsyncTransport] = None,
+                 definition_cache: Optional[DefinitionCache] = None,
+                 idempotency_ledger: Optional[IdempotencyLedger] = None,
+                 submission_validator: Optional[SubmissionValidator] = None,
+                 field_resolver: Optional[FieldResolver] = None,
+                 metrics: Optional[MetricsSink] = None,
+                 json_codec: Optional[JsonCodec] = None,
+                 dedupe_reads: bool = True,
+                 structured_results: bool = False):
+        """Initialize the async Clappia client with all specialized clients.
+
+        Args:
+            api_key: Clappia API key.
+            base_url: API base URL.
+            workplace_id: Workspace ID.
+            timeout: Request timeout in seconds. Defaults to 30.
+            pool_config: Connection pool settings shared by all specialized clients.
+            retry_config: Retry policies per endpoint class. Defaults to retrying reads on
+                transient failures and mutations only when the server rejected them.
+            rate_limiter: Client-side token bucket limiter applied to every request.
+            transport: Sends the HTTP requests. Defaults to the pooled HTTP transport.
+            definition_cache: Cache for app definitions, invalidated by this client's schema
+                changes. None (default) disables caching.
+            idempotency_ledger: Records successful creates so repeating one returns the
+                recorded submission instead of creating a duplicate. None (default) disables it.
+            submission_validator: Checks submission data against the app definition
+                before it is sent. None (default) leaves validation to the API.
+            field_resolver: Per-app label index for calls made with resolve_labels=True.
+                Defaults to one reading definitions through definition_cache.
+            metrics: Sink for per-endpoint request counts, latencies, bytes and retries,
+                plus pool and definition cache figures. None (default) records nothing.
+            json_codec: Encodes request bodies and decodes responses. Defaults to orjson
+                when installed, else the standard library json module.
+            dedupe_reads: Let concurrent identical reads, such as many callers fetching the
+                same definition at once, share one request. Defaults to True.
+            structured_results: Return ClappiaResult objects instead of formatted strings.
+                The text is still available, rendered on demand, through ``result.text``.
+        """
+        self.api_utils = AsyncClappiaAPIUtils(
+            api_key, base_url, workplace_id, timeout,
+            pool_config=pool_config, retry_config=retry_config,
+            rate_limiter=rate_limiter, transport=transport, metrics=metrics,
+            json_codec=json_codec, dedupe_reads=dedupe_reads,
+        )
+        self.submissions = AsyncSubmissionClient(
+            api_utils=self.api_utils, idempotency_ledger=idempotency_ledger,
+            submission_validator=submission_validator,
+            field_resolver=field_resolver or (FieldResolver(definition_cache) if definition_cache is not None else None),
+            structured_results=structured_results,
+        )
+        self.app_definition = AsyncAppDefinitionClient(
+            api_utils=self.api_utils, definition_cache=definition_cache,
+            structured_results=structured_results,
+        )
+
+    async def aclose(self) -> None:
+        """Closes the shared HTTP connections."""
+        await self.api_utils.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    # =============================================================================
+    # SUBMISSION METHODS
+    # =============================================================================
+
+    async def create_submission(self, app_id: str, data: Dict[str, Any], email: str,
+                                idempotency_key: Optional[str] = None, resolve_labels: bool = False) -> Union[str, ClappiaResult]:
+        """Creates a new submission. Delegates to self.submissions.create_submission()."""
+        return await self.submissions.create_submission(app_id, data, email, idempotency_key, resolve_labels)
+
+    async def edit_submission(self, app_id: str, submission_id: str, data: Dict[str, Any], email: str,
+                              resolve_labels: bool = False) -> Union[str, ClappiaResult]:
+        """Edits an existing submission. Delegates to self.submissions.edit_submission()."""
+        return await self.submissions.edit_submission(app_id, submission_id, data, email, resolve_labels)
+
+    async def create_submission_raw(self, app_id: str, data: bytes, email: str) -> RawResult:
+        """Creates a submission from encoded JSON. Delegates to self.submissions.create_submission_raw()."""
+        return await self.submissions.create_submission_raw(app_id, data, email)
+
+    async def edit_submission_raw(self, app_id: str, submission_id: str, data: bytes, email: str) -> RawResult:
+        """Edits a submission with encoded JSON. Delegates to self.submissions.edit_submission_raw()."""
+        return await self.submissions.edit_submission_raw(app_id, submission_id, data, email)
+
+    async def update_submission_owners(self, app_id: str, submission_id: str, 
+                                       requesting_user_email_address: str, email_ids: List[str]) -> Union[str, ClappiaResult]:
+        """Updates submission owners. Delegates to self.submissions.update_owners()."""
+        return await self.submissions.update_owners(app_id, submission_id, requesting_user_email_address, email_ids)
+
+    async def update_submission_status(self, app_id: str, submission_id: str, 
+                                       requesting_user_email_address: str, status_name: str, comments: str) -> Union[str, ClappiaResult]:
+        """Updates submission status. Delegates to self.submissions.update_status()."""
+        return await self.submissions.update_status(app_id, submission_id, requesting_user_email_address, status_name, comments)
+
+    async def create_submissions_bulk(self, app_id: str, records: List[Dict[str, Any]], email: str,
+                                      max_concurrency: int = 8,
+                                      idempotency_keys: Optional[List[Optional[str]]] = None,
+                                      resolve_labels: bool = False) -> Union[str, ClappiaResult]:
+        """Creates many submissions concurrently. Delegates to self.submissions.create_submissions_bulk()."""
+        return await self.submissions.create_submissions_bulk(
+            app_id, records, email, max_concurrency, idempotency_keys, resolve_labels
+        )
+
+    # =============================================================================
+    # APP DEFINITION METHODS
+    # =============================================================================
+
+    async def get_app_definition(self, app_id: str, language: str = "en", 
+                                 strip_html: bool = True, include_tags: bool = True) -> Union[str, ClappiaResult]:
+        """Fetches an app definition. Delegates to self.app_definition.get_definition()."""
+        return await self.app_definition.get_definition(app_id, language, strip_html, include_tags)
+
+    async def get_app_definition_raw(self, app_id: str, language: str = "en",
+                                     strip_html: bool = True, include_tags: bool = True) -> RawResult:
+        """Fetches an app definition undecoded. Delegates to self.app_definition.get_definition_raw()."""
+        return await self.app_definition.get_definition_raw(app_id, language, strip_html, include_tags)
+
+    async def create_app(self, app_name: str, requesting_user_email_address: str, 
+                         sections: List[Dict[str, Any]]) -> Union[str, ClappiaResult]:
+        """Creates a new app. Delegates to self.app_definition.create_app()."""
+        return await self.app_definition.create_app(app_name, requesting_user_email_address, sections)
+
+    async def add_field_to_app(self, app_id: str, requesting_user_email_address: str,
+                               section_index: int, field_index: int, field_type: str, 
+                               label: str, required: bool, **kwargs) -> Union[str, ClappiaResult]:
+        """Adds a field to an app. Delegates to self.app_definition.add_field()."""
+        return await self.app_definition.add_field(
+            app_id, requesting_user_email_address, section_index, field_index, 
+            field_type, label, required, **kwargs
+        )
+
+    def __repr__(self) -> str:
+        """String representation of the AsyncClappiaClient."""
+        return f"AsyncClappiaClient(workplace_id={self.api_utils.workplace_id})"
@@ -0,0 +1,213 @@
+import asyncio
+import time
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple, Union
+from .async_base_client import AsyncBaseClappiaClient
+from .base_client import PreparedRequest
+from .submission_client import SubmissionOperations
+from clappia_api_tools._utils.idempotency import IdempotencyLedger
+from clappia_api_tools._utils.definition_cache import DefinitionCache, RequestResult
+from clappia_api_tools._utils.field_index import FieldIndex, FieldResolver
+from clappia_api_tools._utils.schema_validator import SubmissionValidator
+from clappia_api_tools._models.model import ClappiaResult, RawResult
+
+
+class AsyncSubmissionClient(SubmissionOperations, AsyncBaseClappiaClient):
+    """Asyncio client for managing Clappia submissions.
+
+    Async counterpart of SubmissionClient. Inputs are validated and results are
+    formatted exactly as in SubmissionClient; see its methods for argument details.
+    """
+
+    def __init__(self, *args, idempotency_ledger: Optional[IdempotencyLedger] = None,
+                 submission_validator: Optional[SubmissionValidator] = None,
+                 field_resolver: Optional[FieldResolver] = None, **kwargs):
+        """Initialize the async submission client.
+
+        Accepts the same arguments as AsyncBaseClappiaClient, plus:
+
+        Args:
+            idempotency_ledger: Records successful creates by idempotency key, and may be
+                shared with sync clients. None (default) sends every create.
+            submission_validator: Checks data against the app definition before a create
+                or edit is sent. None (default) leaves validation of the data to the API.
+            field_resolver: Per-app label index used by calls made with resolve_labels=True.
+                Created on first use when not given.
+        """
+        super().__init__(*args, **kwargs)
+        self.idempotency_ledger = idempotency_ledger
+        self.submission_validator = submission_validator
+        self.field_resolver = field_resolver
+
+    async def _send(self, prepared: PreparedRequest) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        key = prepared.context.get("idempotency_key")
+        if self.idempotency_ledger is not None and key is not None:
+            return await self.idempotency_ledger.aget_or_send(key, lambda: super(AsyncSubmissionClient, self)._send(prepared))
+        return await super()._send(prepared)
+
+    async def _load_definition(self, app_id: str, cache: DefinitionCache) -> RequestResult:
+        request = self._prepare_definition_lookup(app_id, cache)
+        return await cache.aget_variant(
+            SubmissionValidator.definition_key(app_id),
+            lambda: self._send(request),
+            partial(self._send_conditional, request),
+        )
+
+    async def _load_field_index(self, app_id: str, resolve_labels: bool) -> Union[str, FieldIndex, None]:
+        if not self._should_resolve_labels(app_id, resolve_labels):
+            return None
+        resolver = self._get_field_resolver()
+        return resolver.index_from(app_id, await self._load_definition(app_id, resolver.definition_cache))
+
+    async def _precheck(self, prepared: PreparedRequest) -> Optional[str]:
+        if self.submission_validator is None:
+            return None
+        app_id = prepared.data["appId"]
+        loaded = await self._load_definition(app_id, self.submission_validator.definition_cache)
+        return self.submission_validator.check(app_id, prepared.data["data"], loaded)
+
+    async def create_submission(self, app_id: str, data: Dict[str, Any], requesting_user_email_address: str,
+                                idempotency_key: Optional[str] = None, resolve_labels: bool = False) -> Union[str, ClappiaResult]:
+        """Creates a new submission in a Clappia application with specified field data.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412).
+            data: Dictionary of field data to submit, keyed by field name.
+            requesting_user_email_address: Email address of the user creating the submission.
+            idempotency_key: Identifies this create in the idempotency ledger. Defaults to a hash of the app, user and data.
+            resolve_labels: Treat the keys of data as field labels and translate them to fieldNames.
+
+        Returns:
+            str: Formatted response with submission details and status
+        """
+        field_index = await self._load_field_index(app_id, resolve_labels)
+        if isinstance(field_index, str):
+            return self._reject(field_index)
+        prepared = self._prepare_create_submission(app_id, data, requesting_user_email_address, idempotency_key, field_index)
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        problem = await self._precheck(prepared)
+        if problem is not None:
+            return self._reject(problem)
+        return await self._execute(prepared, self._format_create_submission)
+
+    async def edit_submission(self, app_id: str, submission_id: str, data: Dict[str, Any], requesting_user_email_address: str,
+                              resolve_labels: bool = False) -> Union[str, ClappiaResult]:
+        """Edits an existing Clappia submission by updating specified field values.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412).
+            submission_id: Unique identifier of the submission to update (e.g., HGO51464561).
+            data: Dictionary of field data to update, keyed by field name.
+            requesting_user_email_address: Email address of the user requesting the edit.
+            resolve_labels: Treat the keys of data as field labels and translate them to fieldNames.
+
+        Returns:
+            str: Formatted response with edit details and status
+        """
+        field_index = await self._load_field_index(app_id, resolve_labels)
+        if isinstance(field_index, str):
+            return self._reject(field_index)
+        prepared = self._prepare_edit_submission(app_id, submission_id, data, requesting_user_email_address, field_index)
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        problem = await self._precheck(prepared)
+        if problem is not None:
+            return self._reject(problem)
+        return await self._execute(prepared, self._format_edit_submission)
+
+    async def create_submission_raw(self, app_id: str, data: bytes, requesting_user_email_address: str) -> RawResult:
+        """Creates a submission from field data already encoded as JSON; see SubmissionClient.create_submission_raw."""
+        prepared = self._prepare_raw_submission(app_id, None, data, requesting_user_email_address)
+        if isinstance(prepared, str):
+            return RawResult.from_error(prepared)
+        return await self._execute_raw(prepared)
+
+    async def edit_submission_raw(self, app_id: str, submission_id: str, data: bytes,
+                                  requesting_user_email_address: str) -> RawResult:
+        """Edits a submission with field data already encoded as JSON; see SubmissionClient.edit_submission_raw."""
+        prepared = self._prepare_raw_submission(app_id, submission_id, data, requesting_user_email_address)
+        if isinstance(prepared, str):
+            return RawResult.from_error(prepared)
+        return await self._execute_raw(prepared)
+
+    async def update_owners(self, app_id: str, submission_id: str, requesting_user_email_address: str, 
+                            email_ids: List[str]) -> Union[str, ClappiaResult]:
+        """Updates the ownership of a Clappia submission by adding new owners to share access.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412).
+            submission_id: Unique identifier of the submission to update (e.g., HGO51464561).
+            requesting_user_email_address: Email address of the user making the ownership change.
+            email_ids: List of email addresses to add as new owners. Invalid emails are skipped with a warning.
+
+        Returns:
+            str: Formatted response with update details and status
+        """
+        prepared = self._prepare_update_owners(app_id, submission_id, requesting_user_email_address, email_ids)
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        return await self._execute(prepared, self._format_update_owners)
+
+    async def update_status(self, app_id: str, submission_id: str, requesting_user_email_address: str, 
+                            status_name: str, comments: str) -> Union[str, ClappiaResult]:
+        """Updates the status of a Clappia submission to track workflow progress and approvals.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412).
+            submission_id: Unique identifier of the submission to update (e.g., HGO51464561).
+            requesting_user_email_address: Email address of the user making the status change.
+            status_name: Name of the new status to apply to the submission.
+            comments: Optional comments to include with the status change.
+
+        Returns:
+            str: Formatted response with update details and status
+        """
+        prepared = self._prepare_update_status(app_id, submission_id, requesting_user_email_address, status_name, comments)
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        return await self._execute(prepared, self._format_update_status)
+
+    async def create_submissions_bulk(self, app_id: str, records: List[Dict[str, Any]], requesting_user_email_address: str,
+                                      max_concurrency: int = 8,
+                                      idempotency_keys: Optional[List[Optional[str]]] = None,
+                                      resolve_labels: bool = False) -> Union[str, ClappiaResult]:
+        """Creates many submissions in a Clappia application concurrently.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412).
+            records: List of field data dictionaries, one per submission.
+            requesting_user_email_address: Email address of the user creating the submissions.
+            max_concurrency: Maximum number of create requests in flight at once. Defaults to 8.
+            idempotency_keys: Optional idempotency key per record, in the same order as records.
+            resolve_labels: Translate label keys of each record to fieldNames.
+
+        Returns:
+            str: Formatted response with a partial-failure SUMMARY and per-record RESULTS in input order
+        """
+        started = time.perf_counter()
+        field_index = await self._load_field_index(app_id, resolve_labels)
+        if isinstance(field_index, str):
+            return self._reject(field_index)
+        items = self._prepare_create_submissions_bulk(
+            app_id, records, requesting_user_email_address, max_concurrency, idempotency_keys, field_index
+        )
+        if isinstance(items, str):
+            return self._reject(items)
+
+        if self.submission_validator is not None:
+            loaded = await self._load_definition(app_id, self.submission_validator.definition_cache)
+            items = self._screen_bulk_items(items, loaded)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send(prepared: PreparedRequest) -> Dict[str, Any]:
+            async with semaphore:
+                outcome = await self._send(prepared)
+            return self._bulk_item_result(prepared, *outcome)
+
+        results: List[Dict[str, Any]] = [item for item in items if isinstance(item, dict)]
+        pending = [item for item in items if isinstance(item, PreparedRequest)]
+        results.extend(await asyncio.gather(*(send(prepared) for prepared in pending)))
+        results.sort(key=lambda r: r["index"])
+
+        return self._finish(self._bulk_result(app_id, results, time.perf_counter() - started))
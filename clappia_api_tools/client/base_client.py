@@ -1,10 +1,65 @@
-from typing import Optional
-from clappia_api_tools._utils.api_utils import ClappiaAPIUtils
+from dataclasses import dataclass, field
+import time
+from functools import partial
+from typing import Optional, Dict, Any, Callable, Tuple, Union
+from clappia_api_tools._utils.api_utils import ClappiaAPIUtils, ConditionalResult
+from clappia_api_tools._utils.http_pool import PoolConfig
+from clappia_api_tools._utils.retry import RetryConfig
+from clappia_api_tools._utils.rate_limit import RateLimiter
+from clappia_api_tools._utils.metrics import MetricsSink
+from clappia_api_tools._utils.json_codec import JsonCodec
+from clappia_api_tools._utils.transport import Transport
+from clappia_api_tools._utils.definition_store import DefinitionKey
+from clappia_api_tools._models.model import ClappiaResult, RawResult
+from clappia_api_tools._utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PreparedRequest:
+    """A validated API call ready to be sent by a sync or async client.
+
+    Attributes:
+        method: HTTP method.
+        endpoint: API endpoint relative to the base URL.
+        data: JSON body for POST requests.
+        params: Query parameters for GET requests.
+        body: Pre-encoded JSON body of a raw call, sent as is instead of data.
+        context: Values computed during validation that the response formatter needs.
+    """
+
+    method: str
+    endpoint: str
+    data: Optional[Dict[str, Any]] = None
+    params: Optional[Dict[str, Any]] = None
+    context: Dict[str, Any] = field(default_factory=dict)
+    body: Optional[bytes] = None
+
+
+ResponseFormatter = Callable[[PreparedRequest, Optional[Dict[str, Any]]], str]
+
+
+def definition_request(workplace_id: str, key: DefinitionKey) -> PreparedRequest:
+    """getAppDefinition request for the definition variant identified by a DefinitionCache key"""
+    app_id, language, strip_html, include_tags = key
+    return PreparedRequest(
+        method="GET",
+        endpoint="appdefinitionv2/getAppDefinition",
+        params={
+            "appId": app_id,
+            "workplaceId": workplace_id,
+            "language": language,
+            "stripHtml": str(strip_html).lower(),
+            "includeTags": str(include_tags).lower(),
+        },
+        context={"cache_key": key},
+    )
 
 
 class BaseClappiaClient:
     """Base client with shared functionality for all Clappia clients.
-    
+
     This class provides the common initialization and shared utilities
     that all specialized Clappia clients will inherit from.
     """
@@ -15,6 +70,15 @@ class BaseClappiaClient:
         base_url: Optional[str] = None,
         workplace_id: Optional[str] = None,
         timeout: int = 30,
+        pool_config: Optional[PoolConfig] = None,
+        retry_config: Optional[RetryConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[Transport] = None,
+        structured_results: bool = False,
+        metrics: Optional[MetricsSink] = None,
+        json_codec: Optional[JsonCodec] = None,
+        dedupe_reads: bool = True,
+        api_utils: Optional[ClappiaAPIUtils] = None,
     ):
         """Initialize base Clappia client.
 
@@ -23,5 +87,93 @@ class BaseClappiaClient:
             base_url: API base URL.
             workplace_id: Workspace ID.
             timeout: Request timeout in seconds.
+            pool_config: Connection pool settings (pool size, per-host limit, keep-alive).
+            retry_config: Retry policies per endpoint class and the retry budget they share.
+            rate_limiter: Client-side token bucket limiter. Share one instance between
+                clients to pace them together.
+            transport: Sends the HTTP requests. Defaults to the pooled HTTP transport;
+                pass an in-process transport to run without a network.
+            structured_results: Return ClappiaResult objects instead of formatted strings.
+                The string form stays available, rendered lazily, via ClappiaResult.text.
+            metrics: Sink for per-endpoint request metrics, e.g. a ClientMetrics shared
+                between clients. None (default) records nothing.
+            json_codec: Encodes request bodies and decodes responses. Defaults to orjson
+                when installed, else the standard library json module.
+            dedupe_reads: Let concurrent identical reads, such as many callers fetching the
+                same definition at once, share one request. Defaults to True.
+            api_utils: Existing ClappiaAPIUtils to share with other clients. When given,
+                the connection parameters above are ignored.
         """
-        self.api_utils = ClappiaAPIUtils(api_key, base_url, workplace_id, timeout)
\ No newline at end of file
+        if api_utils is None:
+            api_utils = ClappiaAPIUtils(
+                api_key, base_url, workplace_id, timeout,
+                pool_config=pool_config, retry_config=retry_config,
+                rate_limiter=rate_limiter, transport=transport, metrics=metrics,
+                json_codec=json_codec, dedupe_reads=dedupe_reads,
+            )
+        self.api_utils = api_utils
+        self.structured_results = structured_results
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Returns connection pool statistics for this client's HTTP session."""
+        return self.api_utils.get_pool_stats()
+
+    def _send(self, prepared: PreparedRequest) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        """Sends a prepared request and returns the raw (success, error, data) tuple."""
+        return self.api_utils.make_request(
+            method=prepared.method,
+            endpoint=prepared.endpoint,
+            data=prepared.data,
+            params=prepared.params,
+        )
+
+    def _send_conditional(self, prepared: PreparedRequest, etag: Optional[str]) -> ConditionalResult:
+        """Sends a prepared read with If-None-Match, for revalidating a stored response."""
+        return self.api_utils.make_conditional_request(
+            method=prepared.method,
+            endpoint=prepared.endpoint,
+            etag=etag,
+            params=prepared.params,
+        )
+
+    def _execute(self, prepared: PreparedRequest, formatter: ResponseFormatter) -> Union[str, ClappiaResult]:
+        """Sends a prepared request and returns the outcome as a string or ClappiaResult."""
+        started = time.perf_counter()
+        success, error_message, response_data = self._send(prepared)
+        elapsed = time.perf_counter() - started
+
+        if not success:
+            logger.error("Error: %s", error_message)
+            return self._finish(ClappiaResult.from_error(error_message or "", elapsed))
+
+        return self._finish(ClappiaResult(
+            success=True,
+            data=response_data,
+            elapsed=elapsed,
+            renderer=partial(formatter, prepared, response_data),
+        ))
+
+    def _execute_raw(self, prepared: PreparedRequest) -> RawResult:
+        """Sends a raw request; the response body is returned undecoded."""
+        started = time.perf_counter()
+        success, error_message, content = self.api_utils.make_raw_request(
+            method=prepared.method,
+            endpoint=prepared.endpoint,
+            body=prepared.body,
+            params=prepared.params,
+        )
+        elapsed = time.perf_counter() - started
+
+        if not success:
+            logger.error("Error: %s", error_message)
+            return RawResult.from_error(error_message or "", elapsed)
+        return RawResult(success=True, content=content or b"", elapsed=elapsed, decoder=self.api_utils.json_codec.decode)
+
+    def _reject(self, message: str) -> Union[str, ClappiaResult]:
+        """Returns a validation failure produced before any request was sent."""
+        if not self.structured_results:
+            return message
+        return ClappiaResult.from_error(message)
+
+    def _finish(self, result: ClappiaResult) -> Union[str, ClappiaResult]:
+        return result if self.structured_results else result.text
@@ -1,6 +1,21 @@
-from typing import Optional, Dict, Any, List
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, List, Union
 from .submission_client import SubmissionClient
 from .app_definition_client import AppDefinitionClient
+from clappia_api_tools._utils.api_utils import ClappiaAPIUtils
+from clappia_api_tools._utils.http_pool import PoolConfig
+from clappia_api_tools._utils.retry import RetryConfig
+from clappia_api_tools._utils.rate_limit import RateLimiter
+from clappia_api_tools._utils.transport import Transport
+from clappia_api_tools._utils.definition_cache import DefinitionCache
+from clappia_api_tools._utils.idempotency import IdempotencyLedger
+from clappia_api_tools._utils.coalescing import EditCoalescer
+from clappia_api_tools._utils.outbox import SubmissionOutbox
+from clappia_api_tools._utils.schema_validator import SubmissionValidator
+from clappia_api_tools._utils.field_index import FieldResolver
+from clappia_api_tools._utils.metrics import MetricsSink
+from clappia_api_tools._utils.json_codec import JsonCodec
+from clappia_api_tools._models.model import ClappiaResult, RawResult
 
 class ClappiaClient:
     """Main Clappia client that provides unified access to all Clappia functionality.
@@ -18,7 +33,21 @@ class ClappiaClient:
     """
 
     def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, 
-                 workplace_id: Optional[str] = None, timeout: int = 30):
+                 workplace_id: Optional[str] = None, timeout: int = 30,
+                 pool_config: Optional[PoolConfig] = None,
+                 retry_config: Optional[RetryConfig] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 transport: Optional[Transport] = None,
+                 definition_cache: Optional[DefinitionCache] = None,
+                 outbox: Optional[SubmissionOutbox] = None,
+                 idempotency_ledger: Optional[IdempotencyLedger] = None,
+                 edit_coalescer: Optional[EditCoalescer] = None,
+                 submission_validator: Optional[SubmissionValidator] = None,
+                 field_resolver: Optional[FieldResolver] = None,
+                 metrics: Optional[MetricsSink] = None,
+                 json_codec: Optional[JsonCodec] = None,
+                 dedupe_reads: bool = True,
+                 structured_results: bool = False):
         """Initialize the main Clappia client with all specialized clients.
 
         Args:
@@ -26,16 +55,58 @@ class ClappiaClient:
             base_url: API base URL. If None, will use default Clappia API URL.
             workplace_id: Workspace ID. If None, will be read from environment variables.
             timeout: Request timeout in seconds. Defaults to 30.
+            pool_config: Connection pool settings shared by all specialized clients.
+            retry_config: Retry policies per endpoint class. Defaults to retrying reads on
+                transient failures and mutations only when the server rejected them.
+            rate_limiter: Client-side token bucket limiter applied to every request.
+            transport: Sends the HTTP requests. Defaults to the pooled HTTP transport.
+            definition_cache: Cache for app definitions, invalidated by this client's schema
+                changes. None (default) disables caching.
+            outbox: Durable queue that create_submission and edit_submission write to
+                instead of waiting for the API. None (default) sends them synchronously.
+            idempotency_ledger: Records successful creates so repeating one returns the
+                recorded submission instead of creating a duplicate. None (default) disables it.
+            edit_coalescer: Merges edit_submission_coalesced calls for the same submission
+                into one edit request. None (default) sends each edit on its own.
+            submission_validator: Checks submission data against the app definition
+                before it is sent. Build it with the same definition_cache so schema
+                changes made through this client apply immediately. None (default)
+                leaves validation to the API.
+            field_resolver: Per-app label index for calls made with resolve_labels=True.
+                Defaults to one reading definitions through definition_cache.
+            metrics: Sink for per-endpoint request counts, latencies, bytes and retries,
+                plus pool and definition cache figures. None (default) records nothing.
+            json_codec: Encodes request bodies and decodes responses. Defaults to orjson
+                when installed, else the standard library json module.
+            dedupe_reads: Let concurrent identical reads, such as many callers fetching the
+                same definition at once, share one request. Defaults to True.
+            structured_results: Return ClappiaResult objects instead of formatted strings.
+                The text is still available, rendered on demand, through ``result.text``.
         """
-        # Initialize all specialized clients
-        self.submissions = SubmissionClient(api_key, base_url, workplace_id, timeout)
-        self.app_definition = AppDefinitionClient(api_key, base_url, workplace_id, timeout)
+        # All specialized clients share one API utils instance and its pooled session
+        self.api_utils = ClappiaAPIUtils(
+            api_key, base_url, workplace_id, timeout,
+            pool_config=pool_config, retry_config=retry_config,
+            rate_limiter=rate_limiter, transport=transport, metrics=metrics,
+            json_codec=json_codec, dedupe_reads=dedupe_reads,
+        )
+        self.submissions = SubmissionClient(
+            api_utils=self.api_utils, outbox=outbox, idempotency_ledger=idempotency_ledger,
+            edit_coalescer=edit_coalescer, submission_validator=submission_validator,
+            field_resolver=field_resolver or (FieldResolver(definition_cache) if definition_cache is not None else None),
+            structured_results=structured_results,
+        )
+        self.app_definition = AppDefinitionClient(
+            api_utils=self.api_utils, definition_cache=definition_cache,
+            structured_results=structured_results,
+        )
 
     # =============================================================================
     # SUBMISSION METHODS - Direct access for backward compatibility
     # =============================================================================
 
-    def create_submission(self, app_id: str, data: Dict[str, Any], email: str) -> str:
+    def create_submission(self, app_id: str, data: Dict[str, Any], email: str,
+                          idempotency_key: Optional[str] = None, resolve_labels: bool = False) -> Union[str, ClappiaResult]:
         """Creates a new submission in a Clappia application.
         
         This is a convenience method that delegates to self.submissions.create_submission().
@@ -44,13 +115,16 @@ class ClappiaClient:
             app_id: Application ID in uppercase letters and numbers format.
             data: Dictionary of field data to submit.
             email: Email address of the user creating the submission.
+            idempotency_key: Identifies this create in the idempotency ledger.
+            resolve_labels: Translate label keys of data to field names through the app's field index.
             
         Returns:
             str: Formatted response with submission details and status.
         """
-        return self.submissions.create_submission(app_id, data, email)
+        return self.submissions.create_submission(app_id, data, email, idempotency_key, resolve_labels)
 
-    def edit_submission(self, app_id: str, submission_id: str, data: Dict[str, Any], email: str) -> str:
+    def edit_submission(self, app_id: str, submission_id: str, data: Dict[str, Any], email: str,
+                        resolve_labels: bool = False) -> Union[str, ClappiaResult]:
         """Edits an existing Clappia submission.
         
         This is a convenience method that delegates to self.submissions.edit_submission().
@@ -60,14 +134,53 @@ class ClappiaClient:
             submission_id: Unique identifier of the submission to update.
             data: Dictionary of field data to update.
             email: Email address of the user requesting the edit.
+            resolve_labels: Translate label keys of data to field names through the app's field index.
             
         Returns:
             str: Formatted response with edit details and status.
         """
-        return self.submissions.edit_submission(app_id, submission_id, data, email)
+        return self.submissions.edit_submission(app_id, submission_id, data, email, resolve_labels)
+
+    def create_submission_raw(self, app_id: str, data: bytes, email: str) -> RawResult:
+        """Creates a submission from field data already encoded as JSON.
+
+        This is a convenience method that delegates to self.submissions.create_submission_raw().
+
+        Returns:
+            RawResult: The undecoded response body and the call's outcome.
+        """
+        return self.submissions.create_submission_raw(app_id, data, email)
+
+    def edit_submission_raw(self, app_id: str, submission_id: str, data: bytes, email: str) -> RawResult:
+        """Edits a submission with field data already encoded as JSON.
+
+        This is a convenience method that delegates to self.submissions.edit_submission_raw().
+
+        Returns:
+            RawResult: The undecoded response body and the call's outcome.
+        """
+        return self.submissions.edit_submission_raw(app_id, submission_id, data, email)
+
+    def edit_submission_coalesced(self, app_id: str, submission_id: str, data: Dict[str, Any],
+                                  email: str, resolve_labels: bool = False) -> "Future[Union[str, ClappiaResult]]":
+        """Edits a submission, merging it with other pending edits of the same submission.
+        
+        This is a convenience method that delegates to self.submissions.edit_submission_coalesced().
+        
+        Args:
+            app_id: Application ID in uppercase letters and numbers format.
+            submission_id: Unique identifier of the submission to update.
+            data: Dictionary of field data to update.
+            email: Email address of the user requesting the edit.
+            resolve_labels: Translate label keys of data to field names through the app's field index.
+            
+        Returns:
+            Future: Resolves with the formatted response of the merged edit.
+        """
+        return self.submissions.edit_submission_coalesced(app_id, submission_id, data, email, resolve_labels)
     
     def update_submission_owners(self, app_id: str, submission_id: str, 
-                               requesting_user_email_address: str, email_ids: List[str]) -> str:
+                               requesting_user_email_address: str, email_ids: List[str]) -> Union[str, ClappiaResult]:
         """Updates the ownership of a Clappia submission.
         
         This is a convenience method that delegates to self.submissions.update_owners().
@@ -84,7 +197,7 @@ class ClappiaClient:
         return self.submissions.update_owners(app_id, submission_id, requesting_user_email_address, email_ids)
 
     def update_submission_status(self, app_id: str, submission_id: str, 
-                               requesting_user_email_address: str, status_name: str, comments: str) -> str:
+                               requesting_user_email_address: str, status_name: str, comments: str) -> Union[str, ClappiaResult]:
         """Updates the status of a Clappia submission.
         
         This is a convenience method that delegates to self.submissions.update_status().
@@ -101,12 +214,35 @@ class ClappiaClient:
         """
         return self.submissions.update_status(app_id, submission_id, requesting_user_email_address, status_name, comments)
 
+    def create_submissions_bulk(self, app_id: str, records: List[Dict[str, Any]], email: str,
+                                max_concurrency: int = 8,
+                                idempotency_keys: Optional[List[Optional[str]]] = None,
+                                resolve_labels: bool = False) -> Union[str, ClappiaResult]:
+        """Creates many submissions concurrently.
+        
+        This is a convenience method that delegates to self.submissions.create_submissions_bulk().
+        
+        Args:
+            app_id: Application ID in uppercase letters and numbers format.
+            records: List of field data dictionaries, one per submission.
+            email: Email address of the user creating the submissions.
+            max_concurrency: Maximum number of create requests in flight at once.
+            idempotency_keys: Optional idempotency key per record.
+            resolve_labels: Translate label keys of each record to field names.
+            
+        Returns:
+            str: Formatted response with a partial-failure summary and per-record results.
+        """
+        return self.submissions.create_submissions_bulk(
+            app_id, records, email, max_concurrency, idempotency_keys, resolve_labels
+        )
+
     # =============================================================================
     # APP DEFINITION METHODS - Direct access for backward compatibility
     # =============================================================================
 
     def get_app_definition(self, app_id: str, language: str = "en", 
-                          strip_html: bool = True, include_tags: bool = True) -> str:
+                          strip_html: bool = True, include_tags: bool = True) -> Union[str, ClappiaResult]:
         """Fetches complete definition of a Clappia application.
         
         This is a convenience method that delegates to self.app_definition.get_definition().
@@ -122,8 +258,19 @@ class ClappiaClient:
         """
         return self.app_definition.get_definition(app_id, language, strip_html, include_tags)
 
+    def get_app_definition_raw(self, app_id: str, language: str = "en",
+                               strip_html: bool = True, include_tags: bool = True) -> RawResult:
+        """Fetches an app definition as the undecoded response body.
+
+        This is a convenience method that delegates to self.app_definition.get_definition_raw().
+
+        Returns:
+            RawResult: The undecoded definition and the call's outcome.
+        """
+        return self.app_definition.get_definition_raw(app_id, language, strip_html, include_tags)
+
     def create_app(self, app_name: str, requesting_user_email_address: str, 
-                   sections: List[Dict[str, Any]]) -> str:
+                   sections: List[Dict[str, Any]]) -> Union[str, ClappiaResult]:
         """Creates a new Clappia application with specified sections and fields.
         
         This is a convenience method that delegates to self.app_definition.create_app().
@@ -140,7 +287,7 @@ class ClappiaClient:
 
     def add_field_to_app(self, app_id: str, requesting_user_email_address: str,
                         section_index: int, field_index: int, field_type: str, 
-                        label: str, required: bool, **kwargs) -> str:
+                        label: str, required: bool, **kwargs) -> Union[str, ClappiaResult]:
         """Adds a new field to an existing Clappia application.
         
         This is a convenience method that delegates to self.app_definition.add_field().
@@ -167,6 +314,56 @@ class ClappiaClient:
     # UTILITY METHODS
     # =============================================================================
 
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Returns connection pool statistics for the shared HTTP session.
+
+        Returns:
+            dict: Pool configuration and per-host connection counts.
+        """
+        return self.api_utils.get_pool_stats()
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Returns statistics of the app definition cache.
+
+        Returns:
+            dict: Cache size, hits, misses, loads, evictions and invalidations, or None when caching is off.
+        """
+        return self.app_definition.get_cache_stats()
+
+    def get_outbox_stats(self) -> Optional[Dict[str, Any]]:
+        """Returns statistics of the submission outbox.
+
+        Returns:
+            dict: Entry counts by status and delivery counters, or None when no outbox is used.
+        """
+        outbox = self.submissions.outbox
+        return outbox.stats() if outbox is not None else None
+
+    def get_idempotency_stats(self) -> Optional[Dict[str, Any]]:
+        """Returns statistics of the idempotency ledger.
+
+        Returns:
+            dict: Ledger size, hits, misses and recorded creates, or None when no ledger is used.
+        """
+        return self.submissions.get_idempotency_stats()
+
+    def get_validation_stats(self) -> Optional[Dict[str, Any]]:
+        """Returns statistics of the submission validator.
+
+        Returns:
+            dict: Compiled schemas, compiles, records checked and rejected, or None when data is not validated locally.
+        """
+        return self.submissions.get_validation_stats()
+
+    def get_coalescing_stats(self) -> Optional[Dict[str, Any]]:
+        """Returns statistics of the edit coalescer.
+
+        Returns:
+            dict: Edits received, edit requests sent and edits pending, or None when no coalescer is used.
+        """
+        coalescer = self.submissions.edit_coalescer
+        return coalescer.stats() if coalescer is not None else None
+
     def get_client_info(self) -> Dict[str, Any]:
         """Returns information about the client and its configuration.
         
@@ -181,16 +378,22 @@ class ClappiaClient:
                 "app_definition": "AppDefinitionClient"
             },
             "api_config": {
-                "base_url": self.submissions.api_utils.base_url,
-                "workplace_id": self.submissions.api_utils.workplace_id,
-                "timeout": self.submissions.api_utils.timeout
+                "base_url": self.api_utils.base_url,
+                "workplace_id": self.api_utils.workplace_id,
+                "timeout": self.api_utils.timeout,
+                "pool_config": {
+                    "pool_connections": self.api_utils.pool_config.pool_connections,
+                    "pool_maxsize": self.api_utils.pool_config.pool_maxsize,
+                    "pool_block": self.api_utils.pool_config.pool_block,
+                    "keep_alive": self.api_utils.pool_config.keep_alive,
+                },
             }
         }
 
     def __repr__(self) -> str:
         """String representation of the ClappiaClient."""
-        return f"ClappiaClient(workplace_id={self.submissions.api_utils.workplace_id})"
+        return f"ClappiaClient(workplace_id={self.api_utils.workplace_id})"
 
     def __str__(self) -> str:
         """Human-readable string representation of the ClappiaClient."""
-        return f"Clappia API Client for workspace: {self.submissions.api_utils.workplace_id}"
\ No newline at end of file
+        return f"Clappia API Client for workspace: {self.api_utils.workplace_id}"
\ No newline at end of file
@@ -1,33 +1,92 @@
-import json
-from typing import Dict, Any, List, Optional
-from .base_client import BaseClappiaClient          
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple, Union
+from .base_client import BaseClappiaClient, PreparedRequest, definition_request
 from clappia_api_tools._utils.validators import ClappiaInputValidator
-from clappia_api_tools._utils.logging_utils import get_logger
+from clappia_api_tools._utils.logging_utils import BodyPreview, get_logger
+from clappia_api_tools._utils.outbox import SubmissionOutbox
+from clappia_api_tools._utils.idempotency import IdempotencyLedger
+from clappia_api_tools._utils.coalescing import EditCoalescer
+from clappia_api_tools._utils.definition_cache import DefinitionCache, RequestResult
+from clappia_api_tools._utils.field_index import FieldIndex, FieldResolver
+from clappia_api_tools._utils.schema_validator import SubmissionValidator
+from clappia_api_tools._utils.raw_body import RawBodyTemplate, check_raw_object
+from clappia_api_tools._models.model import ClappiaResult, RawResult
 
 logger = get_logger(__name__)
 
 
-class SubmissionClient(BaseClappiaClient):
-    """Client for managing Clappia submissions.
-    
-    This client handles all submission-related operations including creating,
-    editing, retrieving, and managing submission ownership and status.
-    """
-
-    def create_submission(self, app_id: str, data: Dict[str, Any], requesting_user_email_address: str) -> str:
-        """Creates a new submission in a Clappia application with specified field data.
+class SubmissionOperations:
+    """Validation, payload building and response formatting for submission calls.
 
-        Submits form data to create a new record in the specified Clappia app.
-        Use this to programmatically add entries, automate data collection, or integrate external systems.
-
-        Args:
-            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412). Use this to specify which Clappia app to create the submission in.
-            data: Dictionary of field data to submit. Keys should match field names from the app definition, values should match expected field types. Example: {"employee_name": "John Doe", "department": "Engineering", "salary": 75000, "start_date": "2024-01-15"}. For file fields, use format: {"image_field_name": [{"s3Path": {"bucket": "my-files-bucket", "key": "images/photo.jpg", "makePublic": false}}]}.
-            requesting_user_email_address (or email): Email address of the user creating the submission. This user becomes the submission owner and must have access to the specified app. Must be a valid email format.
+    Shared by SubmissionClient and AsyncSubmissionClient so both validate inputs and
+    render results identically; only the transport differs.
+    """
 
-        Returns:
-            str: Formatted response with submission details and status
-        """
+    idempotency_ledger: Optional[IdempotencyLedger] = None
+    submission_validator: Optional[SubmissionValidator] = None
+    field_resolver: Optional[FieldResolver] = None
+
+    def get_idempotency_stats(self) -> Optional[Dict[str, Any]]:
+        """Returns hit/miss statistics of the idempotency ledger, or None when no ledger is used."""
+        return self.idempotency_ledger.stats() if self.idempotency_ledger is not None else None
+
+    def get_validation_stats(self) -> Optional[Dict[str, Any]]:
+        """Returns statistics of the submission validator, or None when data is not validated locally."""
+        return self.submission_validator.stats() if self.submission_validator is not None else None
+
+    def get_field_resolution_stats(self) -> Optional[Dict[str, Any]]:
+        """Returns statistics of the field resolver, or None when no labels were resolved yet."""
+        return self.field_resolver.stats() if self.field_resolver is not None else None
+
+    def _get_field_resolver(self) -> FieldResolver:
+        """The field resolver, created on first use and sharing the validator's definitions."""
+        if self.field_resolver is None:
+            validator = self.submission_validator
+            self.field_resolver = FieldResolver(validator.definition_cache if validator is not None else None)
+        return self.field_resolver
+
+    @staticmethod
+    def _should_resolve_labels(app_id: str, resolve_labels: bool) -> bool:
+        # An invalid app_id is reported by the prepare step, without loading anything
+        return resolve_labels and ClappiaInputValidator.validate_app_id(app_id)[0]
+
+    @staticmethod
+    def _translate_labels(field_index: FieldIndex, data: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+        translated, problems = field_index.translate(data)
+        if problems:
+            return f"Error: could not resolve field labels - {'; '.join(problems)}"
+        return translated
+
+    def _prepare_definition_lookup(self, app_id: str, cache: DefinitionCache) -> PreparedRequest:
+        """Request for the definition the submission validator checks data against, as cached by ``cache``."""
+        key = cache.canonical_key(SubmissionValidator.definition_key(app_id))
+        return definition_request(self.api_utils.workplace_id, key)
+
+    def _screen_bulk_items(self, items: List[Union[PreparedRequest, Dict[str, Any]]],
+                           loaded: RequestResult) -> List[Union[PreparedRequest, Dict[str, Any]]]:
+        """Replaces records the submission validator rejects with validation errors."""
+        screened: List[Union[PreparedRequest, Dict[str, Any]]] = []
+        for item in items:
+            if isinstance(item, PreparedRequest):
+                problem = self.submission_validator.check(item.data["appId"], item.data["data"], loaded)
+                if problem is not None:
+                    item = self._bulk_error(item.context["index"], "validation", problem[len("Error: "):])
+            screened.append(item)
+        return screened
+
+    def _idempotency_key(self, payload: Dict[str, Any], idempotency_key: Optional[str]) -> Optional[str]:
+        """Key a create is recorded under: the caller's key, else a hash of its payload."""
+        if self.idempotency_ledger is None:
+            return None
+        if idempotency_key is not None:
+            return idempotency_key.strip()
+        return IdempotencyLedger.make_key(payload)
+
+    def _prepare_create_submission(self, app_id: str, data: Dict[str, Any], requesting_user_email_address: str,
+                                   idempotency_key: Optional[str] = None,
+                                   field_index: Optional[FieldIndex] = None) -> Union[str, PreparedRequest]:
         is_valid, error_msg = ClappiaInputValidator.validate_app_id(app_id)
         if not is_valid:
             return f"Error: Invalid app_id - {error_msg}"
@@ -43,6 +102,14 @@ class SubmissionClient(BaseClappiaClient):
 
         if not data:
             return "Error: data cannot be empty - at least one field is required"
+
+        if idempotency_key is not None and (not isinstance(idempotency_key, str) or not idempotency_key.strip()):
+            return "Error: idempotency_key must be a non-empty string"
+
+        if field_index is not None:
+            data = self._translate_labels(field_index, data)
+            if isinstance(data, str):
+                return data
         
         env_valid, env_error = self.api_utils.validate_environment()
         if not env_valid:
@@ -55,45 +122,35 @@ class SubmissionClient(BaseClappiaClient):
             "data": data,
         }
 
-        logger.info(
-            f"Creating submission for app_id: {app_id} with data: {data} and requesting_user_email_address: {requesting_user_email_address}"
-        )
+        logger.info("Creating submission for app_id: %s", app_id)
+        logger.debug("Submission payload: %s", BodyPreview(payload))
 
-        success, error_message, response_data = self.api_utils.make_request(
-            method="POST", endpoint="submissions/create", data=payload
+        context = {"app_id": app_id, "data": data, "requesting_user_email_address": requesting_user_email_address}
+        key = self._idempotency_key(payload, idempotency_key)
+        if key is not None:
+            context["idempotency_key"] = key
+        return PreparedRequest(
+            method="POST",
+            endpoint="submissions/create",
+            data=payload,
+            context=context,
         )
 
-        if not success:
-            logger.error(f"Error: {error_message}")
-            return f"Error: {error_message}"
-
+    def _format_create_submission(self, prepared: PreparedRequest, response_data: Optional[Dict[str, Any]]) -> str:
         submission_id = response_data.get("submissionId") if response_data else None
 
         submission_info = {
             "submissionId": submission_id,
             "status": "created",
-            "appId": app_id,
-            "owner": requesting_user_email_address,
-            "fieldsSubmitted": len(data),
+            "appId": prepared.context["app_id"],
+            "owner": prepared.context["requesting_user_email_address"],
+            "fieldsSubmitted": len(prepared.context["data"]),
         }
 
-        return f"Successfully created submission:\n\nSUMMARY:\n{json.dumps(submission_info, indent=2)}\n\nFULL RESPONSE:\n{json.dumps(response_data, indent=2)}"
-
-    def edit_submission(self, app_id: str, submission_id: str, data: Dict[str, Any], requesting_user_email_address: str) -> str:
-        """Edits an existing Clappia submission by updating specified field values.
-
-        Modifies field data in an existing submission record while preserving other field values.
-        Use this to update form data, correct information, or add missing details to submissions.
-
-        Args:
-            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412). Use this to specify which Clappia app contains the submission.
-            submission_id: Unique identifier of the submission to update (e.g., HGO51464561). This identifies the specific submission record to modify.
-            data: Dictionary of field data to update. Keys should match field names from the app definition, values should match expected field types. Only specified fields will be updated. Example: {"employee_name": "Jane Doe", "department": "Marketing", "salary": 80000, "start_date": "20-02-2025"}.
-            requesting_user_email_address: Email address of the user requesting the edit. This user must have permission to modify the submission. Must be a valid email format.
+        return f"Successfully created submission:\n\nSUMMARY:\n{self.api_utils.json_codec.pretty(submission_info)}\n\nFULL RESPONSE:\n{self.api_utils.json_codec.pretty(response_data)}"
 
-        Returns:
-            str: Formatted response with edit details and status
-        """
+    def _prepare_edit_submission(self, app_id: str, submission_id: str, data: Dict[str, Any], requesting_user_email_address: str,
+                                 field_index: Optional[FieldIndex] = None) -> Union[str, PreparedRequest]:
         is_valid, error_msg = ClappiaInputValidator.validate_app_id(app_id)
         if not is_valid:
             return f"Error: Invalid app_id - {error_msg}"
@@ -114,6 +171,11 @@ class SubmissionClient(BaseClappiaClient):
         if not data:
             return "Error: data cannot be empty - at least one field is required"
 
+        if field_index is not None:
+            data = self._translate_labels(field_index, data)
+            if isinstance(data, str):
+                return data
+
         env_valid, env_error = self.api_utils.validate_environment()
         if not env_valid:
             return f"Error: {env_error}"
@@ -126,45 +188,31 @@ class SubmissionClient(BaseClappiaClient):
             "data": data,
         }
 
-        logger.info(
-            f"Editing submission {submission_id} for app_id: {app_id} with data: {data} and requesting_user_email_address: {requesting_user_email_address}"
-        )
+        logger.info("Editing submission %s for app_id: %s", submission_id, app_id)
+        logger.debug("Submission payload: %s", BodyPreview(payload))
 
-        success, error_message, response_data = self.api_utils.make_request(
-            method="POST", endpoint="submissions/edit", data=payload
+        return PreparedRequest(
+            method="POST",
+            endpoint="submissions/edit",
+            data=payload,
+            context={"app_id": app_id, "submission_id": submission_id, "data": data, "requesting_user_email_address": requesting_user_email_address},
         )
 
-        if not success:
-            logger.error(f"Error: {error_message}")
-            return f"Error: {error_message}"
-
+    def _format_edit_submission(self, prepared: PreparedRequest, response_data: Optional[Dict[str, Any]]) -> str:
+        data = prepared.context["data"]
         edit_info = {
-            "submissionId": submission_id,
-            "appId": app_id,
-            "requestingUser": requesting_user_email_address,
+            "submissionId": prepared.context["submission_id"],
+            "appId": prepared.context["app_id"],
+            "requestingUser": prepared.context["requesting_user_email_address"],
             "fieldsUpdated": len(data),
             "updatedFields": list(data.keys()),
             "status": "updated",
         }
 
-        return f"Successfully edited submission:\n\nSUMMARY:\n{json.dumps(edit_info, indent=2)}\n\nFULL RESPONSE:\n{json.dumps(response_data, indent=2)}"
-    
-    def update_owners(self, app_id: str, submission_id: str, requesting_user_email_address: str, 
-                     email_ids: List[str]) -> str:
-        """Updates the ownership of a Clappia submission by adding new owners to share access.
-
-        Modifies submission ownership to include additional users who can view and edit the submission.
-        Use this to collaborate on submissions, delegate work, or transfer ownership.
-
-        Args:
-            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412). Use this to specify which Clappia app contains the submission.
-            submission_id: Unique identifier of the submission to update (e.g., HGO51464561). This identifies the specific submission record to modify.
-            requesting_user_email_address: Email address of the user making the ownership change. This user must have permission to modify the submission. Must be a valid email format.
-            email_ids: List of email addresses to add as new owners. Each email must be valid and the users should have access to the app. Example: ["user1@company.com", "user2@company.com"]. Invalid emails will be skipped with a warning.
+        return f"Successfully edited submission:\n\nSUMMARY:\n{self.api_utils.json_codec.pretty(edit_info)}\n\nFULL RESPONSE:\n{self.api_utils.json_codec.pretty(response_data)}"
 
-        Returns:
-            str: Formatted response with update details and status
-        """
+    def _prepare_update_owners(self, app_id: str, submission_id: str, requesting_user_email_address: str, 
+                               email_ids: List[str]) -> Union[str, PreparedRequest]:
         is_valid, error_msg = ClappiaInputValidator.validate_app_id(app_id)
         if not is_valid:
             return f"Error: Invalid app_id - {error_msg}"
@@ -195,52 +243,42 @@ class SubmissionClient(BaseClappiaClient):
             "emailIds": valid_emails,
         }
 
-        logger.info(
-            f"Updating submission owners for app_id: {app_id} with payload: {payload}"
-        )
+        logger.info("Updating submission owners for app_id: %s", app_id)
+        logger.debug("Owners payload: %s", BodyPreview(payload))
 
-        success, error_message, response_data = self.api_utils.make_request(
+        return PreparedRequest(
             method="POST",
             endpoint="submissions/updateSubmissionOwners",
             data=payload,
+            context={
+                "app_id": app_id,
+                "submission_id": submission_id,
+                "requesting_user_email_address": requesting_user_email_address,
+                "valid_emails": valid_emails,
+                "validation_msg": validation_msg,
+            },
         )
 
-        if not success:
-            logger.error(f"Error: {error_message}")
-            return f"Error: {error_message}"
-
+    def _format_update_owners(self, prepared: PreparedRequest, response_data: Optional[Dict[str, Any]]) -> str:
+        valid_emails = prepared.context["valid_emails"]
+        validation_msg = prepared.context["validation_msg"]
         owners_info = {
-            "submissionId": submission_id,
-            "appId": app_id,
-            "requestingUser": requesting_user_email_address,
+            "submissionId": prepared.context["submission_id"],
+            "appId": prepared.context["app_id"],
+            "requestingUser": prepared.context["requesting_user_email_address"],
             "newOwnersCount": len(valid_emails),
             "newOwners": valid_emails,
             "status": "updated",
         }
 
-        result = f"Successfully updated submission owners:\n\nSUMMARY:\n{json.dumps(owners_info, indent=2)}"
+        result = f"Successfully updated submission owners:\n\nSUMMARY:\n{self.api_utils.json_codec.pretty(owners_info)}"
         if validation_msg:
             result += f"\n\nWARNING: {validation_msg}"
-        result += f"\n\nFULL RESPONSE:\n{json.dumps(response_data, indent=2)}"
+        result += f"\n\nFULL RESPONSE:\n{self.api_utils.json_codec.pretty(response_data)}"
         return result
 
-    def update_status(self, app_id: str, submission_id: str, requesting_user_email_address: str, 
-                     status_name: str, comments: str) -> str:
-        """Updates the status of a Clappia submission to track workflow progress and approvals.
-
-        Changes the submission status to indicate current stage in workflow (e.g., pending, approved, rejected).
-        Use this to manage approval workflows, track processing stages, or update submission lifecycle.
-
-        Args:
-            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412). Use this to specify which Clappia app contains the submission.
-            submission_id: Unique identifier of the submission to update (e.g., HGO51464561). This identifies the specific submission record to modify.
-            requesting_user_email_address: Email address of the user making the status change. This user must have permission to modify the submission. Must be a valid email format.
-            status_name: Name of the new status to apply to the submission.
-            comments: Optional comments to include with the status change.
-
-        Returns:
-            str: Formatted response with update details and status
-        """
+    def _prepare_update_status(self, app_id: str, submission_id: str, requesting_user_email_address: str, 
+                               status_name: str, comments: str) -> Union[str, PreparedRequest]:
         is_valid, error_msg = ClappiaInputValidator.validate_app_id(app_id)
         if not is_valid:
             return f"Error: Invalid app_id - {error_msg}"
@@ -275,27 +313,540 @@ class SubmissionClient(BaseClappiaClient):
             "status": status,
         }
 
-        logger.info(f"Updating submission status for app_id: {app_id} with payload: {payload}")
+        logger.info("Updating submission status for app_id: %s", app_id)
+        logger.debug("Status payload: %s", BodyPreview(payload))
 
-        success, error_message, response_data = self.api_utils.make_request(
+        return PreparedRequest(
             method="POST",
             endpoint="submissions/updateStatus",
             data=payload,
+            context={
+                "app_id": app_id,
+                "submission_id": submission_id,
+                "requesting_user_email_address": requesting_user_email_address,
+                "status_name": status_name,
+                "comments": comments,
+            },
+        )
+
+    def _format_update_status(self, prepared: PreparedRequest, response_data: Optional[Dict[str, Any]]) -> str:
+        status_info = {
+            "submissionId": prepared.context["submission_id"],
+            "appId": prepared.context["app_id"],
+            "requestingUser": prepared.context["requesting_user_email_address"],
+            "newStatus": prepared.context["status_name"],
+            "comments": prepared.context["comments"],
+            "updateStatus": "completed",
+        }
+
+        result = f"Successfully updated submission status:\n\nSUMMARY:\n{self.api_utils.json_codec.pretty(status_info)}"
+        result += f"\n\nFULL RESPONSE:\n{self.api_utils.json_codec.pretty(response_data)}"
+        return result
+
+    def _prepare_raw_submission(self, app_id: str, submission_id: Optional[str], data: bytes,
+                                requesting_user_email_address: str) -> Union[str, PreparedRequest]:
+        """Validates a raw create (submission_id None) or edit and splices data into its body."""
+        is_valid, error_msg = ClappiaInputValidator.validate_app_id(app_id)
+        if not is_valid:
+            return f"Error: Invalid app_id - {error_msg}"
+
+        if submission_id is not None:
+            is_valid, error_msg = ClappiaInputValidator.validate_submission_id(submission_id)
+            if not is_valid:
+                return f"Error: Invalid submission_id - {error_msg}"
+
+        if not requesting_user_email_address or not requesting_user_email_address.strip():
+            return "Error: requesting_user_email_address is required and cannot be empty"
+
+        if not ClappiaInputValidator.validate_email(requesting_user_email_address):
+            return "Error: requesting_user_email_address must be a valid email address"
+
+        problem = check_raw_object(data)
+        if problem is not None:
+            return problem
+
+        env_valid, env_error = self.api_utils.validate_environment()
+        if not env_valid:
+            return f"Error: {env_error}"
+
+        members = {"workplaceId": self.api_utils.workplace_id, "appId": app_id.strip()}
+        if submission_id is not None:
+            members["submissionId"] = submission_id.strip()
+        members["requestingUserEmailAddress"] = requesting_user_email_address.strip()
+        body = RawBodyTemplate(members, codec=self.api_utils.json_codec).render(data)
+
+        logger.info("Sending raw %s for app_id: %s", "edit" if submission_id is not None else "create", app_id)
+        return PreparedRequest(
+            method="POST",
+            endpoint="submissions/create" if submission_id is None else "submissions/edit",
+            body=body,
+            context={"app_id": app_id, "submission_id": submission_id},
+        )
+
+    def _prepare_create_submissions_bulk(self, app_id: str, records: List[Dict[str, Any]], requesting_user_email_address: str,
+                                         max_concurrency: int, idempotency_keys: Optional[List[Optional[str]]] = None,
+                                         field_index: Optional[FieldIndex] = None
+                                         ) -> Union[str, List[Union[PreparedRequest, Dict[str, Any]]]]:
+        """Validates a whole batch up front.
+
+        Returns an error string when the batch itself is invalid, otherwise one item per
+        record in input order: a PreparedRequest to send, or an error result for records
+        that failed validation and will not be sent.
+        """
+        is_valid, error_msg = ClappiaInputValidator.validate_app_id(app_id)
+        if not is_valid:
+            return f"Error: Invalid app_id - {error_msg}"
+
+        if not requesting_user_email_address or not requesting_user_email_address.strip():
+            return "Error: requesting_user_email_address is required and cannot be empty"
+
+        if not ClappiaInputValidator.validate_email(requesting_user_email_address):
+            return "Error: requesting_user_email_address must be a valid email address"
+
+        if not isinstance(records, list):
+            return "Error: records must be a list of dictionaries"
+
+        if not records:
+            return "Error: records cannot be empty - at least one record is required"
+
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            return "Error: max_concurrency must be a positive integer"
+
+        if idempotency_keys is not None and (not isinstance(idempotency_keys, list) or len(idempotency_keys) != len(records)):
+            return "Error: idempotency_keys must be a list with one key (or None) per record"
+
+        env_valid, env_error = self.api_utils.validate_environment()
+        if not env_valid:
+            return f"Error: {env_error}"
+
+        items: List[Union[PreparedRequest, Dict[str, Any]]] = []
+        for index, data in enumerate(records):
+            if not isinstance(data, dict):
+                items.append(self._bulk_error(index, "validation", "data must be a dictionary"))
+                continue
+            if not data:
+                items.append(self._bulk_error(index, "validation", "data cannot be empty - at least one field is required"))
+                continue
+            caller_key = idempotency_keys[index] if idempotency_keys is not None else None
+            if caller_key is not None and (not isinstance(caller_key, str) or not caller_key.strip()):
+                items.append(self._bulk_error(index, "validation", "idempotency_key must be a non-empty string"))
+                continue
+            if field_index is not None:
+                data = self._translate_labels(field_index, data)
+                if isinstance(data, str):
+                    items.append(self._bulk_error(index, "validation", data[len("Error: "):]))
+                    continue
+            payload = {
+                "workplaceId": self.api_utils.workplace_id,
+                "appId": app_id.strip(),
+                "requestingUserEmailAddress": requesting_user_email_address.strip(),
+                "data": data,
+            }
+            context: Dict[str, Any] = {"index": index}
+            key = self._idempotency_key(payload, caller_key)
+            if key is not None:
+                context["idempotency_key"] = key
+            items.append(PreparedRequest(method="POST", endpoint="submissions/create", data=payload, context=context))
+
+        logger.info(
+            "Creating %d submissions for app_id: %s with max_concurrency: %d", len(records), app_id, max_concurrency
         )
+        return items
 
+    @staticmethod
+    def _bulk_error(index: int, stage: str, message: str) -> Dict[str, Any]:
+        return {"index": index, "success": False, "submissionId": None, "error": {"stage": stage, "message": message}}
+
+    def _bulk_item_result(self, prepared: PreparedRequest, success: bool, error_message: Optional[str],
+                          response_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        index = prepared.context["index"]
         if not success:
-            logger.error(f"Error: {error_message}")
-            return f"Error: {error_message}"
+            return self._bulk_error(index, "request", error_message or "Unknown error")
+        submission_id = response_data.get("submissionId") if response_data else None
+        return {"index": index, "success": True, "submissionId": submission_id, "error": None}
+
+    def _bulk_result(self, app_id: str, results: List[Dict[str, Any]], elapsed: float) -> ClappiaResult:
+        failed = sum(1 for r in results if not r["success"])
+        if failed:
+            logger.error("Error: %d of %d submissions failed for app_id: %s", failed, len(results), app_id)
+        return ClappiaResult(
+            success=failed == 0,
+            data={"results": results},
+            error=f"{failed} of {len(results)} records failed" if failed else None,
+            error_code="partial_failure" if failed else None,
+            elapsed=elapsed,
+            renderer=partial(self._format_create_submissions_bulk, app_id, results),
+        )
 
-        status_info = {
-            "submissionId": submission_id,
+    def _format_create_submissions_bulk(self, app_id: str, results: List[Dict[str, Any]]) -> str:
+        failed = [r["index"] for r in results if not r["success"]]
+        summary = {
             "appId": app_id,
-            "requestingUser": requesting_user_email_address,
-            "newStatus": status_name,
-            "comments": comments,
-            "updateStatus": "completed",
+            "total": len(results),
+            "succeeded": len(results) - len(failed),
+            "failed": len(failed),
+            "failedIndexes": failed,
+        }
+        if not failed:
+            headline = "Successfully created all submissions"
+        elif len(failed) == len(results):
+            headline = "Failed to create any submissions"
+        else:
+            headline = "Created submissions with partial failures"
+        return f"{headline}:\n\nSUMMARY:\n{self.api_utils.json_codec.pretty(summary)}\n\nRESULTS:\n{self.api_utils.json_codec.pretty(results)}"
+
+
+class SubmissionClient(SubmissionOperations, BaseClappiaClient):
+    """Client for managing Clappia submissions.
+    
+    This client handles all submission-related operations including creating,
+    editing, retrieving, and managing submission ownership and status.
+
+    Methods return formatted strings, or ClappiaResult objects when the client is
+    created with structured_results=True.
+    """
+
+    def __init__(self, *args, outbox: Optional[SubmissionOutbox] = None,
+                 idempotency_ledger: Optional[IdempotencyLedger] = None,
+                 edit_coalescer: Optional[EditCoalescer] = None,
+                 submission_validator: Optional[SubmissionValidator] = None,
+                 field_resolver: Optional[FieldResolver] = None, **kwargs):
+        """Initialize the submission client.
+
+        Accepts the same arguments as BaseClappiaClient, plus:
+
+        Args:
+            outbox: Durable queue for create_submission and edit_submission. When given,
+                those calls return as soon as the request is stored, and the outbox
+                workers (started here, replaying anything left from a previous run)
+                deliver it. None (default) sends them synchronously.
+            idempotency_ledger: Records successful creates by idempotency key, so a
+                repeated create returns the recorded submission instead of creating a
+                duplicate. None (default) sends every create.
+            edit_coalescer: Buffer that merges edit_submission_coalesced calls for the same
+                submission into one request. Its flusher is started here.
+            submission_validator: Checks data against the app definition before a create
+                or edit is sent, rejecting unknown fields and malformed values locally.
+                None (default) leaves validation of the data to the API.
+            field_resolver: Per-app label index used by calls made with resolve_labels=True.
+                Created on first use when not given, sharing the validator's definition cache.
+        """
+        super().__init__(*args, **kwargs)
+        self.outbox = outbox
+        self.idempotency_ledger = idempotency_ledger
+        self.edit_coalescer = edit_coalescer
+        self.submission_validator = submission_validator
+        self.field_resolver = field_resolver
+        if outbox is not None:
+            outbox.start(self._send_outbox_entry)
+        if edit_coalescer is not None:
+            edit_coalescer.start(self._send_coalesced_edit)
+
+    def _send(self, prepared: PreparedRequest) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        key = prepared.context.get("idempotency_key")
+        if self.idempotency_ledger is not None and key is not None:
+            return self.idempotency_ledger.get_or_send(key, lambda: super(SubmissionClient, self)._send(prepared))
+        return super()._send(prepared)
+
+    def _load_definition(self, app_id: str, cache: DefinitionCache) -> RequestResult:
+        request = self._prepare_definition_lookup(app_id, cache)
+        return cache.get_variant(
+            SubmissionValidator.definition_key(app_id),
+            lambda: self._send(request),
+            partial(self._send_conditional, request),
+        )
+
+    def _load_field_index(self, app_id: str, resolve_labels: bool) -> Union[str, FieldIndex, None]:
+        """Field index to resolve labels with, an error message, or None when not resolving."""
+        if not self._should_resolve_labels(app_id, resolve_labels):
+            return None
+        resolver = self._get_field_resolver()
+        return resolver.index_from(app_id, self._load_definition(app_id, resolver.definition_cache))
+
+    def _precheck(self, prepared: PreparedRequest) -> Optional[str]:
+        """Error message when the submission validator rejects a create or edit, else None."""
+        if self.submission_validator is None:
+            return None
+        app_id = prepared.data["appId"]
+        loaded = self._load_definition(app_id, self.submission_validator.definition_cache)
+        return self.submission_validator.check(app_id, prepared.data["data"], loaded)
+
+    def _send_outbox_entry(self, method: str, endpoint: str, data: Optional[Dict[str, Any]],
+                           idempotency_key: Optional[str] = None) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        context = {"idempotency_key": idempotency_key} if idempotency_key is not None else {}
+        return self._send(PreparedRequest(method=method, endpoint=endpoint, data=data, context=context))
+
+    def _send_coalesced_edit(self, payload: Dict[str, Any]) -> Union[str, ClappiaResult]:
+        prepared = PreparedRequest(
+            method="POST",
+            endpoint="submissions/edit",
+            data=payload,
+            context={
+                "app_id": payload["appId"],
+                "submission_id": payload["submissionId"],
+                "data": payload["data"],
+                "requesting_user_email_address": payload["requestingUserEmailAddress"],
+            },
+        )
+        return self._send_edit(prepared)
+
+    def _send_edit(self, prepared: PreparedRequest) -> Union[str, ClappiaResult]:
+        if self.outbox is not None:
+            # Edits of one submission are delivered in the order they were made
+            return self._enqueue(prepared, ordering_key=f"{prepared.data['appId']}/{prepared.data['submissionId']}")
+        return self._execute(prepared, self._format_edit_submission)
+
+    def _enqueue(self, prepared: PreparedRequest, ordering_key: Optional[str] = None) -> Union[str, ClappiaResult]:
+        """Stores a prepared mutation in the outbox instead of sending it."""
+        started = time.perf_counter()
+        key = prepared.context.get("idempotency_key")
+        if self.idempotency_ledger is not None and key is not None:
+            recorded = self.idempotency_ledger.get(key)
+            if recorded is not None:
+                # Already created; queueing it again would only produce a duplicate
+                return self._finish(ClappiaResult(
+                    success=True,
+                    data=recorded,
+                    elapsed=time.perf_counter() - started,
+                    renderer=partial(self._format_create_submission, prepared, recorded),
+                ))
+        try:
+            entry_id = self.outbox.enqueue(prepared.method, prepared.endpoint, prepared.data, ordering_key, key)
+        except Exception as e:
+            logger.error("Error: could not queue %s: %s", prepared.endpoint, e)
+            return self._finish(ClappiaResult.from_error(f"Unexpected error: could not queue request - {str(e)}"))
+
+        data = {"outboxId": entry_id, "status": "queued"}
+        return self._finish(ClappiaResult(
+            success=True,
+            data=data,
+            elapsed=time.perf_counter() - started,
+            renderer=partial(self._format_queued, prepared, data),
+        ))
+
+    def _format_queued(self, prepared: PreparedRequest, data: Dict[str, Any]) -> str:
+        queued_info = {
+            **data,
+            "endpoint": prepared.endpoint,
+            "appId": prepared.context["app_id"],
+            "fieldsSubmitted": len(prepared.context["data"]),
         }
+        if "submission_id" in prepared.context:
+            queued_info["submissionId"] = prepared.context["submission_id"]
+        return f"Queued submission for delivery:\n\nSUMMARY:\n{self.api_utils.json_codec.pretty(queued_info)}"
+
+    def create_submission(self, app_id: str, data: Dict[str, Any], requesting_user_email_address: str,
+                          idempotency_key: Optional[str] = None, resolve_labels: bool = False) -> Union[str, ClappiaResult]:
+        """Creates a new submission in a Clappia application with specified field data.
+
+        Submits form data to create a new record in the specified Clappia app.
+        Use this to programmatically add entries, automate data collection, or integrate external systems.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412). Use this to specify which Clappia app to create the submission in.
+            data: Dictionary of field data to submit. Keys should match field names from the app definition, values should match expected field types. Example: {"employee_name": "John Doe", "department": "Engineering", "salary": 75000, "start_date": "2024-01-15"}. For file fields, use format: {"image_field_name": [{"s3Path": {"bucket": "my-files-bucket", "key": "images/photo.jpg", "makePublic": false}}]}.
+            requesting_user_email_address (or email): Email address of the user creating the submission. This user becomes the submission owner and must have access to the specified app. Must be a valid email format.
+            idempotency_key: Identifies this create in the idempotency ledger; a create with a key that already succeeded returns the recorded submission without sending a request. Defaults to a hash of the app, user and data. Ignored when the client has no ledger.
+            resolve_labels: Treat the keys of data as field labels (or fieldNames) and translate them to fieldNames through the app's field index, e.g. {"Employee Name": "John Doe"}. Unmatched or ambiguous labels fail the call before anything is sent.
+
+        Returns:
+            str: Formatted response with submission details and status, or the queued outbox entry when the client has an outbox
+        """
+        field_index = self._load_field_index(app_id, resolve_labels)
+        if isinstance(field_index, str):
+            return self._reject(field_index)
+        prepared = self._prepare_create_submission(app_id, data, requesting_user_email_address, idempotency_key, field_index)
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        problem = self._precheck(prepared)
+        if problem is not None:
+            return self._reject(problem)
+        if self.outbox is not None:
+            return self._enqueue(prepared)
+        return self._execute(prepared, self._format_create_submission)
+
+    def create_submission_raw(self, app_id: str, data: bytes, requesting_user_email_address: str) -> RawResult:
+        """Creates a submission from field data that is already encoded as JSON.
+
+        The bytes are spliced into the request body as they are, without being decoded,
+        and the response body comes back undecoded. Label resolution, local validation,
+        the idempotency ledger and the outbox are not applied.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412).
+            data: Encoded JSON object of field data, e.g. b'{"employee_name": "John Doe"}'. Only its outer braces are checked.
+            requesting_user_email_address: Email address of the user creating the submission.
+
+        Returns:
+            RawResult: Always structured. Use result.extract("submissionId") to read the new ID without decoding the whole response.
+        """
+        prepared = self._prepare_raw_submission(app_id, None, data, requesting_user_email_address)
+        if isinstance(prepared, str):
+            return RawResult.from_error(prepared)
+        return self._execute_raw(prepared)
+
+    def edit_submission(self, app_id: str, submission_id: str, data: Dict[str, Any], requesting_user_email_address: str,
+                        resolve_labels: bool = False) -> Union[str, ClappiaResult]:
+        """Edits an existing Clappia submission by updating specified field values.
 
-        result = f"Successfully updated submission status:\n\nSUMMARY:\n{json.dumps(status_info, indent=2)}"
-        result += f"\n\nFULL RESPONSE:\n{json.dumps(response_data, indent=2)}"
-        return result
\ No newline at end of file
+        Modifies field data in an existing submission record while preserving other field values.
+        Use this to update form data, correct information, or add missing details to submissions.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412). Use this to specify which Clappia app contains the submission.
+            submission_id: Unique identifier of the submission to update (e.g., HGO51464561). This identifies the specific submission record to modify.
+            data: Dictionary of field data to update. Keys should match field names from the app definition, values should match expected field types. Only specified fields will be updated. Example: {"employee_name": "Jane Doe", "department": "Marketing", "salary": 80000, "start_date": "20-02-2025"}.
+            requesting_user_email_address: Email address of the user requesting the edit. This user must have permission to modify the submission. Must be a valid email format.
+            resolve_labels: Treat the keys of data as field labels (or fieldNames) and translate them to fieldNames through the app's field index, e.g. {"Employee Name": "John Doe"}. Unmatched or ambiguous labels fail the call before anything is sent.
+
+        Returns:
+            str: Formatted response with edit details and status, or the queued outbox entry when the client has an outbox
+        """
+        field_index = self._load_field_index(app_id, resolve_labels)
+        if isinstance(field_index, str):
+            return self._reject(field_index)
+        prepared = self._prepare_edit_submission(app_id, submission_id, data, requesting_user_email_address, field_index)
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        problem = self._precheck(prepared)
+        if problem is not None:
+            return self._reject(problem)
+        return self._send_edit(prepared)
+
+    def edit_submission_raw(self, app_id: str, submission_id: str, data: bytes,
+                            requesting_user_email_address: str) -> RawResult:
+        """Edits a submission with field data that is already encoded as JSON.
+
+        Raw counterpart of edit_submission; see create_submission_raw.
+
+        Returns:
+            RawResult: Always structured, with the undecoded response body.
+        """
+        prepared = self._prepare_raw_submission(app_id, submission_id, data, requesting_user_email_address)
+        if isinstance(prepared, str):
+            return RawResult.from_error(prepared)
+        return self._execute_raw(prepared)
+
+    def edit_submission_coalesced(self, app_id: str, submission_id: str, data: Dict[str, Any],
+                                  requesting_user_email_address: str,
+                                  resolve_labels: bool = False) -> "Future[Union[str, ClappiaResult]]":
+        """Edits a submission through the edit coalescer and returns a Future for the outcome.
+
+        Edits of the same submission and requesting user made within the coalescer's window
+        are merged (the last write of a field wins) and sent as one edit request; all of
+        them resolve with that request's outcome, summarizing the merged fields. Without a
+        coalescer the edit is sent immediately and the returned Future is already done.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412).
+            submission_id: Unique identifier of the submission to update (e.g., HGO51464561).
+            data: Dictionary of field data to update, keyed by field name.
+            requesting_user_email_address: Email address of the user requesting the edit.
+            resolve_labels: Translate label keys of data to fieldNames, as in edit_submission.
+
+        Returns:
+            Future: Resolves with the formatted response (or ClappiaResult) of the merged edit
+        """
+        field_index = self._load_field_index(app_id, resolve_labels)
+        if isinstance(field_index, str):
+            prepared: Union[str, PreparedRequest] = field_index
+        else:
+            prepared = self._prepare_edit_submission(app_id, submission_id, data, requesting_user_email_address, field_index)
+        if not isinstance(prepared, str):
+            prepared = self._precheck(prepared) or prepared
+        if isinstance(prepared, str) or self.edit_coalescer is None:
+            future: Future = Future()
+            future.set_result(self._reject(prepared) if isinstance(prepared, str) else self._send_edit(prepared))
+            return future
+        return self.edit_coalescer.submit(prepared.data)
+
+    def update_owners(self, app_id: str, submission_id: str, requesting_user_email_address: str, 
+                     email_ids: List[str]) -> Union[str, ClappiaResult]:
+        """Updates the ownership of a Clappia submission by adding new owners to share access.
+
+        Modifies submission ownership to include additional users who can view and edit the submission.
+        Use this to collaborate on submissions, delegate work, or transfer ownership.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412). Use this to specify which Clappia app contains the submission.
+            submission_id: Unique identifier of the submission to update (e.g., HGO51464561). This identifies the specific submission record to modify.
+            requesting_user_email_address: Email address of the user making the ownership change. This user must have permission to modify the submission. Must be a valid email format.
+            email_ids: List of email addresses to add as new owners. Each email must be valid and the users should have access to the app. Example: ["user1@company.com", "user2@company.com"]. Invalid emails will be skipped with a warning.
+
+        Returns:
+            str: Formatted response with update details and status
+        """
+        prepared = self._prepare_update_owners(app_id, submission_id, requesting_user_email_address, email_ids)
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        return self._execute(prepared, self._format_update_owners)
+
+    def update_status(self, app_id: str, submission_id: str, requesting_user_email_address: str, 
+                     status_name: str, comments: str) -> Union[str, ClappiaResult]:
+        """Updates the status of a Clappia submission to track workflow progress and approvals.
+
+        Changes the submission status to indicate current stage in workflow (e.g., pending, approved, rejected).
+        Use this to manage approval workflows, track processing stages, or update submission lifecycle.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412). Use this to specify which Clappia app contains the submission.
+            submission_id: Unique identifier of the submission to update (e.g., HGO51464561). This identifies the specific submission record to modify.
+            requesting_user_email_address: Email address of the user making the status change. This user must have permission to modify the submission. Must be a valid email format.
+            status_name: Name of the new status to apply to the submission.
+            comments: Optional comments to include with the status change.
+
+        Returns:
+            str: Formatted response with update details and status
+        """
+        prepared = self._prepare_update_status(app_id, submission_id, requesting_user_email_address, status_name, comments)
+        if isinstance(prepared, str):
+            return self._reject(prepared)
+        return self._execute(prepared, self._format_update_status)
+
+    def create_submissions_bulk(self, app_id: str, records: List[Dict[str, Any]], requesting_user_email_address: str,
+                                max_concurrency: int = 8,
+                                idempotency_keys: Optional[List[Optional[str]]] = None,
+                                resolve_labels: bool = False) -> Union[str, ClappiaResult]:
+        """Creates many submissions in a Clappia application concurrently.
+
+        Every record is validated before anything is sent; invalid records are reported
+        and skipped without aborting the batch. Valid records are sent over a bounded
+        worker pool and failures of individual records do not stop the others. With an
+        idempotency ledger, records already created are not sent again, so a failed
+        batch can simply be resubmitted.
+
+        Args:
+            app_id: Application ID in uppercase letters and numbers format (e.g., MFX093412).
+            records: List of field data dictionaries, one per submission, in the same format as create_submission's data.
+            requesting_user_email_address: Email address of the user creating the submissions. Must be a valid email format.
+            max_concurrency: Maximum number of create requests in flight at once. Defaults to 8.
+            idempotency_keys: Optional idempotency key per record, in the same order as records. None entries, or
+                omitting the list, use a hash of the record. Ignored when the client has no ledger.
+            resolve_labels: Translate label keys of each record to fieldNames, as in create_submission.
+                Records with unmatched or ambiguous labels fail validation.
+
+        Returns:
+            str: Formatted response with a partial-failure SUMMARY and RESULTS listing, in input order,
+                each record's submissionId or a structured error ({"stage": "validation" | "request", "message": ...}).
+        """
+        started = time.perf_counter()
+        field_index = self._load_field_index(app_id, resolve_labels)
+        if isinstance(field_index, str):
+            return self._reject(field_index)
+        items = self._prepare_create_submissions_bulk(
+            app_id, records, requesting_user_email_address, max_concurrency, idempotency_keys, field_index
+        )
+        if isinstance(items, str):
+            return self._reject(items)
+
+        if self.submission_validator is not None:
+            items = self._screen_bulk_items(items, self._load_definition(app_id, self.submission_validator.definition_cache))
+        results: List[Dict[str, Any]] = [item for item in items if isinstance(item, dict)]
+        pending = [item for item in items if isinstance(item, PreparedRequest)]
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(pending))) as executor:
+                for prepared, outcome in zip(pending, executor.map(self._send, pending)):
+                    results.append(self._bulk_item_result(prepared, *outcome))
+        results.sort(key=lambda r: r["index"])
+
+        return self._finish(self._bulk_result(app_id, results, time.perf_counter() - started))
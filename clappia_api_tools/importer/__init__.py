@@ -0,0 +1,7 @@
+"""Streaming CSV/JSONL importer that creates submissions with resumable checkpoints"""
+
+from .checkpoint import ImportCheckpoint
+from .importer import ImportStats, SubmissionImporter
+from .readers import RecordReader, SourceRecord
+
+__all__ = ["SubmissionImporter", "ImportStats", "ImportCheckpoint", "RecordReader", "SourceRecord"]
@@ -0,0 +1,53 @@
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+
+@dataclass
+class ImportCheckpoint:
+    """Progress of an import, saved so a killed job resumes where it stopped.
+
+    Attributes:
+        source: Absolute path of the imported file.
+        app_id: App the records are imported into.
+        offset: Byte offset up to which every record has been committed.
+        succeeded: Records created so far.
+        failed: Records that failed so far.
+        completed: Whether the whole file has been committed.
+        updated_at: Time of the last save, seconds since the epoch.
+    """
+
+    source: str
+    app_id: str
+    offset: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    completed: bool = False
+    updated_at: float = 0.0
+
+    @classmethod
+    def load(cls, path: str) -> Optional["ImportCheckpoint"]:
+        """Read a checkpoint file, returning None when it does not exist"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        return cls(**{key: state[key] for key in cls.__dataclass_fields__ if key in state})
+
+    def matches(self, source: str, app_id: str) -> bool:
+        return self.source == os.path.abspath(source) and self.app_id == app_id
+
+    def save(self, path: str) -> None:
+        """Atomically replace the checkpoint file, so a crash never leaves it half written"""
+        self.updated_at = time.time()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
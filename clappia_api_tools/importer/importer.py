@@ -0,0 +1,274 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Set, TextIO, Tuple, Union
+
+from clappia_api_tools._models.model import ClappiaResult
+from clappia_api_tools._utils.logging_utils import get_logger
+from clappia_api_tools.client.submission_client import SubmissionClient
+from clappia_api_tools.importer.checkpoint import ImportCheckpoint
+from clappia_api_tools.importer.readers import RecordReader, SourceRecord
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ImportStats:
+    """Running totals of an import.
+
+    Attributes:
+        succeeded: Records created (or queued, with an outbox) in this run.
+        failed: Records that could not be parsed or created in this run.
+        resumed_from: Byte offset the run started at.
+        offset: Byte offset up to which every record is committed.
+        total_bytes: Size of the file.
+        started: When the run started, from time.monotonic().
+    """
+
+    succeeded: int = 0
+    failed: int = 0
+    resumed_from: int = 0
+    offset: int = 0
+    total_bytes: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def processed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def rate(self) -> float:
+        """Records processed per second in this run"""
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def fraction(self) -> float:
+        """Share of the file committed, between 0 and 1"""
+        return self.offset / self.total_bytes if self.total_bytes else 1.0
+
+
+class SubmissionImporter:
+    """Streams a CSV or JSONL file into ``create_submission`` with bounded concurrency.
+
+    Records are read through a memory map and at most ``2 * concurrency`` are held at
+    once, so memory use is constant regardless of file size. The checkpoint records the
+    offset up to which every record has been committed (created, or written to the
+    failures file); a run started with the same checkpoint skips those records.
+
+    Records in flight when a job is killed are sent again on resume. With an
+    idempotency ledger on the client, each record is keyed by file and offset so
+    such records are not created twice.
+    """
+
+    def __init__(
+        self,
+        client: SubmissionClient,
+        app_id: str,
+        requesting_user_email_address: str,
+        mapping: Optional[Dict[str, str]] = None,
+        only_mapped: bool = False,
+        keep_empty: bool = False,
+        resolve_labels: bool = False,
+        concurrency: int = 8,
+        checkpoint_path: Optional[str] = None,
+        failures_path: Optional[str] = None,
+        checkpoint_interval: float = 1.0,
+        progress: Optional[Callable[[ImportStats], None]] = None,
+        progress_interval: float = 1.0,
+    ):
+        """
+        Args:
+            client: Submission client used to create the records.
+            app_id: App to create the submissions in.
+            requesting_user_email_address: Owner of the created submissions.
+            mapping: Column (or JSON key) to fieldName renames. Other columns keep their name.
+            only_mapped: Drop columns that are not in ``mapping``.
+            keep_empty: Send empty strings instead of leaving those fields out.
+            resolve_labels: Columns (after mapping) are field labels; translate them to
+                fieldNames through the client's field index.
+            concurrency: Maximum number of create requests in flight at once.
+            checkpoint_path: File recording the committed offset. None disables resuming.
+            failures_path: JSONL file receiving every failed record with its error.
+            checkpoint_interval: Minimum seconds between checkpoint saves.
+            progress: Called with the running ImportStats at most every ``progress_interval`` seconds.
+            progress_interval: Seconds between progress callbacks.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.client = client
+        self.app_id = app_id
+        self.requesting_user_email_address = requesting_user_email_address
+        self.mapping = dict(mapping or {})
+        self.only_mapped = only_mapped
+        self.keep_empty = keep_empty
+        self.resolve_labels = resolve_labels
+        self.concurrency = concurrency
+        self.checkpoint_path = checkpoint_path
+        self.failures_path = failures_path
+        self.checkpoint_interval = checkpoint_interval
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """Stop reading new records; records in flight are finished and checkpointed"""
+        self._stop.set()
+
+    def transform(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply the column mapping and empty-value rules to one record"""
+        fields = {}
+        for column, value in data.items():
+            name = self.mapping.get(column)
+            if name is None:
+                if self.only_mapped:
+                    continue
+                name = column
+            if not self.keep_empty and (value is None or value == ""):
+                continue
+            fields[name] = value
+        return fields
+
+    def _create(self, source: str, record: SourceRecord) -> ClappiaResult:
+        fields = self.transform(record.data)
+        key = f"import:{source}:{record.start}" if self.client.idempotency_ledger is not None else None
+        result = self.client.create_submission(
+            self.app_id, fields, self.requesting_user_email_address, idempotency_key=key, resolve_labels=self.resolve_labels
+        )
+        if isinstance(result, ClappiaResult):
+            return result
+        if result.startswith("Error: "):
+            return ClappiaResult.from_error(result)
+        return ClappiaResult(success=True, renderer=lambda: result)
+
+    def run(self, path: str, file_format: Optional[str] = None, restart: bool = False, **reader_options) -> ImportStats:
+        """Import ``path``, resuming from the checkpoint unless ``restart`` is set.
+
+        Args:
+            path: CSV or JSONL file.
+            file_format: "csv" or "jsonl"; guessed from the extension when None.
+            restart: Ignore an existing checkpoint and start from the beginning.
+            **reader_options: Passed to RecordReader (delimiter, encoding).
+
+        Returns:
+            ImportStats of this run.
+
+        Raises:
+            ValueError: If the checkpoint belongs to another file or app.
+        """
+        source = os.path.abspath(path)
+        reader = RecordReader(path, file_format, **reader_options)
+        checkpoint = None
+        if self.checkpoint_path is not None and not restart:
+            checkpoint = ImportCheckpoint.load(self.checkpoint_path)
+            if checkpoint is not None and not checkpoint.matches(path, self.app_id):
+                raise ValueError(
+                    f"Checkpoint {self.checkpoint_path} belongs to {checkpoint.source} (app {checkpoint.app_id}); "
+                    "pass another checkpoint path or restart"
+                )
+        if checkpoint is None:
+            checkpoint = ImportCheckpoint(source=source, app_id=self.app_id)
+
+        stats = ImportStats(resumed_from=checkpoint.offset, offset=checkpoint.offset, total_bytes=reader.size)
+        if checkpoint.completed:
+            logger.info("Import of %s already completed according to %s", path, self.checkpoint_path)
+            return stats
+        if checkpoint.offset:
+            logger.info("Resuming import of %s at byte %d", path, checkpoint.offset)
+
+        failures = open(self.failures_path, "a", encoding="utf-8") if self.failures_path else None
+        # Offsets of records not yet finished, in file order; the committed offset is the
+        # end of the last record before the first one still in flight
+        ends: Dict[int, int] = {}
+        done: Set[int] = set()
+        next_commit = 0
+        sequence = 0
+        last_save = last_progress = time.monotonic()
+        inflight: Dict[Future, Tuple[int, SourceRecord]] = {}
+
+        def finish(seq: int, record: SourceRecord, result: ClappiaResult) -> None:
+            nonlocal next_commit
+            if result.success:
+                stats.succeeded += 1
+                checkpoint.succeeded += 1
+            else:
+                stats.failed += 1
+                checkpoint.failed += 1
+                self._record_failure(failures, record, result.error)
+            done.add(seq)
+            while next_commit in done:
+                done.discard(next_commit)
+                stats.offset = checkpoint.offset = ends.pop(next_commit)
+                next_commit += 1
+
+        def settle(block: bool) -> None:
+            nonlocal last_save, last_progress
+            if not inflight:
+                return
+            finished, _ = wait(list(inflight), timeout=None if block else 0, return_when=FIRST_COMPLETED)
+            for future in finished:
+                seq, record = inflight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = ClappiaResult.from_error(f"Unexpected error: {str(e)}")
+                finish(seq, record, result)
+            now = time.monotonic()
+            if self.checkpoint_path is not None and now - last_save >= self.checkpoint_interval:
+                checkpoint.save(self.checkpoint_path)
+                last_save = now
+            if self.progress is not None and now - last_progress >= self.progress_interval:
+                self.progress(stats)
+                last_progress = now
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="clappia-import") as executor:
+                for record in reader.records(checkpoint.offset):
+                    if self._stop.is_set():
+                        break
+                    seq = sequence
+                    sequence += 1
+                    ends[seq] = record.end
+                    if record.error is not None:
+                        finish(seq, record, ClappiaResult.from_error(f"Could not parse record - {record.error}"))
+                        continue
+                    inflight[executor.submit(self._create, source, record)] = (seq, record)
+                    while len(inflight) >= 2 * self.concurrency:
+                        settle(block=True)
+                    settle(block=False)
+                while inflight:
+                    settle(block=True)
+            checkpoint.completed = not self._stop.is_set()
+            if checkpoint.completed:
+                stats.offset = checkpoint.offset = reader.size
+        finally:
+            # Also reached on KeyboardInterrupt: the pool has drained, so everything
+            # finished is counted in the committed offset
+            while inflight:
+                settle(block=True)
+            if self.checkpoint_path is not None:
+                checkpoint.save(self.checkpoint_path)
+            if failures is not None:
+                failures.close()
+            if self.progress is not None:
+                self.progress(stats)
+        return stats
+
+    def _record_failure(self, failures: Optional[TextIO], record: SourceRecord, error: Optional[str]) -> None:
+        logger.warning("Record at byte %d failed: %s", record.start, error)
+        if failures is None:
+            return
+        entry: Dict[str, Union[int, str, None, Dict[str, Any]]] = {
+            "offset": record.start,
+            "error": error,
+            "record": record.data,
+        }
+        failures.write(json.dumps(entry, default=str) + "\n")
+        failures.flush()
@@ -0,0 +1,149 @@
+import csv
+import json
+import mmap
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+CSV = "csv"
+JSONL = "jsonl"
+FORMATS = (CSV, JSONL)
+
+
+@dataclass
+class SourceRecord:
+    """One record read from an import file.
+
+    Attributes:
+        start: Byte offset where the record starts.
+        end: Byte offset just past the record; resuming from here skips it.
+        data: Parsed record, None when it could not be parsed.
+        error: Why the record could not be parsed.
+    """
+
+    start: int
+    end: int
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+def detect_format(path: str) -> str:
+    """Guess the file format from its extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson", ".json"):
+        return JSONL
+    if extension in (".csv", ".tsv", ".txt"):
+        return CSV
+    raise ValueError(f"Cannot tell the format of {path}; pass the format explicitly (csv or jsonl)")
+
+
+class _Lines:
+    """Iterates the lines of a memory-mapped file, tracking the offset reached"""
+
+    def __init__(self, mm: mmap.mmap, start: int, size: int, encoding: str):
+        self.mm = mm
+        self.pos = start
+        self.size = size
+        self.encoding = encoding
+
+    def __iter__(self) -> "_Lines":
+        return self
+
+    def __next__(self) -> str:
+        if self.pos >= self.size:
+            raise StopIteration
+        newline = self.mm.find(b"\n", self.pos)
+        end = self.size if newline == -1 else newline + 1
+        line = self.mm[self.pos:end]
+        self.pos = end
+        return line.decode(self.encoding)
+
+
+class RecordReader:
+    """Streams records of a CSV or JSONL file through a memory map.
+
+    Only the record being parsed is held in memory, so memory use does not grow with
+    the file size. Every record carries its byte offsets, which lets an import resume
+    from the end of the last committed record.
+    """
+
+    def __init__(self, path: str, file_format: Optional[str] = None, delimiter: Optional[str] = None,
+                 encoding: str = "utf-8"):
+        """
+        Args:
+            path: File to read.
+            file_format: "csv" or "jsonl". Guessed from the extension when None.
+            delimiter: CSV delimiter. Defaults to a tab for .tsv files and a comma otherwise.
+            encoding: Text encoding of the file. A UTF-8 byte order mark is skipped.
+        """
+        self.path = path
+        self.format = file_format or detect_format(path)
+        if self.format not in FORMATS:
+            raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+        if delimiter is None:
+            delimiter = "\t" if path.lower().endswith(".tsv") else ","
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.size = os.path.getsize(path)
+        self.header: Optional[List[str]] = None
+        self.data_start = 0
+
+    def records(self, offset: int = 0) -> Iterator[SourceRecord]:
+        """Yield the records starting at byte ``offset``, which must be a record boundary"""
+        if self.size == 0:
+            return
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 3 if mm[:3] == b"\xef\xbb\xbf" else 0
+            if self.format == JSONL:
+                yield from self._jsonl(mm, max(offset, start))
+            else:
+                yield from self._csv(mm, start, offset)
+
+    def _jsonl(self, mm: mmap.mmap, offset: int) -> Iterator[SourceRecord]:
+        lines = _Lines(mm, offset, self.size, self.encoding)
+        start = offset
+        for line in lines:
+            end = lines.pos
+            if line.strip():
+                try:
+                    data = json.loads(line)
+                except ValueError as e:
+                    yield SourceRecord(start, end, error=f"invalid JSON: {e}")
+                else:
+                    if isinstance(data, dict):
+                        yield SourceRecord(start, end, data=data)
+                    else:
+                        yield SourceRecord(start, end, error="record must be a JSON object")
+            start = end
+
+    def _csv(self, mm: mmap.mmap, header_start: int, offset: int) -> Iterator[SourceRecord]:
+        lines = _Lines(mm, header_start, self.size, self.encoding)
+        reader = csv.reader(lines, delimiter=self.delimiter)
+        try:
+            self.header = [column.strip() for column in next(reader)]
+        except StopIteration:
+            return
+        self.data_start = lines.pos
+
+        lines.pos = max(offset, self.data_start)
+        start = lines.pos
+        # csv.reader pulls one line at a time (more for quoted newlines), so the
+        # position reached after each row is exactly where that row ends
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                yield SourceRecord(start, lines.pos, error=f"invalid CSV: {e}")
+                start = lines.pos
+                continue
+            end = lines.pos
+            if not row or (len(row) == 1 and not row[0].strip()):
+                start = end
+                continue
+            if len(row) > len(self.header):
+                yield SourceRecord(start, end, error=f"row has {len(row)} columns, header has {len(self.header)}")
+            else:
+                yield SourceRecord(start, end, data=dict(zip(self.header, row)))
+            start = end
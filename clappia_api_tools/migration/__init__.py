@@ -0,0 +1,6 @@
+"""Declarative schema migrations: diff a desired app spec against the live definition"""
+
+from .migrator import MigrationResult, SchemaMigrator
+from .planner import FieldOperation, MigrationPlan, MigrationPlanner
+
+__all__ = ["SchemaMigrator", "MigrationPlanner", "MigrationPlan", "MigrationResult", "FieldOperation"]
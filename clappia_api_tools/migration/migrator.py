@@ -0,0 +1,199 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from clappia_api_tools._models.model import Section
+from clappia_api_tools._utils.logging_utils import get_logger
+from clappia_api_tools.client.app_definition_client import AppDefinitionClient
+from clappia_api_tools.client.base_client import PreparedRequest
+from clappia_api_tools.migration.planner import FieldOperation, MigrationPlan, MigrationPlanner
+
+logger = get_logger(__name__)
+
+# API property name -> keyword of add_field/update_field
+_PROPERTY_ARGUMENTS = {
+    "label": "label",
+    "description": "description",
+    "required": "required",
+    "blockWidthPercentageDesktop": "block_width_percentage_desktop",
+    "blockWidthPercentageMobile": "block_width_percentage_mobile",
+    "displayCondition": "display_condition",
+    "retainValues": "retain_values",
+    "isEditable": "is_editable",
+    "editabilityCondition": "editability_condition",
+    "validation": "validation",
+    "defaultValue": "default_value",
+    "options": "options",
+    "style": "style",
+    "numberOfCols": "number_of_cols",
+    "allowedFileTypes": "allowed_file_types",
+    "maxFileAllowed": "max_file_allowed",
+    "imageQuality": "image_quality",
+    "imageText": "image_text",
+    "fileNamePrefix": "file_name_prefix",
+    "formula": "formula",
+    "hidden": "hidden",
+}
+
+
+@dataclass
+class MigrationResult:
+    """Outcome of applying a migration plan.
+
+    Attributes:
+        plan: The plan that was applied.
+        outcomes: One entry per operation, in plan order, with its ``status``
+            ("applied", "failed" or "skipped" after an earlier failure in its chain),
+            ``fieldName`` and ``error``.
+        elapsed: Seconds spent applying.
+    """
+
+    plan: MigrationPlan
+    outcomes: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return not self.plan.errors and all(outcome["status"] == "applied" for outcome in self.outcomes)
+
+    def summary(self) -> Dict[str, Any]:
+        counts = {"applied": 0, "failed": 0, "skipped": 0}
+        for outcome in self.outcomes:
+            counts[outcome["status"]] += 1
+        return {"appId": self.plan.app_id, "operations": len(self.outcomes), **counts, "seconds": round(self.elapsed, 3)}
+
+
+class SchemaMigrator:
+    """Brings an app's fields in line with a declarative spec.
+
+    ``plan`` reads the live definition and diffs it with MigrationPlanner; ``apply``
+    sends the planned addField/updateField calls, running independent chains in
+    parallel. Unchanged properties are never resent, so re-running a migration that
+    already applied sends nothing.
+
+    Usage:
+        migrator = SchemaMigrator(client.app_definition)
+        plan = migrator.plan("MFX093412", [Section("Details", [Field("singleLineText", "Phone", required=True)])])
+        print(plan.describe())   # dry run
+        result = migrator.apply(plan, "admin@example.com")
+    """
+
+    def __init__(self, client: AppDefinitionClient, max_concurrency: int = 4):
+        """
+        Args:
+            client: Client used to read the definition and send the schema changes.
+            max_concurrency: Maximum number of chains applied at once. 1 applies the
+                whole plan sequentially.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.planner = MigrationPlanner()
+
+    def _load_definition(self, app_id: str) -> Dict[str, Any]:
+        prepared = self.client._prepare_get_definition(app_id)
+        if isinstance(prepared, str):
+            raise ValueError(prepared[len("Error: "):])
+        if self.client.definition_cache is not None:
+            # Plan against the live schema, not a cached copy
+            self.client.definition_cache.invalidate_app(app_id)
+        success, error_message, definition = self.client._send(prepared)
+        if not success or not isinstance(definition, dict):
+            raise RuntimeError(f"Could not load the definition of {app_id}: {error_message}")
+        return definition
+
+    def plan(self, app_id: str, sections: Sequence[Union[Section, Dict[str, Any]]]) -> MigrationPlan:
+        """Diff ``sections`` against the live definition of ``app_id``.
+
+        Raises:
+            ValueError: If app_id is invalid.
+            RuntimeError: If the definition cannot be loaded.
+        """
+        return self.planner.plan(app_id.strip(), sections, self._load_definition(app_id))
+
+    def apply(self, plan: MigrationPlan, requesting_user_email_address: str) -> MigrationResult:
+        """Send the operations of ``plan``.
+
+        Chains run in parallel, up to max_concurrency at once; the operations of one
+        chain run in order, and a failure skips the rest of its chain because their
+        positions (or the field they update) depend on it.
+
+        Raises:
+            ValueError: If the plan has errors.
+        """
+        if plan.errors:
+            raise ValueError(f"Plan for {plan.app_id} has errors: {'; '.join(plan.errors)}")
+        started = time.perf_counter()
+        outcomes: Dict[int, Dict[str, Any]] = {}
+        chains = list(plan.chains.values())
+        positions = {id(operation): position for position, operation in enumerate(plan.operations)}
+
+        def run_chain(chain: List[FieldOperation]) -> None:
+            field_name: Optional[str] = None
+            failed = False
+            for operation in chain:
+                position = positions[id(operation)]
+                if failed:
+                    outcomes[position] = self._outcome(operation, "skipped", operation.field_name, "earlier operation failed")
+                    continue
+                if operation.action == "update" and operation.field_name is None:
+                    # Follow-up of an add earlier in this chain
+                    operation_field = field_name
+                else:
+                    operation_field = operation.field_name
+                success, error, name = self._send(plan.app_id, operation, operation_field, requesting_user_email_address)
+                if operation.action == "add":
+                    field_name = name
+                if not success:
+                    failed = True
+                    logger.error("Error: migration of %s failed at %s: %s", plan.app_id, operation.describe(), error)
+                outcomes[position] = self._outcome(operation, "applied" if success else "failed", name, error)
+
+        if chains:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chains))) as executor:
+                list(executor.map(run_chain, chains))
+
+        logger.info("Applied migration of %s: %d operations in %d chains", plan.app_id, len(plan.operations), len(chains))
+        return MigrationResult(
+            plan=plan,
+            outcomes=[outcomes[position] for position in range(len(plan.operations))],
+            elapsed=time.perf_counter() - started,
+        )
+
+    def migrate(self, app_id: str, sections: Sequence[Union[Section, Dict[str, Any]]],
+                requesting_user_email_address: str, dry_run: bool = False) -> Union[MigrationPlan, MigrationResult]:
+        """Plan and, unless ``dry_run``, apply a migration"""
+        plan = self.plan(app_id, sections)
+        if dry_run:
+            return plan
+        return self.apply(plan, requesting_user_email_address)
+
+    def _send(self, app_id: str, operation: FieldOperation, field_name: Optional[str],
+              requesting_user_email_address: str) -> Tuple[bool, Optional[str], Optional[str]]:
+        arguments = {_PROPERTY_ARGUMENTS[name]: value for name, value in operation.properties.items()}
+        prepared: Union[str, PreparedRequest]
+        if operation.action == "add":
+            prepared = self.client._prepare_add_field(
+                app_id, requesting_user_email_address, operation.section_index, operation.field_index,
+                operation.field_type, **arguments,
+            )
+        else:
+            prepared = self.client._prepare_update_field(app_id, requesting_user_email_address, field_name or "", **arguments)
+        if isinstance(prepared, str):
+            return False, prepared[len("Error: "):], field_name
+        success, error_message, response_data = self.client._send(prepared)
+        if operation.action == "add" and success:
+            field_name = (response_data or {}).get("fieldName")
+        return success, error_message, field_name
+
+    @staticmethod
+    def _outcome(operation: FieldOperation, status: str, field_name: Optional[str], error: Optional[str]) -> Dict[str, Any]:
+        return {
+            "action": operation.action,
+            "label": operation.label,
+            "fieldName": field_name,
+            "status": status,
+            "error": error,
+        }
@@ -0,0 +1,260 @@
+import json
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from clappia_api_tools._models.model import Field, Section
+from clappia_api_tools._utils.field_index import FieldIndex, FieldInfo
+
+# Properties addField only sends for some field types (see _prepare_add_field);
+# on other types they have to be set with a follow-up updateField
+_ADD_FIELD_TYPE_RESTRICTED = {
+    "defaultValue": ("singleLineText",),
+    "options": ("singleSelector", "multiSelector", "dropDown"),
+    "style": ("singleSelector", "multiSelector"),
+    "numberOfCols": ("singleSelector", "multiSelector"),
+    "allowedFileTypes": ("file",),
+    "maxFileAllowed": ("file",),
+    "imageQuality": ("file",),
+    "imageText": ("file",),
+    "fileNamePrefix": ("file",),
+    "formula": ("calculationsAndLogic",),
+    "hidden": ("formula",),
+}
+
+
+@dataclass
+class FieldOperation:
+    """One addField or updateField call of a migration plan.
+
+    Attributes:
+        action: "add" or "update".
+        label: Label of the field, as in the spec.
+        field_type: Type of the field.
+        properties: Properties to send, keyed as in the API.
+        field_name: Field to update; None for adds, and for updates of a field added
+            earlier in the same chain (its name is only known once the add ran).
+        section_index: Section an added field goes to.
+        field_index: Position of an added field in its section, valid once the adds
+            before it in the chain ran.
+        changes: For updates of existing fields, property -> [live value, desired value].
+        chain: Operations of a chain run one after another, in plan order; different
+            chains run in parallel.
+    """
+
+    action: str
+    label: str
+    field_type: Optional[str]
+    properties: Dict[str, Any]
+    field_name: Optional[str] = None
+    section_index: Optional[int] = None
+    field_index: Optional[int] = None
+    changes: Dict[str, List[Any]] = field(default_factory=dict)
+    chain: str = ""
+
+    def describe(self) -> str:
+        if self.action == "add":
+            extras = ", ".join(f"{k}={json.dumps(v)}" for k, v in self.properties.items() if k != "label")
+            return (
+                f'+ add {self.field_type} "{self.label}" at section {self.section_index} '
+                f"position {self.field_index}" + (f" ({extras})" if extras else "")
+            )
+        target = self.field_name or f'the field added as "{self.label}"'
+        if self.changes:
+            details = ", ".join(f"{k}: {json.dumps(old)} -> {json.dumps(new)}" for k, (old, new) in self.changes.items())
+        else:
+            details = ", ".join(f"{k}={json.dumps(v)}" for k, v in self.properties.items())
+        return f"~ update {target}: {details}"
+
+
+@dataclass
+class MigrationPlan:
+    """Operations that turn a live app definition into the desired spec.
+
+    Attributes:
+        app_id: App being migrated.
+        version: Version of the live definition the plan was computed from.
+        operations: Calls to make, in an order that satisfies every chain.
+        warnings: Differences the API cannot express (type changes, moves, section names).
+        errors: Problems that make the plan unsafe to apply, such as ambiguous labels.
+        unmanaged: Live fields the spec does not mention; they are left untouched.
+    """
+
+    app_id: str
+    version: Any = None
+    operations: List[FieldOperation] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    unmanaged: List[str] = field(default_factory=list)
+
+    @property
+    def chains(self) -> "OrderedDict[str, List[FieldOperation]]":
+        """Operations grouped into chains that can run in parallel"""
+        chains: "OrderedDict[str, List[FieldOperation]]" = OrderedDict()
+        for operation in self.operations:
+            chains.setdefault(operation.chain, []).append(operation)
+        return chains
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def describe(self) -> str:
+        """Dry-run listing of the plan"""
+        adds = sum(1 for op in self.operations if op.action == "add")
+        lines = [
+            f"Migration plan for {self.app_id} (live version {self.version}): {adds} adds, "
+            f"{len(self.operations) - adds} updates in {len(self.chains)} parallel chains"
+        ]
+        if not self.operations:
+            lines.append("  (no changes)")
+        lines.extend(f"  {operation.describe()}" for operation in self.operations)
+        lines.extend(f"  ! {warning}" for warning in self.warnings)
+        lines.extend(f"  x {error}" for error in self.errors)
+        if self.unmanaged:
+            lines.append(f"  Not in spec, left unchanged: {', '.join(self.unmanaged)}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _normalize(value: Any) -> Any:
+    return value.strip() if isinstance(value, str) else value
+
+
+def _section_field_names(definition: Dict[str, Any]) -> List[List[str]]:
+    sections = []
+    for section in definition.get("sections") or []:
+        names = []
+        for entry in (section.get("fields") or []) if isinstance(section, dict) else []:
+            name = entry.get("fieldName") if isinstance(entry, dict) else entry
+            if isinstance(name, str):
+                names.append(name)
+        sections.append(names)
+    return sections
+
+
+class MigrationPlanner:
+    """Diffs a desired list of sections against a live ``getAppDefinition`` response.
+
+    Spec fields are matched to live fields by ``fieldName`` when given, else by label
+    (exact, then ignoring case and punctuation). Matched fields get one updateField
+    with only the properties that differ; unmatched fields get one addField carrying
+    all their properties. Properties left as None in the spec are not managed.
+
+    Adds into the same section shift each other's positions, so they form one chain
+    run in order; every other operation is independent.
+    """
+
+    def plan(self, app_id: str, sections: Sequence[Union[Section, Dict[str, Any]]],
+             definition: Dict[str, Any]) -> MigrationPlan:
+        """Compute the operations turning ``definition`` into ``sections``"""
+        sections = [s if isinstance(s, Section) else Section.from_dict(s) for s in sections]
+        plan = MigrationPlan(app_id=app_id, version=definition.get("version"))
+        index = FieldIndex.build(definition)
+        layout = _section_field_names(definition)
+        live_sections = definition.get("sections") or []
+        matched: Dict[str, str] = {}
+
+        for section_index, section in enumerate(sections):
+            if section_index < len(live_sections):
+                live_name = live_sections[section_index].get("sectionName") if isinstance(live_sections[section_index], dict) else None
+                if live_name is not None and live_name != section.sectionName:
+                    plan.warnings.append(
+                        f'section {section_index} is named "{live_name}", not "{section.sectionName}"; sections cannot be renamed'
+                    )
+            else:
+                plan.warnings.append(
+                    f'section {section_index} "{section.sectionName}" does not exist; adding a field to it creates it '
+                    "with a default name"
+                )
+            while len(layout) <= section_index:
+                layout.append([])
+            placed = layout[section_index]
+            # Adds to sections that do not exist yet are ordered, so sections appear in order
+            chain = f"section:{section_index}" if section_index < len(live_sections) else "new-sections"
+            previous: Optional[str] = None
+
+            for spec in section.fields:
+                info, error = self._match(index, spec)
+                if error is None and info is not None and info.field_name in matched:
+                    error = f'"{spec.label}" and "{matched[info.field_name]}" both match field {info.field_name}'
+                if error is not None:
+                    plan.errors.append(error)
+                    continue
+                if info is not None:
+                    matched[info.field_name] = spec.label
+                    self._plan_update(plan, spec, info, section_index)
+                    if info.field_name in placed:
+                        previous = info.field_name
+                    continue
+
+                position = placed.index(previous) + 1 if previous in placed else 0
+                placeholder = f"<new:{section_index}:{spec.label}>"
+                placed.insert(position, placeholder)
+                previous = placeholder
+                self._plan_add(plan, spec, section_index, position, chain)
+
+        plan.unmanaged = [name for name in index.fields if name not in matched]
+        return plan
+
+    @staticmethod
+    def _match(index: FieldIndex, spec: Field) -> Tuple[Optional[FieldInfo], Optional[str]]:
+        """Live field a spec field refers to (None for a new field), or an error"""
+        if spec.fieldName:
+            info = index.fields.get(spec.fieldName)
+            if info is None:
+                return None, f'"{spec.label}": no live field named {spec.fieldName}'
+            return info, None
+        info = index.resolve(spec.label)
+        candidates = index.candidates(spec.label) if info is None else []
+        if candidates:
+            return None, f'"{spec.label}" matches several fields ({", ".join(candidates)}); give its fieldName'
+        return info, None
+
+    @staticmethod
+    def _plan_update(plan: MigrationPlan, spec: Field, info: FieldInfo, section_index: int) -> None:
+        if spec.fieldType != info.field_type:
+            plan.warnings.append(
+                f"{info.field_name} is a {info.field_type}, not a {spec.fieldType}; updateField cannot change a field's type"
+            )
+        if info.section_index is not None and info.section_index != section_index:
+            plan.warnings.append(
+                f"{info.field_name} is in section {info.section_index}, not {section_index}; fields are not moved"
+            )
+        changes = {}
+        for name, desired in spec.properties().items():
+            live = info.definition.get(name)
+            if _normalize(live) != _normalize(desired):
+                changes[name] = [live, desired]
+        if changes:
+            plan.operations.append(FieldOperation(
+                action="update",
+                label=spec.label,
+                field_type=info.field_type,
+                properties={name: desired for name, (_, desired) in changes.items()},
+                field_name=info.field_name,
+                changes=changes,
+                chain=f"update:{info.field_name}",
+            ))
+
+    @staticmethod
+    def _plan_add(plan: MigrationPlan, spec: Field, section_index: int, position: int, chain: str) -> None:
+        properties = spec.properties()
+        deferred = {
+            name: value for name, value in properties.items()
+            if spec.fieldType not in _ADD_FIELD_TYPE_RESTRICTED.get(name, (spec.fieldType,))
+        }
+        plan.operations.append(FieldOperation(
+            action="add",
+            label=spec.label,
+            field_type=spec.fieldType,
+            properties={name: value for name, value in properties.items() if name not in deferred},
+            section_index=section_index,
+            field_index=position,
+            chain=chain,
+        ))
+        if deferred:
+            plan.operations.append(FieldOperation(
+                action="update", label=spec.label, field_type=spec.fieldType, properties=deferred, chain=chain,
+            ))
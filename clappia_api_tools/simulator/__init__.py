@@ -0,0 +1,12 @@
+"""Local stand-in for the Clappia API, for load tests and offline development"""
+
+from .app import ClappiaSimulator
+from .faults import FaultConfig, LatencyModel
+from .server import SimulatorServer
+
+__all__ = [
+    "ClappiaSimulator",
+    "FaultConfig",
+    "LatencyModel",
+    "SimulatorServer",
+]
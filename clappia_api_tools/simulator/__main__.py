@@ -0,0 +1,62 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from clappia_api_tools.simulator.app import ClappiaSimulator
+from clappia_api_tools.simulator.faults import FaultConfig, LatencyModel
+from clappia_api_tools.simulator.server import SimulatorServer
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m clappia_api_tools.simulator",
+        description="Run a local Clappia API simulator with latency and fault injection.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8808)
+    parser.add_argument(
+        "--latency", type=LatencyModel.parse, default=LatencyModel(),
+        help='Latency in seconds, e.g. "0.02", "uniform:0.1,0.05" or "lognormal:0.05,0.6"',
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with --error-status")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--throttle-rate", type=float, default=None, help="Requests per second per workplace before 429s")
+    parser.add_argument("--throttle-burst", type=float, default=10.0)
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--slow-body-rate", type=float, default=0.0, help="Fraction of responses sent slowly")
+    parser.add_argument("--slow-body-delay", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--api-key", default=None, help="Reject requests with a different x-api-key")
+    parser.add_argument("--workplace-id", default=None, help="Reject requests for a different workplace")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    faults = FaultConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        throttle_rate=args.throttle_rate,
+        throttle_burst=args.throttle_burst,
+        retry_after=args.retry_after,
+        slow_body_rate=args.slow_body_rate,
+        slow_body_delay=args.slow_body_delay,
+        seed=args.seed,
+    )
+    simulator = ClappiaSimulator(faults, api_key=args.api_key, workplace_id=args.workplace_id)
+    server = SimulatorServer(simulator, args.host, args.port, verbose=args.verbose)
+    print(f"Clappia simulator listening on {server.url}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"Stats: {simulator.stats()}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,314 @@
+import asyncio
+import hashlib
+import itertools
+import random
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from clappia_api_tools._utils.transport import TransportRequest, TransportResponse
+from clappia_api_tools.simulator.faults import FaultConfig, FaultDecision, Throttle
+
+Result = Tuple[int, Dict[str, Any]]
+
+# Payload keys describing the request rather than the field being stored
+_REQUEST_ONLY_KEYS = ("workplaceId", "appId", "requestingUserEmailAddress", "sectionIndex", "fieldIndex")
+
+
+class ClappiaSimulator:
+    """Stateful in-memory stand-in for the Clappia API.
+
+    Implements the endpoints used by this package, keeps apps and submissions in
+    memory and injects latency, errors, 429 throttling and slow bodies according
+    to ``faults``. Use ``handle`` as an InProcessTransport handler, ``ahandle`` with
+    AsyncInProcessTransport, or serve it over HTTP with SimulatorServer.
+    """
+
+    def __init__(
+        self,
+        faults: Optional[FaultConfig] = None,
+        api_key: Optional[str] = None,
+        workplace_id: Optional[str] = None,
+        auto_create_apps: bool = True,
+    ):
+        """
+        Args:
+            faults: Failure modes to inject. Defaults to none.
+            api_key: When set, requests with another x-api-key get a 401.
+            workplace_id: When set, requests for another workplace get a 403.
+            auto_create_apps: Accept submissions for apps that were never created.
+        """
+        self.faults = faults or FaultConfig()
+        self.api_key = api_key
+        self.workplace_id = workplace_id
+        self.auto_create_apps = auto_create_apps
+        self.apps: Dict[str, Dict[str, Any]] = {}
+        self.submissions: Dict[str, Dict[str, Any]] = {}
+        self._rng = random.Random(self.faults.seed)
+        self._throttle = (
+            Throttle(self.faults.throttle_rate, self.faults.throttle_burst)
+            if self.faults.throttle_rate
+            else None
+        )
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._requests: Counter = Counter()
+        self._statuses: Counter = Counter()
+        self._routes: Dict[Tuple[str, str], Callable[[TransportRequest], Result]] = {
+            ("POST", "submissions/create"): self._create_submission,
+            ("POST", "submissions/edit"): self._edit_submission,
+            ("POST", "submissions/updateSubmissionOwners"): self._update_owners,
+            ("POST", "submissions/updateStatus"): self._update_status,
+            ("GET", "appdefinitionv2/getAppDefinition"): self._get_definition,
+            ("POST", "appdefinitionv2/createApp"): self._create_app,
+            ("POST", "appdefinitionv2/addField"): self._add_field,
+            ("POST", "appdefinitionv2/updateField"): self._update_field,
+        }
+
+    # -------------------------------------------------------------------------
+    # Entry points
+    # -------------------------------------------------------------------------
+
+    def handle(self, request: TransportRequest) -> TransportResponse:
+        """Answer a request, sleeping for the injected latency"""
+        decision = self.decide(request)
+        response = self.respond(request, decision)
+        delay = decision.latency + decision.slow_body_delay
+        if delay:
+            time.sleep(delay)
+        return response
+
+    async def ahandle(self, request: TransportRequest) -> TransportResponse:
+        """asyncio counterpart of handle"""
+        decision = self.decide(request)
+        response = self.respond(request, decision)
+        delay = decision.latency + decision.slow_body_delay
+        if delay:
+            await asyncio.sleep(delay)
+        return response
+
+    def decide(self, request: TransportRequest) -> FaultDecision:
+        """Draw the latency and injected failure for one request"""
+        faults = self.faults
+        with self._lock:
+            decision = FaultDecision(latency=faults.latency.sample(self._rng))
+            if self._throttle is not None:
+                workplace = request.headers.get("workplaceId", "")
+                if not self._throttle.allow(workplace):
+                    decision.status = 429
+                    decision.headers = (("Retry-After", f"{faults.retry_after:g}"),)
+                    return decision
+            if faults.error_rate and self._rng.random() < faults.error_rate:
+                decision.status = faults.error_status
+            elif faults.slow_body_rate and self._rng.random() < faults.slow_body_rate:
+                decision.slow_body_delay = faults.slow_body_delay
+        return decision
+
+    def respond(self, request: TransportRequest, decision: Optional[FaultDecision] = None) -> TransportResponse:
+        """Build the response for a request without any delay"""
+        if decision is not None and decision.status is not None:
+            status, body = decision.status, {"message": "Injected failure"}
+            if status == 429:
+                body = {"message": "Too many requests"}
+        else:
+            status, body = self._dispatch(request)
+        headers = dict(decision.headers) if decision is not None else {}
+        response = TransportResponse.from_json(status, body, headers)
+        if status == 200 and request.method.upper() == "GET":
+            # Reads carry an ETag and honor If-None-Match, like a conditional-GET capable API
+            etag = f'"{hashlib.sha1(response.content).hexdigest()}"'
+            response.headers["ETag"] = etag
+            if etag == self._header(request, "If-None-Match"):
+                status = 304
+                response = TransportResponse(304, {"ETag": etag})
+        with self._lock:
+            self._requests[request.path] += 1
+            self._statuses[status] += 1
+        return response
+
+    @staticmethod
+    def _header(request: TransportRequest, name: str) -> Optional[str]:
+        name = name.lower()
+        return next((value for key, value in request.headers.items() if key.lower() == name), None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests per endpoint and responses per status code"""
+        with self._lock:
+            return {
+                "requests": dict(self._requests),
+                "statuses": {str(k): v for k, v in self._statuses.items()},
+                "apps": len(self.apps),
+                "submissions": len(self.submissions),
+            }
+
+    def reset(self) -> None:
+        """Forget all apps, submissions and counters"""
+        with self._lock:
+            self.apps.clear()
+            self.submissions.clear()
+            self._requests.clear()
+            self._statuses.clear()
+
+    # -------------------------------------------------------------------------
+    # State helpers
+    # -------------------------------------------------------------------------
+
+    def _next_id(self, prefix: str) -> str:
+        return f"{prefix}{next(self._ids):06d}"
+
+    def add_app(self, app_id: str, name: str = "Simulated App", fields: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Create an app directly, e.g. to seed state before a test"""
+        with self._lock:
+            app = {
+                "appId": app_id,
+                "name": name,
+                "version": 1,
+                "sections": [{"sectionName": "Section 1", "fields": []}],
+                "fields": {},
+            }
+            self.apps[app_id] = app
+            for spec in fields or []:
+                self._insert_field(app, 0, len(app["sections"][0]["fields"]), spec)
+            return app
+
+    def _insert_field(self, app: Dict[str, Any], section_index: int, field_index: int, spec: Dict[str, Any]) -> str:
+        field_name = spec.get("fieldName") or f"field{len(app['fields']) + 1}"
+        definition = {k: v for k, v in spec.items() if k not in _REQUEST_ONLY_KEYS}
+        definition["fieldName"] = field_name
+        while len(app["sections"]) <= section_index:
+            app["sections"].append({"sectionName": f"Section {len(app['sections']) + 1}", "fields": []})
+        section_fields = app["sections"][section_index]["fields"]
+        section_fields.insert(min(field_index, len(section_fields)), field_name)
+        app["fields"][field_name] = definition
+        app["version"] += 1
+        return field_name
+
+    def _get_app(self, app_id: Optional[str], create: bool = False) -> Optional[Dict[str, Any]]:
+        app = self.apps.get(app_id or "")
+        if app is None and create and self.auto_create_apps and app_id:
+            app = self.add_app(app_id)
+        return app
+
+    def _get_submission(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        submission = self.submissions.get(body.get("submissionId") or "")
+        if submission is None or submission["appId"] != body.get("appId"):
+            return None
+        return submission
+
+    # -------------------------------------------------------------------------
+    # Endpoints
+    # -------------------------------------------------------------------------
+
+    def _dispatch(self, request: TransportRequest) -> Result:
+        if self.api_key is not None and request.headers.get("x-api-key") != self.api_key:
+            return 401, {"message": "Invalid API key"}
+        if self.workplace_id is not None and request.headers.get("workplaceId") != self.workplace_id:
+            return 403, {"message": "Workplace not accessible"}
+        route = self._routes.get((request.method.upper(), request.path))
+        if route is None:
+            return 404, {"message": f"Unknown endpoint {request.method} {request.path}"}
+        try:
+            with self._lock:
+                return route(request)
+        except (ValueError, TypeError, KeyError) as e:
+            return 400, {"message": f"Invalid request: {e}"}
+
+    @staticmethod
+    def _body(request: TransportRequest) -> Dict[str, Any]:
+        body = request.json()
+        if not isinstance(body, dict):
+            raise ValueError("body must be a JSON object")
+        return body
+
+    def _create_submission(self, request: TransportRequest) -> Result:
+        body = self._body(request)
+        if self._get_app(body.get("appId"), create=True) is None:
+            return 404, {"message": f"App {body.get('appId')} not found"}
+        if not isinstance(body.get("data"), dict):
+            return 400, {"message": "data must be an object"}
+        submission_id = self._next_id("SIM")
+        self.submissions[submission_id] = {
+            "submissionId": submission_id,
+            "appId": body["appId"],
+            "data": dict(body["data"]),
+            "owners": [body.get("requestingUserEmailAddress")],
+            "status": None,
+        }
+        return 200, {"submissionId": submission_id}
+
+    def _edit_submission(self, request: TransportRequest) -> Result:
+        body = self._body(request)
+        submission = self._get_submission(body)
+        if submission is None:
+            return 404, {"message": "Submission not found"}
+        submission["data"].update(body.get("data") or {})
+        return 200, {"submissionId": submission["submissionId"], "message": "Submission updated"}
+
+    def _update_owners(self, request: TransportRequest) -> Result:
+        body = self._body(request)
+        submission = self._get_submission(body)
+        if submission is None:
+            return 404, {"message": "Submission not found"}
+        for email in body.get("emailIds") or []:
+            if email not in submission["owners"]:
+                submission["owners"].append(email)
+        return 200, {"submissionId": submission["submissionId"], "owners": submission["owners"]}
+
+    def _update_status(self, request: TransportRequest) -> Result:
+        body = self._body(request)
+        submission = self._get_submission(body)
+        if submission is None:
+            return 404, {"message": "Submission not found"}
+        submission["status"] = body.get("status")
+        return 200, {"submissionId": submission["submissionId"], "status": submission["status"]}
+
+    def _get_definition(self, request: TransportRequest) -> Result:
+        params = request.params or {}
+        app = self._get_app(params.get("appId"))
+        if app is None:
+            return 404, {"message": f"App {params.get('appId')} not found"}
+        sections = app["sections"]
+        return 200, {
+            "appId": app["appId"],
+            "version": app["version"],
+            "state": "ACTIVE",
+            "pageIds": ["page1"],
+            "sectionIds": [f"section{i + 1}" for i in range(len(sections))],
+            "sections": [dict(section, fields=list(section["fields"])) for section in sections],
+            "fieldDefinitions": {name: dict(definition) for name, definition in app["fields"].items()},
+            "metadata": {"sectionName": app["name"], "description": ""},
+        }
+
+    def _create_app(self, request: TransportRequest) -> Result:
+        body = self._body(request)
+        app_id = self._next_id("SIMAPP")
+        app = self.add_app(app_id, body["appName"])
+        app["sections"] = []
+        for section_index, section in enumerate(body.get("sections") or []):
+            app["sections"].append({"sectionName": section["sectionName"], "fields": []})
+            for spec in section.get("fields") or []:
+                self._insert_field(app, section_index, len(app["sections"][section_index]["fields"]), spec)
+        app["version"] = 1
+        return 200, {"appId": app_id, "appUrl": f"https://simulator.local/app/{app_id}"}
+
+    def _add_field(self, request: TransportRequest) -> Result:
+        body = self._body(request)
+        app = self._get_app(body.get("appId"))
+        if app is None:
+            return 404, {"message": f"App {body.get('appId')} not found"}
+        field_name = self._insert_field(app, int(body["sectionIndex"]), int(body["fieldIndex"]), body)
+        return 200, {"fieldName": field_name}
+
+    def _update_field(self, request: TransportRequest) -> Result:
+        body = self._body(request)
+        app = self._get_app(body.get("appId"))
+        if app is None:
+            return 404, {"message": f"App {body.get('appId')} not found"}
+        definition = app["fields"].get(body.get("fieldName"))
+        if definition is None:
+            return 404, {"message": f"Field {body.get('fieldName')} not found"}
+        definition.update({k: v for k, v in body.items() if k not in _REQUEST_ONLY_KEYS and k != "fieldName"})
+        app["version"] += 1
+        return 200, {"fieldName": definition["fieldName"], "message": "Field updated"}
+
@@ -0,0 +1,105 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+LATENCY_DISTRIBUTIONS = ("constant", "uniform", "exponential", "lognormal")
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """Server-side latency distribution, in seconds.
+
+    Attributes:
+        distribution: "constant", "uniform", "exponential" or "lognormal".
+        mean: Mean latency (median for lognormal).
+        spread: Half-width for uniform, sigma of the underlying normal for lognormal.
+        max_latency: Upper bound applied to every sample.
+    """
+
+    distribution: str = "constant"
+    mean: float = 0.0
+    spread: float = 0.0
+    max_latency: float = 30.0
+
+    def __post_init__(self):
+        if self.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {', '.join(LATENCY_DISTRIBUTIONS)}")
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """Parse ``"lognormal:0.05,0.6"``, ``"uniform:0.1,0.05"`` or ``"0.02"``"""
+        name, _, args = spec.partition(":")
+        if not args:
+            return cls("constant", float(name))
+        values = [float(v) for v in args.split(",")]
+        return cls(name, *values)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "uniform":
+            value = rng.uniform(self.mean - self.spread, self.mean + self.spread)
+        elif self.distribution == "exponential":
+            value = rng.expovariate(1 / self.mean) if self.mean > 0 else 0.0
+        elif self.distribution == "lognormal":
+            value = self.mean * rng.lognormvariate(0, self.spread) if self.mean > 0 else 0.0
+        else:
+            value = self.mean
+        return min(self.max_latency, max(0.0, value))
+
+
+@dataclass(frozen=True)
+class FaultConfig:
+    """Failure modes injected by the simulator.
+
+    Attributes:
+        latency: Delay before each response.
+        error_rate: Fraction of requests answered with ``error_status``.
+        error_status: Status used for injected errors.
+        throttle_rate: Requests per second accepted per workplace before answering 429.
+            None disables throttling.
+        throttle_burst: Requests that may arrive back to back before throttling starts.
+        retry_after: Retry-After header value sent with 429 responses, in seconds.
+        slow_body_rate: Fraction of responses whose body trickles out slowly.
+        slow_body_delay: Total seconds spent sending a slow body.
+        seed: Seed for reproducible runs.
+    """
+
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    error_rate: float = 0.0
+    error_status: int = 500
+    throttle_rate: Optional[float] = None
+    throttle_burst: float = 10.0
+    retry_after: float = 1.0
+    slow_body_rate: float = 0.0
+    slow_body_delay: float = 1.0
+    seed: Optional[int] = None
+
+
+class Throttle:
+    """Token bucket deciding which requests the simulator answers with 429"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            allowed = tokens >= 1
+            self._buckets[key] = (tokens - 1 if allowed else tokens, now)
+            return allowed
+
+
+@dataclass
+class FaultDecision:
+    """What the simulator does with one request"""
+
+    latency: float = 0.0
+    status: Optional[int] = None
+    headers: Tuple[Tuple[str, str], ...] = ()
+    slow_body_delay: float = 0.0
@@ -0,0 +1,31 @@
+"""pytest fixtures for the Clappia API simulator.
+
+Enable in a conftest.py with::
+
+    pytest_plugins = ["clappia_api_tools.simulator.pytest_plugin"]
+"""
+
+import pytest
+
+from clappia_api_tools._utils.transport import InProcessTransport
+from clappia_api_tools.simulator.app import ClappiaSimulator
+from clappia_api_tools.simulator.server import SimulatorServer
+
+
+@pytest.fixture
+def clappia_simulator() -> ClappiaSimulator:
+    """Fresh simulator without injected faults"""
+    return ClappiaSimulator()
+
+
+@pytest.fixture
+def clappia_transport(clappia_simulator: ClappiaSimulator) -> InProcessTransport:
+    """In-process transport answered by ``clappia_simulator``"""
+    return InProcessTransport(clappia_simulator.handle)
+
+
+@pytest.fixture
+def clappia_simulator_server(clappia_simulator: ClappiaSimulator):
+    """``clappia_simulator`` served over HTTP on a free local port"""
+    with SimulatorServer(clappia_simulator) as server:
+        yield server
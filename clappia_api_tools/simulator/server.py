@@ -0,0 +1,122 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from clappia_api_tools._utils.transport import TransportRequest
+from clappia_api_tools.simulator.app import ClappiaSimulator
+
+# Number of pieces a slow body is split into
+SLOW_BODY_CHUNKS = 10
+
+
+class _SimulatorRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, delayed ACKs add ~40ms
+    disable_nagle_algorithm = True
+    server: "_SimulatorHTTPServer"
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        parts = urlsplit(self.path)
+        request = TransportRequest(
+            method=self.command,
+            url=f"http://{self.headers.get('Host', 'localhost')}{parts.path}",
+            headers=dict(self.headers.items()),
+            params=dict(parse_qsl(parts.query)),
+            body=body,
+        )
+        simulator = self.server.simulator
+        decision = simulator.decide(request)
+        response = simulator.respond(request, decision)
+        if decision.latency:
+            time.sleep(decision.latency)
+
+        self.send_response(response.status_code)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.content)))
+        self.end_headers()
+
+        if not decision.slow_body_delay:
+            self.wfile.write(response.content)
+            return
+        chunk_size = max(1, -(-len(response.content) // SLOW_BODY_CHUNKS))
+        pause = decision.slow_body_delay / SLOW_BODY_CHUNKS
+        for start in range(0, len(response.content), chunk_size):
+            time.sleep(pause)
+            self.wfile.write(response.content[start:start + chunk_size])
+            self.wfile.flush()
+
+    do_GET = _handle
+    do_POST = _handle
+
+
+class _SimulatorHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, simulator: ClappiaSimulator, verbose: bool):
+        super().__init__(address, _SimulatorRequestHandler)
+        self.simulator = simulator
+        self.verbose = verbose
+
+
+class SimulatorServer:
+    """Serves a ClappiaSimulator over HTTP on a background thread.
+
+    Usage:
+        with SimulatorServer(ClappiaSimulator()) as server:
+            client = ClappiaClient("key", server.url, "WP1")
+    """
+
+    def __init__(
+        self,
+        simulator: Optional[ClappiaSimulator] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        verbose: bool = False,
+    ):
+        """
+        Args:
+            simulator: Simulator answering requests. Defaults to one without faults.
+            host: Interface to bind.
+            port: Port to bind; 0 picks a free port.
+            verbose: Log every request to stderr.
+        """
+        self.simulator = simulator or ClappiaSimulator()
+        self._httpd = _SimulatorHTTPServer((host, port), self.simulator, verbose)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "SimulatorServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="clappia-simulator", daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted"""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "SimulatorServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
@@ -0,0 +1,29 @@
+import pytest
+
+from clappia_api_tools._utils.retry import RetryConfig
+from clappia_api_tools._utils.transport import InProcessTransport
+from clappia_api_tools.client.clappia_client import ClappiaClient
+
+
+@pytest.fixture
+def make_client():
+    """Factory for clients whose requests are answered in-process by ``handler``.
+
+    ``handler`` is a transport handler such as ``clappia_simulator.handle``. Results
+    are structured and retries disabled unless ``structured_results`` or
+    ``retry_config`` say otherwise; other keyword arguments go to the client, so each
+    test only passes the options it is about.
+    """
+
+    def make(handler, cls=ClappiaClient, transport_cls=InProcessTransport, **kwargs):
+        kwargs.setdefault("retry_config", RetryConfig.disabled())
+        kwargs.setdefault("structured_results", True)
+        return cls(
+            api_key="test_key",
+            base_url="https://sim.local",
+            workplace_id="TEST123",
+            transport=transport_cls(handler),
+            **kwargs,
+        )
+
+    return make
@@ -0,0 +1,125 @@
+import threading
+import time
+from unittest.mock import patch
+
+from clappia_api_tools._utils.definition_cache import DefinitionCache
+from clappia_api_tools.client.app_definition_client import AppDefinitionClient
+
+
+def dummy_client(cache):
+    """Helper function to create an app definition client with a cache"""
+    return AppDefinitionClient(
+        api_key="test_key",
+        base_url="https://test.com",
+        workplace_id="TEST123",
+        definition_cache=cache,
+    )
+
+
+class TestDefinitionCache:
+    """Test cases for DefinitionCache"""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted"""
+        cache = DefinitionCache(max_entries=2)
+        cache.put(("A", "en", True, True), {"appId": "A"})
+        cache.put(("B", "en", True, True), {"appId": "B"})
+        cache.get(("A", "en", True, True))
+        cache.put(("C", "en", True, True), {"appId": "C"})
+        assert cache.get(("B", "en", True, True)) is None
+        assert cache.get(("A", "en", True, True)) == {"appId": "A"}
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL"""
+        cache = DefinitionCache(ttl=0.01)
+        cache.put(("A", "en", True, True), {"appId": "A"})
+        time.sleep(0.02)
+        assert cache.get(("A", "en", True, True)) is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_invalidate_app_drops_all_variants(self):
+        """Test that invalidation removes every variant of one app only"""
+        cache = DefinitionCache()
+        cache.put(("A", "en", True, True), {"appId": "A"})
+        cache.put(("A", "fr", False, True), {"appId": "A"})
+        cache.put(("B", "en", True, True), {"appId": "B"})
+        assert cache.invalidate_app("A") == 2
+        assert cache.stats()["size"] == 1
+
+    def test_load_started_before_invalidation_is_not_stored(self):
+        """Test that an in-flight load does not repopulate an invalidated app"""
+        cache = DefinitionCache()
+        key = ("A", "en", True, True)
+
+        def loader():
+            cache.invalidate_app("A")
+            return True, None, {"appId": "A", "version": "old"}
+
+        cache.get_or_load(key, loader)
+        assert cache.get(key) is None
+
+    def test_failures_are_not_cached(self):
+        """Test that failed loads are not cached"""
+        cache = DefinitionCache()
+        key = ("A", "en", True, True)
+        cache.get_or_load(key, lambda: (False, "boom", None))
+        assert cache.stats()["size"] == 0
+
+    def test_single_flight_loading(self):
+        """Test that concurrent misses share one load"""
+        cache = DefinitionCache()
+        key = ("A", "en", True, True)
+        calls = []
+        started = threading.Event()
+
+        def loader():
+            calls.append(1)
+            started.set()
+            time.sleep(0.05)
+            return True, None, {"appId": "A"}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_load(key, loader))) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert all(r == (True, None, {"appId": "A"}) for r in results)
+
+
+class TestAppDefinitionClientCaching:
+    """Test cases for definition caching in AppDefinitionClient"""
+
+    @patch("clappia_api_tools._utils.api_utils.ClappiaAPIUtils.make_request")
+    def test_get_definition_uses_cache(self, mock_request):
+        """Test that repeated get_definition calls hit the cache and other variants are fetched"""
+        mock_request.return_value = (True, None, {"appId": "MFX093412"})
+        client = dummy_client(DefinitionCache(derive_variants=False))
+        first = client.get_definition("MFX093412")
+        second = client.get_definition("MFX093412")
+        client.get_definition("MFX093412", strip_html=False)
+        assert first == second
+        assert mock_request.call_count == 2
+        assert client.get_cache_stats()["hits"] == 1
+
+    @patch("clappia_api_tools._utils.api_utils.ClappiaAPIUtils.make_request")
+    def test_update_field_invalidates_app(self, mock_request):
+        """Test that update_field forces the next get_definition to refetch"""
+        mock_request.return_value = (True, None, {"appId": "MFX093412"})
+        client = dummy_client(DefinitionCache())
+        client.get_definition("MFX093412")
+        client.update_field("MFX093412", "test@example.com", "name", label="Full Name")
+        client.get_definition("MFX093412")
+        assert mock_request.call_count == 3
+
+    @patch("clappia_api_tools._utils.api_utils.ClappiaAPIUtils.make_request")
+    def test_add_field_error_still_invalidates(self, mock_request):
+        """Test that a failed schema write still invalidates the app"""
+        client = dummy_client(DefinitionCache())
+        mock_request.return_value = (True, None, {"appId": "MFX093412"})
+        client.get_definition("MFX093412")
+        mock_request.return_value = (False, "Request timeout after 30 seconds", None)
+        client.add_field("MFX093412", "test@example.com", 0, 0, "singleLineText", "Name", True)
+        assert client.get_cache_stats()["size"] == 0
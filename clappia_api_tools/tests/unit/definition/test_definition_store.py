@@ -0,0 +1,162 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from clappia_api_tools._utils.definition_cache import DefinitionCache
+from clappia_api_tools._utils.definition_store import DefinitionStore
+from clappia_api_tools._utils.transport import AsyncInProcessTransport
+from clappia_api_tools.client.async_clappia_client import AsyncClappiaClient
+from clappia_api_tools.simulator import ClappiaSimulator
+
+KEY = ("MFX093412", "en", True, True)
+
+
+@pytest.fixture
+def clappia_simulator():
+    """Simulator holding the one app whose definition is cached"""
+    simulator = ClappiaSimulator(auto_create_apps=False)
+    simulator.add_app("MFX093412", name="Inspections")
+    return simulator
+
+
+def _cache(path, ttl=300.0):
+    return DefinitionCache(ttl=ttl, store=DefinitionStore(path))
+
+
+class RecordingStore(DefinitionStore):
+    """Remembers the threads its reads and writes ran on"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+    def put(self, key, content, etag=None, generation=None):
+        self.threads.append(threading.get_ident())
+        return super().put(key, content, etag, generation)
+
+    def invalidate_app(self, app_id):
+        self.threads.append(threading.get_ident())
+        return super().invalidate_app(app_id)
+
+
+def _write_many(path, worker):
+    with DefinitionStore(path) as store:
+        for i in range(50):
+            store.put((f"APP{worker}", "en", True, True), b'{"appId":"APP%d","n":%d}' % (worker, i))
+
+
+class TestDefinitionStore:
+    """Test cases for the on-disk definition store"""
+
+    def test_round_trip_and_unchanged_body(self, tmp_path):
+        """Test that bodies round-trip with their ETag and an identical body is not rewritten"""
+        with DefinitionStore(str(tmp_path / "defs.db")) as store:
+            assert store.put(KEY, b'{"appId":"MFX093412"}', etag='"v1"')
+            stored_at, etag, _, definition = store.get(KEY)
+            assert (etag, definition) == ('"v1"', {"appId": "MFX093412"})
+            assert not store.put(KEY, b'{"appId":"MFX093412"}', etag='"v1"')
+            assert store.stats()["writes"] == 1 and store.stats()["unchanged"] == 1
+
+    def test_invalidation_rejects_stale_write(self, tmp_path):
+        """Test that a load started before another process invalidated the app is not stored"""
+        path = str(tmp_path / "defs.db")
+        with DefinitionStore(path) as mine, DefinitionStore(path) as other:
+            generation = mine.generation("MFX093412")
+            other.invalidate_app("MFX093412")
+            assert not mine.put(KEY, b'{"old":true}', generation=generation)
+            assert mine.get(KEY) is None
+            assert mine.put(KEY, b'{"new":true}', generation=mine.generation("MFX093412"))
+
+    def test_concurrent_processes(self, tmp_path):
+        """Test that several processes writing the same file leave every entry readable"""
+        path = str(tmp_path / "defs.db")
+        DefinitionStore(path).close()
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_write_many, args=(path, i)) for i in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+            assert worker.exitcode == 0
+        with DefinitionStore(path) as store:
+            for i in range(3):
+                assert store.get((f"APP{i}", "en", True, True))[3] == {"appId": f"APP{i}", "n": 49}
+
+
+class TestLayeredCache:
+    """Test cases for DefinitionCache on top of a DefinitionStore"""
+
+    def test_restart_reads_from_disk(self, tmp_path, clappia_simulator, make_client):
+        """Test that a new process-level cache serves a stored definition without a request"""
+        path = str(tmp_path / "defs.db")
+        first = make_client(clappia_simulator.handle, definition_cache=_cache(path))
+        assert first.get_app_definition("MFX093412").success
+
+        restarted = make_client(clappia_simulator.handle, definition_cache=_cache(path))
+        result = restarted.get_app_definition("MFX093412")
+        assert result.data["appId"] == "MFX093412"
+        assert clappia_simulator.stats()["requests"] == {"appdefinitionv2/getAppDefinition": 1}
+        assert restarted.get_cache_stats()["diskHits"] == 1
+
+    def test_expired_copy_revalidated(self, tmp_path, clappia_simulator, make_client):
+        """Test that an expired stored copy is confirmed with a 304 and refetched once changed"""
+        path = str(tmp_path / "defs.db")
+        make_client(clappia_simulator.handle, definition_cache=_cache(path, ttl=0.01)).get_app_definition("MFX093412")
+        time.sleep(0.02)
+
+        client = make_client(clappia_simulator.handle, definition_cache=_cache(path, ttl=0.01))
+        assert client.get_app_definition("MFX093412").success
+        assert clappia_simulator.stats()["statuses"] == {"200": 1, "304": 1}
+        assert client.get_cache_stats()["revalidations"] == 1
+
+        clappia_simulator.apps["MFX093412"]["name"] = "Audits"
+        time.sleep(0.02)
+        changed = make_client(clappia_simulator.handle, definition_cache=_cache(path, ttl=0.01))
+        result = changed.get_app_definition("MFX093412")
+        assert result.data["metadata"]["sectionName"] == "Audits"
+        assert clappia_simulator.stats()["statuses"] == {"200": 2, "304": 1}
+
+    def test_schema_change_invalidates_disk(self, tmp_path, clappia_simulator, make_client):
+        """Test that a schema change made through the client drops the stored copy"""
+        path = str(tmp_path / "defs.db")
+        client = make_client(clappia_simulator.handle, definition_cache=_cache(path))
+        client.get_app_definition("MFX093412")
+        stored_key = client.app_definition.definition_cache.canonical_key(KEY)
+        assert DefinitionStore(path).get(stored_key) is not None
+        client.add_field_to_app("MFX093412", "user@example.com", 0, 0, "singleLineText", "Notes", False)
+        assert DefinitionStore(path).get(stored_key) is None
+
+    def test_async_client_uses_store(self, tmp_path, clappia_simulator, make_client):
+        """Test that async clients share the disk layer with sync ones"""
+        path = str(tmp_path / "defs.db")
+        make_client(clappia_simulator.handle, definition_cache=_cache(path)).get_app_definition("MFX093412")
+
+        async def run():
+            async with make_client(clappia_simulator.handle, cls=AsyncClappiaClient,
+                                   transport_cls=AsyncInProcessTransport, definition_cache=_cache(path)) as client:
+                return await client.get_app_definition("MFX093412")
+
+        assert asyncio.run(run()).data["appId"] == "MFX093412"
+        assert clappia_simulator.stats()["statuses"] == {"200": 1}
+
+    def test_async_store_io_runs_off_the_loop(self, tmp_path, clappia_simulator, make_client):
+        """Test that the async client reads, writes and invalidates the store from worker threads"""
+        store = RecordingStore(str(tmp_path / "defs.db"))
+
+        async def run():
+            async with make_client(clappia_simulator.handle, cls=AsyncClappiaClient,
+                                   transport_cls=AsyncInProcessTransport,
+                                   definition_cache=DefinitionCache(store=store)) as client:
+                await client.get_app_definition("MFX093412")
+                await client.add_field_to_app("MFX093412", "user@example.com", 0, 0, "singleLineText", "Notes", False)
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+        assert len(store.threads) == 3 and loop_thread not in store.threads
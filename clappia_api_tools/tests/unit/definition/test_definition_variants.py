@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+from clappia_api_tools._utils.definition_cache import DefinitionCache
+from clappia_api_tools._utils.definition_variants import derive_variant, strip_html
+from clappia_api_tools.client.app_definition_client import AppDefinitionClient
+
+CANONICAL = {
+    "appId": "MFX093412",
+    "metadata": {"sectionName": "<b>Site</b> &amp; Safety", "description": "plain"},
+    "fieldDefinitions": {
+        "field1": {"label": "<p>Name</p>", "tags": ["pii"], "formula": "{a} < 5 && {b} > 2"},
+        "field2": {"label": "Count", "options": ["a", "b"]},
+        "field3": {"label": "<i>Size</i>", "options": ["S &amp; M", "<L>"], "defaultValue": "<L>"},
+    },
+}
+
+
+def dummy_client(cache):
+    """Helper function to create an app definition client with a cache"""
+    return AppDefinitionClient(
+        api_key="test_key",
+        base_url="https://test.com",
+        workplace_id="TEST123",
+        definition_cache=cache,
+    )
+
+
+class TestDeriveVariant:
+    """Test cases for deriving definition variants locally"""
+
+    def test_strip_html(self):
+        """Test that tags are removed and entities decoded, but comparisons survive"""
+        assert strip_html("<p>Hello <i>you</i></p><!-- note -->") == "Hello you"
+        assert strip_html("Tom &amp; Jerry") == "Tom & Jerry"
+        assert strip_html("a < b and c > d") == "a < b and c > d"
+
+    def test_stripped_variant(self):
+        """Test that display text is stripped, expressions are kept and unchanged parts are shared"""
+        derived = derive_variant(CANONICAL, strip_html=True, include_tags=True)
+        assert derived["metadata"]["sectionName"] == "Site & Safety"
+        assert derived["fieldDefinitions"]["field1"]["label"] == "Name"
+        assert derived["fieldDefinitions"]["field1"]["formula"] == "{a} < 5 && {b} > 2"
+        assert derived["fieldDefinitions"]["field2"] is CANONICAL["fieldDefinitions"]["field2"]
+        assert CANONICAL["fieldDefinitions"]["field1"]["label"] == "<p>Name</p>"
+
+    def test_options_and_defaults_survive(self):
+        """Test that only display text is stripped; option and default values are data"""
+        derived = derive_variant(CANONICAL, strip_html=True, include_tags=False)
+        field3 = derived["fieldDefinitions"]["field3"]
+        assert field3["label"] == "Size"
+        assert field3["options"] is CANONICAL["fieldDefinitions"]["field3"]["options"]
+        assert field3["options"] == ["S &amp; M", "<L>"] and field3["defaultValue"] == "<L>"
+
+    def test_tagless_variant(self):
+        """Test that tag metadata is dropped"""
+        derived = derive_variant(CANONICAL, strip_html=False, include_tags=False)
+        assert "tags" not in derived["fieldDefinitions"]["field1"]
+        assert derived["metadata"] is CANONICAL["metadata"]
+        assert derive_variant(CANONICAL, strip_html=False, include_tags=True) is CANONICAL
+
+
+class TestVariantCaching:
+    """Test cases for serving every variant from one canonical fetch"""
+
+    @patch("clappia_api_tools._utils.api_utils.ClappiaAPIUtils.make_request")
+    def test_variants_share_one_fetch(self, mock_request):
+        """Test that only the canonical variant is requested and cached"""
+        mock_request.return_value = (True, None, CANONICAL)
+        cache = DefinitionCache(derive_variants=True)
+        client = dummy_client(cache)
+        client.structured_results = True
+
+        stripped = client.get_definition("MFX093412")
+        raw = client.get_definition("MFX093412", strip_html=False)
+        tagless = client.get_definition("MFX093412", include_tags=False)
+        again = client.get_definition("MFX093412")
+
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.kwargs["params"]["stripHtml"] == "false"
+        assert mock_request.call_args.kwargs["params"]["includeTags"] == "true"
+        assert raw.data is CANONICAL
+        assert stripped.data["fieldDefinitions"]["field1"]["label"] == "Name"
+        assert "tags" not in tagless.data["fieldDefinitions"]["field1"]
+        assert again.data is stripped.data
+        assert cache.stats()["size"] == 1 and cache.stats()["derivations"] == 2
+
+    @patch("clappia_api_tools._utils.api_utils.ClappiaAPIUtils.make_request")
+    def test_invalidation_drops_variants(self, mock_request):
+        """Test that derived variants go away with their canonical definition"""
+        mock_request.return_value = (True, None, CANONICAL)
+        cache = DefinitionCache(derive_variants=True)
+        client = dummy_client(cache)
+        client.get_definition("MFX093412")
+        cache.invalidate_app("MFX093412")
+        client.get_definition("MFX093412")
+        assert mock_request.call_count == 2
+        assert cache.stats()["derivations"] == 2
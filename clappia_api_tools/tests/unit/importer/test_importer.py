@@ -0,0 +1,184 @@
+import json
+from functools import partial
+
+import pytest
+
+from clappia_api_tools._utils.idempotency import IdempotencyLedger
+from clappia_api_tools._utils.transport import TransportResponse
+from clappia_api_tools.cli import main
+from clappia_api_tools.client.submission_client import SubmissionClient
+from clappia_api_tools.importer import ImportCheckpoint, RecordReader, SubmissionImporter
+from clappia_api_tools.simulator import SimulatorServer
+
+
+@pytest.fixture
+def submission_client(make_client):
+    """make_client for the SubmissionClient the importer drives"""
+    return partial(make_client, cls=SubmissionClient)
+
+
+def _created(simulator):
+    return sorted(s["data"]["n"] for s in simulator.submissions.values())
+
+
+class TestRecordReader:
+    """Test cases for streaming CSV and JSONL records"""
+
+    def test_csv_records_and_offsets(self, tmp_path):
+        """Test that CSV rows, including quoted newlines, resume at their end offsets"""
+        path = tmp_path / "data.csv"
+        path.write_bytes(b'\xef\xbb\xbfname,note\nAda,"multi\nline"\n\nGrace,plain\n')
+        reader = RecordReader(str(path))
+        records = list(reader.records())
+        assert [r.data for r in records] == [{"name": "Ada", "note": "multi\nline"}, {"name": "Grace", "note": "plain"}]
+        assert [r.data for r in reader.records(records[0].end)] == [{"name": "Grace", "note": "plain"}]
+        assert records[-1].end == reader.size
+
+    def test_jsonl_parse_errors_are_reported(self, tmp_path):
+        """Test that malformed JSONL lines become errors without stopping the stream"""
+        path = tmp_path / "data.jsonl"
+        path.write_text('{"n": 1}\nnot json\n[1]\n{"n": 2}')
+        records = list(RecordReader(str(path)).records())
+        assert [r.data for r in records] == [{"n": 1}, None, None, {"n": 2}]
+        assert records[1].error.startswith("invalid JSON")
+        assert records[2].error == "record must be a JSON object"
+
+    def test_unknown_extension_needs_format(self, tmp_path):
+        """Test that the format must be given for unknown extensions"""
+        path = tmp_path / "data.bin"
+        path.write_text("")
+        with pytest.raises(ValueError):
+            RecordReader(str(path))
+
+
+class TestSubmissionImporter:
+    """Test cases for the resumable submission importer"""
+
+    def test_import_applies_mapping(self, tmp_path, clappia_simulator, submission_client):
+        """Test that columns are renamed, unmapped columns dropped and empty cells omitted"""
+        path = tmp_path / "people.csv"
+        path.write_text("Full Name,Age,Ignored\nAda,36,x\nGrace,,y\n")
+        importer = SubmissionImporter(
+            submission_client(clappia_simulator.handle), "APP1", "ada@example.com",
+            mapping={"Full Name": "name", "Age": "age"}, only_mapped=True,
+        )
+        stats = importer.run(str(path))
+
+        assert stats.succeeded == 2
+        assert sorted((s["data"] for s in clappia_simulator.submissions.values()), key=lambda d: d["name"]) == [
+            {"name": "Ada", "age": "36"}, {"name": "Grace"},
+        ]
+
+    def test_failures_are_recorded_and_committed(self, tmp_path, clappia_simulator, submission_client):
+        """Test that failed records go to the failures file and do not block the checkpoint"""
+        path = tmp_path / "data.jsonl"
+        path.write_text('{"n": 1}\nbroken\n{"n": 2}\n')
+
+        def reject_two(request):
+            if request.json()["data"]["n"] == 2:
+                return TransportResponse.from_json(400, {"message": "bad"})
+            return clappia_simulator.handle(request)
+
+        checkpoint = str(tmp_path / "import.checkpoint.json")
+        failures = tmp_path / "failures.jsonl"
+        stats = SubmissionImporter(
+            submission_client(reject_two), "APP1", "ada@example.com",
+            checkpoint_path=checkpoint, failures_path=str(failures),
+        ).run(str(path))
+
+        assert (stats.succeeded, stats.failed) == (1, 2)
+        errors = [json.loads(line) for line in failures.read_text().splitlines()]
+        assert [e["offset"] for e in errors] == [9, 16]
+        saved = ImportCheckpoint.load(checkpoint)
+        assert saved.completed and saved.offset == path.stat().st_size
+
+    def test_killed_import_resumes(self, tmp_path, clappia_simulator, submission_client):
+        """Test that a stopped import resumes after the last committed record"""
+        path = tmp_path / "data.jsonl"
+        path.write_text("".join(json.dumps({"n": n}) + "\n" for n in range(50)))
+        checkpoint = str(tmp_path / "import.checkpoint.json")
+        importer = SubmissionImporter(
+            submission_client(clappia_simulator.handle), "APP1", "ada@example.com",
+            concurrency=2, checkpoint_path=checkpoint,
+        )
+
+        def stop_after_ten(request):
+            response = clappia_simulator.handle(request)
+            if len(clappia_simulator.submissions) == 10:
+                importer.stop()
+            return response
+
+        importer.client = submission_client(stop_after_ten)
+        first = importer.run(str(path))
+        saved = ImportCheckpoint.load(checkpoint)
+        assert not saved.completed
+        assert first.succeeded == saved.succeeded < 50
+
+        second = SubmissionImporter(
+            submission_client(clappia_simulator.handle), "APP1", "ada@example.com",
+            checkpoint_path=checkpoint,
+        ).run(str(path))
+
+        assert second.resumed_from == saved.offset
+        assert first.succeeded + second.succeeded == 50
+        assert _created(clappia_simulator) == list(range(50))
+
+    def test_resent_records_are_not_duplicated_with_ledger(self, tmp_path, clappia_simulator, submission_client):
+        """Test that records resent after a crash are answered by the idempotency ledger"""
+        path = tmp_path / "data.jsonl"
+        path.write_text('{"n": 1}\n{"n": 2}\n')
+        checkpoint = str(tmp_path / "import.checkpoint.json")
+        ledger = IdempotencyLedger()
+
+        client = submission_client(clappia_simulator.handle, idempotency_ledger=ledger)
+
+        SubmissionImporter(client, "APP1", "a@example.com").run(str(path))
+        # The checkpoint was lost, so every record is sent again
+        SubmissionImporter(client, "APP1", "a@example.com", checkpoint_path=checkpoint).run(str(path))
+
+        assert _created(clappia_simulator) == [1, 2]
+
+    def test_checkpoint_of_another_file_is_refused(self, tmp_path, clappia_simulator, submission_client):
+        """Test that a checkpoint is only reused for the same file and app"""
+        path = tmp_path / "data.jsonl"
+        path.write_text('{"n": 1}\n')
+        checkpoint = str(tmp_path / "import.checkpoint.json")
+        ImportCheckpoint(source="/elsewhere.jsonl", app_id="APP1").save(checkpoint)
+
+        importer = SubmissionImporter(
+            submission_client(clappia_simulator.handle), "APP1", "a@example.com",
+            checkpoint_path=checkpoint,
+        )
+        with pytest.raises(ValueError):
+            importer.run(str(path))
+        assert importer.run(str(path), restart=True).succeeded == 1
+
+
+class TestImportCommand:
+    """Test cases for the clappia-tools import command"""
+
+    def test_cli_import_against_simulator(self, tmp_path, capsys):
+        """Test the command end to end over HTTP, including a no-op rerun"""
+        path = tmp_path / "people.csv"
+        path.write_text("Name\nAda\nGrace\n")
+        with SimulatorServer() as server:
+            argv = [
+                "import", str(path), "--app-id", "APP1", "--email", "ada@example.com",
+                "--map", "Name=name", "--quiet",
+                "--api-key", "key", "--base-url", server.url, "--workplace-id", "WP1",
+            ]
+            assert main(argv) == 0
+            summary = json.loads(capsys.readouterr().out)
+            assert summary["created"] == 2
+            assert main(argv) == 0
+            assert json.loads(capsys.readouterr().out)["created"] == 0
+            assert server.simulator.stats()["submissions"] == 2
+
+    def test_cli_rejects_bad_mapping(self, tmp_path):
+        """Test that malformed --map values are rejected"""
+        path = tmp_path / "people.csv"
+        path.write_text("Name\nAda\n")
+        assert main([
+            "import", str(path), "--app-id", "APP1", "--email", "ada@example.com", "--map", "Name",
+            "--api-key", "key", "--base-url", "http://localhost", "--workplace-id", "WP1",
+        ]) == 2
@@ -0,0 +1,136 @@
+from functools import partial
+
+import pytest
+
+from clappia_api_tools._models.model import Field, Section
+from clappia_api_tools._utils.definition_cache import DefinitionCache
+from clappia_api_tools._utils.transport import TransportResponse
+from clappia_api_tools.client.app_definition_client import AppDefinitionClient
+from clappia_api_tools.migration import MigrationPlanner, SchemaMigrator
+from clappia_api_tools.simulator import ClappiaSimulator
+
+LIVE = [
+    {"fieldName": "name", "fieldType": "singleLineText", "label": "Name", "required": True},
+    {"fieldName": "dept", "fieldType": "dropDown", "label": "Department", "options": ["Sales", "Ops"]},
+    {"fieldName": "legacy", "fieldType": "singleLineText", "label": "Legacy"},
+]
+
+
+@pytest.fixture
+def clappia_simulator():
+    """Simulator holding APP1 with the live fields above"""
+    simulator = ClappiaSimulator(auto_create_apps=False)
+    simulator.add_app("APP1", fields=LIVE)
+    return simulator
+
+
+@pytest.fixture
+def definition_client(make_client):
+    """make_client for the AppDefinitionClient the migrator drives"""
+    return partial(make_client, cls=AppDefinitionClient)
+
+
+def _spec():
+    return [Section("Section 1", [
+        Field("singleLineText", "Name", required=True),
+        Field("singleLineText", "Phone", required=False, description="Work phone"),
+        Field("dropDown", "Department", options=["Sales", "Ops", "Support"]),
+        Field("singleLineText", "Email"),
+    ])]
+
+
+class TestMigrationPlanner:
+    """Test cases for diffing a spec against a live definition"""
+
+    def setup_method(self):
+        self.definition = {
+            "appId": "APP1",
+            "version": 4,
+            "sections": [{"sectionName": "Section 1", "fields": ["name", "dept", "legacy"]}],
+            "fieldDefinitions": {spec["fieldName"]: dict(spec) for spec in LIVE},
+        }
+
+    def test_only_changed_properties_are_planned(self):
+        """Test that unchanged fields are skipped and updates carry only the differences"""
+        plan = MigrationPlanner().plan("APP1", _spec(), self.definition)
+
+        assert [(op.action, op.label) for op in plan.operations] == [
+            ("add", "Phone"), ("update", "Department"), ("add", "Email"),
+        ]
+        update = plan.operations[1]
+        assert update.properties == {"options": ["Sales", "Ops", "Support"]}
+        assert update.changes == {"options": [["Sales", "Ops"], ["Sales", "Ops", "Support"]]}
+        assert plan.unmanaged == ["legacy"]
+
+    def test_adds_in_a_section_are_ordered_and_positioned(self):
+        """Test that new fields are placed after their spec predecessor, in one chain"""
+        plan = MigrationPlanner().plan("APP1", _spec(), self.definition)
+
+        phone, _, email = plan.operations
+        assert (phone.field_index, email.field_index) == (1, 3)
+        assert phone.chain == email.chain
+        assert len(plan.chains) == 2
+
+    def test_ambiguous_labels_are_errors(self):
+        """Test that a label matching several live fields must be disambiguated"""
+        definition = dict(self.definition)
+        definition["fieldDefinitions"] = dict(definition["fieldDefinitions"], other={"label": "Name"})
+        plan = MigrationPlanner().plan("APP1", [Section("Section 1", [Field("singleLineText", "Name")])], definition)
+
+        assert plan.errors and "matches several fields" in plan.errors[0]
+
+    def test_properties_add_field_ignores_become_a_follow_up_update(self):
+        """Test that properties addField drops for a type are set by an update after the add"""
+        spec = [Section("Section 1", [Field("calculationsAndLogic", "Total", formula="{a}+1", hidden=True)])]
+        plan = MigrationPlanner().plan("APP1", spec, self.definition)
+
+        add, follow_up = plan.operations
+        assert add.properties == {"label": "Total", "formula": "{a}+1"}
+        assert (follow_up.action, follow_up.field_name, follow_up.properties) == ("update", None, {"hidden": True})
+        assert follow_up.chain == add.chain
+
+
+class TestSchemaMigrator:
+    """Test cases for applying migration plans"""
+
+    def test_apply_converges_and_rerun_is_a_no_op(self, clappia_simulator, definition_client):
+        """Test that applying a plan reaches the spec and a second plan is empty"""
+        cache = DefinitionCache()
+        migrator = SchemaMigrator(definition_client(clappia_simulator.handle, definition_cache=cache))
+
+        result = migrator.migrate("APP1", _spec(), "admin@example.com")
+
+        assert result.success and result.summary()["applied"] == 3
+        app = clappia_simulator.apps["APP1"]
+        labels = [app["fields"][name]["label"] for name in app["sections"][0]["fields"]]
+        assert labels == ["Name", "Phone", "Department", "Email", "Legacy"]
+        assert len(migrator.plan("APP1", _spec())) == 0
+
+    def test_dry_run_sends_nothing(self, clappia_simulator, definition_client):
+        """Test that a dry run only reads the definition"""
+        migrator = SchemaMigrator(definition_client(clappia_simulator.handle))
+        plan = migrator.migrate("APP1", _spec(), "admin@example.com", dry_run=True)
+
+        assert "+ add singleLineText \"Phone\" at section 0 position 1" in plan.describe()
+        assert set(clappia_simulator.stats()["requests"]) == {"appdefinitionv2/getAppDefinition"}
+
+    def test_failure_skips_rest_of_chain_only(self, clappia_simulator, definition_client):
+        """Test that a failed add skips later adds in its section but not other chains"""
+
+        def reject_phone(request):
+            if request.path == "appdefinitionv2/addField" and request.json().get("label") == "Phone":
+                return TransportResponse.from_json(400, {"message": "bad field"})
+            return clappia_simulator.handle(request)
+
+        result = SchemaMigrator(definition_client(reject_phone)).migrate("APP1", _spec(), "admin@example.com")
+
+        assert [o["status"] for o in result.outcomes] == ["failed", "applied", "skipped"]
+        assert not result.success
+
+    def test_plan_with_errors_is_not_applied(self, clappia_simulator, definition_client):
+        """Test that apply refuses a plan with errors"""
+        migrator = SchemaMigrator(definition_client(clappia_simulator.handle))
+        plan = migrator.plan("APP1", [Section("Section 1", [Field("singleLineText", "X", fieldName="missing")])])
+
+        with pytest.raises(ValueError):
+            migrator.apply(plan, "admin@example.com")
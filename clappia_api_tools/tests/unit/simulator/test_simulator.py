@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from clappia_api_tools._utils.retry import RetryConfig, RetryPolicy
+from clappia_api_tools._utils.transport import InProcessTransport
+from clappia_api_tools.client.clappia_client import ClappiaClient
+from clappia_api_tools.simulator import ClappiaSimulator, FaultConfig, LatencyModel, SimulatorServer
+
+
+def _client(transport=None, base_url="https://sim.local", retry_config=None):
+    return ClappiaClient(
+        api_key="test_key",
+        base_url=base_url,
+        workplace_id="TEST123",
+        retry_config=retry_config or RetryConfig.disabled(),
+        transport=transport,
+    )
+
+
+class TestSimulatorEndpoints:
+    """Test cases for the simulator's stateful endpoints"""
+
+    def test_submission_lifecycle(self, clappia_simulator, clappia_transport):
+        """Test create, edit, owners and status against simulator state"""
+        client = _client(clappia_transport)
+        result = client.create_submission("MFX093412", {"name": "a"}, "user@example.com")
+        submission_id = next(iter(clappia_simulator.submissions))
+        assert submission_id in result
+
+        client.edit_submission("MFX093412", submission_id, {"name": "b"}, "user@example.com")
+        client.update_submission_owners("MFX093412", submission_id, "user@example.com", ["other@example.com"])
+        client.update_submission_status("MFX093412", submission_id, "user@example.com", "Approved", "ok")
+
+        stored = clappia_simulator.submissions[submission_id]
+        assert stored["data"] == {"name": "b"}
+        assert "other@example.com" in stored["owners"]
+        assert stored["status"]["name"] == "Approved"
+
+    def test_unknown_submission(self, clappia_transport):
+        """Test that editing a missing submission returns a 404 error"""
+        result = _client(clappia_transport).edit_submission(
+            "MFX093412", "MISSING1", {"name": "b"}, "user@example.com"
+        )
+        assert "API Error (404)" in result
+
+    def test_app_schema_changes(self, clappia_simulator, clappia_transport):
+        """Test createApp, addField and updateField show up in getAppDefinition"""
+        client = _client(clappia_transport)
+        client.create_app(
+            "Inspections", "user@example.com",
+            [{"sectionName": "Main", "fields": [{"fieldType": "singleLineText", "label": "Site"}]}],
+        )
+        app_id = next(iter(clappia_simulator.apps))
+        added = client.add_field_to_app(app_id, "user@example.com", 0, 1, "singleLineText", "Notes", False)
+        assert "field2" in added
+        client.app_definition.update_field(app_id, "user@example.com", "field2", label="Remarks")
+
+        definition = clappia_simulator.apps[app_id]
+        assert definition["sections"][0]["fields"] == ["field1", "field2"]
+        assert definition["fields"]["field2"]["label"] == "Remarks"
+        assert "Inspections" in client.get_app_definition(app_id)
+
+    def test_api_key_checked(self):
+        """Test that a configured api_key rejects other keys"""
+        simulator = ClappiaSimulator(api_key="secret")
+        result = _client(InProcessTransport(simulator.handle)).get_app_definition("MFX093412")
+        assert "API Error (401)" in result
+
+
+class TestSimulatorFaults:
+    """Test cases for fault injection"""
+
+    def test_latency_distributions(self):
+        """Test that latency samples stay within bounds"""
+        rng = random.Random(1)
+        assert LatencyModel.parse("0.02").sample(rng) == 0.02
+        samples = [LatencyModel.parse("uniform:0.1,0.05").sample(rng) for _ in range(100)]
+        assert all(0.05 <= s <= 0.15 for s in samples)
+        assert LatencyModel("lognormal", 1, 3, max_latency=2).sample(rng) <= 2
+        with pytest.raises(ValueError):
+            LatencyModel("bimodal")
+
+    def test_error_rate(self):
+        """Test that a full error rate fails every request"""
+        simulator = ClappiaSimulator(FaultConfig(error_rate=1.0, error_status=502))
+        result = _client(InProcessTransport(simulator.handle)).create_submission(
+            "MFX093412", {"name": "a"}, "user@example.com"
+        )
+        assert "Unexpected API response (502)" in result
+        assert not simulator.submissions
+
+    def test_throttling_with_retry_after(self):
+        """Test that throttled requests get 429 with Retry-After and succeed on retry"""
+        simulator = ClappiaSimulator(FaultConfig(throttle_rate=50, throttle_burst=1, retry_after=0.03))
+        retry = RetryConfig(
+            read=RetryPolicy(backoff_base=0.002, jitter=False),
+            mutation=RetryPolicy(backoff_base=0.002, jitter=False, retry_ambiguous=False),
+            budget=None,
+        )
+        client = _client(InProcessTransport(simulator.handle), retry_config=retry)
+        for i in range(3):
+            client.create_submission("MFX093412", {"name": str(i)}, "user@example.com")
+        assert len(simulator.submissions) == 3
+        assert simulator.stats()["statuses"].get("429", 0) >= 1
+
+
+class TestSimulatorServer:
+    """Test cases for serving the simulator over HTTP"""
+
+    def test_client_over_http(self, clappia_simulator, clappia_simulator_server):
+        """Test that the regular HTTP transport works against the served simulator"""
+        client = _client(base_url=clappia_simulator_server.url)
+        result = client.create_submission("MFX093412", {"name": "a"}, "user@example.com")
+        assert "Successfully created submission" in result
+        assert len(clappia_simulator.submissions) == 1
+
+    def test_slow_body(self):
+        """Test that slow bodies are delivered completely"""
+        simulator = ClappiaSimulator(FaultConfig(slow_body_rate=1.0, slow_body_delay=0.05))
+        with SimulatorServer(simulator) as server:
+            result = _client(base_url=server.url).get_app_definition("NOAPP1")
+        assert "API Error (404)" in result
@@ -0,0 +1,119 @@
+import asyncio
+import json
+from unittest.mock import patch, AsyncMock
+
+import httpx
+
+from clappia_api_tools.client.async_submission_client import AsyncSubmissionClient
+from clappia_api_tools.client.async_app_definition_client import AsyncAppDefinitionClient
+from clappia_api_tools.client.async_clappia_client import AsyncClappiaClient
+from clappia_api_tools._utils.transport import HttpxTransport
+
+
+def dummy_async_client():
+    """Helper function to create an async client with a mocked HTTP transport"""
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if request.url.path.endswith("submissions/create"):
+            return httpx.Response(200, json={"submissionId": "SUB123"})
+        if request.url.path.endswith("appdefinitionv2/getAppDefinition"):
+            return httpx.Response(200, json={"appId": request.url.params["appId"], "fieldDefinitions": {}})
+        return httpx.Response(400, json={"message": "bad request"})
+
+    client = AsyncClappiaClient(
+        api_key="test_key",
+        base_url="https://test.com",
+        workplace_id="TEST123",
+        transport=HttpxTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler))),
+    )
+    return client, requests_seen
+
+
+class TestAsyncSubmissionClient:
+    """Test cases for AsyncSubmissionClient"""
+
+    def test_create_submission_validation_error(self):
+        """Test async create_submission with invalid app_id"""
+        client = AsyncSubmissionClient()
+        result = asyncio.run(client.create_submission("invalid-id", {}, "test@example.com"))
+        assert "Error: Invalid app_id" in result
+
+    def test_edit_submission_invalid_submission_id(self):
+        """Test async edit_submission with invalid submission ID"""
+        client = AsyncSubmissionClient()
+        result = asyncio.run(
+            client.edit_submission("MFX093412", "invalid-id", {"name": "Updated"}, "test@example.com")
+        )
+        assert "Error: Invalid submission_id" in result
+
+    @patch(
+        "clappia_api_tools._utils.async_api_utils.AsyncClappiaAPIUtils.make_request",
+        new_callable=AsyncMock,
+    )
+    def test_update_status_api_error(self, mock_request):
+        """Test async update_status with API error"""
+        mock_request.return_value = (False, "API Error: Invalid request", None)
+        client = AsyncSubmissionClient(
+            api_key="test_key", base_url="https://test.com", workplace_id="TEST123"
+        )
+        result = asyncio.run(
+            client.update_status("MFX093412", "HGO51464561", "test@example.com", "Approved", "ok")
+        )
+        assert result == "Error: API Error: Invalid request"
+
+
+class TestAsyncClappiaClient:
+    """Test cases for AsyncClappiaClient"""
+
+    def test_clients_share_api_utils(self):
+        """Test that the async facade shares one API utils instance"""
+        client = AsyncClappiaClient(
+            api_key="test_key", base_url="https://test.com", workplace_id="TEST123"
+        )
+        assert client.submissions.api_utils is client.app_definition.api_utils
+
+    def test_create_submission_sends_payload(self):
+        """Test that create_submission sends the same payload as the sync client"""
+        client, requests_seen = dummy_async_client()
+
+        async def run():
+            async with client:
+                return await client.create_submission("MFX093412", {"name": "Test"}, "test@example.com")
+
+        result = asyncio.run(run())
+        assert "Successfully created submission" in result
+        assert "SUB123" in result
+        body = json.loads(requests_seen[0].content)
+        assert body == {
+            "workplaceId": "TEST123",
+            "appId": "MFX093412",
+            "requestingUserEmailAddress": "test@example.com",
+            "data": {"name": "Test"},
+        }
+
+    def test_concurrent_get_definition(self):
+        """Test that many definitions can be fetched concurrently on one loop"""
+        client, requests_seen = dummy_async_client()
+
+        async def run():
+            async with client:
+                return await asyncio.gather(
+                    *(client.get_app_definition(f"APP{i}") for i in range(20))
+                )
+
+        results = asyncio.run(run())
+        assert len(requests_seen) == 20
+        assert all("Successfully retrieved app definition" in r for r in results)
+        assert "APP7" in results[7]
+
+    def test_add_field_unknown_field_type(self):
+        """Test async add_field with unknown field type"""
+        client = AsyncAppDefinitionClient(
+            api_key="test_key", base_url="https://test.com", workplace_id="TEST123"
+        )
+        result = asyncio.run(
+            client.add_field("MFX093412", "test@example.com", 0, 0, "unknownFieldType", "Test Field", True)
+        )
+        assert "Error: field_type 'unknownFieldType'" in result
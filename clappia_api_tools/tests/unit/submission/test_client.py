@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch, Mock
 from clappia_api_tools.client.base_client import BaseClappiaClient
 from clappia_api_tools.client.submission_client import SubmissionClient
@@ -250,4 +251,51 @@ class TestMainClappiaClient:
             )
             repr_str = repr(client)
 
-            assert "ClappiaClient(workplace_id=TEST123)" in repr_str
\ No newline at end of file
+            assert "ClappiaClient(workplace_id=TEST123)" in repr_str
+
+class TestCreateSubmissionsBulk:
+    """Test cases for SubmissionClient.create_submissions_bulk"""
+
+    def _client(self):
+        return SubmissionClient(
+            api_key="test_key",
+            base_url="https://test.com",
+            workplace_id="TEST123",
+        )
+
+    def test_invalid_app_id_fails_whole_batch(self):
+        """Test that batch-level validation errors abort before sending"""
+        client = self._client()
+        result = client.create_submissions_bulk("invalid-id", [{"a": 1}], "test@example.com")
+        assert "Error: Invalid app_id" in result
+
+    def test_empty_records(self):
+        """Test that an empty batch is rejected"""
+        client = self._client()
+        result = client.create_submissions_bulk("MFX093412", [], "test@example.com")
+        assert "Error: records cannot be empty" in result
+
+    @patch("clappia_api_tools._utils.api_utils.ClappiaAPIUtils.make_request")
+    def test_results_in_input_order_with_partial_failures(self, mock_request):
+        """Test per-record results keep input order and failures do not abort the batch"""
+        def fake_request(method, endpoint, data=None, params=None):
+            name = data["data"]["name"]
+            if name == "bad":
+                return False, "API Error (400): invalid field", None
+            return True, None, {"submissionId": f"SUB{name}"}
+
+        mock_request.side_effect = fake_request
+        client = self._client()
+        records = [{"name": str(i)} for i in range(10)]
+        records[3] = {"name": "bad"}
+        records[6] = {}
+
+        result = client.create_submissions_bulk("MFX093412", records, "test@example.com", max_concurrency=4)
+
+        assert "Created submissions with partial failures" in result
+        results = json.loads(result.split("RESULTS:\n", 1)[1])
+        assert [r["index"] for r in results] == list(range(10))
+        assert results[0]["submissionId"] == "SUB0"
+        assert results[3]["error"]["stage"] == "request"
+        assert results[6]["error"]["stage"] == "validation"
+        assert mock_request.call_count == 9
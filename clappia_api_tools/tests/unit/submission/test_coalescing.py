@@ -0,0 +1,139 @@
+import threading
+import time
+
+import pytest
+
+from clappia_api_tools._utils.coalescing import EditCoalescer
+from clappia_api_tools._utils.transport import TransportResponse
+
+
+def _recorder():
+    seen = []
+    lock = threading.Lock()
+
+    def record(request):
+        body = request.json()
+        with lock:
+            seen.append(body)
+        return TransportResponse.from_json(200, {"submissionId": body["submissionId"]})
+
+    return seen, record
+
+
+class TestEditCoalescer:
+    """Test cases for coalescing edits of the same submission"""
+
+    def test_edits_within_window_are_merged(self, make_client):
+        """Test that edits of one submission are sent as one request, last write winning"""
+        seen, record = _recorder()
+        with EditCoalescer(window=0.05) as coalescer:
+            client = make_client(record, edit_coalescer=coalescer)
+            futures = [
+                client.edit_submission_coalesced("APP1", "SUB1", {"a": 1, "b": 1}, "ada@example.com"),
+                client.edit_submission_coalesced("APP1", "SUB1", {"b": 2}, "ada@example.com"),
+                client.edit_submission_coalesced("APP1", "SUB1", {"c": 3}, "ada@example.com"),
+            ]
+            results = [future.result(timeout=5) for future in futures]
+
+        assert len(seen) == 1
+        assert seen[0]["data"] == {"a": 1, "b": 2, "c": 3}
+        assert all(result is results[0] for result in results)
+        assert results[0].success
+        assert '"fieldsUpdated": 3' in results[0].text
+        assert coalescer.stats()["edits"] == 3
+        assert coalescer.stats()["requests"] == 1
+
+    def test_different_submissions_and_users_are_not_merged(self, make_client):
+        """Test that edits are only merged per submission and requesting user"""
+        seen, record = _recorder()
+        with EditCoalescer(window=0.02) as coalescer:
+            client = make_client(record, edit_coalescer=coalescer)
+            futures = [
+                client.edit_submission_coalesced("APP1", "SUB1", {"a": 1}, "ada@example.com"),
+                client.edit_submission_coalesced("APP1", "SUB2", {"a": 1}, "ada@example.com"),
+                client.edit_submission_coalesced("APP1", "SUB1", {"a": 2}, "grace@example.com"),
+            ]
+            for future in futures:
+                future.result(timeout=5)
+
+        assert len(seen) == 3
+
+    def test_max_edits_sends_immediately(self, make_client):
+        """Test that a full buffer is sent without waiting for the window"""
+        seen, record = _recorder()
+        with EditCoalescer(window=60, max_edits=2) as coalescer:
+            client = make_client(record, edit_coalescer=coalescer)
+            futures = [
+                client.edit_submission_coalesced("APP1", "SUB1", {"a": 1}, "ada@example.com"),
+                client.edit_submission_coalesced("APP1", "SUB1", {"b": 2}, "ada@example.com"),
+            ]
+            for future in futures:
+                future.result(timeout=5)
+            assert seen[0]["data"] == {"a": 1, "b": 2}
+
+    def test_batches_of_one_submission_do_not_overtake(self, make_client):
+        """Test that a batch waits while an earlier batch of the same submission is in flight"""
+        seen = []
+        release = threading.Event()
+
+        def slow(request):
+            body = request.json()
+            seen.append(body["data"])
+            if len(seen) == 1:
+                release.wait(5)
+            return TransportResponse.from_json(200, {"submissionId": body["submissionId"]})
+
+        with EditCoalescer(window=0.01, max_workers=4) as coalescer:
+            client = make_client(slow, edit_coalescer=coalescer)
+            first = client.edit_submission_coalesced("APP1", "SUB1", {"step": 1}, "ada@example.com")
+            time.sleep(0.05)
+            second = client.edit_submission_coalesced("APP1", "SUB1", {"step": 2}, "ada@example.com")
+            time.sleep(0.05)
+            assert len(seen) == 1
+            release.set()
+            first.result(timeout=5)
+            second.result(timeout=5)
+
+        assert seen == [{"step": 1}, {"step": 2}]
+
+    def test_failure_is_shared(self, make_client):
+        """Test that every merged edit receives the failed outcome"""
+        def reject(request):
+            return TransportResponse.from_json(400, {"message": "bad field"})
+
+        with EditCoalescer(window=0.02) as coalescer:
+            client = make_client(reject, edit_coalescer=coalescer)
+            futures = [
+                client.edit_submission_coalesced("APP1", "SUB1", {"a": 1}, "ada@example.com"),
+                client.edit_submission_coalesced("APP1", "SUB1", {"b": 1}, "ada@example.com"),
+            ]
+            results = [future.result(timeout=5) for future in futures]
+
+        assert all(result.error_code == "api_error" for result in results)
+
+    def test_validation_errors_resolve_immediately(self, make_client):
+        """Test that invalid edits are rejected without being buffered"""
+        seen, record = _recorder()
+        with EditCoalescer(window=60) as coalescer:
+            client = make_client(record, edit_coalescer=coalescer, structured_results=False)
+            future = client.edit_submission_coalesced("APP1", "invalid-id", {"a": 1}, "ada@example.com")
+            assert future.done()
+            assert "Error: Invalid submission_id" in future.result()
+            assert coalescer.stats()["edits"] == 0
+
+    def test_flush_sends_pending_edits(self, make_client):
+        """Test that flush sends buffered edits without waiting for the window"""
+        seen, record = _recorder()
+        with EditCoalescer(window=60) as coalescer:
+            client = make_client(record, edit_coalescer=coalescer)
+            future = client.edit_submission_coalesced("APP1", "SUB1", {"a": 1}, "ada@example.com")
+            assert coalescer.flush(timeout=5)
+            assert future.done()
+
+    def test_submit_after_close_fails(self, make_client):
+        """Test that a closed coalescer refuses new edits"""
+        coalescer = EditCoalescer()
+        make_client(_recorder()[1], edit_coalescer=coalescer)
+        coalescer.close()
+        with pytest.raises(RuntimeError):
+            coalescer.submit({"appId": "APP1", "submissionId": "SUB1", "requestingUserEmailAddress": "a@example.com", "data": {}})
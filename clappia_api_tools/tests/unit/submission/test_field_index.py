@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from clappia_api_tools._utils.definition_cache import DefinitionCache
+from clappia_api_tools._utils.field_index import FieldIndex
+from clappia_api_tools._utils.transport import AsyncInProcessTransport
+from clappia_api_tools.client.async_submission_client import AsyncSubmissionClient
+from clappia_api_tools.simulator import ClappiaSimulator
+
+DEFINITION = {
+    "appId": "APP1",
+    "version": 3,
+    "sections": [
+        {"sectionName": "Employee", "fields": ["employee_name", "dept"]},
+        {"sectionName": "Review", "fields": ["notes", "notes2"]},
+    ],
+    "fieldDefinitions": {
+        "employee_name": {"fieldType": "singleLineText", "label": "Employee Name"},
+        "dept": {"fieldType": "dropDown", "label": "Department"},
+        "notes": {"fieldType": "multiLineText", "label": "Notes"},
+        "notes2": {"fieldType": "multiLineText", "label": "Notes"},
+    },
+}
+
+FIELDS = [
+    {"fieldName": "employee_name", "fieldType": "singleLineText", "label": "Employee Name"},
+    {"fieldName": "dept", "fieldType": "dropDown", "label": "Department", "options": ["Sales", "Ops"]},
+]
+
+
+@pytest.fixture
+def clappia_simulator():
+    """Simulator holding APP1 with the fields above"""
+    simulator = ClappiaSimulator(auto_create_apps=False)
+    simulator.add_app("APP1", fields=FIELDS)
+    return simulator
+
+
+class TestFieldIndex:
+    """Test cases for resolving labels to field names"""
+
+    def setup_method(self):
+        self.index = FieldIndex.build(DEFINITION)
+
+    def test_resolves_names_labels_and_normalized_labels(self):
+        """Test the fieldName, exact label and normalized label lookups"""
+        for key in ("employee_name", "Employee Name", " employee-NAME ", "EmployeeName"):
+            assert self.index.resolve(key).field_name == "employee_name"
+
+    def test_field_metadata_includes_section(self):
+        """Test that resolved fields carry their type and section"""
+        info = self.index.resolve("Department")
+        assert (info.field_type, info.section_index, info.section_name) == ("dropDown", 0, "Employee")
+
+    def test_translate_reports_unknown_ambiguous_and_duplicate_keys(self):
+        """Test that problems are listed instead of guessing"""
+        translated, problems = self.index.translate({"Employee Name": "Ada", "Notes": "x", "Salary": 1, "employee_name": "B"})
+        assert translated == {"employee_name": "Ada"}
+        assert problems == [
+            "'Notes' matches several fields (notes, notes2)",
+            "'Salary' matches no field label or name",
+            "'employee_name' and 'Employee Name' both refer to field 'employee_name'",
+        ]
+
+    def test_labels_with_markup_resolve_by_text(self):
+        """Test that labels of the canonical definition are indexed without their HTML"""
+        index = FieldIndex.build({"appId": "APP1", "fieldDefinitions": {"a": {"label": "<b>Start &amp; End</b>"}}})
+        assert index.resolve("Start & End").field_name == "a"
+
+    def test_build_leaves_definition_untouched(self):
+        """Test that building an index does not modify the (cached) definition"""
+        definition = {"appId": "APP1", "sections": [{"sectionName": "S", "fields": [{"fieldName": "a", "label": "A"}]}]}
+        assert FieldIndex.build(definition).resolve("A").section_index == 0
+        assert "fieldDefinitions" not in definition
+
+
+class TestLabelKeyedSubmissions:
+    """Test cases for resolve_labels in the submission clients"""
+
+    def test_create_and_edit_with_labels(self, clappia_simulator, make_client):
+        """Test that label-keyed data is stored under field names"""
+        client = make_client(clappia_simulator.handle)
+
+        created = client.create_submission("APP1", {"Employee Name": "Ada", "department": "Ops"}, "a@example.com",
+                                           resolve_labels=True)
+        submission_id = created.data["submissionId"]
+        assert client.edit_submission("APP1", submission_id, {"Department": "Sales"}, "a@example.com",
+                                      resolve_labels=True).success
+
+        assert clappia_simulator.submissions[submission_id]["data"] == {"employee_name": "Ada", "dept": "Sales"}
+
+    def test_index_is_built_once_and_rebuilt_after_schema_change(self, clappia_simulator, make_client):
+        """Test that the definition is loaded once and re-read after add_field"""
+        client = make_client(clappia_simulator.handle, definition_cache=DefinitionCache())
+
+        result = client.create_submissions_bulk("APP1", [{"Employee Name": "Ada"}, {"Salary": 1}], "a@example.com",
+                                                resolve_labels=True)
+        assert [r["success"] for r in result.data["results"]] == [True, False]
+        assert "'Salary' matches no field" in result.data["results"][1]["error"]["message"]
+
+        client.add_field_to_app("APP1", "a@example.com", 0, 2, "counter", "Salary", required=False)
+        assert client.create_submission("APP1", {"Salary": 10}, "a@example.com", resolve_labels=True).success
+
+        assert clappia_simulator.stats()["requests"]["appdefinitionv2/getAppDefinition"] == 2
+        assert client.submissions.get_field_resolution_stats()["builds"] == 2
+
+    def test_unresolved_label_is_not_sent(self, clappia_simulator, make_client):
+        """Test that a create with an unknown label fails before sending"""
+        client = make_client(clappia_simulator.handle)
+        result = client.create_submission("APP1", {"Nmae": "Ada"}, "a@example.com", resolve_labels=True)
+
+        assert result.error_code == "validation_error"
+        assert "submissions/create" not in clappia_simulator.stats()["requests"]
+
+    def test_async_create_with_labels(self, clappia_simulator, make_client):
+        """Test that the async client resolves labels too"""
+        client = make_client(clappia_simulator.ahandle, cls=AsyncSubmissionClient,
+                             transport_cls=AsyncInProcessTransport)
+
+        result = asyncio.run(client.create_submission("APP1", {"Employee Name": "Ada"}, "a@example.com",
+                                                      resolve_labels=True))
+
+        assert clappia_simulator.submissions[result.data["submissionId"]]["data"] == {"employee_name": "Ada"}
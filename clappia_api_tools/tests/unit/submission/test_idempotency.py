@@ -0,0 +1,168 @@
+import asyncio
+import threading
+import time
+
+from clappia_api_tools._utils.idempotency import IdempotencyLedger
+from clappia_api_tools._utils.outbox import DONE, SubmissionOutbox
+from clappia_api_tools._utils.retry import RetryPolicy
+from clappia_api_tools._utils.transport import AsyncInProcessTransport, TransportResponse
+from clappia_api_tools.client.async_clappia_client import AsyncClappiaClient
+
+
+class TestIdempotencyLedger:
+    """Test cases for the idempotency ledger"""
+
+    def test_repeated_create_returns_recorded_result(self, clappia_simulator, make_client):
+        """Test that a second create with the same key is answered from the ledger"""
+        client = make_client(clappia_simulator.handle, idempotency_ledger=IdempotencyLedger())
+
+        first = client.create_submission("APP1", {"name": "Ada"}, "ada@example.com", idempotency_key="order-1")
+        second = client.create_submission("APP1", {"name": "Ada"}, "ada@example.com", idempotency_key="order-1")
+
+        assert first.success and second.success
+        assert second.data["submissionId"] == first.data["submissionId"]
+        assert second.text == first.text
+        assert clappia_simulator.stats()["requests"] == {"submissions/create": 1}
+        assert client.get_idempotency_stats()["hits"] == 1
+
+    def test_content_hash_key_by_default(self, clappia_simulator, make_client):
+        """Test that identical records share a key and different records do not"""
+        client = make_client(clappia_simulator.handle, idempotency_ledger=IdempotencyLedger())
+
+        client.create_submission("APP1", {"name": "Ada"}, "ada@example.com")
+        client.create_submission("APP1", {"name": "Ada"}, "ada@example.com")
+        client.create_submission("APP1", {"name": "Grace"}, "ada@example.com")
+        client.create_submission("APP1", {"name": "Ada"}, "ada@example.com", idempotency_key="second-ada")
+
+        assert clappia_simulator.stats()["requests"] == {"submissions/create": 3}
+
+    def test_make_key_ignores_dict_order(self):
+        """Test that the content hash does not depend on key order"""
+        assert IdempotencyLedger.make_key({"a": 1, "b": {"c": 2, "d": 3}}) == \
+            IdempotencyLedger.make_key({"b": {"d": 3, "c": 2}, "a": 1})
+
+    def test_failures_are_not_recorded(self, clappia_simulator, make_client):
+        """Test that a failed create is sent again on the next attempt"""
+        responses = [TransportResponse(503, content=b"busy")]
+
+        def flaky(request):
+            return responses.pop(0) if responses else clappia_simulator.handle(request)
+
+        client = make_client(flaky, idempotency_ledger=IdempotencyLedger())
+        assert not client.create_submission("APP1", {"name": "Ada"}, "ada@example.com").success
+        assert client.create_submission("APP1", {"name": "Ada"}, "ada@example.com").success
+        assert client.get_idempotency_stats()["recorded"] == 1
+
+    def test_concurrent_creates_share_one_request(self, make_client):
+        """Test that concurrent creates with one key send a single request"""
+        calls = []
+
+        def slow(request):
+            calls.append(1)
+            time.sleep(0.05)
+            return TransportResponse.from_json(200, {"submissionId": "SUB1"})
+
+        client = make_client(slow, idempotency_ledger=IdempotencyLedger())
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                client.create_submission("APP1", {"name": "Ada"}, "ada@example.com", idempotency_key="k")
+            ))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert {r.data["submissionId"] for r in results} == {"SUB1"}
+
+    def test_bulk_resubmission_skips_created_records(self, clappia_simulator, make_client):
+        """Test that resubmitting a batch only sends the records that failed"""
+        failed_once = set()
+
+        def fail_first_grace(request):
+            body = request.json()
+            if body["data"]["name"] == "Grace" and "Grace" not in failed_once:
+                failed_once.add("Grace")
+                return TransportResponse(503, content=b"busy")
+            return clappia_simulator.handle(request)
+
+        client = make_client(fail_first_grace, idempotency_ledger=IdempotencyLedger())
+        records = [{"name": "Ada"}, {"name": "Grace"}, {"name": "Linus"}]
+
+        first = client.create_submissions_bulk("APP1", records, "ada@example.com")
+        assert first.error_code == "partial_failure"
+        second = client.create_submissions_bulk("APP1", records, "ada@example.com")
+
+        assert second.success
+        assert [r["submissionId"] for r in second.data["results"]][::2] == \
+            [r["submissionId"] for r in first.data["results"]][::2]
+        assert clappia_simulator.stats()["requests"] == {"submissions/create": 3}
+
+    def test_bulk_idempotency_keys_must_match_records(self, clappia_simulator, make_client):
+        """Test that a key list of the wrong length is rejected"""
+        client = make_client(clappia_simulator.handle, idempotency_ledger=IdempotencyLedger())
+        result = client.create_submissions_bulk("APP1", [{"name": "Ada"}], "ada@example.com", idempotency_keys=[])
+        assert result.error_code == "validation_error"
+
+    def test_on_disk_ledger_survives_restart(self, tmp_path, clappia_simulator, make_client):
+        """Test that outcomes recorded on disk are honored by a new ledger"""
+        path = str(tmp_path / "ledger.db")
+
+        with IdempotencyLedger(path=path) as ledger:
+            first = make_client(clappia_simulator.handle, idempotency_ledger=ledger).create_submission(
+                "APP1", {"name": "Ada"}, "ada@example.com", idempotency_key="order-1"
+            )
+        with IdempotencyLedger(path=path) as ledger:
+            second = make_client(clappia_simulator.handle, idempotency_ledger=ledger).create_submission(
+                "APP1", {"name": "Ada"}, "ada@example.com", idempotency_key="order-1"
+            )
+
+        assert second.data["submissionId"] == first.data["submissionId"]
+        assert clappia_simulator.stats()["requests"] == {"submissions/create": 1}
+
+    def test_ttl_expiry(self):
+        """Test that expired outcomes are no longer honored"""
+        ledger = IdempotencyLedger(ttl=0.01)
+        ledger.record("k", {"submissionId": "SUB1"})
+        time.sleep(0.02)
+        assert ledger.get("k") is None
+
+    def test_outbox_replay_of_recorded_create_is_not_sent(self, tmp_path, clappia_simulator, make_client):
+        """Test that an outbox entry whose create already succeeded is not sent again"""
+        ledger = IdempotencyLedger()
+        outbox = SubmissionOutbox(
+            str(tmp_path / "outbox.db"), poll_interval=0.01,
+            backoff=RetryPolicy(backoff_base=0.01, backoff_max=0.01, jitter=False),
+        )
+        with outbox:
+            client = make_client(clappia_simulator.handle, idempotency_ledger=ledger, outbox=outbox)
+            queued = client.create_submission("APP1", {"name": "Ada"}, "ada@example.com", idempotency_key="order-1")
+            assert outbox.drain(timeout=5)
+            assert outbox.get(queued.data["outboxId"]).status == DONE
+
+            # A crash after the 200 but before the entry was marked done replays it
+            entry_id = outbox.enqueue("POST", "submissions/create", outbox.get(queued.data["outboxId"]).data,
+                                      idempotency_key="order-1")
+            assert outbox.drain(timeout=5)
+            assert outbox.get(entry_id).response == outbox.get(queued.data["outboxId"]).response
+
+            again = client.create_submission("APP1", {"name": "Ada"}, "ada@example.com", idempotency_key="order-1")
+            assert "outboxId" not in again.data
+        assert clappia_simulator.stats()["requests"] == {"submissions/create": 1}
+
+    def test_async_client_uses_ledger(self, clappia_simulator, make_client):
+        """Test that the async client answers repeated creates from the ledger"""
+        client = make_client(clappia_simulator.ahandle, cls=AsyncClappiaClient,
+                             transport_cls=AsyncInProcessTransport, idempotency_ledger=IdempotencyLedger())
+
+        async def run():
+            return await asyncio.gather(*(
+                client.create_submission("APP1", {"name": "Ada"}, "ada@example.com") for _ in range(3)
+            ))
+
+        results = asyncio.run(run())
+        assert len({r.data["submissionId"] for r in results}) == 1
+        assert clappia_simulator.stats()["requests"] == {"submissions/create": 1}
@@ -0,0 +1,153 @@
+import threading
+
+from clappia_api_tools._utils.outbox import DONE, FAILED, INFLIGHT, SubmissionOutbox, is_transient_error
+from clappia_api_tools._utils.retry import RetryPolicy
+from clappia_api_tools._utils.transport import TransportConnectionError, TransportResponse
+
+FAST_BACKOFF = RetryPolicy(backoff_base=0.01, backoff_max=0.01, jitter=False)
+
+
+def _outbox(tmp_path, **kwargs):
+    kwargs.setdefault("backoff", FAST_BACKOFF)
+    kwargs.setdefault("poll_interval", 0.01)
+    return SubmissionOutbox(str(tmp_path / "outbox.db"), **kwargs)
+
+
+class TestSubmissionOutbox:
+    """Test cases for the durable submission outbox"""
+
+    def test_create_returns_queued_then_delivers(self, tmp_path, clappia_simulator, make_client):
+        """Test that create_submission returns before delivery and the entry is marked done"""
+        with _outbox(tmp_path) as outbox:
+            client = make_client(clappia_simulator.handle, outbox=outbox)
+            result = client.create_submission("APP1", {"name": "Ada"}, "ada@example.com")
+
+            assert result.success
+            assert result.data["status"] == "queued"
+            assert "Queued submission for delivery" in result.text
+            assert outbox.drain(timeout=5)
+
+            entry = outbox.get(result.data["outboxId"])
+            assert entry.status == DONE
+            assert entry.attempts == 1
+            assert entry.response["submissionId"].startswith("SIM")
+            assert client.get_outbox_stats()["delivered"] == 1
+
+    def test_string_api_reports_outbox_entry(self, tmp_path, clappia_simulator, make_client):
+        """Test that the string API describes the queued entry"""
+        with _outbox(tmp_path) as outbox:
+            client = make_client(clappia_simulator.handle, outbox=outbox, structured_results=False)
+            result = client.edit_submission("APP1", "SUB1", {"name": "Ada"}, "ada@example.com")
+            assert result.startswith("Queued submission for delivery")
+            assert '"submissionId": "SUB1"' in result
+
+    def test_validation_errors_are_not_queued(self, tmp_path, clappia_simulator, make_client):
+        """Test that invalid input is rejected without touching the outbox"""
+        with _outbox(tmp_path) as outbox:
+            client = make_client(clappia_simulator.handle, outbox=outbox)
+            result = client.create_submission("APP1", {}, "ada@example.com")
+            assert result.error_code == "validation_error"
+            assert outbox.entries() == []
+
+    def test_transient_failures_are_retried(self, tmp_path, clappia_simulator, make_client):
+        """Test that connection errors and 5xx responses are replayed until a 200"""
+        failures = [TransportConnectionError("refused", request_sent=False), TransportResponse(503, content=b"busy")]
+
+        def flaky(request):
+            if failures:
+                failure = failures.pop(0)
+                if isinstance(failure, Exception):
+                    raise failure
+                return failure
+            return clappia_simulator.handle(request)
+
+        with _outbox(tmp_path) as outbox:
+            client = make_client(flaky, outbox=outbox)
+            entry_id = client.create_submission("APP1", {"name": "Ada"}, "ada@example.com").data["outboxId"]
+            assert outbox.drain(timeout=5)
+            entry = outbox.get(entry_id)
+            assert entry.status == DONE
+            assert entry.attempts == 3
+            assert outbox.stats()["retried"] == 2
+
+    def test_permanent_failures_are_parked(self, tmp_path, make_client):
+        """Test that a 400 rejection is marked failed without retrying"""
+        def reject(request):
+            return TransportResponse.from_json(400, {"message": "bad field"})
+
+        with _outbox(tmp_path) as outbox:
+            client = make_client(reject, outbox=outbox)
+            entry_id = client.create_submission("APP1", {"name": "Ada"}, "ada@example.com").data["outboxId"]
+            assert outbox.drain(timeout=5)
+            entry = outbox.get(entry_id)
+            assert entry.status == FAILED
+            assert entry.attempts == 1
+            assert entry.last_error.startswith("API Error (400)")
+
+    def test_max_attempts_parks_transient_failures(self, tmp_path, make_client):
+        """Test that an entry stops being retried after max_attempts"""
+        def unreachable(request):
+            raise TransportConnectionError("refused", request_sent=False)
+
+        with _outbox(tmp_path, max_attempts=3) as outbox:
+            client = make_client(unreachable, outbox=outbox)
+            entry_id = client.create_submission("APP1", {"name": "Ada"}, "ada@example.com").data["outboxId"]
+            assert outbox.drain(timeout=5)
+            entry = outbox.get(entry_id)
+            assert entry.status == FAILED
+            assert entry.attempts == 3
+            assert outbox.retry_failed() == 1
+            assert outbox.drain(timeout=5)
+            assert outbox.stats()["permanentlyFailed"] == 2
+
+    def test_pending_work_is_replayed_after_restart(self, tmp_path, clappia_simulator, make_client):
+        """Test that entries queued or in flight when a process died are delivered on restart"""
+        crashed = _outbox(tmp_path)
+        queued = crashed.enqueue("POST", "submissions/create", {
+            "workplaceId": "TEST123", "appId": "APP1", "requestingUserEmailAddress": "a@example.com", "data": {"n": 1},
+        })
+        claimed = crashed.enqueue("POST", "submissions/create", {
+            "workplaceId": "TEST123", "appId": "APP1", "requestingUserEmailAddress": "a@example.com", "data": {"n": 2},
+        })
+        assert crashed._claim().id == queued
+        assert crashed.get(queued).status == INFLIGHT
+        crashed._conn.close()
+
+        with _outbox(tmp_path) as outbox:
+            make_client(clappia_simulator.handle, outbox=outbox)
+            assert outbox.drain(timeout=5)
+            assert outbox.get(queued).status == DONE
+            assert outbox.get(claimed).status == DONE
+        assert clappia_simulator.stats()["requests"] == {"submissions/create": 2}
+
+    def test_edits_of_one_submission_keep_their_order(self, tmp_path, make_client):
+        """Test that edits sharing a submission are delivered one at a time, in order"""
+        seen = []
+        lock = threading.Lock()
+
+        def record(request):
+            body = request.json()
+            with lock:
+                seen.append((body["submissionId"], body["data"]["step"]))
+            return TransportResponse.from_json(200, {"submissionId": body["submissionId"]})
+
+        with _outbox(tmp_path, max_workers=4) as outbox:
+            client = make_client(record, outbox=outbox)
+            outbox.stop()
+            for step in range(10):
+                client.edit_submission("APP1", "SUB1", {"step": step}, "ada@example.com")
+                client.edit_submission("APP1", "SUB2", {"step": step}, "ada@example.com")
+            outbox.start(client.submissions._send_outbox_entry)
+            assert outbox.drain(timeout=5)
+
+        assert [step for sid, step in seen if sid == "SUB1"] == list(range(10))
+        assert [step for sid, step in seen if sid == "SUB2"] == list(range(10))
+
+    def test_is_transient_error(self):
+        """Test the classification of make_request errors"""
+        assert is_transient_error("Connection error - unable to reach Clappia API")
+        assert is_transient_error("Request timeout after 30 seconds")
+        assert is_transient_error("Unexpected API response (503): busy")
+        assert is_transient_error("Rate limit exceeded - no request slot available for submissions/create")
+        assert not is_transient_error("API Error (400): {}")
+        assert not is_transient_error("Unexpected error: boom")
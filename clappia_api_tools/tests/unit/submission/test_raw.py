@@ -0,0 +1,92 @@
+import asyncio
+import json
+
+from clappia_api_tools._models.model import RawResult
+from clappia_api_tools._utils.raw_body import RawBodyTemplate, check_raw_object
+from clappia_api_tools._utils.transport import AsyncInProcessTransport
+from clappia_api_tools.client.async_clappia_client import AsyncClappiaClient
+
+
+class TestRawBody:
+    """Test cases for the raw body helpers"""
+
+    def test_template_splices_payload(self):
+        """Test that the payload bytes are embedded unchanged after the members"""
+        template = RawBodyTemplate({"workplaceId": "WP1", "appId": "APP1"})
+        payload = b'{"name": "Ada",  "n": 1.50}'
+        body = template.render(payload, submissionId="S1")
+        assert body == b'{"workplaceId":"WP1","appId":"APP1","submissionId":"S1","data":' + payload + b"}"
+        assert json.loads(body)["data"] == {"name": "Ada", "n": 1.5}
+
+    def test_check_raw_object(self):
+        """Test the shape check of pre-encoded payloads"""
+        assert check_raw_object(b' {"a": 1}\n') is None
+        assert check_raw_object(memoryview(b'{"a":1}')) is None
+        assert "bytes" in check_raw_object({"a": 1})
+        assert "JSON object" in check_raw_object(b"[1]")
+        assert "cannot be empty" in check_raw_object(b"{ }")
+
+    def test_extract_and_json(self):
+        """Test scalar lookup in the undecoded body and full decoding"""
+        result = RawResult(success=True, content=b'{"submissionId":"S\\"1","count":3,"ok":true,"x":{"y":null}}')
+        assert result.extract("submissionId") == 'S"1'
+        assert result.extract("count") == 3
+        assert result.extract("y") is None
+        assert result.extract("missing", "-") == "-"
+        assert result.json()["ok"] is True
+
+
+class TestRawClients:
+    """Test cases for the raw client methods"""
+
+    def test_create_and_edit_raw(self, clappia_simulator, make_client):
+        """Test that raw creates and edits reach the API with the payload as sent"""
+        client = make_client(clappia_simulator.handle)
+
+        result = client.create_submission_raw("MFX093412", b'{"name":"a"}', "user@example.com")
+        assert isinstance(result, RawResult) and result.success
+        submission_id = result.extract("submissionId")
+        assert clappia_simulator.submissions[submission_id]["data"] == {"name": "a"}
+
+        edited = client.edit_submission_raw("MFX093412", submission_id, b'{"name":"b"}', "user@example.com")
+        assert edited.success
+        assert clappia_simulator.submissions[submission_id]["data"] == {"name": "b"}
+
+    def test_invalid_payload_not_sent(self, make_client):
+        """Test that a payload failing the shape check is rejected before any request"""
+        seen = []
+        client = make_client(seen.append)
+        result = client.create_submission_raw("MFX093412", b"[]", "user@example.com")
+        assert isinstance(result, RawResult)
+        assert result.error_code == "validation_error"
+        assert seen == []
+
+    def test_get_definition_raw_skips_cache(self, clappia_simulator, make_client):
+        """Test that raw definitions are fetched every time and decode on demand"""
+        clappia_simulator.add_app("MFX093412", name="Inspections")
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            return clappia_simulator.handle(request)
+
+        client = make_client(handler)
+        first = client.get_app_definition_raw("MFX093412")
+        second = client.get_app_definition_raw("MFX093412")
+        assert first.success and first.content == second.content
+        assert len(calls) == 2
+        assert "Inspections" in json.dumps(first.json())
+
+    def test_async_create_raw(self, clappia_simulator, make_client):
+        """Test the async raw create"""
+
+        async def handler(request):
+            return clappia_simulator.handle(request)
+
+        async def run():
+            async with make_client(handler, cls=AsyncClappiaClient, transport_cls=AsyncInProcessTransport) as client:
+                return await client.create_submission_raw("MFX093412", b'{"name":"a"}', "user@example.com")
+
+        result = asyncio.run(run())
+        assert result.success
+        assert result.extract("submissionId") in clappia_simulator.submissions
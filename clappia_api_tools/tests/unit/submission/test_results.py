@@ -0,0 +1,110 @@
+from unittest.mock import patch, Mock
+from clappia_api_tools._models.model import ClappiaResult
+from clappia_api_tools.client.submission_client import SubmissionClient
+from clappia_api_tools.client.app_definition_client import AppDefinitionClient
+
+
+def _client(cls=SubmissionClient, **kwargs):
+    return cls(
+        api_key="test_key",
+        base_url="https://test.com",
+        workplace_id="TEST123",
+        **kwargs,
+    )
+
+
+class TestClappiaResult:
+    """Test cases for ClappiaResult"""
+
+    def test_from_error_validation(self):
+        """Test that validator messages are classified as validation errors"""
+        result = ClappiaResult.from_error("Error: Invalid app_id")
+        assert result.success is False
+        assert result.error == "Invalid app_id"
+        assert result.error_code == "validation_error"
+        assert result.text == "Error: Invalid app_id"
+
+    def test_from_error_api_status(self):
+        """Test that API errors carry their HTTP status code"""
+        result = ClappiaResult.from_error("API Error (404): not found")
+        assert result.error_code == "api_error"
+        assert result.status_code == 404
+
+    def test_from_error_timeout(self):
+        """Test that timeouts are classified"""
+        result = ClappiaResult.from_error("Request timeout after 30 seconds")
+        assert result.error_code == "timeout"
+        assert result.status_code is None
+
+    def test_text_rendered_lazily_once(self):
+        """Test that the renderer only runs when text is first accessed"""
+        renderer = Mock(return_value="Rendered")
+        result = ClappiaResult(success=True, data={}, renderer=renderer)
+        renderer.assert_not_called()
+        assert str(result) == "Rendered"
+        assert result.text == "Rendered"
+        renderer.assert_called_once()
+
+
+class TestStructuredResults:
+    """Test cases for clients created with structured_results=True"""
+
+    @patch("clappia_api_tools._utils.api_utils.ClappiaAPIUtils.make_request")
+    def test_success_result(self, mock_request):
+        """Test that a successful call returns data without rendering text"""
+        mock_request.return_value = (True, None, {"submissionId": "SUB1"})
+        client = _client(structured_results=True)
+
+        with patch.object(client, "_format_create_submission") as formatter:
+            result = client.create_submission("MFX093412", {"name": "x"}, "test@example.com")
+            formatter.assert_not_called()
+
+        assert isinstance(result, ClappiaResult)
+        assert result.success is True
+        assert result.data == {"submissionId": "SUB1"}
+        assert result.elapsed >= 0
+
+    @patch("clappia_api_tools._utils.api_utils.ClappiaAPIUtils.make_request")
+    def test_text_matches_string_mode(self, mock_request):
+        """Test that result.text is identical to what the string API returns"""
+        mock_request.return_value = (True, None, {"submissionId": "SUB1"})
+        structured = _client(structured_results=True).create_submission(
+            "MFX093412", {"name": "x"}, "test@example.com"
+        )
+        plain = _client().create_submission("MFX093412", {"name": "x"}, "test@example.com")
+        assert isinstance(plain, str)
+        assert structured.text == plain
+
+    @patch("clappia_api_tools._utils.api_utils.ClappiaAPIUtils.make_request")
+    def test_api_error_result(self, mock_request):
+        """Test that failed API calls are classified with their status code"""
+        mock_request.return_value = (False, "API Error (403): forbidden", None)
+        client = _client(AppDefinitionClient, structured_results=True)
+        result = client.get_definition("MFX093412")
+        assert result.success is False
+        assert result.error_code == "api_error"
+        assert result.status_code == 403
+        assert result.text == "Error: API Error (403): forbidden"
+
+    def test_validation_error_result(self):
+        """Test that validation failures are returned as results, not strings"""
+        result = _client(structured_results=True).create_submission(
+            "invalid-id", {}, "test@example.com"
+        )
+        assert result.error_code == "validation_error"
+        assert result.text.startswith("Error: Invalid app_id")
+
+    @patch("clappia_api_tools._utils.api_utils.ClappiaAPIUtils.make_request")
+    def test_bulk_partial_failure(self, mock_request):
+        """Test that bulk results expose per-record data and a partial failure code"""
+        mock_request.side_effect = [
+            (True, None, {"submissionId": "SUB0"}),
+            (False, "API Error (400): bad", None),
+        ]
+        result = _client(structured_results=True).create_submissions_bulk(
+            "MFX093412", [{"a": 1}, {"a": 2}], "test@example.com", max_concurrency=1
+        )
+        assert result.success is False
+        assert result.error_code == "partial_failure"
+        assert [r["success"] for r in result.data["results"]] == [True, False]
+        assert "Created submissions with partial failures" in result.text
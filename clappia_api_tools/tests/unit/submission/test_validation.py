@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from clappia_api_tools._utils.definition_cache import DefinitionCache
+from clappia_api_tools._utils.schema_validator import SubmissionSchema, SubmissionValidator
+from clappia_api_tools._utils.transport import AsyncInProcessTransport
+from clappia_api_tools.client.async_submission_client import AsyncSubmissionClient
+from clappia_api_tools.simulator import ClappiaSimulator
+
+FIELDS = [
+    {"fieldName": "name", "fieldType": "singleLineText", "label": "Name"},
+    {"fieldName": "age", "fieldType": "counter", "label": "Age"},
+    {"fieldName": "joined", "fieldType": "dateSelector", "label": "Joined"},
+    {"fieldName": "team", "fieldType": "dropDown", "label": "Team", "options": ["Red", "Blue"]},
+    {"fieldName": "skills", "fieldType": "multiSelector", "label": "Skills", "options": ["Go", "Python"]},
+    {"fieldName": "photo", "fieldType": "file", "label": "Photo", "maxFileAllowed": 1},
+]
+
+PHOTO = [{"s3Path": {"bucket": "files", "key": "a.jpg", "makePublic": False}}]
+
+
+@pytest.fixture
+def clappia_simulator():
+    """Simulator holding APP1 with the fields above"""
+    simulator = ClappiaSimulator(auto_create_apps=False)
+    simulator.add_app("APP1", fields=FIELDS)
+    return simulator
+
+
+class TestSubmissionSchema:
+    """Test cases for checks compiled from an app definition"""
+
+    def setup_method(self):
+        self.schema = SubmissionSchema.compile(
+            {"appId": "APP1", "version": 1, "fieldDefinitions": {f["fieldName"]: f for f in FIELDS}}
+        )
+
+    def test_valid_record_passes(self):
+        """Test that values matching every field type are accepted"""
+        assert self.schema.validate({
+            "name": "Ada", "age": "36", "joined": "15-01-2024", "team": "Red",
+            "skills": "Go, Python", "photo": PHOTO,
+        }) == []
+
+    def test_unknown_field_suggests_close_match(self):
+        """Test that misspelled field names are reported with a suggestion"""
+        assert self.schema.validate({"nmae": "Ada"}) == ["unknown field 'nmae' (did you mean 'name'?)"]
+
+    def test_malformed_values_are_reported(self):
+        """Test that numbers, dates, options and s3Path objects are checked"""
+        problems = self.schema.validate({
+            "age": "old", "joined": "yesterday", "team": "Green", "skills": ["Go", "Rust"],
+            "photo": [{"s3Path": {"bucket": "files"}}],
+        })
+        assert [problem.split(":")[0] for problem in problems] == ["'age'", "'joined'", "'team'", "'skills'", "'photo'"]
+        assert 'needs a non-empty "key"' in problems[-1]
+
+    def test_file_limit_and_nulls(self):
+        """Test that maxFileAllowed is enforced and None clears any field"""
+        assert self.schema.validate({"photo": PHOTO * 2}) == ["'photo': at most 1 files allowed, got 2"]
+        assert self.schema.validate({"team": None, "photo": None}) == []
+
+    def test_unrecognized_definition_accepts_everything(self):
+        """Test that a definition without a field list does not reject valid data"""
+        assert SubmissionSchema.compile({"appId": "APP1"}).validate({"anything": 1}) == []
+
+
+class TestSubmissionValidation:
+    """Test cases for pre-flight validation in the submission clients"""
+
+    def test_invalid_create_is_not_sent(self, clappia_simulator, make_client):
+        """Test that a rejected create never reaches the API"""
+        client = make_client(clappia_simulator.handle, submission_validator=SubmissionValidator())
+
+        result = client.create_submission("APP1", {"team": "Green"}, "ada@example.com")
+
+        assert not result.success and result.error_code == "validation_error"
+        assert "'team'" in result.error
+        assert "submissions/create" not in clappia_simulator.stats()["requests"]
+
+    def test_schema_is_compiled_once_per_version(self, clappia_simulator, make_client):
+        """Test that the definition is fetched and compiled once for many records"""
+        client = make_client(clappia_simulator.handle, submission_validator=SubmissionValidator())
+
+        for n in range(5):
+            assert client.create_submission("APP1", {"name": f"n{n}"}, "ada@example.com").success
+        result = client.create_submissions_bulk("APP1", [{"name": "x"}, {"age": "x"}], "ada@example.com")
+
+        assert [r["success"] for r in result.data["results"]] == [True, False]
+        assert result.data["results"][1]["error"]["stage"] == "validation"
+        assert clappia_simulator.stats()["requests"]["appdefinitionv2/getAppDefinition"] == 1
+        assert client.get_validation_stats()["compiles"] == 1
+
+    def test_shared_cache_picks_up_new_fields(self, clappia_simulator, make_client):
+        """Test that adding a field through the client makes it valid immediately"""
+        cache = DefinitionCache()
+        client = make_client(clappia_simulator.handle, definition_cache=cache,
+                             submission_validator=SubmissionValidator(cache))
+        assert not client.create_submission("APP1", {"notes": "hi"}, "ada@example.com").success
+
+        client.add_field_to_app("APP1", "ada@example.com", 0, 0, "multiLineText", "Notes", required=False)
+        fields = clappia_simulator.apps["APP1"]["fields"]
+        field_name = next(name for name, f in fields.items() if f.get("label") == "Notes")
+
+        assert client.create_submission("APP1", {field_name: "hi"}, "ada@example.com").success
+        assert client.get_validation_stats()["compiles"] == 2
+
+    def test_options_are_checked_unstripped(self, clappia_simulator, make_client):
+        """Test that option values that look like HTML are accepted with derived variants on"""
+        clappia_simulator.add_app("APP2", fields=[
+            {"fieldName": "size", "fieldType": "dropDown", "label": "<b>Size</b>", "options": ["S &amp; M", "<L>"]},
+        ])
+        cache = DefinitionCache(derive_variants=True)
+        client = make_client(clappia_simulator.handle, definition_cache=cache,
+                             submission_validator=SubmissionValidator(cache))
+
+        assert client.create_submission("APP2", {"size": "<L>"}, "ada@example.com").success
+        assert client.create_submission("APP2", {"size": "S &amp; M"}, "ada@example.com").success
+        assert not client.create_submission("APP2", {"size": "XL"}, "ada@example.com").success
+
+    def test_unavailable_definition_sends_unchecked(self, make_client):
+        """Test that data is sent when the definition cannot be loaded"""
+        client = make_client(ClappiaSimulator().handle, submission_validator=SubmissionValidator())
+
+        assert client.create_submission("NEWAPP", {"anything": "x"}, "ada@example.com").success
+        assert client.get_validation_stats()["unavailable"] == 1
+
+    def test_async_edit_is_validated(self, clappia_simulator, make_client):
+        """Test that the async client rejects invalid edits before sending"""
+        client = make_client(clappia_simulator.ahandle, cls=AsyncSubmissionClient,
+                             transport_cls=AsyncInProcessTransport, submission_validator=SubmissionValidator())
+
+        result = asyncio.run(client.edit_submission("APP1", "SIM000001", {"joined": "soon"}, "ada@example.com"))
+
+        assert not result.success and "'joined'" in result.error
+        assert "submissions/edit" not in clappia_simulator.stats()["requests"]
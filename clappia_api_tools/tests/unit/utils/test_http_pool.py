@@ -0,0 +1,75 @@
+from clappia_api_tools._utils.http_pool import PoolConfig, SessionPool
+from clappia_api_tools._utils.api_utils import ClappiaAPIUtils
+from clappia_api_tools.client.clappia_client import ClappiaClient
+
+
+class TestSessionPool:
+    """Test cases for SessionPool"""
+
+    def test_same_base_url_and_config_share_session(self):
+        """Test that clients with the same configuration reuse one session"""
+        pool = SessionPool()
+        first = pool.get_session("https://api.clappia.com", PoolConfig())
+        second = pool.get_session("https://API.clappia.com/", PoolConfig())
+        assert first is second
+
+    def test_different_config_gets_separate_session(self):
+        """Test that a different pool configuration gets its own session"""
+        pool = SessionPool()
+        first = pool.get_session("https://api.clappia.com", PoolConfig())
+        second = pool.get_session("https://api.clappia.com", PoolConfig(pool_maxsize=50))
+        other_host = pool.get_session("https://other.clappia.com", PoolConfig())
+        assert first is not second
+        assert first is not other_host
+
+    def test_adapter_uses_pool_config(self):
+        """Test that pool sizes and blocking are applied to the mounted adapter"""
+        pool = SessionPool()
+        session = pool.get_session(
+            "https://api.clappia.com", PoolConfig(pool_maxsize=25, pool_block=True)
+        )
+        adapter = session.get_adapter("https://api.clappia.com")
+        assert adapter._pool_maxsize == 25
+        assert adapter._pool_block is True
+
+    def test_keep_alive_disabled_sends_connection_close(self):
+        """Test that disabling keep-alive sets the Connection header"""
+        pool = SessionPool()
+        session = pool.get_session("https://api.clappia.com", PoolConfig(keep_alive=False))
+        assert session.headers["Connection"] == "close"
+
+    def test_stats_include_config(self):
+        """Test that stats expose the pool configuration"""
+        pool = SessionPool()
+        pool.get_session("https://api.clappia.com", PoolConfig(pool_maxsize=5))
+        stats = pool.stats()
+        assert stats["https://api.clappia.com"]["config"]["poolMaxsize"] == 5
+        assert stats["https://api.clappia.com"]["hosts"] == {}
+
+    def test_close_clears_sessions(self):
+        """Test that close forgets all sessions"""
+        pool = SessionPool()
+        first = pool.get_session("https://api.clappia.com")
+        pool.close()
+        assert pool.get_session("https://api.clappia.com") is not first
+
+
+class TestSharedSessions:
+    """Test cases for session sharing between clients"""
+
+    def test_api_utils_share_session(self):
+        """Test that two API utils with the same config share a session"""
+        first = ClappiaAPIUtils("key", "https://test.com", "WP1")
+        second = ClappiaAPIUtils("other", "https://test.com", "WP2")
+        assert first.session is second.session
+
+    def test_clappia_client_shares_api_utils(self):
+        """Test that ClappiaClient builds a single API utils for all clients"""
+        client = ClappiaClient(
+            api_key="test_key",
+            base_url="https://test.com",
+            workplace_id="TEST123",
+            pool_config=PoolConfig(pool_maxsize=20),
+        )
+        assert client.submissions.api_utils is client.app_definition.api_utils
+        assert client.get_pool_stats()["config"]["poolMaxsize"] == 20
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from clappia_api_tools._utils import json_codec
+from clappia_api_tools._utils.api_utils import ClappiaAPIUtils
+from clappia_api_tools._utils.json_codec import OrjsonCodec, StdlibJsonCodec, get_default_codec
+from clappia_api_tools._utils.retry import RetryConfig
+from clappia_api_tools._utils.transport import InProcessTransport, TransportResponse
+
+PAYLOAD = {"appId": "APP1", "data": {"name": "Zoë", "count": 3, "ratio": 0.5, "tags": ["a", None, True]}}
+
+CODECS = [StdlibJsonCodec()] + ([OrjsonCodec()] if json_codec.orjson is not None else [])
+
+
+class CountingCodec(StdlibJsonCodec):
+    name = "counting"
+
+    def __init__(self):
+        self.encoded = 0
+        self.decoded = 0
+
+    def encode(self, value):
+        self.encoded += 1
+        return super().encode(value)
+
+    def decode(self, data):
+        self.decoded += 1
+        return super().decode(data)
+
+
+class TestCodecs:
+    """Test cases for the JSON codec backends"""
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_round_trip_compact_bytes(self, codec):
+        """Test that encode produces compact UTF-8 bytes that decode back"""
+        encoded = codec.encode(PAYLOAD)
+        assert isinstance(encoded, bytes)
+        assert b", " not in encoded and b": " not in encoded
+        assert "Zoë".encode("utf-8") in encoded
+        assert codec.decode(encoded) == PAYLOAD
+        assert codec.decode(memoryview(encoded)) == PAYLOAD
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_pretty_and_errors(self, codec):
+        """Test indented rendering and that invalid input raises ValueError"""
+        assert json.loads(codec.pretty(PAYLOAD)) == PAYLOAD
+        assert "\n  " in codec.pretty(PAYLOAD)
+        with pytest.raises(ValueError):
+            codec.decode(b"not json")
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_rejects_non_finite_floats(self, codec):
+        """Test that NaN and Infinity are refused rather than sent as null"""
+        for value in (float("nan"), float("inf")):
+            with pytest.raises(ValueError):
+                codec.encode({"data": {"n": [1, value]}})
+        assert codec.decode(codec.encode({"n": None, "x": 1.5})) == {"n": None, "x": 1.5}
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_pretty_matches_stdlib(self, codec):
+        """Test that formatted results read the same whichever backend is installed"""
+        value = {"name": "José", "big": 1e20, 1: [0.1]}
+        assert codec.pretty(value) == json.dumps(value, indent=2)
+
+    def test_base_codec_is_abstract(self):
+        """Test that a codec must implement encode, decode and pretty"""
+        with pytest.raises(TypeError):
+            json_codec.JsonCodec()
+
+    def test_default_prefers_orjson(self, monkeypatch):
+        """Test the automatic backend selection and its override"""
+        monkeypatch.setattr(json_codec, "_default_codec", None)
+        expected = "orjson" if json_codec.orjson is not None else "json"
+        assert get_default_codec().name == expected
+
+        codec = StdlibJsonCodec()
+        json_codec.set_default_codec(codec)
+        assert get_default_codec() is codec
+
+
+class TestApiUtilsCodec:
+    """Test cases for the codec in the request path"""
+
+    def test_requests_and_responses_go_through_codec(self):
+        """Test that the body is encoded and the response decoded by the configured codec"""
+        codec = CountingCodec()
+        seen = []
+
+        def handler(request):
+            seen.append(request.body)
+            return TransportResponse.from_json(200, {"submissionId": "S1"})
+
+        utils = ClappiaAPIUtils("key", "https://sim.local", "WP1", retry_config=RetryConfig.disabled(),
+                                transport=InProcessTransport(handler), json_codec=codec)
+        success, _, data = utils.make_request("POST", "submissions/create", data=PAYLOAD)
+
+        assert success and data == {"submissionId": "S1"}
+        assert seen == [codec.encode(PAYLOAD)]
+        assert (codec.encoded, codec.decoded) == (2, 1)
+
+    def test_invalid_json_response(self):
+        """Test that an undecodable 200 body is returned raw"""
+        utils = ClappiaAPIUtils("key", "https://sim.local", "WP1", retry_config=RetryConfig.disabled(),
+                                transport=InProcessTransport(lambda request: TransportResponse(200, {}, b"<html>")))
+        assert utils.make_request("GET", "ping") == (True, None, {"raw_response": "<html>"})
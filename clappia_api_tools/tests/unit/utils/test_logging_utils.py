@@ -0,0 +1,64 @@
+import logging
+from unittest.mock import Mock
+from clappia_api_tools._utils.logging_utils import (
+    BodyPreview,
+    LogLevel,
+    PACKAGE_LOGGER_NAME,
+    get_logger,
+)
+
+
+class TestLogger:
+    """Test cases for the stdlib-backed Logger"""
+
+    def test_loggers_nest_under_package(self):
+        """Test that module loggers are children of the package logger"""
+        assert get_logger("clappia_api_tools.client.x").name == "clappia_api_tools.client.x"
+        assert get_logger("other").name == f"{PACKAGE_LOGGER_NAME}.other"
+
+    def test_records_reach_stdlib_handlers(self, caplog):
+        """Test that %-style arguments are formatted by stdlib logging"""
+        logger = get_logger("clappia_api_tools.tests.records")
+        with caplog.at_level(logging.INFO, logger=PACKAGE_LOGGER_NAME):
+            logger.info("Created %d submissions for %s", 3, "APP1")
+        assert "Created 3 submissions for APP1" in caplog.text
+
+    def test_disabled_level_skips_formatting(self):
+        """Test that arguments are never rendered when the level is disabled"""
+        logger = get_logger("clappia_api_tools.tests.lazy", LogLevel.WARNING)
+        body = Mock()
+        body.__str__ = Mock(return_value="body")
+        logger.debug("Request data: %s", body)
+        logger.info("Request data: %s", body)
+        body.__str__.assert_not_called()
+
+    def test_package_level_silences_children(self, caplog):
+        """Test that setting the package logger level silences module loggers"""
+        package_logger = logging.getLogger(PACKAGE_LOGGER_NAME)
+        previous = package_logger.level
+        try:
+            package_logger.setLevel(logging.ERROR)
+            logger = get_logger("clappia_api_tools.tests.silenced")
+            logger.info("hidden")
+            assert logger.level == LogLevel.ERROR
+            assert "hidden" not in caplog.text
+        finally:
+            package_logger.setLevel(previous)
+
+
+class TestBodyPreview:
+    """Test cases for BodyPreview"""
+
+    def test_serializes_dict(self):
+        """Test that dict bodies are rendered as compact JSON"""
+        assert str(BodyPreview({"a": 1})) == '{"a": 1}'
+
+    def test_truncates_large_bodies(self):
+        """Test that bodies over the limit are truncated"""
+        preview = str(BodyPreview("x" * 50, limit=10))
+        assert preview == "xxxxxxxxxx... [truncated 40 chars]"
+
+    def test_reads_response_text(self):
+        """Test that response objects are rendered from their text"""
+        response = Mock(text="response body")
+        assert str(BodyPreview(response)) == "response body"
@@ -0,0 +1,175 @@
+import asyncio
+import threading
+import urllib.request
+
+import pytest
+
+from clappia_api_tools._utils.api_utils import ClappiaAPIUtils
+from clappia_api_tools._utils.async_api_utils import AsyncClappiaAPIUtils
+from clappia_api_tools._utils.definition_cache import DefinitionCache
+from clappia_api_tools._utils.metrics import ClientMetrics, MetricsSink, PrometheusExporter
+from clappia_api_tools._utils.rate_limit import RateLimit, RateLimiter
+from clappia_api_tools._utils.retry import RetryConfig, RetryPolicy
+from clappia_api_tools._utils.transport import (
+    AsyncInProcessTransport,
+    InProcessTransport,
+    TransportResponse,
+    TransportTimeout,
+)
+
+
+def _utils(handler, metrics, **kwargs):
+    return ClappiaAPIUtils(
+        "key", "https://sim.local", "WP1",
+        retry_config=kwargs.pop("retry_config", RetryConfig.disabled()),
+        transport=InProcessTransport(handler),
+        metrics=metrics,
+        **kwargs,
+    )
+
+
+class TestClientMetrics:
+    """Test cases for recording and merging metrics"""
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that latencies land in the first bucket whose bound they do not exceed"""
+        metrics = ClientMetrics(latency_buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 3.0):
+            metrics.observe_request("submissions/create", 200, None, seconds, 10, 5)
+
+        latency = metrics.snapshot()["endpoints"]["submissions/create"]["latency"]
+        assert latency["buckets"] == {0.1: 2, 1.0: 3, float("inf"): 4}
+        assert latency["count"] == 4 and latency["sum"] == pytest.approx(3.65)
+
+    def test_shards_from_threads_are_merged(self):
+        """Test that updates recorded on many threads add up"""
+        metrics = ClientMetrics()
+
+        def record():
+            for _ in range(1000):
+                metrics.observe_request("submissions/create", 200, None, 0.01, 100, 20)
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        entry = metrics.snapshot()["endpoints"]["submissions/create"]
+        assert entry["requests"] == {"200": 8000}
+        assert (entry["bytesSent"], entry["bytesReceived"]) == (800000, 160000)
+        assert entry["latency"]["count"] == 8000
+
+    def test_finished_threads_are_retired(self):
+        """Test that shards of finished threads are folded together without losing counts"""
+        metrics = ClientMetrics()
+        for _ in range(50):
+            thread = threading.Thread(target=metrics.observe_request,
+                                      args=("submissions/create", 200, None, 0.01, 1, 1))
+            thread.start()
+            thread.join()
+
+        entry = metrics.snapshot()["endpoints"]["submissions/create"]
+        assert entry["requests"] == {"200": 50} and entry["latency"]["count"] == 50
+        assert metrics._shards == []
+        metrics.reset()
+        assert metrics.snapshot()["endpoints"] == {}
+
+    def test_invalid_buckets(self):
+        """Test that bucket bounds must increase"""
+        with pytest.raises(ValueError):
+            ClientMetrics(latency_buckets=(1.0, 0.5))
+
+
+class TestRequestPathMetrics:
+    """Test cases for the metrics recorded by the API utilities"""
+
+    def test_statuses_errors_bytes_and_retries(self):
+        """Test that each attempt and retry is counted under its endpoint"""
+        metrics = ClientMetrics()
+        responses = iter([TransportResponse.from_json(503, {}), TransportResponse.from_json(200, {"ok": True})])
+        utils = _utils(
+            lambda request: next(responses), metrics,
+            retry_config=RetryConfig(read=RetryPolicy(backoff_base=0, jitter=False)),
+        )
+
+        assert utils.make_request("GET", "appdefinitionv2/getAppDefinition", params={"appId": "A"})[0]
+
+        entry = metrics.snapshot()["endpoints"]["appdefinitionv2/getAppDefinition"]
+        assert entry["requests"] == {"503": 1, "200": 1}
+        assert entry["errors"] == {"http_5xx": 1}
+        assert entry["retries"] == {"503": 1}
+        assert entry["bytesReceived"] == len(b'{"ok": true}') + len(b"{}")
+
+    def test_timeouts_and_rate_limits_are_error_classes(self):
+        """Test that attempts without a response are counted by error class"""
+        metrics = ClientMetrics()
+
+        def timeout(request):
+            raise TransportTimeout("slow")
+
+        utils = _utils(timeout, metrics, rate_limiter=RateLimiter(workplace_limit=RateLimit(rate=0.001, burst=1), mode="fail"))
+        utils.make_request("POST", "submissions/create", data={"appId": "A"})
+        utils.make_request("POST", "submissions/create", data={"appId": "A"})
+
+        entry = metrics.snapshot()["endpoints"]["submissions/create"]
+        assert entry["requests"] == {"timeout": 1, "rate_limited": 1}
+        assert entry["latency"]["count"] == 1
+
+    def test_async_requests_are_recorded(self):
+        """Test that the async utilities report to the same sink"""
+        metrics = ClientMetrics()
+        utils = AsyncClappiaAPIUtils(
+            "key", "https://sim.local", "WP1", retry_config=RetryConfig.disabled(),
+            transport=AsyncInProcessTransport(lambda request: TransportResponse.from_json(200, {})),
+            metrics=metrics,
+        )
+
+        asyncio.run(utils.make_request("POST", "submissions/create", data={"appId": "A"}))
+
+        assert metrics.snapshot()["endpoints"]["submissions/create"]["requests"] == {"200": 1}
+
+    def test_custom_sink(self):
+        """Test that any MetricsSink subclass receives the attempts"""
+        seen = []
+
+        class Sink(MetricsSink):
+            def observe_request(self, endpoint, status_code, error, seconds, bytes_sent, bytes_received):
+                seen.append((endpoint, status_code))
+
+        _utils(lambda request: TransportResponse.from_json(200, {}), Sink()).make_request("GET", "ping")
+        assert seen == [("ping", 200)]
+
+
+class TestPrometheusExporter:
+    """Test cases for the Prometheus text exposition"""
+
+    @pytest.fixture(autouse=True)
+    def record_requests(self, clappia_simulator, make_client):
+        self.metrics = ClientMetrics(latency_buckets=(0.5,))
+        client = make_client(clappia_simulator.handle, definition_cache=DefinitionCache(), metrics=self.metrics)
+        client.create_submission("APP1", {"name": "Ada"}, "a@example.com")
+        client.get_app_definition("APP1")
+        client.get_app_definition("APP1")
+
+    def test_render(self):
+        """Test the families, labels and cache counters of the exposition"""
+        text = PrometheusExporter(self.metrics).render()
+
+        assert "# TYPE clappia_request_duration_seconds histogram" in text
+        assert 'clappia_requests_total{endpoint="submissions/create",status="200"} 1' in text
+        assert 'clappia_request_duration_seconds_bucket{endpoint="submissions/create",le="+Inf"} 1' in text
+        assert 'clappia_request_duration_seconds_count{endpoint="appdefinitionv2/getAppDefinition"} 1' in text
+        assert 'clappia_definition_cache_events_total{event="hits"} 1' in text
+
+    def test_serve(self):
+        """Test that the built-in server exposes /metrics"""
+        server = PrometheusExporter(self.metrics).serve(0)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics", timeout=5) as response:
+                body = response.read().decode()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert 'clappia_requests_total{endpoint="submissions/create",status="200"} 1' in body
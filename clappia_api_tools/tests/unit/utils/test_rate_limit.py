@@ -0,0 +1,173 @@
+import asyncio
+import fcntl
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+from clappia_api_tools._utils.api_utils import ClappiaAPIUtils
+from clappia_api_tools._utils.rate_limit import (
+    FileTokenStore,
+    MemoryTokenStore,
+    RateLimit,
+    RateLimiter,
+)
+from clappia_api_tools._utils.retry import RetryConfig
+from clappia_api_tools._utils.transport import InProcessTransport, TransportResponse
+
+
+def _take_from_file_store(directory, results):
+    store = FileTokenStore(directory)
+    results.put(store.take(("WP1", "*"), RateLimit(rate=0.001, burst=3)))
+
+
+class TestTokenStores:
+    """Test cases for the token bucket stores"""
+
+    def test_burst_then_wait(self):
+        """Test that a bucket allows its burst and then reports the wait"""
+        store = MemoryTokenStore()
+        limit = RateLimit(rate=1, burst=2)
+        assert store.take(("WP1", "*"), limit) == 0
+        assert store.take(("WP1", "*"), limit) == 0
+        assert 0 < store.take(("WP1", "*"), limit) <= 1
+
+    def test_buckets_are_independent(self):
+        """Test that workplaces do not share buckets"""
+        store = MemoryTokenStore()
+        limit = RateLimit(rate=1, burst=1)
+        assert store.take(("WP1", "*"), limit) == 0
+        assert store.take(("WP2", "*"), limit) == 0
+
+    def test_file_store_shared_across_processes(self, tmp_path):
+        """Test that processes draw from the same file-backed bucket"""
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=_take_from_file_store, args=(str(tmp_path), results))
+            for _ in range(5)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+        waits = [results.get(timeout=5) for _ in workers]
+        assert sum(1 for w in waits if w == 0) == 3
+
+    def test_file_store_refund(self, tmp_path):
+        """Test that a refunded token can be taken again from a file-backed bucket"""
+        store = FileTokenStore(str(tmp_path))
+        limit = RateLimit(rate=0.01, burst=1)
+        assert store.take(("WP1", "*"), limit) == 0
+        store.refund(("WP1", "*"), limit)
+        assert store.take(("WP1", "*"), limit) == 0
+        assert store.take(("WP1", "*"), limit) > 0
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter modes"""
+
+    def test_fail_fast(self):
+        """Test that fail mode rejects immediately once the burst is spent"""
+        limiter = RateLimiter(workplace_limit=RateLimit(rate=0.01, burst=1), mode="fail")
+        assert limiter.acquire("WP1", "submissions/create") is True
+        assert limiter.acquire("WP1", "submissions/create") is False
+        assert limiter.stats()["rejected"] == 1
+
+    def test_wait_with_timeout(self):
+        """Test that wait mode waits for a token that arrives before the timeout"""
+        limiter = RateLimiter(workplace_limit=RateLimit(rate=50, burst=1), mode="wait", timeout=1)
+        assert limiter.acquire("WP1", "x") is True
+        assert limiter.acquire("WP1", "x") is True
+        assert limiter.acquire("WP1", "x", timeout=0.001) is False
+
+    def test_endpoint_limit_only_applies_to_endpoint(self):
+        """Test that endpoint limits leave other endpoints alone"""
+        limiter = RateLimiter(endpoint_limits={"/submissions/create": RateLimit(rate=0.01, burst=1)}, mode="fail")
+        assert limiter.acquire("WP1", "submissions/create") is True
+        assert limiter.acquire("WP1", "submissions/create") is False
+        assert limiter.acquire("WP1", "appdefinitionv2/getAppDefinition") is True
+
+    def test_rejection_refunds_endpoint_token(self):
+        """Test that a request rejected by the workplace bucket does not spend its endpoint token"""
+        limiter = RateLimiter(
+            workplace_limit=RateLimit(rate=0.01, burst=1),
+            endpoint_limits={"x": RateLimit(rate=0.01, burst=3)},
+            mode="fail",
+        )
+        assert [limiter.acquire("WP1", "x") for _ in range(3)] == [True, False, False]
+        limiter.workplace_limit = None
+        assert [limiter.acquire("WP1", "x") for _ in range(3)] == [True, True, False]
+
+    def test_shared_across_threads(self):
+        """Test that concurrent threads never exceed the burst"""
+        limiter = RateLimiter(workplace_limit=RateLimit(rate=0.01, burst=5), mode="fail")
+        outcomes = []
+        threads = [
+            threading.Thread(target=lambda: outcomes.append(limiter.acquire("WP1", "x")))
+            for _ in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert outcomes.count(True) == 5
+
+    def test_async_acquire(self):
+        """Test that aacquire waits without blocking the loop"""
+        limiter = RateLimiter(workplace_limit=RateLimit(rate=50, burst=1))
+
+        async def run():
+            return await asyncio.gather(*(limiter.aacquire("WP1", "x") for _ in range(3)))
+
+        assert asyncio.run(run()) == [True, True, True]
+
+    def test_async_acquire_with_file_store_keeps_loop_responsive(self, tmp_path):
+        """Test that aacquire waits for a locked bucket file without blocking the loop"""
+        store = FileTokenStore(str(tmp_path))
+        limiter = RateLimiter(workplace_limit=RateLimit(rate=1, burst=1), store=store)
+        fd = os.open(store._path(("WP1", "*")), os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        threading.Timer(0.2, os.close, args=(fd,)).start()
+
+        async def run():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticker = asyncio.ensure_future(tick())
+            acquired = await limiter.aacquire("WP1", "x")
+            ticker.cancel()
+            return acquired, ticks
+
+        acquired, ticks = asyncio.run(run())
+        assert acquired
+        assert ticks >= 5
+
+    def test_invalid_mode(self):
+        """Test that unknown modes are rejected"""
+        with pytest.raises(ValueError):
+            RateLimiter(mode="sometimes")
+
+
+class TestRateLimitedRequests:
+    """Test cases for rate limiting in ClappiaAPIUtils.make_request"""
+
+    def test_request_not_sent_when_limited(self):
+        """Test that a rejected token returns an error without sending"""
+        limiter = RateLimiter(workplace_limit=RateLimit(rate=0.01, burst=1), mode="fail")
+        transport = InProcessTransport(lambda request: TransportResponse.from_json(200, {}))
+        utils = ClappiaAPIUtils(
+            "key", "https://api.example.com", "WP1",
+            retry_config=RetryConfig.disabled(), rate_limiter=limiter, transport=transport,
+        )
+
+        assert utils.make_request("POST", "submissions/create", {"a": 1})[0] is True
+        success, error, _ = utils.make_request("POST", "submissions/create", {"a": 1})
+        assert success is False
+        assert error.startswith("Rate limit exceeded")
+        assert transport.requests_sent == 1
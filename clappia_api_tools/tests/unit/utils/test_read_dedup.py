@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from clappia_api_tools._utils.api_utils import ClappiaAPIUtils
+from clappia_api_tools._utils.async_api_utils import AsyncClappiaAPIUtils
+from clappia_api_tools._utils.retry import RetryConfig
+from clappia_api_tools._utils.transport import AsyncInProcessTransport, InProcessTransport, TransportResponse
+
+DEFINITION = "appdefinitionv2/getAppDefinition"
+
+
+class GatedHandler:
+    """Holds every request until released, counting how many reached it"""
+
+    def __init__(self):
+        self.calls = 0
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, request):
+        self.calls += 1
+        self.entered.set()
+        self.release.wait(5)
+        return TransportResponse.from_json(200, {"appId": request.params["appId"]})
+
+
+def _utils(handler, api_key="key", **kwargs):
+    return ClappiaAPIUtils(api_key, "https://sim.local", "WP1", retry_config=RetryConfig.disabled(),
+                           transport=InProcessTransport(handler), **kwargs)
+
+
+class TestSyncReadDedup:
+    """Test cases for collapsing concurrent identical reads in ClappiaAPIUtils"""
+
+    def test_identical_reads_share_one_call(self):
+        """Test that concurrent reads from separate clients go out once and all get the result"""
+        handler = GatedHandler()
+        clients = [_utils(handler) for _ in range(8)]
+        with ThreadPoolExecutor(8) as pool:
+            futures = [pool.submit(c.make_request, "GET", DEFINITION, params={"appId": "APP1"}) for c in clients]
+            handler.entered.wait(5)
+            time.sleep(0.1)  # let the other threads join the call in flight
+            handler.release.set()
+            results = [future.result() for future in futures]
+
+        assert handler.calls == 1
+        assert all(result == (True, None, {"appId": "APP1"}) for result in results)
+        # Each caller decodes its own copy
+        assert results[0][2] is not results[1][2]
+
+    def test_different_params_or_credentials_not_shared(self):
+        """Test that reads differing in params or api key are sent separately"""
+        handler = GatedHandler()
+        requests = [
+            (_utils(handler), {"appId": "APP1"}),
+            (_utils(handler), {"appId": "APP2"}),
+            (_utils(handler, api_key="other"), {"appId": "APP1"}),
+        ]
+        with ThreadPoolExecutor(3) as pool:
+            futures = [pool.submit(u.make_request, "GET", DEFINITION, params=p) for u, p in requests]
+            handler.entered.wait(5)
+            time.sleep(0.1)
+            handler.release.set()
+            for future in futures:
+                future.result()
+        assert handler.calls == 3
+
+    def test_mutations_and_disabled_not_shared(self):
+        """Test that mutations always go out, as do reads with dedupe_reads=False"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            return TransportResponse.from_json(200, {})
+
+        utils = _utils(handler)
+        utils.make_request("POST", "submissions/create", data={"appId": "APP1"})
+        utils.make_request("POST", "submissions/create", data={"appId": "APP1"})
+        assert utils._flight_key("POST", "submissions/create", utils.build_request("POST", "submissions/create")) is None
+        assert _utils(handler, dedupe_reads=False)._flight_key(
+            "GET", DEFINITION, utils.build_request("GET", DEFINITION)) is None
+        assert len(calls) == 2
+
+
+class TestAsyncReadDedup:
+    """Test cases for collapsing concurrent identical reads in AsyncClappiaAPIUtils"""
+
+    def test_identical_reads_share_one_call(self):
+        """Test that concurrent coroutines reading the same definition share one request"""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.params["appId"])
+            await asyncio.sleep(0.01)
+            return TransportResponse.from_json(200, {"appId": request.params["appId"]})
+
+        async def run():
+            utils = AsyncClappiaAPIUtils("key", "https://sim.local", "WP1", retry_config=RetryConfig.disabled(),
+                                         transport=AsyncInProcessTransport(handler))
+            same = [utils.make_request("GET", DEFINITION, params={"appId": "APP1"}) for _ in range(10)]
+            other = utils.make_request("GET", DEFINITION, params={"appId": "APP2"})
+            return await asyncio.gather(*same, other)
+
+        results = asyncio.run(run())
+        assert sorted(calls) == ["APP1", "APP2"]
+        assert all(result == (True, None, {"appId": "APP1"}) for result in results[:10])
+        assert results[10] == (True, None, {"appId": "APP2"})
+
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that cancelling the caller that started a read leaves the others waiting for it"""
+        release = asyncio.Event()
+        calls = []
+
+        async def handler(request):
+            calls.append(request.params["appId"])
+            await release.wait()
+            return TransportResponse.from_json(200, {"appId": request.params["appId"]})
+
+        async def run():
+            utils = AsyncClappiaAPIUtils("key", "https://sim.local", "WP1", retry_config=RetryConfig.disabled(),
+                                         transport=AsyncInProcessTransport(handler))
+            leader = asyncio.ensure_future(utils.make_request("GET", DEFINITION, params={"appId": "APP1"}))
+            await asyncio.sleep(0.01)
+            followers = [asyncio.ensure_future(utils.make_request("GET", DEFINITION, params={"appId": "APP1"}))
+                         for _ in range(2)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            await asyncio.sleep(0.01)
+            release.set()
+            return leader, await asyncio.gather(*followers)
+
+        leader, results = asyncio.run(run())
+        assert leader.cancelled()
+        assert calls == ["APP1"]
+        assert results == [(True, None, {"appId": "APP1"})] * 2
@@ -0,0 +1,146 @@
+from unittest.mock import Mock
+
+import requests
+
+from clappia_api_tools._utils.api_utils import ClappiaAPIUtils
+from clappia_api_tools._utils.transport import RequestsTransport
+from clappia_api_tools._utils.retry import (
+    EndpointClass,
+    RetryBudget,
+    RetryConfig,
+    RetryPolicy,
+    classify_endpoint,
+    next_retry_delay,
+    parse_retry_after,
+)
+
+
+def fast_config(budget=None):
+    """Helper returning a retry config without backoff delays"""
+    return RetryConfig(
+        read=RetryPolicy(max_attempts=3, backoff_base=0, jitter=False),
+        mutation=RetryPolicy(max_attempts=3, backoff_base=0, jitter=False, retry_ambiguous=False),
+        budget=budget,
+    )
+
+
+def response(status, body=b'{"ok": true}', headers=None):
+    """Helper building a requests.Response"""
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body
+    resp.headers.update(headers or {})
+    return resp
+
+
+class TestRetryPolicy:
+    """Test cases for retry decisions"""
+
+    def test_classify_endpoint(self):
+        """Test endpoint classification"""
+        assert classify_endpoint("GET", "appdefinitionv2/getAppDefinition") is EndpointClass.READ
+        assert classify_endpoint("POST", "submissions/create") is EndpointClass.MUTATION
+        assert classify_endpoint("GET", "unknown/read") is EndpointClass.READ
+
+    def test_read_retries_ambiguous_failures(self):
+        """Test that reads retry timeouts and 5xx"""
+        config = fast_config()
+        assert next_retry_delay(config, EndpointClass.READ, 1, status_code=500) == 0
+        assert next_retry_delay(config, EndpointClass.READ, 1, request_sent=True) == 0
+
+    def test_mutation_only_retries_rejected_requests(self):
+        """Test that mutations only retry when the server could not have processed them"""
+        config = fast_config()
+        assert next_retry_delay(config, EndpointClass.MUTATION, 1, status_code=500) is None
+        assert next_retry_delay(config, EndpointClass.MUTATION, 1, request_sent=True) is None
+        assert next_retry_delay(config, EndpointClass.MUTATION, 1, status_code=429) == 0
+        assert next_retry_delay(config, EndpointClass.MUTATION, 1, request_sent=False) == 0
+
+    def test_max_attempts(self):
+        """Test that retries stop after max_attempts"""
+        config = fast_config()
+        assert next_retry_delay(config, EndpointClass.READ, 3, status_code=503) is None
+
+    def test_retry_after_is_honored(self):
+        """Test that Retry-After raises the delay and oversized values give up"""
+        config = fast_config()
+        assert next_retry_delay(config, EndpointClass.READ, 1, status_code=429, retry_after="2") == 2
+        assert next_retry_delay(config, EndpointClass.READ, 1, status_code=429, retry_after="3600") is None
+
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing"""
+        assert parse_retry_after("5") == 5
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert parse_retry_after("garbage") is None
+        assert parse_retry_after(None) is None
+
+    def test_backoff_is_capped(self):
+        """Test exponential backoff with cap"""
+        policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+        assert [policy.backoff(n) for n in range(1, 6)] == [1, 2, 4, 5, 5]
+
+
+class TestRetryBudget:
+    """Test cases for RetryBudget"""
+
+    def test_budget_limits_retries(self):
+        """Test that the budget caps retries relative to requests"""
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, window=60)
+        for _ in range(4):
+            budget.record_request()
+        assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+        assert budget.stats() == {"requests": 4, "retries": 2}
+
+
+class TestMakeRequestRetries:
+    """Test cases for retries inside ClappiaAPIUtils.make_request"""
+
+    def _utils(self, budget=None):
+        return ClappiaAPIUtils(
+            "key", "https://test.com", "WP1",
+            retry_config=fast_config(budget),
+            transport=RequestsTransport(session=Mock()),
+        )
+
+    def test_read_retried_until_success(self):
+        """Test that a read succeeds after transient failures"""
+        utils = self._utils()
+        utils.session.request.side_effect = [
+            requests.exceptions.ReadTimeout(),
+            response(503),
+            response(200, b'{"appId": "APP1"}'),
+        ]
+        success, error, data = utils.make_request("GET", "appdefinitionv2/getAppDefinition")
+        assert success is True
+        assert data == {"appId": "APP1"}
+        assert utils.session.request.call_count == 3
+
+    def test_mutation_not_retried_after_timeout(self):
+        """Test that a create is not resent when it may already have been processed"""
+        utils = self._utils()
+        utils.session.request.side_effect = requests.exceptions.ReadTimeout()
+        success, error, data = utils.make_request("POST", "submissions/create", data={"a": 1})
+        assert success is False
+        assert "timeout" in error
+        assert utils.session.request.call_count == 1
+
+    def test_mutation_retried_after_429(self):
+        """Test that a throttled create is resent"""
+        utils = self._utils()
+        utils.session.request.side_effect = [
+            response(429, headers={"Retry-After": "0"}),
+            response(200, b'{"submissionId": "SUB1"}'),
+        ]
+        success, error, data = utils.make_request("POST", "submissions/create", data={"a": 1})
+        assert success is True
+        assert data == {"submissionId": "SUB1"}
+
+    def test_exhausted_budget_stops_retries(self):
+        """Test that an exhausted budget turns failures into immediate errors"""
+        budget = RetryBudget(ratio=0, min_retries_per_second=0)
+        utils = self._utils(budget)
+        utils.session.request.return_value = response(503, b"unavailable")
+        success, error, data = utils.make_request("GET", "appdefinitionv2/getAppDefinition")
+        assert success is False
+        assert "503" in error
+        assert utils.session.request.call_count == 1
@@ -0,0 +1,106 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from clappia_api_tools._utils.retry import RetryConfig
+from clappia_api_tools._utils.transport import (
+    AsyncInProcessTransport,
+    InProcessTransport,
+    RequestsTransport,
+    TransportConnectionError,
+    TransportResponse,
+    TransportTimeout,
+)
+from clappia_api_tools.client.submission_client import SubmissionClient
+from clappia_api_tools.client.async_submission_client import AsyncSubmissionClient
+
+
+def _client(transport, cls=SubmissionClient):
+    return cls(
+        api_key="test_key",
+        base_url="https://test.com",
+        workplace_id="TEST123",
+        retry_config=RetryConfig.disabled(),
+        transport=transport,
+    )
+
+
+class TestInProcessTransport:
+    """Test cases for clients running on an in-process transport"""
+
+    def test_request_dispatched_to_handler(self):
+        """Test that the handler sees the encoded request and its response is parsed"""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return TransportResponse.from_json(200, {"submissionId": "SUB1"})
+
+        result = _client(InProcessTransport(handler)).create_submission(
+            "MFX093412", {"name": "x"}, "test@example.com"
+        )
+
+        assert "SUB1" in result
+        assert seen[0].method == "POST"
+        assert seen[0].path == "submissions/create"
+        assert seen[0].headers["workplaceId"] == "TEST123"
+        assert seen[0].json()["data"] == {"name": "x"}
+
+    def test_error_status(self):
+        """Test that non-200 responses go through the usual error formatting"""
+        transport = InProcessTransport(lambda request: TransportResponse.from_json(403, {"message": "no"}))
+        result = _client(transport).create_submission("MFX093412", {"name": "x"}, "test@example.com")
+        assert "API Error (403)" in result
+
+    def test_transport_timeout(self):
+        """Test that transport timeouts map to the timeout error message"""
+        def handler(request):
+            raise TransportTimeout("slow")
+
+        result = _client(InProcessTransport(handler)).create_submission(
+            "MFX093412", {"name": "x"}, "test@example.com"
+        )
+        assert "Request timeout after 30 seconds" in result
+
+    def test_async_handler(self):
+        """Test that the async in-process transport awaits coroutine handlers"""
+        async def handler(request):
+            return TransportResponse.from_json(200, {"submissionId": "SUB2"})
+
+        client = _client(AsyncInProcessTransport(handler), AsyncSubmissionClient)
+        result = asyncio.run(client.create_submission("MFX093412", {"name": "x"}, "test@example.com"))
+        assert "SUB2" in result
+
+    def test_headers_case_insensitive(self):
+        """Test that response headers can be read in any case"""
+        response = TransportResponse(429, {"retry-after": "1"})
+        assert response.headers.get("Retry-After") == "1"
+
+
+class TestRequestsTransport:
+    """Test cases for the requests-based transport"""
+
+    def test_connect_timeout_not_sent(self):
+        """Test that connect timeouts are reported as never sent"""
+        session = Mock()
+        session.request.side_effect = requests.exceptions.ConnectTimeout()
+        with pytest.raises(TransportTimeout) as info:
+            RequestsTransport(session=session).send(Mock())
+        assert info.value.request_sent is False
+
+    def test_read_timeout_sent(self):
+        """Test that read timeouts are reported as possibly processed"""
+        session = Mock()
+        session.request.side_effect = requests.exceptions.ReadTimeout()
+        with pytest.raises(TransportTimeout) as info:
+            RequestsTransport(session=session).send(Mock())
+        assert info.value.request_sent is True
+
+    def test_connection_error(self):
+        """Test that dropped connections raise TransportConnectionError"""
+        session = Mock()
+        session.request.side_effect = requests.exceptions.ConnectionError("reset")
+        with pytest.raises(TransportConnectionError):
+            RequestsTransport(session=session).send(Mock())
@@ -0,0 +1 @@
+pytest_plugins = ["clappia_api_tools.simulator.pytest_plugin"]